@@ -0,0 +1,2 @@
+from .request_context import AsyncRequestContext
+from .base import get, put, post, delete
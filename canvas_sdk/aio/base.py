@@ -0,0 +1,51 @@
+"""
+Non-blocking counterparts of the shortcuts in :py:mod:`canvas_sdk.client.base`.  Each function takes the same
+arguments as its blocking equivalent, but returns a concurrent.futures.Future immediately.  The request itself
+is made by :py:func:`canvas_sdk.client.base.call` on one of the context's worker threads, so the retry
+behavior for RETRY_ERROR_CODES and the InvalidOAuthTokenError/CanvasAPIError mapping are identical; any
+exception is raised when the future's result() is read.
+"""
+from canvas_sdk.client import base
+
+
+def get(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making an asynchronous GET call to the API.  Data is passed as url params.
+    """
+    return request_context.executor.submit(
+        base.get, request_context, url, payload, **optional_request_params)
+
+
+def put(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making an asynchronous PUT call to the API
+    """
+    return request_context.executor.submit(
+        base.put, request_context, url, payload, **optional_request_params)
+
+
+def post(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making an asynchronous POST call to the API
+    """
+    return request_context.executor.submit(
+        base.post, request_context, url, payload, **optional_request_params)
+
+
+def delete(request_context, url, payload=None, **optional_request_params):
+    """
+    Shortcut for making an asynchronous DELETE call to the API
+    """
+    return request_context.executor.submit(
+        base.delete, request_context, url, payload, **optional_request_params)
+
+
+def call(action, url, request_context, **optional_request_params):
+    """
+    Asynchronous pass-through to :py:func:`canvas_sdk.client.base.call`.
+
+        :return: A future that resolves to the requests.Response object
+        :rtype: concurrent.futures.Future
+    """
+    return request_context.executor.submit(
+        base.call, action, url, request_context, **optional_request_params)
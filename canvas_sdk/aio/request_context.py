@@ -0,0 +1,59 @@
+# request_context.py
+from concurrent.futures import ThreadPoolExecutor
+
+from canvas_sdk.client import RequestContext
+
+
+class AsyncRequestContext(RequestContext):
+
+    """
+    A :class:`RequestContext <canvas_sdk.client.RequestContext>` that dispatches requests onto a pool of
+    worker threads instead of the calling thread.  All of the parameters of :class:`RequestContext` are
+    accepted, along with the following.  Since requests.Session isn't thread safe, thread_local_sessions defaults
+    to ``True``, so that each worker makes its requests with a session of its own.
+
+    :param int max_workers: (optional) The maximum number of requests that may be in flight at once.  The
+        session's connection pool (pool_connections and pool_maxsize) is sized to match by default so that
+        keep-alive connections are reused by every worker.
+    """
+
+    def __init__(self, auth_token, base_api_url, max_workers=10, **kwargs):
+        kwargs.setdefault('thread_local_sessions', True)
+        kwargs.setdefault('pool_connections', max_workers)
+        kwargs.setdefault('pool_maxsize', max_workers)
+        super(AsyncRequestContext, self).__init__(auth_token, base_api_url, **kwargs)
+        self.max_workers = max_workers
+        self._executor = None
+
+    @property
+    def executor(self):
+        """
+        The concurrent.futures.ThreadPoolExecutor used to run requests for this context.  It is created
+        on first use and may be replaced with any object that implements the Executor interface.
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor):
+        self._executor = executor
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Schedule function(self, *args, **kwargs) to run on the context's executor.  Any of the SDK methods
+        in :py:mod:`canvas_sdk.methods` can be used as the function.
+
+            :return: A future that resolves to the function's return value
+            :rtype: concurrent.futures.Future
+        """
+        return self.executor.submit(function, self, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the executor (waiting for outstanding requests if wait is True) and expire the session.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        self.expire_session()
@@ -1,3 +1,9 @@
 from .request_context import RequestContext
+from .request_context_pool import RequestContextPool
 from .auth import OAuth2Bearer
+from .retry import RetryPolicy
+from .throttle import RateLimitThrottle
+from .rate_limit import RateLimiter, MemoryBucketStore, FileBucketStore
+from .cache import MemoryCache, FileCache
+from .cache_policy import CachePolicy
 from .base import get, put, post, delete
@@ -1,9 +1,13 @@
 import logging
+import threading
 
 import requests
-from requests.exceptions import HTTPError
+from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 from .auth import OAuth2Bearer
+from .cache import ResponseCache
+from .json_backend import install_json_decoder
+from .throttle import is_rate_limit_error
 from canvas_sdk.exceptions import (CanvasAPIError, InvalidOAuthTokenError)
 
 log = logging.getLogger(__name__)
@@ -15,6 +19,11 @@ RETRY_ERROR_CODES = (
     requests.codes['service_unavailable'],  # 503
     requests.codes['gateway_timeout']  # 504
 )
+# A 403 is also retried when it is a "Rate Limit Exceeded" response (see throttle.is_rate_limit_error)
+
+# GET requests currently being made on behalf of contexts with coalesce_gets enabled, keyed by request identity
+_in_flight = {}
+_in_flight_lock = threading.Lock()
 
 
 def merge_or_create_key_value_for_dictionary(target, key, value=None):
@@ -37,35 +46,152 @@ def merge_or_create_key_value_for_dictionary(target, key, value=None):
             target.update({key: value})
 
 
+def encode_payload_value(value):
+    """
+    Encode a single payload value the way Canvas expects it: booleans are sent as 'true' and 'false' (rather than
+    Python's 'True' and 'False'), and everything else is left for requests to encode.
+    """
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return value
+
+
+def normalize_payload(payload):
+    """
+    Turn a payload into the list of (key, value) pairs that is actually sent, once, before the request is made.
+    Keys with a value of None are dropped, list values (e.g. for 'include[]' keys) are expanded into one pair per
+    item, and booleans are encoded with :py:func:`encode_payload_value`.  Payloads that are neither a dictionary
+    nor a sequence of pairs (e.g. a string or file-like body) are returned as they are.
+
+    :param payload: The params or data of a request
+    :type payload: dictionary, list of (key, value) tuples, or None
+    :rtype: list of (key, value) tuples
+    """
+    if isinstance(payload, dict):
+        items = payload.iteritems()
+    elif isinstance(payload, (list, tuple)):
+        items = payload
+    else:
+        return payload
+    pairs = []
+    for key, value in items:
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            pairs.extend((key, encode_payload_value(v)) for v in value if v is not None)
+        else:
+            pairs.append((key, encode_payload_value(value)))
+    return pairs
+
+
+def normalize_request_payload(optional_request_params, key):
+    """
+    Normalize the params or data in a dictionary of request parameters, if there are any.
+    """
+    if optional_request_params.get(key) is not None:
+        optional_request_params[key] = normalize_payload(optional_request_params[key])
+
+
+class _Flight(object):
+
+    """
+    The shared outcome of an in-flight request, set by the thread making it.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def single_flight(key, function, *args, **kwargs):
+    """
+    Call function(*args, **kwargs), unless a call with the same key is already in progress on another thread,
+    in which case wait for it and return its result (or raise its exception) instead.
+
+    :param key: A hashable identity of the call
+    :param function function: The function to call
+    """
+    with _in_flight_lock:
+        flight = _in_flight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _in_flight[key] = _Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.response
+    try:
+        flight.response = function(*args, **kwargs)
+        return flight.response
+    except BaseException as error:
+        # BaseExceptions too (e.g. KeyboardInterrupt or SystemExit in the leader), so that the calls waiting on
+        # this one raise rather than return None
+        flight.error = error
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+        flight.done.set()
+
+
+def prepare_response(request_context, response):
+    """
+    Make a response returned to the caller decode its json with the request context's JSON backend.
+    """
+    if request_context.json_backend is not None:
+        install_json_decoder(response, request_context.json_backend)
+    return response
+
+
 def get(request_context, url, payload=None, **optional_request_params):
     """
-    Shortcut for making a GET call to the API.  Data is passed as url params.
+    Shortcut for making a GET call to the API.  Data is passed as url params, normalized with
+    :py:func:`normalize_payload`.  If the request context has
+    coalesce_gets enabled, identical GETs (same url, params, auth and request options) made concurrently
+    share a single request and response.
     """
     merge_or_create_key_value_for_dictionary(optional_request_params, 'params', payload)
+    normalize_request_payload(optional_request_params, 'params')
+    if request_context.coalesce_gets:
+        options = sorted((k, repr(v)) for k, v in optional_request_params.items() if k != 'params')
+        key = (ResponseCache.build_key(
+            url, optional_request_params.get('params'),
+            optional_request_params.get('auth_token') or request_context.auth_token), tuple(options))
+        return single_flight(key, call, "GET", url, request_context, **optional_request_params)
     return call("GET", url, request_context, **optional_request_params)
 
 
 def put(request_context, url, payload=None, **optional_request_params):
     """
-    Shortcut for making a PUT call to the API
+    Shortcut for making a PUT call to the API.  Data is sent in the body, normalized with
+    :py:func:`normalize_payload`.
     """
     merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    normalize_request_payload(optional_request_params, 'data')
     return call("PUT", url, request_context, **optional_request_params)
 
 
 def post(request_context, url, payload=None, **optional_request_params):
     """
-    Shortcut for making a POST call to the API
+    Shortcut for making a POST call to the API.  Data is sent in the body, normalized with
+    :py:func:`normalize_payload`.
     """
     merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    normalize_request_payload(optional_request_params, 'data')
     return call("POST", url, request_context, **optional_request_params)
 
 
 def delete(request_context, url, payload=None, **optional_request_params):
     """
-    Shortcut for making a DELETE call to the API
+    Shortcut for making a DELETE call to the API.  Data is sent in the body, normalized with
+    :py:func:`normalize_payload`.
     """
     merge_or_create_key_value_for_dictionary(optional_request_params, 'data', payload)
+    normalize_request_payload(optional_request_params, 'data')
     return call("DELETE", url, request_context, **optional_request_params)
 
 
@@ -86,9 +212,11 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
     :param data: (optional) Dictionary, bytes, or file-like object to send in
         the body of the :class:`Request`.
     :param int max_retries: (optional) Number of times a request that generates
-        a certain class of HTTP exception will be retried before being raised
-        back to the caller.  See :py:mod:`client.base` for a list of those error
-        types.
+        a certain class of HTTP exception, or fails to connect or times out,
+        will be retried before being raised back to the caller.  See
+        :py:mod:`client.base` for a list of those error types.  The delay
+        between attempts is determined by the context's retry_policy.  403
+        "Rate Limit Exceeded" responses are retried as well.
     :param files: (optional) Dictionary of 'name': file-like-objects (or
         {'name': ('filename', fileobj)}) for multipart encoding upload.
     :param dictionary headers: (optional) dictionary of headers to send for each
@@ -107,6 +235,15 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
     :type cert: str or Tuple
     :param bool allow_redirects: (optional) Set to True if POST/PUT/DELETE
         redirect following is allowed.  Defaults to True.
+
+    If the request context has a cache, GET requests for which a response is
+    cached are sent as conditional requests, and a 304 Not Modified reply
+    returns the cached response; responses the cache policy considers fresh
+    are returned without a request.  Other successful requests invalidate the
+    cached responses for the url.
+
+    The returned response decodes its json with the request context's
+    json_backend, once (see :py:mod:`canvas_sdk.client.json_backend`).
     """
     # This will be a requests.Session object with defaults set for context
     canvas_session = request_context.session
@@ -118,20 +255,47 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
     auth = None
     if auth_token:
         auth = OAuth2Bearer(auth_token)
+    retry_policy = request_context.retry_policy
+    throttle = request_context.throttle
+    rate_limiter = request_context.rate_limiter
+    # Look up a cached response for GET requests; return it if the cache policy
+    # says it's still fresh, otherwise make the request conditional
+    cache = request_context.cache
+    if cache is not None and action == "GET":
+        cache_key = cache.build_key(url, params, auth_token or request_context.auth_token)
+        cached_response, fresh = cache.lookup(cache_key, url)
+        if fresh:
+            return prepare_response(request_context, cached_response)
+        if cached_response is not None:
+            headers = cache.get_conditional_headers(cached_response, headers)
     # try the request until max_retries is reached.  we need to account for the
     # fact that the first iteration through isn't a retry, so add 1 to max_retries
     for retry in range(retries + 1):
+        response = None
         try:
+            # take a token from the shared request budget, then slow down if the
+            # rate limit quota reported by Canvas is running low
+            if rate_limiter:
+                rate_limiter.acquire()
+            if throttle:
+                throttle.wait()
             # build and send the request
             response = canvas_session.request(
                 action, url, params=params, data=data, headers=headers,
                 cookies=cookies, files=files, auth=auth, timeout=timeout,
                 proxies=proxies, verify=verify, cert=cert,
                 allow_redirects=allow_redirects)
+            if throttle:
+                throttle.update(response)
 
             # raise an http exception if one occured
             response.raise_for_status()
 
+        except (ConnectionError, Timeout) as connection_error:
+            log.info("Request to %s failed: %s", url, str(connection_error))
+            if retry >= retries:
+                raise
+
         except HTTPError as http_error:
             log.info("Caught an API Error returned by Canvas: %s", str(http_error))
             # Need to check its an error code that can be retried
@@ -144,7 +308,8 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
                     "OAuth Token used to make request to %s is invalid" % response.url)
 
             # If we can't retry the request, raise a CanvasAPIError
-            if status_code not in RETRY_ERROR_CODES or retry >= retries:
+            retriable = status_code in RETRY_ERROR_CODES or is_rate_limit_error(response)
+            if not retriable or retry >= retries:
                 try:
                     error_json = response.json()
                     message = str(error_json)
@@ -157,4 +322,14 @@ def call(action, url, request_context, params=None, data=None, max_retries=None,
                     error_json=error_json,
                 )
         else:
-            return response
+            if cache is not None:
+                if action == "GET":
+                    return prepare_response(request_context, cache.update(cache_key, url, response, cached_response))
+                # a write makes cached responses for the resource stale
+                cache.invalidate(url)
+            return prepare_response(request_context, response)
+
+        # back off before the next attempt.  Contexts get a default RetryPolicy when created without one, so
+        # retrying immediately only happens if the retry_policy attribute has been set to None afterwards
+        if retry_policy:
+            retry_policy.wait(retry, response)
@@ -0,0 +1,339 @@
+"""
+Opt-in caching of GET responses for :py:func:`canvas_sdk.client.base.call`.  Responses that carry an ETag or
+Last-Modified header are stored under a key built from the url, query parameters and a hash of the auth token.
+When a cached response exists for a request, the request is made conditional (If-None-Match/If-Modified-Since)
+and a 304 Not Modified reply is answered with the cached response, saving the transfer and decode of the body.
+With a :class:`CachePolicy <canvas_sdk.client.cache_policy.CachePolicy>`, responses for matching endpoints are
+served without any request while they are younger than the policy's ttl.  A successful PUT, POST or DELETE
+invalidates the cached responses for the resource it wrote to, its sub-resources, and its parent collection.
+"""
+import errno
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import urllib
+from collections import OrderedDict
+from operator import itemgetter
+from urlparse import urlsplit
+
+import requests
+
+
+def _encode(value):
+    """
+    Return unicode as UTF-8 encoded bytes, which urlencode and the hash functions take; other values are returned
+    unchanged.
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+
+class ResponseCache(object):
+
+    """
+    Base class for response cache backends.  Subclasses store (response, stored_at) pairs by key by implementing
+    get_entry, set_entry, delete, keys and clear.  Entries older than ttl seconds are ignored.
+
+    :param float ttl: (optional) Seconds after which a stored response is discarded instead of revalidated; None
+        to keep responses until they are evicted
+    :param policy: (optional) A :class:`CachePolicy <canvas_sdk.client.cache_policy.CachePolicy>` giving the number
+        of seconds responses for an endpoint may be used without revalidation
+    """
+
+    def __init__(self, ttl=None, policy=None):
+        self.ttl = ttl
+        self.policy = policy
+
+    def get_entry(self, key):
+        raise NotImplementedError
+
+    def set_entry(self, key, entry):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def keys(self):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def build_key(url, params=None, auth_token=None):
+        """
+        Build the cache key for a GET request.  The token is hashed so that it is never stored in the cache.
+        params may be a dictionary or a list of (name, value) pairs.  Unicode names and values are encoded as UTF-8,
+        the way requests sends them.
+        """
+        params = params or {}
+        if isinstance(params, dict):
+            params = params.items()
+        items = []
+        # sort on the name only, so that the order of repeated values (e.g. include[]) is kept
+        for name, value in sorted(params, key=itemgetter(0)):
+            if value is None:
+                continue
+            name = _encode(name)
+            if isinstance(value, (list, tuple)):
+                items.extend((name, _encode(v)) for v in value)
+            else:
+                items.append((name, _encode(value)))
+        token_hash = hashlib.sha1(_encode(auth_token)).hexdigest() if auth_token else ''
+        return '%s?%s#%s' % (url, urllib.urlencode(items), token_hash)
+
+    def get(self, key, now=None):
+        """
+        Return the stored response for a key, or None if there isn't one or it has outlived the ttl.
+        """
+        return self.lookup(key, None, now)[0]
+
+    def lookup(self, key, url, now=None):
+        """
+        Return the stored response for a key (or None) and whether the policy allows it to be used for the url
+        without revalidation.
+
+            :rtype: tuple
+        """
+        entry = self.get_entry(key)
+        if entry is None:
+            return None, False
+        response, stored_at = entry
+        age = (now or time.time()) - stored_at
+        if self.ttl is not None and age > self.ttl:
+            self.delete(key)
+            return None, False
+        max_age = self.get_policy_ttl(url)
+        return response, max_age is not None and age <= max_age
+
+    def get_policy_ttl(self, url):
+        """
+        Return the policy's ttl for a url, or None if there is no policy or url.
+        """
+        if self.policy is None or url is None:
+            return None
+        return self.policy.get_ttl(url)
+
+    def set(self, key, response, now=None):
+        """
+        Store a response for a key.
+        """
+        self.set_entry(key, (response, now or time.time()))
+
+    @staticmethod
+    def get_conditional_headers(cached_response, headers=None):
+        """
+        Return a copy of the request headers with the validators of a cached response added.
+        """
+        conditional_headers = dict(headers or {})
+        if 'ETag' in cached_response.headers:
+            conditional_headers['If-None-Match'] = cached_response.headers['ETag']
+        if 'Last-Modified' in cached_response.headers:
+            conditional_headers['If-Modified-Since'] = cached_response.headers['Last-Modified']
+        return conditional_headers
+
+    def update(self, key, url, response, cached_response=None):
+        """
+        Handle the response to a (possibly conditional) GET request and return the response for the caller: the
+        cached response if the server replied 304 Not Modified, otherwise the new response, which is stored if it
+        carries a validator or the policy has a ttl for the url.
+        """
+        if response.status_code == requests.codes['not_modified'] and cached_response is not None:
+            self.set(key, cached_response)
+            return cached_response
+        if ('ETag' in response.headers or 'Last-Modified' in response.headers or
+                self.get_policy_ttl(url)):
+            self.set(key, response)
+        return response
+
+    def invalidate(self, url):
+        """
+        Delete the responses cached (for any token) for the resource at url, its sub-resources, and the collection
+        it belongs to.  Called after a successful PUT, POST or DELETE to url.
+        """
+        path = urlsplit(url).path.rstrip('/')
+        self.invalidate_paths(path, path.rsplit('/', 1)[0])
+
+    def invalidate_paths(self, path, parent):
+        """
+        Delete the responses whose url path is path, or below it, or is parent.  This checks every key; backends
+        that index their entries by path override it to touch only the matching entries.
+        """
+        for key in self.keys():
+            key_path = urlsplit(key).path.rstrip('/')
+            if key_path == path or key_path == parent or key_path.startswith(path + '/'):
+                self.delete(key)
+
+
+class MemoryCache(ResponseCache):
+
+    """
+    In-memory response cache shared by the threads of a process, bounded to max_entries responses with least
+    recently used eviction.
+
+    :param int max_entries: (optional) Maximum number of responses to keep
+    :param float ttl: (optional) See :class:`ResponseCache`
+    :param policy: (optional) See :class:`ResponseCache`
+    """
+
+    def __init__(self, max_entries=1000, ttl=None, policy=None):
+        super(MemoryCache, self).__init__(ttl=ttl, policy=policy)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_entry(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set_entry(self, key, entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache(ResponseCache):
+
+    """
+    On-disk response cache, which may be shared by processes on a host.  Each response is pickled to its own file
+    in directory, without the request that produced it, so authorization headers are not written to disk.  The
+    files are laid out in subdirectories that mirror the path of their url, so that invalidating a resource
+    deletes its own directory and the entries of its parent's, without reading any entry.
+
+    :param str directory: Directory to store responses in; it is created if it doesn't exist
+    :param float ttl: (optional) See :class:`ResponseCache`
+    :param policy: (optional) See :class:`ResponseCache`
+    """
+
+    # Suffix of entry files; dots are escaped in directory names, so entries and subdirectories never clash
+    ENTRY_SUFFIX = '.entry'
+
+    def __init__(self, directory, ttl=None, policy=None):
+        super(FileCache, self).__init__(ttl=ttl, policy=policy)
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _get_directory(self, url_path):
+        """
+        Return the directory of the entries for a url path, with each segment of the path quoted into a file name.
+        """
+        names = [urllib.quote(_encode(segment), safe='').replace('.', '%2E')
+                 for segment in url_path.split('/') if segment]
+        return os.path.join(self.directory, *names)
+
+    def _get_path(self, key):
+        return os.path.join(self._get_directory(urlsplit(key).path),
+                            hashlib.sha1(_encode(key)).hexdigest() + self.ENTRY_SUFFIX)
+
+    def _load(self, path):
+        try:
+            with open(path, 'rb') as cache_file:
+                return pickle.load(cache_file)
+        except (IOError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+
+    def get_entry(self, key):
+        stored = self._load(self._get_path(key))
+        if stored is None:
+            return None
+        key, state, stored_at = stored
+        response = requests.Response()
+        response.__setstate__(state)
+        return response, stored_at
+
+    def set_entry(self, key, entry):
+        response, stored_at = entry
+        state = response.__getstate__()
+        state['request'] = None
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+        # Write to a temporary file and rename it into place so readers never see a partial entry.  An
+        # invalidation may remove the directory meanwhile, in which case the entry is dropped.
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=directory)
+        except OSError:
+            return
+        with os.fdopen(fd, 'wb') as cache_file:
+            pickle.dump((key, state, stored_at), cache_file, pickle.HIGHEST_PROTOCOL)
+        try:
+            os.rename(temp_path, path)
+        except OSError:
+            self._remove(temp_path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def delete(self, key):
+        self._remove(self._get_path(key))
+
+    def invalidate_paths(self, path, parent):
+        directory = self._get_directory(path)
+        if directory == self._get_directory(''):
+            self.clear()
+            return
+        # the resource's entries and, in its subdirectories, those of its sub-resources
+        shutil.rmtree(directory, ignore_errors=True)
+        # the collection's entries, but not the subdirectories of its other members
+        parent_directory = self._get_directory(parent)
+        try:
+            names = os.listdir(parent_directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(self.ENTRY_SUFFIX):
+                self._remove(os.path.join(parent_directory, name))
+
+    def keys(self):
+        # Keys are stored with each entry since file names are hashes; this reads every entry
+        keys = []
+        for directory, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(self.ENTRY_SUFFIX):
+                    stored = self._load(os.path.join(directory, name))
+                    if stored is not None:
+                        keys.append(stored[0])
+        return keys
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                self._remove(path)
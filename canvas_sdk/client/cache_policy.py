@@ -0,0 +1,93 @@
+"""
+Per-endpoint freshness rules for a :class:`ResponseCache <canvas_sdk.client.cache.ResponseCache>`.  A GET response
+for a url that matches a rule is served straight from the cache, without a request to Canvas, until it is older
+than the rule's ttl; after that, it is revalidated as usual.
+"""
+import importlib
+import re
+import types
+from urlparse import urlsplit
+
+PATH_PARAMETER_PATTERN = re.compile(r'\{[^}]+\}')
+
+
+def get_method_paths(function):
+    """
+    Return the api path templates (e.g. '/v1/accounts/{id}') used by one of the generated functions in
+    :py:mod:`canvas_sdk.methods`, as listed in its module's endpoint table.  Methods that build their request
+    themselves aren't in the table and have no paths.
+    """
+    # imported here since canvas_sdk.endpoints imports canvas_sdk.client
+    from canvas_sdk.endpoints import get_endpoint
+    endpoint = get_endpoint(function)
+    return [endpoint.path] if endpoint is not None else []
+
+
+def is_get_method(function):
+    """
+    Return True if a generated function in :py:mod:`canvas_sdk.methods` makes a GET request, according to its
+    module's endpoint table.
+    """
+    from canvas_sdk.endpoints import get_endpoint
+    endpoint = get_endpoint(function)
+    return endpoint is not None and endpoint.method == 'GET'
+
+
+def compile_path_template(path):
+    """
+    Compile an api path template into a regular expression that matches the path of absolute urls built from it.
+    """
+    parts = PATH_PARAMETER_PATTERN.split(path)
+    return re.compile('[^/]+'.join(re.escape(part) for part in parts) + '/?$')
+
+
+class CachePolicy(object):
+
+    """
+    A list of (path pattern, ttl) rules, checked in the order they were added.  Rules may be given as api path
+    templates in the form used by :py:mod:`canvas_sdk.methods` ('/v1/accounts/{id}'), as generated methods (e.g.
+    accounts.get_single_account), or as whole method modules (e.g. enrollment_terms), in which case a rule is added
+    for every GET method in the module.
+
+    :param rules: (optional) Iterable of (target, ttl in seconds) pairs, where the target is a path template, a
+        method or a module
+    :param float default_ttl: (optional) ttl for urls that don't match any rule; None to always revalidate
+    """
+
+    def __init__(self, rules=None, default_ttl=None):
+        self.default_ttl = default_ttl
+        self._rules = []
+        for target, ttl in rules or ():
+            self.add_rule(target, ttl)
+
+    def add_rule(self, target, ttl):
+        """
+        Add a rule for a path template, generated method, or method module.
+
+            :raises ValueError: if a method isn't in its module's endpoint table
+        """
+        if isinstance(target, types.ModuleType):
+            # Resolve lazily imported modules (see canvas_sdk.methods) to the real module
+            module = importlib.import_module(target.__name__)
+            for function in vars(module).values():
+                if isinstance(function, types.FunctionType) and is_get_method(function):
+                    self.add_rule(function, ttl)
+        elif isinstance(target, types.FunctionType):
+            paths = get_method_paths(target)
+            if not paths:
+                raise ValueError('%s.%s is not in the endpoint table of its module; add a rule for its path template '
+                                 'instead' % (target.__module__, target.__name__))
+            for path in paths:
+                self.add_rule(path, ttl)
+        else:
+            self._rules.append((compile_path_template(target), ttl))
+
+    def get_ttl(self, url):
+        """
+        Return the ttl of the first rule matching the url's path, or default_ttl.
+        """
+        path = urlsplit(url).path
+        for pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
@@ -0,0 +1,73 @@
+"""
+Pluggable JSON decoding for response bodies.  A :class:`RequestContext <canvas_sdk.client.RequestContext>` picks the
+fastest decoder available (orjson, then ujson, then the stdlib json module), or the one it is given, and responses
+returned by :py:func:`canvas_sdk.client.base.call` decode their body with it the first time ``response.json()`` is
+called, reusing the result afterwards.  Bodies that are never read are never decoded.
+"""
+import importlib
+import json
+
+import requests
+
+# Backends in order of preference when none is given
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+
+
+def get_json_backend(backend=None):
+    """
+    Return a JSON backend: a module or object with a ``loads`` function.
+
+    :param backend: (optional) The name of a backend module ('orjson', 'ujson' or 'json'), or an object with a
+        ``loads`` function.  If None, the first of JSON_BACKENDS that can be imported is used.
+    :raises ImportError: if the named backend isn't installed
+    """
+    if backend is None:
+        for name in JSON_BACKENDS:
+            try:
+                return importlib.import_module(name)
+            except ImportError:
+                continue
+    if isinstance(backend, basestring):
+        return importlib.import_module(backend)
+    return backend
+
+
+class JsonResponse(requests.Response):
+
+    """
+    A requests.Response whose ``json`` method decodes the body with a JSON backend on first use and memoizes the
+    result in the response's own ``__dict__``.  Calls with keyword arguments (e.g. ``object_hook``) are decoded by
+    requests, uncached.  Responses are made JsonResponses by :py:func:`install_json_decoder`, which swaps their
+    class: the decoder is a method rather than an object held by the response, so a decoded response isn't part
+    of a reference cycle and is freed as soon as it is no longer used.
+    """
+
+    # the backend of a response unpickled without one
+    _json_backend = json
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super(JsonResponse, self).json(**kwargs)
+        try:
+            return self.__dict__['_decoded_json']
+        except KeyError:
+            pass
+        if self._json_backend is json:
+            # the stdlib decoder goes through requests, which also handles the response's text encoding
+            value = super(JsonResponse, self).json()
+        else:
+            value = self._json_backend.loads(self.content)
+        self._decoded_json = value
+        return value
+
+
+def install_json_decoder(response, backend):
+    """
+    Make ``response.json()`` decode with the backend, once, by making the response a :class:`JsonResponse`.  A
+    response that already is one keeps its backend, and objects that aren't plain requests.Responses are left as
+    they are.  Returns the response.
+    """
+    if type(response) is requests.Response:
+        response.__class__ = JsonResponse
+        response._json_backend = backend
+    return response
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+import time
+
+
+def consume_tokens(state, tokens, rate, capacity, now):
+    """
+    Token bucket arithmetic shared by the bucket stores.  Refill the bucket described by state (a
+    (tokens, timestamp) pair, or None for a new, full bucket) at rate tokens per second up to capacity, then
+    try to take the requested number of tokens.
+
+        :return: The new state and the number of seconds to wait before trying again (0 if the tokens were taken)
+        :rtype: tuple
+    """
+    if state is None:
+        available, updated_at = capacity, now
+    else:
+        available, updated_at = state
+    available = min(capacity, available + max(0, now - updated_at) * rate)
+    if available >= tokens:
+        return (available - tokens, now), 0
+    return (available, now), (tokens - available) / float(rate)
+
+
+class BucketStore(object):
+
+    """
+    Interface for the storage backing a :class:`RateLimiter`.  A store keeps the state of any number of named
+    buckets and must apply consume_tokens to a bucket atomically with respect to every other client of the
+    store, whether that's other threads, other processes on the host, or (for a network store such as Redis)
+    other hosts.
+    """
+
+    def consume(self, key, tokens, rate, capacity, now):
+        """
+        Atomically refill and take tokens from the named bucket.
+
+            :return: Seconds to wait before trying again, or 0 if the tokens were taken
+            :rtype: float
+        """
+        raise NotImplementedError
+
+
+class MemoryBucketStore(BucketStore):
+
+    """
+    Bucket store shared by the threads of a single process.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, tokens, rate, capacity, now):
+        with self._lock:
+            self._buckets[key], wait = consume_tokens(self._buckets.get(key), tokens, rate, capacity, now)
+        return wait
+
+
+class FileBucketStore(BucketStore):
+
+    """
+    Bucket store shared by every process on a host that uses the same file path.  Bucket state is kept as
+    json in the file, which is locked with fcntl.flock for the duration of each update, so it is only
+    available on POSIX systems.
+
+    :param str path: Path of the state file; it is created if it doesn't exist
+    """
+
+    def __init__(self, path):
+        import fcntl  # Not available on Windows; only required when this store is used
+        self._fcntl = fcntl
+        self.path = path
+        self._lock = threading.Lock()  # flock doesn't serialize threads sharing the process
+
+    def consume(self, key, tokens, rate, capacity, now):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), 'r+') as state_file:
+                    try:
+                        buckets = json.load(state_file)
+                    except ValueError:  # new or corrupt file; start with full buckets
+                        buckets = {}
+                    state, wait = consume_tokens(buckets.get(key), tokens, rate, capacity, now)
+                    buckets[key] = state
+                    state_file.seek(0)
+                    state_file.truncate()
+                    json.dump(buckets, state_file)
+            finally:
+                os.close(fd)  # closing the descriptor releases the lock
+        return wait
+
+
+class RateLimiter(object):
+
+    """
+    Token bucket rate limiter.  Each request takes a token from the bucket, which refills at rate tokens per
+    second up to capacity; when the bucket is empty, acquire blocks until a token is available.  The bucket
+    state lives in a :class:`BucketStore`, so every :class:`RequestContext <canvas_sdk.client.RequestContext>`
+    whose limiter uses the same store and key shares one budget.  Use a :class:`FileBucketStore` to share the
+    budget between worker processes on a host.
+
+    :param float rate: Sustained number of requests per second allowed
+    :param float capacity: (optional) Number of requests that may be made in a burst.  Defaults to rate, or 1 if
+        rate is lower, so that the bucket can hold a whole token.
+    :param store: (optional) The :class:`BucketStore` holding the bucket state.  Defaults to a new
+        :class:`MemoryBucketStore`.
+    :param str key: (optional) Name of the bucket within the store, e.g. one per Canvas token
+    """
+
+    def __init__(self, rate, capacity=None, store=None, key='default'):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.store = store or MemoryBucketStore()
+        self.key = key
+
+    def acquire(self, tokens=1):
+        """
+        Block until the requested number of tokens has been taken from the bucket.
+
+            :raises ValueError: if more tokens are requested than the bucket can hold, which would block forever
+        """
+        if tokens > self.capacity:
+            raise ValueError('Cannot acquire %s tokens from a bucket with a capacity of %s' % (tokens, self.capacity))
+        while True:
+            wait = self.store.consume(self.key, tokens, self.rate, self.capacity, time.time())
+            if wait <= 0:
+                return
+            time.sleep(wait)
@@ -1,6 +1,11 @@
 # request_context.py
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter
 from .auth import OAuth2Bearer
+from .json_backend import get_json_backend
+from .retry import RetryPolicy
 from urlparse import urlparse
 
 
@@ -26,6 +31,29 @@ class RequestContext(object):
     :type verify: boolean or str
     :param cert: (optional) if String, path to ssl client cert file (.pem).  If Tuple, ('cert', 'key') pair.
     :type cert: str or Tuple
+    :param int prefetch_depth: (optional) When paging over results with :py:func:`canvas_sdk.utils.get_next`, the number of
+        "next" pages that may be fetched ahead of the caller on a background thread.  Defaults to 0 (no prefetching).
+    :param retry_policy: (optional) A :class:`RetryPolicy <canvas_sdk.client.retry.RetryPolicy>` that controls the delay
+        between retries.  Defaults to exponential backoff with full jitter that honors Retry-After headers.
+    :param throttle: (optional) A :class:`RateLimitThrottle <canvas_sdk.client.throttle.RateLimitThrottle>` that tracks the
+        rate limit quota reported by Canvas and delays requests as it runs low.  Share one instance across contexts that
+        use the same token.
+    :param rate_limiter: (optional) A :class:`RateLimiter <canvas_sdk.client.rate_limit.RateLimiter>` that each request must
+        acquire a token from before it is sent.  Its bucket store determines whether the budget is shared across threads,
+        processes, or hosts.
+    :param bool thread_local_sessions: (optional) If ``True``, each thread gets its own requests.Session so that a context
+        can safely be shared by a pool of threads.  Defaults to ``False`` (one session shared by all callers).
+    :param int pool_connections: (optional) Number of per-host connection pools the session's HTTPAdapter caches.
+    :param int pool_maxsize: (optional) Maximum number of connections kept alive per host.  Set this to at least the number of
+        threads sharing a session so that keep-alive connections aren't discarded when the pool is full.
+    :param cache: (optional) A :class:`ResponseCache <canvas_sdk.client.cache.ResponseCache>` backend (e.g. MemoryCache or
+        FileCache) used to store GET responses and revalidate them with conditional requests.  Defaults to no caching.
+    :param bool coalesce_gets: (optional) If ``True``, identical GET requests made concurrently by different threads share
+        a single request to Canvas and the same response object.  Defaults to ``False``.
+    :param json_backend: (optional) The JSON decoder used by ``response.json()`` for responses to requests made with the
+        context: 'orjson', 'ujson', 'json', or any object with a ``loads`` function.  Defaults to the fastest one
+        installed.  Responses are decoded the first time ``json()`` is called and the result is reused, so treat it
+        as read-only when responses may be cached or shared.
     """
 
     @classmethod
@@ -39,8 +67,11 @@ class RequestContext(object):
         }
         return default_headers
 
-    def __init__(self, auth_token, base_api_url, max_retries=0, per_page=None, headers=None, cookies=None, timeout=None, proxies=None, verify=True, cert=None):
+    def __init__(self, auth_token, base_api_url, max_retries=0, per_page=None, headers=None, cookies=None, timeout=None, proxies=None, verify=True, cert=None, prefetch_depth=0,
+                 retry_policy=None, throttle=None, rate_limiter=None, thread_local_sessions=False,
+                 pool_connections=None, pool_maxsize=None, cache=None, coalesce_gets=False, json_backend=None):
         self._session = None
+        self._local = threading.local()
         self.auth_token = auth_token
         self.per_page = per_page
         parsed_url = urlparse(base_api_url)
@@ -58,6 +89,16 @@ class RequestContext(object):
         self.verify = verify
         self.cert = cert
         self.max_retries = max_retries
+        self.prefetch_depth = prefetch_depth
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.throttle = throttle
+        self.rate_limiter = rate_limiter
+        self.thread_local_sessions = thread_local_sessions
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        self.coalesce_gets = coalesce_gets
+        self.json_backend = get_json_backend(json_backend)
 
     @property
     def auth(self):
@@ -73,34 +114,60 @@ class RequestContext(object):
         class.  The setter should only be used if you need fine-grained control over your session.
         You can refer to the requests library documentation for information on available options for
         the session object: http://docs.python-requests.org/
+        When thread_local_sessions is enabled, the session is stored (and set) for the current thread only.
         NOTE: Refer to the setup.py file to match up the version of the Requests library the SDK uses
         with the right doc version.
         """
+        if self.thread_local_sessions:
+            if not getattr(self._local, 'session', None):
+                self._local.session = self.create_session()
+            return self._local.session
         if not self._session:
-            self._session = requests.Session()
-            # Streaming is disabled by default when creating a requests.Session
-            # object, but let's be explicit here to prevent connections from staying
-            # open indefinitely
-            self._session.stream = False
-            self._session.auth = self.auth
-            self._session.headers.update(self.headers or {})
-            self._session.timeout = self.timeout
-            self._session.cert = self.cert
-            self._session.verify = self.verify
-            # We only need to set proxies and cookies if not None or empty since the
-            # defaults are empty dicts
-            if self.proxies:
-                self._session.proxies = self.proxies
-            if self.cookies:
-                self._session.cookies = self.cookies
+            self._session = self.create_session()
         return self._session
 
     @session.setter
     def session(self, sess):
-        self._session = sess
+        if self.thread_local_sessions:
+            self._local.session = sess
+        else:
+            self._session = sess
+
+    def create_session(self):
+        """
+        Create a new requests.Session instance configured with the values passed into the class.
+        """
+        session = requests.Session()
+        # Streaming is disabled by default when creating a requests.Session
+        # object, but let's be explicit here to prevent connections from staying
+        # open indefinitely
+        session.stream = False
+        session.auth = self.auth
+        session.headers.update(self.headers or {})
+        session.timeout = self.timeout
+        session.cert = self.cert
+        session.verify = self.verify
+        # We only need to set proxies and cookies if not None or empty since the
+        # defaults are empty dicts
+        if self.proxies:
+            session.proxies = self.proxies
+        if self.cookies:
+            session.cookies = self.cookies
+        # Size the connection pool if asked to; otherwise keep the requests defaults
+        if self.pool_connections or self.pool_maxsize:
+            adapter_kwargs = {}
+            if self.pool_connections:
+                adapter_kwargs['pool_connections'] = self.pool_connections
+            if self.pool_maxsize:
+                adapter_kwargs['pool_maxsize'] = self.pool_maxsize
+            adapter = HTTPAdapter(**adapter_kwargs)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        return session
 
     def expire_session(self):
         """
-        To expire a session, it just needs to be set to None according to requests doc.
+        To expire a session, it just needs to be set to None according to requests doc.  With thread_local_sessions,
+        only the current thread's session is expired.
         """
         self.session = None
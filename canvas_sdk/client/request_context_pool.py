@@ -0,0 +1,119 @@
+# request_context_pool.py
+import threading
+import time
+from collections import OrderedDict
+from urlparse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+from .request_context import RequestContext
+
+
+class PooledRequestContext(RequestContext):
+
+    """
+    A :class:`RequestContext` whose sessions send requests to the Canvas host through a shared HTTPAdapter, so
+    that contexts for different tokens reuse the same keep-alive connections.  Created by
+    :class:`RequestContextPool`.
+    """
+
+    def __init__(self, auth_token, base_api_url, adapter, **kwargs):
+        super(PooledRequestContext, self).__init__(auth_token, base_api_url, **kwargs)
+        self.adapter = adapter
+
+    def create_session(self):
+        session = super(PooledRequestContext, self).create_session()
+        session.mount(get_host_prefix(self.base_api_url), self.adapter)
+        return session
+
+
+def get_host_prefix(url):
+    """
+    Return the scheme://host/ prefix of a url, which is used to mount the shared adapter for the host.
+    """
+    parsed_url = urlparse(url)
+    return '%s://%s/' % (parsed_url.scheme, parsed_url.netloc)
+
+
+class RequestContextPool(object):
+
+    """
+    A thread-safe cache of request contexts keyed by (base_api_url, auth_token), for services that make requests to
+    many Canvas instances on behalf of many users.  Contexts are evicted once max_size contexts are cached (least
+    recently used first) or when they haven't been used for idle_timeout seconds.  All contexts for a Canvas host
+    share one connection pool, while each keeps its own OAuth2Bearer authentication.  Any other keyword arguments
+    are passed to every :class:`RequestContext` the pool creates.
+
+    :param int max_size: (optional) Maximum number of contexts to keep
+    :param float idle_timeout: (optional) Seconds after its last use that a context is expired; None to disable
+    :param int pool_maxsize: (optional) Maximum number of connections kept alive per Canvas host
+    """
+
+    def __init__(self, max_size=100, idle_timeout=300, pool_maxsize=10, **context_kwargs):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.pool_maxsize = pool_maxsize
+        self.context_kwargs = context_kwargs
+        self._contexts = OrderedDict()  # (base_api_url, auth_token) -> (context, last used)
+        self._adapters = {}  # host prefix -> HTTPAdapter
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._contexts)
+
+    def get(self, auth_token, base_api_url):
+        """
+        Return the cached context for the Canvas instance and token, creating it if needed.
+
+            :param str auth_token: OAuth2 token retrieved from a Canvas site
+            :param str base_api_url: The api endpoint of the Canvas site
+            :rtype: :class:`PooledRequestContext`
+        """
+        key = (base_api_url, auth_token)
+        now = time.time()
+        with self._lock:
+            self._expire_idle(now)
+            entry = self._contexts.pop(key, None)
+            if entry:
+                context = entry[0]
+            else:
+                context = PooledRequestContext(
+                    auth_token, base_api_url, self._get_adapter(base_api_url), **self.context_kwargs)
+            self._contexts[key] = (context, now)
+            while len(self._contexts) > self.max_size:
+                self._contexts.popitem(last=False)
+        return context
+
+    def remove(self, auth_token, base_api_url):
+        """
+        Remove the context for the Canvas instance and token (e.g. when the token is revoked), if it's cached.
+        """
+        with self._lock:
+            self._contexts.pop((base_api_url, auth_token), None)
+
+    def clear(self):
+        """
+        Remove all contexts and close the shared connection pools.
+        """
+        with self._lock:
+            self._contexts.clear()
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+
+    def _get_adapter(self, base_api_url):
+        prefix = get_host_prefix(base_api_url)
+        if prefix not in self._adapters:
+            self._adapters[prefix] = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+        return self._adapters[prefix]
+
+    def _expire_idle(self, now):
+        # Contexts are ordered by last use, so stop at the first one that is still fresh.  Evicted sessions
+        # are dropped rather than closed, since closing a session would close the shared adapter.
+        if self.idle_timeout is None:
+            return
+        while self._contexts:
+            key, (context, last_used) = next(self._contexts.iteritems())
+            if now - last_used < self.idle_timeout:
+                break
+            del self._contexts[key]
@@ -0,0 +1,72 @@
+import random
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+
+class RetryPolicy(object):
+
+    """
+    Determines how long :py:func:`canvas_sdk.client.base.call` waits before retrying a failed request.  The
+    delay grows exponentially with each retry (base_delay * multiplier ** retry), is capped at max_delay, and
+    with full jitter enabled a uniformly random delay between zero and that value is used so that concurrent
+    clients don't retry in lockstep.  A Retry-After header on the failed response takes precedence when it asks
+    for a longer wait, up to max_delay.
+
+    :param float base_delay: (optional) Delay in seconds before the first retry
+    :param float multiplier: (optional) Factor the delay is multiplied by for each subsequent retry
+    :param float max_delay: (optional) Upper bound in seconds for the delay, including one asked for by a
+        Retry-After header
+    :param bool jitter: (optional) If ``True``, use "full jitter" (a random delay up to the computed value)
+    :param bool respect_retry_after: (optional) If ``True``, wait at least as long as the response's
+        Retry-After header asks (but no longer than max_delay)
+    """
+
+    def __init__(self, base_delay=0.5, multiplier=2.0, max_delay=30.0, jitter=True, respect_retry_after=True):
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def get_delay(self, retry, response=None):
+        """
+        Return the number of seconds to wait before making a retry.
+
+            :param int retry: Zero-based count of retries already made for the request
+            :param response: (optional) The requests.Response that failed, if one was received
+            :rtype: float
+        """
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** retry))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and response is not None:
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                # a server asking for a wait of hours (or a date far off) mustn't stall the caller that long
+                delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def wait(self, retry, response=None):
+        """
+        Sleep for the delay returned by get_delay.
+        """
+        delay = self.get_delay(retry, response)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_retry_after(response):
+    """
+    Return the number of seconds requested by a response's Retry-After header, which may be given either
+    as a number of seconds or as an HTTP date, or None if the header is missing or malformed.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        parsed_date = parsedate_tz(value)
+        if parsed_date is None:
+            return None
+        return max(0.0, mktime_tz(parsed_date) - time.time())
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import requests
+
+RATE_LIMIT_REMAINING_HEADER = 'X-Rate-Limit-Remaining'
+REQUEST_COST_HEADER = 'X-Request-Cost'
+
+
+def is_rate_limit_error(response):
+    """
+    Return True if the response is Canvas's 403 Forbidden (Rate Limit Exceeded) response.
+    """
+    return (response.status_code == requests.codes['forbidden'] and
+            'rate limit exceeded' in (response.text or '').lower())
+
+
+class RateLimitThrottle(object):
+
+    """
+    Client-side throttle driven by the X-Rate-Limit-Remaining header that Canvas returns with every response.
+    Canvas meters each token with a leaky bucket; when the bucket is empty, requests are rejected with a 403
+    (Rate Limit Exceeded) response.  The throttle records the quota remaining after each response and, once it
+    falls below threshold, delays the dispatch of new requests in proportion to how much of the threshold has
+    been used, up to max_delay when the quota is exhausted.  An instance may be shared by every thread making
+    requests with a :class:`RequestContext <canvas_sdk.client.RequestContext>` so that they slow down together.
+
+    :param float threshold: (optional) Remaining quota below which requests start being delayed
+    :param float max_delay: (optional) Delay in seconds before each request while the quota is exhausted
+    """
+
+    def __init__(self, threshold=300.0, max_delay=2.0):
+        self.threshold = threshold
+        self.max_delay = max_delay
+        self.remaining = None
+        self.request_cost = None
+        self._lock = threading.Lock()
+
+    def get_delay(self):
+        """
+        Return the number of seconds to wait before dispatching the next request.
+        """
+        remaining = self.remaining
+        if remaining is None or remaining >= self.threshold:
+            return 0
+        return self.max_delay * (1 - max(remaining, 0) / float(self.threshold))
+
+    def wait(self):
+        """
+        Sleep for the delay returned by get_delay.
+        """
+        delay = self.get_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response):
+        """
+        Record the remaining quota and request cost reported by a response.  A rate limit error is treated as
+        an exhausted quota even if the header is missing.
+        """
+        remaining = _get_float_header(response, RATE_LIMIT_REMAINING_HEADER)
+        cost = _get_float_header(response, REQUEST_COST_HEADER)
+        if is_rate_limit_error(response):
+            remaining = 0.0
+        with self._lock:
+            if remaining is not None:
+                self.remaining = remaining
+            if cost is not None:
+                self.request_cost = cost
+
+
+def _get_float_header(response, header):
+    try:
+        return float(response.headers[header])
+    except (KeyError, TypeError, ValueError):
+        return None
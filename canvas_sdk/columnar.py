@@ -0,0 +1,370 @@
+"""
+Columnar export of paged list results.  Instead of building the full list of json objects with
+:py:func:`canvas_sdk.utils.get_all_list_data`, :py:func:`export_list_data` streams records page by page into
+fixed-size column buffers and hands each full batch to a writer, so exporting a whole term's submissions or page
+views takes memory proportional to the batch size only.  Ids, scores and timestamps are held in typed arrays and
+repeated strings like ``workflow_state`` are dictionary encoded:
+
+    columns = [Column('id', 'int'), Column('user_id', 'int'), Column('score', 'float'),
+               Column('submitted_at', 'timestamp'), Column('workflow_state', 'category')]
+    with open('submissions.csv', 'wb') as csv_file:
+        export_list_data(CsvWriter(csv_file, columns), request_context,
+                         submissions.list_assignment_submissions_courses, course_id, assignment_id)
+
+Writing Parquet files with :class:`ParquetWriter` requires pyarrow (``pip install canvas_python_sdk[parquet]``).
+"""
+import calendar
+import csv
+import re
+import time
+from array import array
+from itertools import izip
+
+from canvas_sdk import utils
+
+# Canvas timestamps are ISO 8601, e.g. '2012-07-01T23:59:00-06:00' or '2012-07-01T23:59:00Z'
+TIMESTAMP_PATTERN = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:(Z)|([+-])(\d{2}):?(\d{2}))?$')
+
+DEFAULT_BATCH_SIZE = 10000
+
+
+def parse_timestamp(value):
+    """
+    Return an ISO 8601 timestamp as whole seconds since the epoch (UTC).  Numbers are taken to be epoch seconds
+    already.  Timestamps without an offset are taken to be UTC.
+
+    :raises ValueError: if the value isn't an ISO 8601 timestamp
+    """
+    if isinstance(value, (int, long, float)):
+        return int(value)
+    match = TIMESTAMP_PATTERN.match(value)
+    if not match:
+        raise ValueError('%r is not an ISO 8601 timestamp' % (value,))
+    year, month, day, hour, minute, second, _, sign, offset_hours, offset_minutes = match.groups()
+    seconds = calendar.timegm((int(year), int(month), int(day), int(hour), int(minute), int(second), 0, 0, 0))
+    if sign:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        seconds -= offset if sign == '+' else -offset
+    return seconds
+
+
+def format_timestamp(seconds):
+    """
+    Return seconds since the epoch as an ISO 8601 UTC timestamp, the way Canvas writes them.
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+
+class Column(object):
+
+    """
+    A column of an export.
+
+    :param str name: Name of the column in the output
+    :param str kind: (optional) One of 'int', 'float', 'bool', 'timestamp' (stored as epoch seconds), 'string' or
+        'category' (a dictionary-encoded string, for values that repeat).  Defaults to 'string'.
+    :param str key: (optional) The key of the value in each json object, with dots separating the keys of nested
+        objects, e.g. 'grades.current_score'.  Defaults to name.
+    :raises ValueError: if kind isn't one of the column kinds
+    """
+
+    __slots__ = ('name', 'kind', 'key', 'path')
+
+    def __init__(self, name, kind='string', key=None):
+        if kind not in COLUMN_BUFFERS:
+            raise ValueError('%r is not a column kind; use one of %s' % (kind, ', '.join(sorted(COLUMN_BUFFERS))))
+        self.name = name
+        self.kind = kind
+        self.key = key or name
+        self.path = tuple(self.key.split('.'))
+
+    def __repr__(self):
+        return 'Column(%r, %r, %r)' % (self.name, self.kind, self.key)
+
+    def get_value(self, item):
+        """
+        Return the column's value in a json object (or record), or None if it is missing.
+        """
+        for part in self.path:
+            if item is None:
+                return None
+            if isinstance(item, dict):
+                item = item.get(part)
+            else:
+                item = getattr(item, part, None)
+        return item
+
+
+class ArrayColumnBuffer(object):
+
+    """
+    Buffer of numeric values in a typed array, with a byte per value recording whether it is present (not None).
+    A value that doesn't fit the array's type, e.g. an id above 2**31 where a C long is 32 bits (Windows and 32 bit
+    builds), moves the buffer's values to a list.
+
+    :param str typecode: The array's typecode
+    :param function convert: Converts a record's value to the value buffered
+    :param function output: (optional) Converts a buffered value to the value returned by to_list
+    """
+
+    def __init__(self, typecode, convert, output=None):
+        self.typecode = typecode
+        self.convert = convert
+        self.output = output
+        self.values = array(typecode)
+        self.valid = bytearray()
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, value):
+        if value is None:
+            self.values.append(0)
+            self.valid.append(0)
+        else:
+            value = self.convert(value)
+            try:
+                self.values.append(value)
+            except OverflowError:
+                self.values = self.values.tolist()
+                self.values.append(value)
+            self.valid.append(1)
+
+    def clear(self):
+        self.values = array(self.typecode)
+        self.valid = bytearray()
+
+    def to_list(self):
+        """
+        Return the buffered values as a list, with None for missing values.
+        """
+        if self.output is not None:
+            output = self.output
+            return [output(value) if valid else None for value, valid in izip(self.values, self.valid)]
+        return [value if valid else None for value, valid in izip(self.values, self.valid)]
+
+
+class StringColumnBuffer(object):
+
+    """
+    Buffer of string values.
+    """
+
+    def __init__(self):
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, value):
+        self.values.append(value)
+
+    def clear(self):
+        self.values = []
+
+    def to_list(self):
+        return list(self.values)
+
+
+class DictionaryColumnBuffer(object):
+
+    """
+    Buffer of dictionary-encoded strings: each distinct value is stored once in ``dictionary`` and the buffer
+    holds its index in a typed array (-1 for None).  The dictionary is kept across batches, so a value has the
+    same code in every batch of an export.
+    """
+
+    def __init__(self):
+        self.codes = array('l')
+        self.dictionary = []
+        self.index = {}
+
+    def __len__(self):
+        return len(self.codes)
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        self.codes.append(code)
+
+    def clear(self):
+        self.codes = array('l')
+
+    def to_list(self):
+        dictionary = self.dictionary
+        return [dictionary[code] if code >= 0 else None for code in self.codes]
+
+
+COLUMN_BUFFERS = {
+    'int': lambda: ArrayColumnBuffer('l', int),
+    'float': lambda: ArrayColumnBuffer('d', float),
+    'bool': lambda: ArrayColumnBuffer('b', bool),
+    # timestamps are held as doubles, which are 64 bits everywhere and hold whole seconds exactly
+    'timestamp': lambda: ArrayColumnBuffer('d', parse_timestamp, int),
+    'string': StringColumnBuffer,
+    'category': DictionaryColumnBuffer,
+}
+
+
+class ColumnarBatch(object):
+
+    """
+    A batch of records held as one buffer per column.
+    """
+
+    def __init__(self, columns):
+        self.columns = tuple(columns)
+        self.buffers = tuple(COLUMN_BUFFERS[column.kind]() for column in self.columns)
+
+    def __len__(self):
+        return len(self.buffers[0]) if self.buffers else 0
+
+    def append(self, item):
+        """
+        Add the column values of a json object (or record) to the batch.
+        """
+        for column, column_buffer in izip(self.columns, self.buffers):
+            column_buffer.append(column.get_value(item))
+
+    def clear(self):
+        for column_buffer in self.buffers:
+            column_buffer.clear()
+
+    def rows(self):
+        """
+        Iterate over the batch as tuples of values, with None for missing values.
+        """
+        return izip(*[column_buffer.to_list() for column_buffer in self.buffers])
+
+
+class CsvWriter(object):
+
+    """
+    Writes batches to a CSV file, with a header row of column names.  Missing values are written as empty
+    fields, timestamps as ISO 8601 UTC and booleans as 'true' or 'false'.
+
+    :param fileobj: A file opened for writing in binary mode
+    :param columns: The :class:`Column` instances of the export
+    :param bool header: (optional) Whether to write a header row.  Defaults to ``True``.
+    """
+
+    def __init__(self, fileobj, columns, header=True, **csv_kwargs):
+        self.columns = tuple(columns)
+        self.writer = csv.writer(fileobj, **csv_kwargs)
+        self.formatters = tuple(CSV_FORMATTERS.get(column.kind, _format_csv_value) for column in self.columns)
+        if header:
+            self.writer.writerow([_format_csv_value(column.name) for column in self.columns])
+
+    def write_batch(self, batch):
+        formatters = self.formatters
+        self.writer.writerows(
+            [formatter(value) if value is not None else '' for formatter, value in izip(formatters, row)]
+            for row in batch.rows())
+
+    def close(self):
+        pass
+
+
+def _format_csv_value(value):
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+
+CSV_FORMATTERS = {
+    'float': repr,
+    'bool': lambda value: 'true' if value else 'false',
+    'timestamp': format_timestamp,
+}
+
+
+class ParquetWriter(object):
+
+    """
+    Writes batches to a Parquet file as row groups, using pyarrow.  Timestamps are written as UTC timestamps in
+    seconds and 'category' columns as dictionary-encoded strings.
+
+    :param where: A path or a file opened for writing in binary mode
+    :param columns: The :class:`Column` instances of the export
+    :raises ImportError: if pyarrow isn't installed
+    """
+
+    def __init__(self, where, columns, **parquet_kwargs):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError('Writing Parquet files requires pyarrow: pip install canvas_python_sdk[parquet]')
+        self.pyarrow = pyarrow
+        self.columns = tuple(columns)
+        self.types = tuple(self.get_arrow_type(column.kind) for column in self.columns)
+        self.schema = pyarrow.schema([pyarrow.field(column.name, arrow_type)
+                                      for column, arrow_type in izip(self.columns, self.types)])
+        self.writer = pyarrow.parquet.ParquetWriter(where, self.schema, **parquet_kwargs)
+
+    def get_arrow_type(self, kind):
+        pyarrow = self.pyarrow
+        return {
+            'int': pyarrow.int64(),
+            'float': pyarrow.float64(),
+            'bool': pyarrow.bool_(),
+            'timestamp': pyarrow.timestamp('s', tz='UTC'),
+            'string': pyarrow.string(),
+            'category': pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        }[kind]
+
+    def write_batch(self, batch):
+        pyarrow = self.pyarrow
+        arrays = []
+        for column, arrow_type, column_buffer in izip(self.columns, self.types, batch.buffers):
+            if column.kind == 'category':
+                codes = [code if code >= 0 else None for code in column_buffer.codes]
+                arrays.append(pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.array(codes, type=pyarrow.int32()),
+                    pyarrow.array(column_buffer.dictionary, type=pyarrow.string())))
+            else:
+                arrays.append(pyarrow.array(column_buffer.to_list(), type=arrow_type))
+        self.writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def export_list_data(writer, request_context, function, *args, **kwargs):
+    """
+    Make a function request with args and kwargs and stream the records of the initial response and each of its
+    "next" responses into the writer, a batch of columns at a time.  Pages are requested as batches fill (see
+    :py:func:`canvas_sdk.utils.iter_list_data`, which also takes the max_items, stop_when, record_type and fields
+    keyword arguments), and neither the pages nor the records are kept once they are in a batch.  The writer is
+    closed when the export is done.
+
+        :param writer: A :class:`CsvWriter` or :class:`ParquetWriter`, or any object with columns, write_batch and
+            close attributes
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The API function to call
+        :param int batch_size: (optional) Number of records buffered before they are written.  Defaults to
+            DEFAULT_BATCH_SIZE.
+        :return: The number of records exported
+        :rtype: int
+    """
+    batch_size = kwargs.pop('batch_size', DEFAULT_BATCH_SIZE)
+    batch = ColumnarBatch(writer.columns)
+    count = 0
+    try:
+        for record in utils.iter_list_data(request_context, function, *args, **kwargs):
+            batch.append(record)
+            count += 1
+            if len(batch) >= batch_size:
+                writer.write_batch(batch)
+                batch.clear()
+        if len(batch):
+            writer.write_batch(batch)
+    finally:
+        writer.close()
+    return count
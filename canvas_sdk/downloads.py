@@ -0,0 +1,349 @@
+"""
+Streaming downloads of the files that Canvas jobs produce, like account reports
+(:py:func:`canvas_sdk.methods.account_reports.status_of_report`) and content exports
+(:py:func:`canvas_sdk.methods.content_exports.show_content_export`).  Artifacts are read in fixed-size chunks as
+they arrive, so a multi-hundred-MB provisioning CSV or course package never has to fit in memory:
+
+    report = account_reports.status_of_report(request_context, account_id, 'provisioning_csv', report_id).json()
+    download(request_context, report, '/data/provisioning.zip')
+
+    # or, without touching the disk
+    for entry in iter_zip_entries(iter_download(request_context, report)):
+        if entry.name == 'users.csv':
+            for row in iter_csv_rows(entry, as_dicts=True):
+                ...
+"""
+import codecs
+import csv
+import os
+import struct
+import zipfile
+import zlib
+
+from canvas_sdk.exceptions import CanvasAPIError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+LOCAL_FILE_HEADER = struct.Struct('<4sHHHHHIIIHH')
+LOCAL_FILE_HEADER_SIGNATURE = 'PK\x03\x04'
+DATA_DESCRIPTOR_SIGNATURE = 'PK\x07\x08'
+ZIP64_EXTRA_FIELD_ID = 0x0001
+# General purpose flags: the entry is encrypted, or its sizes and crc follow its data in a data descriptor
+FLAG_ENCRYPTED = 0x1
+FLAG_DATA_DESCRIPTOR = 0x8
+
+
+def get_artifact_url(job):
+    """
+    Return the url of the file a job produced: the url of its attachment (content exports, SIS import errors) or
+    its file_url (account reports).  A url is returned as it is.
+
+    :raises ValueError: if the job has no file (yet)
+    """
+    if isinstance(job, basestring):
+        return job
+    url = (job.get('attachment') or {}).get('url') or job.get('file_url')
+    if not url:
+        raise ValueError('Job %s has no file to download (workflow state: %s)' % (
+            job.get('id'), job.get('workflow_state') or job.get('status')))
+    return url
+
+
+def iter_download(request_context, job_or_url, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Download a file in chunks, with the request context's session.  The request is made when iteration starts,
+    and the connection is released when it ends.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param job_or_url: A file url, or the json of a report or export (see :py:func:`get_artifact_url`)
+        :param int chunk_size: (optional) Number of bytes read at a time
+        :return: chunks of the file's content
+        :rtype: iterator
+        :raises CanvasAPIError: if the download is refused
+    """
+    url = get_artifact_url(job_or_url)
+    # Files are redirected off the Canvas host, and requests drops the auth header when it follows those
+    response = request_context.session.get(url, stream=True, timeout=request_context.timeout)
+    try:
+        if response.status_code >= 400:
+            raise CanvasAPIError(status_code=response.status_code, msg=response.text.strip())
+        for chunk in response.iter_content(chunk_size):
+            if chunk:
+                yield chunk
+    finally:
+        response.close()
+
+
+def download(request_context, job_or_url, destination, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Download a file to a path, a file object, or a callback, a chunk at a time.  A file downloaded to a path is
+    written to a '.part' file first, so the path only ever holds complete files.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param job_or_url: A file url, or the json of a report or export (see :py:func:`get_artifact_url`)
+        :param destination: A path, a file object opened for writing in binary mode, or a function that is
+            called with each chunk
+        :param int chunk_size: (optional) Number of bytes read at a time
+        :return: Number of bytes downloaded
+        :rtype: int
+        :raises CanvasAPIError: if the download is refused
+    """
+    chunks = iter_download(request_context, job_or_url, chunk_size)
+    if callable(destination):
+        return _write_chunks(chunks, destination)
+    if hasattr(destination, 'write'):
+        return _write_chunks(chunks, destination.write)
+    part_path = destination + '.part'
+    try:
+        with open(part_path, 'wb') as part_file:
+            size = _write_chunks(chunks, part_file.write)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    if os.name == 'nt' and os.path.exists(destination):
+        os.remove(destination)
+    os.rename(part_path, destination)
+    return size
+
+
+def _write_chunks(chunks, write):
+    size = 0
+    for chunk in chunks:
+        write(chunk)
+        size += len(chunk)
+    return size
+
+
+class _ChunkReader(object):
+
+    """
+    Reads exact numbers of bytes from an iterator of chunks.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = ''
+
+    def read(self, size):
+        """
+        Read size bytes, or fewer if the chunks run out.
+        """
+        pieces = [self.buffer]
+        length = len(self.buffer)
+        while length < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            pieces.append(chunk)
+            length += len(chunk)
+        data = ''.join(pieces)
+        self.buffer = data[size:]
+        return data[:size]
+
+    def read_exactly(self, size):
+        data = self.read(size)
+        if len(data) < size:
+            raise zipfile.BadZipfile('Zip file ended unexpectedly')
+        return data
+
+    def read_chunk(self, size):
+        """
+        Read up to size bytes, at most one chunk's worth; '' at the end.
+        """
+        if not self.buffer:
+            self.buffer = next(self.chunks, '')
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def unread(self, data):
+        self.buffer = data + self.buffer
+
+
+class ZipEntry(object):
+
+    """
+    A file in a zip archive that is being read as a stream.  Iterating over it yields its decompressed content in
+    chunks, and its crc is checked at the end.  The content must be read before moving on to the next entry;
+    the rest of an entry that isn't read is skipped.
+
+    :ivar str name: The entry's name
+    :ivar int size: The entry's uncompressed size, or None if the archive only gives it after the content
+    """
+
+    def __init__(self, reader, name, method, flags, crc, compressed_size, size, zip64, chunk_size):
+        self.name = name
+        self.size = None if flags & FLAG_DATA_DESCRIPTOR else size
+        self._reader = reader
+        self._method = method
+        self._flags = flags
+        self._crc = crc
+        self._compressed_size = compressed_size
+        self._zip64 = zip64
+        self._chunk_size = chunk_size
+        self._content = self._iter_content()
+
+    def __repr__(self):
+        return '<ZipEntry %s>' % self.name
+
+    def __iter__(self):
+        return self._content
+
+    def _iter_content(self):
+        crc = 0
+        if self._method == zipfile.ZIP_DEFLATED:
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            remaining = None if self._flags & FLAG_DATA_DESCRIPTOR else self._compressed_size
+            while remaining is None or remaining > 0:
+                data = self._reader.read_chunk(self._chunk_size if remaining is None
+                                               else min(self._chunk_size, remaining))
+                if not data:
+                    raise zipfile.BadZipfile('Zip file ended in entry %s' % self.name)
+                if remaining is not None:
+                    remaining -= len(data)
+                content = decompressor.decompress(data)
+                if decompressor.unused_data:
+                    # the deflate stream ended inside this chunk; the rest belongs to what follows the entry
+                    self._reader.unread(decompressor.unused_data)
+                    remaining = 0
+                if content:
+                    crc = zlib.crc32(content, crc)
+                    yield content
+            content = decompressor.flush()
+            if content:
+                crc = zlib.crc32(content, crc)
+                yield content
+        elif self._method == zipfile.ZIP_STORED:
+            if self._flags & FLAG_DATA_DESCRIPTOR:
+                raise zipfile.BadZipfile('Stored entry %s has no size, so it can\'t be streamed' % self.name)
+            remaining = self._compressed_size
+            while remaining > 0:
+                content = self._reader.read_chunk(min(self._chunk_size, remaining))
+                if not content:
+                    raise zipfile.BadZipfile('Zip file ended in entry %s' % self.name)
+                remaining -= len(content)
+                crc = zlib.crc32(content, crc)
+                yield content
+        else:
+            raise zipfile.BadZipfile('Entry %s uses unsupported compression method %d' % (self.name, self._method))
+        expected_crc = self._crc
+        if self._flags & FLAG_DATA_DESCRIPTOR:
+            expected_crc = self._read_data_descriptor()
+        if crc & 0xffffffff != expected_crc:
+            raise zipfile.BadZipfile('Bad CRC-32 for entry %s' % self.name)
+
+    def _read_data_descriptor(self):
+        """
+        Read the data descriptor that follows the content, returning its crc.
+        """
+        crc = self._reader.read_exactly(4)
+        if crc == DATA_DESCRIPTOR_SIGNATURE:
+            crc = self._reader.read_exactly(4)
+        self._reader.read_exactly(16 if self._zip64 else 8)
+        return struct.unpack('<I', crc)[0]
+
+    def skip(self):
+        """
+        Read past the rest of the entry's content.
+        """
+        for _ in self._content:
+            pass
+
+
+def _get_zip64_sizes(extra, compressed_size, size):
+    """
+    Return the sizes of an entry from the zip64 extra field of its local header, if it has one.
+    """
+    position = 0
+    while position + 4 <= len(extra):
+        field_id, field_size = struct.unpack('<HH', extra[position:position + 4])
+        if field_id == ZIP64_EXTRA_FIELD_ID:
+            values = extra[position + 4:position + 4 + field_size]
+            if size == 0xffffffff and len(values) >= 8:
+                size, values = struct.unpack('<Q', values[:8])[0], values[8:]
+            if compressed_size == 0xffffffff and len(values) >= 8:
+                compressed_size = struct.unpack('<Q', values[:8])[0]
+            return compressed_size, size, True
+        position += 4 + field_size
+    return compressed_size, size, False
+
+
+def iter_zip_entries(chunks, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read a zip archive as it is downloaded, yielding a :class:`ZipEntry` for each of its files in the order they
+    are stored.  Unlike :py:mod:`zipfile`, this reads the local file headers rather than the central directory at
+    the end, so the archive never needs to be on disk or in memory.
+
+        :param chunks: An iterable of the archive's content in chunks, e.g. from :py:func:`iter_download`
+        :param int chunk_size: (optional) Maximum number of bytes decompressed at a time
+        :rtype: iterator of :class:`ZipEntry`
+        :raises zipfile.BadZipfile: if the archive is damaged or an entry can't be read as a stream
+    """
+    reader = _ChunkReader(chunks)
+    while True:
+        header = reader.read(LOCAL_FILE_HEADER.size)
+        if header[:4] != LOCAL_FILE_HEADER_SIGNATURE:
+            # the central directory (or the end of the archive) follows the last entry
+            return
+        if len(header) < LOCAL_FILE_HEADER.size:
+            raise zipfile.BadZipfile('Zip file ended unexpectedly')
+        (_, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = LOCAL_FILE_HEADER.unpack(header)
+        if flags & FLAG_ENCRYPTED:
+            raise zipfile.BadZipfile('Encrypted zip entries are not supported')
+        name = reader.read_exactly(name_length)
+        extra = reader.read_exactly(extra_length)
+        compressed_size, size, zip64 = _get_zip64_sizes(extra, compressed_size, size)
+        entry = ZipEntry(reader, name, method, flags, crc, compressed_size, size, zip64, chunk_size)
+        yield entry
+        entry.skip()
+
+
+def _iter_lines(chunks):
+    """
+    Split chunks of text into lines, keeping their line endings.
+    """
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    if pending:
+        yield pending
+
+
+def iter_csv_rows(chunks, as_dicts=False, encoding='utf-8', **csv_kwargs):
+    """
+    Parse CSV content as it is downloaded, yielding its rows with their values decoded.  A byte order mark at
+    the start of the content is skipped.
+
+        :param chunks: An iterable of the CSV content in chunks, e.g. from :py:func:`iter_download` or a
+            :class:`ZipEntry`
+        :param bool as_dicts: (optional) If ``True``, the first row is the header and the others are yielded as
+            dictionaries keyed by it.  Defaults to ``False`` (rows are lists).
+        :param str encoding: (optional) Encoding of the content.  Defaults to 'utf-8'.
+        :rtype: iterator
+    """
+    lines = _iter_lines(chunks)
+    first_line = next(lines, None)
+    if first_line is None:
+        return
+    if first_line.startswith(codecs.BOM_UTF8):
+        first_line = first_line[len(codecs.BOM_UTF8):]
+
+    def all_lines():
+        yield first_line
+        for line in lines:
+            yield line
+
+    rows = csv.reader(all_lines(), **csv_kwargs)
+    header = None
+    for row in rows:
+        row = [value.decode(encoding) for value in row]
+        if not as_dicts:
+            yield row
+        elif header is None:
+            header = row
+        else:
+            yield dict(zip(header, row))
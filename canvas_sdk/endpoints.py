@@ -0,0 +1,150 @@
+"""
+The endpoint table behind the generated functions in :py:mod:`canvas_sdk.methods`.  Each method module holds an
+ENDPOINTS table describing its api calls (verb, path template, arguments, payload keys and enums), and each of its
+functions is a thin wrapper that passes its path values and payload to the request function of the matching
+:class:`Endpoint`, which validates them and makes the request.  Methods whose request building doesn't fit the
+table are written out in full instead.
+"""
+import re
+import sys
+
+from canvas_sdk import client, utils
+
+PATH_PARAMETER_PATTERN = re.compile(r'\{([^}]+)\}')
+
+NONE_VALUES = frozenset([None])
+
+
+class Endpoint(object):
+
+    """
+    One Canvas api call.
+
+    :param str name: Name of the generated function that wraps the endpoint
+    :param str method: HTTP verb, e.g. 'GET'
+    :param str path: Api path template, e.g. '/v1/courses/{course_id}/sections'
+    :param arguments: The function's arguments, in signature order (not counting request_ctx and request_kwargs).
+        Each is either a name, which is a path parameter if it appears in the path template and a payload key
+        otherwise, or a (payload key, name) pair, e.g. ('include[]', 'include').
+    :param enums: (optional) (name, acceptable values) pairs for payload arguments that are validated with
+        :py:func:`canvas_sdk.utils.validate_attr_is_acceptable`, in the order they are checked
+    """
+
+    __slots__ = ('name', 'method', 'path', 'argument_names', 'url_template', 'path_indexes', 'payload_indexes',
+                 'enum_indexes', 'per_page_index', 'client_function_name', 'request')
+
+    def __init__(self, name, method, path, arguments=(), enums=()):
+        self.name = name
+        self.method = method
+        self.path = path
+        names = []
+        keys = []
+        for argument in arguments:
+            if isinstance(argument, tuple):
+                key, argument = argument
+            else:
+                key = argument
+            names.append(argument)
+            keys.append(key)
+        self.argument_names = tuple(names)
+        # Precompile the path template into a %-format string and the positions of the arguments that fill it, so
+        # that building a url is a single string interpolation
+        path_names = PATH_PARAMETER_PATTERN.findall(path)
+        self.url_template = PATH_PARAMETER_PATTERN.sub('%s', path.replace('%', '%%'))
+        self.path_indexes = tuple(names.index(path_name) for path_name in path_names)
+        self.payload_indexes = tuple((key, index) for index, key in enumerate(keys) if names[index] not in path_names)
+        # Acceptable values are kept as frozensets so that validation is a hash lookup; a single value given as a
+        # plain string is one value, not a set of characters
+        self.enum_indexes = tuple(
+            (names.index(enum_name), frozenset((values,) if isinstance(values, basestring) else values))
+            for enum_name, values in enums)
+        # list endpoints take a per_page argument that defaults to the request context's per_page
+        self.per_page_index = names.index('per_page') if 'per_page' in names else None
+        self.client_function_name = method.lower()
+        self.request = self.build_request_function()
+
+    def __repr__(self):
+        return '<Endpoint %s %s %s>' % (self.name, self.method, self.path)
+
+    @property
+    def path_arguments(self):
+        """
+        Names of the arguments that fill the path template, in the order they appear in it.
+        """
+        return tuple(self.argument_names[index] for index in self.path_indexes)
+
+    @property
+    def payload_keys(self):
+        """
+        (payload key, argument name) pairs for the arguments sent in the payload.
+        """
+        return tuple((key, self.argument_names[index]) for key, index in self.payload_indexes)
+
+    @property
+    def enums(self):
+        """
+        (argument name, frozenset of acceptable values) pairs, in the order they are validated.
+        """
+        return tuple((self.argument_names[index], values) for index, values in self.enum_indexes)
+
+    def build_request_function(self):
+        """
+        Return the function that the generated methods call to make the api call and return the response:
+        request(request_ctx, request_kwargs, path_values, payload), with the tuple of values filling the path
+        template, in path order, and the payload dictionary, or None if the endpoint has no payload arguments.  The
+        generated methods write both out as literals, and everything that doesn't depend on the values is worked
+        out here, once, and held by the function as closure variables.
+        """
+        payload_keys = dict((index, key) for key, index in self.payload_indexes)
+        # each enum is checked against its acceptable values plus None in a single lookup; the full check, which
+        # raises the error, only runs for lists and for unacceptable or unhashable values
+        enum_checks = tuple((payload_keys[index], values | NONE_VALUES, values) for index, values in self.enum_indexes)
+        per_page_key = payload_keys.get(self.per_page_index)
+        url_template = self.url_template
+        # the client functions are looked up on each call, so that they can be patched in tests
+        client_functions = vars(client)
+        client_function_name = self.client_function_name
+
+        def request(request_ctx, request_kwargs, path_values, payload):
+            for key, check_values, acceptable_values in enum_checks:
+                try:
+                    if payload[key] in check_values:
+                        continue
+                except TypeError:
+                    pass
+                utils.validate_attr_is_acceptable(payload[key], acceptable_values)
+            url = request_ctx.base_api_url + url_template % path_values
+            if payload is None:
+                return client_functions[client_function_name](request_ctx, url, **request_kwargs)
+            if per_page_key is not None and payload[per_page_key] is None:
+                payload[per_page_key] = request_ctx.per_page
+            return client_functions[client_function_name](request_ctx, url, payload=payload, **request_kwargs)
+        return request
+
+    def __call__(self, request_ctx, request_kwargs, *values):
+        """
+        Make the api call with the values of the arguments, given in signature order, and return the response.
+        """
+        path_values = tuple(values[index] for index in self.path_indexes)
+        payload = dict((key, values[index]) for key, index in self.payload_indexes) if self.payload_indexes else None
+        return self.request(request_ctx, request_kwargs, path_values, payload)
+
+    @classmethod
+    def table(cls, rows):
+        """
+        Build a method module's ENDPOINTS table, a dictionary of endpoints keyed by function name, from
+        (name, method, path, arguments[, enums]) rows.
+        """
+        endpoints = {}
+        for row in rows:
+            endpoint = cls(*row)
+            endpoints[endpoint.name] = endpoint
+        return endpoints
+
+
+def get_endpoint(function):
+    """
+    Return the :class:`Endpoint` wrapped by a generated function, or None if the function builds its request itself.
+    """
+    module = sys.modules.get(function.__module__)
+    return getattr(module, 'ENDPOINTS', {}).get(function.__name__)
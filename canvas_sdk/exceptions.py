@@ -38,3 +38,24 @@ class CanvasAPIError(SDKException):
             return u'%s: %s' % (self.status_code, self.error_msg)
         else:
             return u'%s' % self.status_code
+
+
+class JobFailedError(SDKException):
+
+    """
+    Error for a Canvas job (a progress, report, SIS import, content export or content migration) that finished
+    without succeeding.  Contains the job's json as it was last polled.
+    """
+
+    def __init__(self, job):
+        self.job = job
+        self.workflow_state = job.get('workflow_state') or job.get('status')
+
+    def __str__(self):
+        return self.__unicode__().encode('utf-8')
+
+    def __unicode__(self):
+        message = self.job.get('message')
+        if message:
+            return u'Job %s %s: %s' % (self.job.get('id'), self.workflow_state, message)
+        return u'Job %s %s' % (self.job.get('id'), self.workflow_state)
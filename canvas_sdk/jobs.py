@@ -0,0 +1,275 @@
+"""
+Polling of long-running Canvas jobs.  A :class:`JobPoller` supervises any number of outstanding jobs from a single
+background thread, polling each one with its status function and resolving a future with the job's json when it
+finishes:
+
+    poller = JobPoller(request_context)
+    futures = [poller.submit(content_exports.show_content_export, course_id, export['id'])
+               for course_id, export in exports]
+    for future in concurrent.futures.as_completed(futures):
+        download(request_context, future.result(), ...)
+    poller.shutdown()
+
+Any function that returns a job's json can be polled, e.g. :py:func:`canvas_sdk.methods.progress.query_progress`,
+:py:func:`canvas_sdk.methods.account_reports.status_of_report`,
+:py:func:`canvas_sdk.methods.sis_imports.get_sis_import_status`,
+:py:func:`canvas_sdk.methods.content_exports.show_content_export` and
+:py:func:`canvas_sdk.methods.content_migrations.get_content_migration_courses`.  A job is finished once its
+workflow_state (or status, for reports) is one of SUCCEEDED_STATES or FAILED_STATES.
+
+Each job is first polled initial_interval seconds after it is submitted.  The interval then grows by multiplier
+with every poll, up to max_interval, so long jobs are polled less and less often.  When a job reports its
+completion percentage, the interval is also capped at the time the job's progress so far says it has left, so a
+job about to finish is polled sooner.
+
+A poll that fails with a transient error (a connection error, a timeout, or a CanvasAPIError with one of the
+status codes the client retries) is retried on the same backoff; the job's future fails only after max_errors
+consecutive transient errors, or on any other error.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from concurrent.futures import Future
+from requests.exceptions import ConnectionError, Timeout
+
+from canvas_sdk.client.base import RETRY_ERROR_CODES
+from canvas_sdk.exceptions import CanvasAPIError, JobFailedError
+
+log = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_INTERVAL = 1.0
+
+DEFAULT_MAX_INTERVAL = 60.0
+
+DEFAULT_INTERVAL_MULTIPLIER = 1.5
+
+# Number of consecutive transient errors polling a job after which its future fails
+DEFAULT_MAX_POLL_ERRORS = 5
+
+# States of the jobs' workflow_state (or a report's status) in which they have finished successfully; a content
+# migration that is waiting_for_select won't make progress until content is selected for it, so it counts as done
+SUCCEEDED_STATES = frozenset([
+    'completed', 'complete', 'exported', 'imported', 'imported_with_messages', 'restored', 'partially_restored',
+    'waiting_for_select',
+])
+
+FAILED_STATES = frozenset(['failed', 'failed_with_messages', 'error', 'aborted', 'deleted'])
+
+
+def get_job_state(job):
+    """
+    Return the state of a job: its workflow_state, or its status for account reports.
+    """
+    return job.get('workflow_state') or job.get('status')
+
+
+def get_job_completion(job):
+    """
+    Return a job's percentage of completion (its completion, or its progress for reports and SIS imports), or
+    None if it doesn't report one.
+    """
+    completion = job.get('completion')
+    if completion is None:
+        completion = job.get('progress')
+    if isinstance(completion, (int, long, float)):
+        return float(completion)
+    return None
+
+
+def is_transient_error(error):
+    """
+    Return True if an error raised while polling a job is worth retrying: a connection error, a timeout, or a
+    CanvasAPIError with one of the status codes in RETRY_ERROR_CODES.
+    """
+    if isinstance(error, (ConnectionError, Timeout)):
+        return True
+    return isinstance(error, CanvasAPIError) and error.status_code in RETRY_ERROR_CODES
+
+
+class _Job(object):
+
+    """
+    A job being polled, and the state of its polling.
+    """
+
+    __slots__ = ('function', 'args', 'kwargs', 'future', 'interval', 'completion', 'polled_at', 'errors')
+
+    def __init__(self, function, args, kwargs, future, interval):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+        self.interval = interval
+        self.completion = None
+        self.polled_at = None
+        # number of consecutive polls that failed with a transient error
+        self.errors = 0
+
+
+class JobPoller(object):
+
+    """
+    Polls outstanding jobs on a background thread with adaptive intervals (see :py:mod:`canvas_sdk.jobs`) and
+    resolves their futures when they finish.  The thread is started by the first submit and runs until shutdown.
+
+    :param RequestContext request_context: The context required to make an API call
+    :param float initial_interval: (optional) Seconds before a job is first polled, and the shortest interval
+        between polls
+    :param float max_interval: (optional) Longest interval in seconds between polls of a job
+    :param float multiplier: (optional) Factor the interval grows by with each poll
+    :param int max_errors: (optional) Number of consecutive transient errors polling a job after which its future
+        fails with the last of them
+    """
+
+    def __init__(self, request_context, initial_interval=DEFAULT_INITIAL_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL, multiplier=DEFAULT_INTERVAL_MULTIPLIER,
+                 max_errors=DEFAULT_MAX_POLL_ERRORS):
+        self.request_context = request_context
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.max_errors = max_errors
+        # (due time, sequence, job) entries, ordered by the time each job is due to be polled
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._shutdown = False
+
+    def __len__(self):
+        """
+        Return the number of jobs being polled.
+        """
+        with self._condition:
+            return len(self._schedule)
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Start polling a job, calling function(request_context, *args, **kwargs) to get its json.  Cancelling the
+        returned future stops the polling.
+
+            :param function function: The job's status function, e.g. progress.query_progress
+            :return: A future that resolves to the job's json once it has succeeded, or raises
+                :class:`JobFailedError <canvas_sdk.exceptions.JobFailedError>` if it failed (or the exception
+                that made polling it fail for good)
+            :rtype: concurrent.futures.Future
+            :raises RuntimeError: if the poller has been shut down
+        """
+        future = Future()
+        job = _Job(function, args, kwargs, future, self.initial_interval)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit jobs after the poller has been shut down')
+            self._schedule_job(job, time.time() + self.initial_interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='canvas-job-poller')
+                self._thread.daemon = True
+                self._thread.start()
+        return future
+
+    def _schedule_job(self, job, due):
+        """
+        Add a job to the schedule; the condition must be held.
+        """
+        heapq.heappush(self._schedule, (due, next(self._sequence), job))
+        self._condition.notify()
+
+    def get_next_interval(self, job, completion, now):
+        """
+        Return the number of seconds until a job that isn't finished is polled again, given the completion it
+        reported at the poll made now.
+        """
+        interval = min(self.max_interval, job.interval * self.multiplier)
+        if (completion is not None and job.completion is not None and completion > job.completion and
+                now > job.polled_at):
+            rate = (completion - job.completion) / (now - job.polled_at)
+            interval = min(interval, (100.0 - completion) / rate)
+        return max(self.initial_interval, interval)
+
+    def poll(self, job):
+        """
+        Poll a job once, resolving its future if it has finished (or polling it failed for good).  Returns ``True``
+        if it has.
+        """
+        try:
+            data = job.function(self.request_context, *job.args, **job.kwargs).json()
+        except Exception as error:
+            job.errors += 1
+            if is_transient_error(error) and job.errors < self.max_errors:
+                log.warning('Polling job with %s%r failed (%d of %d): %s; retrying', job.function.__name__,
+                            job.args, job.errors, self.max_errors, error)
+                now = time.time()
+                job.interval = self.get_next_interval(job, None, now)
+                job.polled_at = now
+                return False
+            log.warning('Polling job with %s%r failed: %s', job.function.__name__, job.args, error)
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+            return True
+        job.errors = 0
+        state = get_job_state(data)
+        if state in SUCCEEDED_STATES or state in FAILED_STATES:
+            if job.future.set_running_or_notify_cancel():
+                if state in SUCCEEDED_STATES:
+                    job.future.set_result(data)
+                else:
+                    job.future.set_exception(JobFailedError(data))
+            return True
+        now = time.time()
+        completion = get_job_completion(data)
+        job.interval = self.get_next_interval(job, completion, now)
+        job.completion = completion
+        job.polled_at = now
+        return False
+
+    def poll_due_jobs(self):
+        """
+        Poll every job that is due and reschedule those that haven't finished.  Jobs whose futures were cancelled
+        are dropped without being polled.
+        """
+        now = time.time()
+        due_jobs = []
+        with self._condition:
+            while self._schedule and self._schedule[0][0] <= now:
+                due_jobs.append(heapq.heappop(self._schedule)[2])
+        for job in due_jobs:
+            if job.future.cancelled() or self.poll(job):
+                continue
+            with self._condition:
+                if self._shutdown:
+                    job.future.cancel()
+                else:
+                    self._schedule_job(job, job.polled_at + job.interval)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._shutdown:
+                    if self._schedule:
+                        wait = self._schedule[0][0] - time.time()
+                        if wait <= 0:
+                            break
+                        self._condition.wait(wait)
+                    else:
+                        self._condition.wait()
+                if self._shutdown:
+                    return
+            self.poll_due_jobs()
+
+    def shutdown(self, wait=True):
+        """
+        Stop polling.  The futures of jobs that haven't finished are cancelled.
+
+            :param bool wait: (optional) If ``True`` (the default), wait for a poll in progress to end
+        """
+        with self._condition:
+            self._shutdown = True
+            schedule, self._schedule = self._schedule, []
+            self._condition.notify()
+        for _, _, job in schedule:
+            job.future.cancel()
+        if wait and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
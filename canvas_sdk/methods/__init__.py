@@ -0,0 +1,87 @@
+"""
+The modules in this package are generated from the Canvas API documentation (see scripts/generate_sdk_methods.py)
+and are imported lazily, since importing all of them is a significant part of the SDK's startup time.  Accessing a
+submodule as an attribute of the package, including through "from canvas_sdk.methods import courses" or
+"from canvas_sdk.methods import *", returns a :class:`LazyModule` that imports the real module the first time one of
+its attributes is used.  Importing a submodule by its full name (e.g. "import canvas_sdk.methods.courses") imports
+it immediately, as usual.
+"""
+import importlib
+import os
+import pkgutil
+import sys
+import types
+
+MODULE_SUFFIXES = ('.py', '.pyc', '.pyo')
+
+
+def _list_modules(path):
+    # Listing the package directory takes a fraction of a millisecond, where pkgutil.iter_modules, which checks
+    # each file in turn, takes several; pkgutil is still used for a package that isn't a directory (a zipped egg)
+    try:
+        file_names = os.listdir(path[0])
+    except OSError:
+        return sorted(name for _, name, is_package in pkgutil.iter_modules(path) if not is_package)
+    return sorted(set(os.path.splitext(file_name)[0] for file_name in file_names
+                      if file_name.endswith(MODULE_SUFFIXES) and not file_name.startswith('__init__.')))
+
+
+__all__ = _list_modules(__path__)
+
+
+class LazyModule(types.ModuleType):
+
+    """
+    Stand-in for a submodule of :py:mod:`canvas_sdk.methods` that imports the module on first attribute access and
+    then delegates attribute access to it.
+    """
+
+    def _load(self):
+        module = self.__dict__.get('_module')
+        if module is None:
+            module = self.__dict__['_module'] = importlib.import_module(self.__name__)
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return "<lazy module '%s'>" % self.__name__
+
+
+class _MethodsPackage(types.ModuleType):
+
+    """
+    Module type of the :py:mod:`canvas_sdk.methods` package, which returns a :class:`LazyModule` for any submodule
+    that has not been imported yet (an imported submodule is set as an attribute of the package by the import
+    system, so this is only called for submodules that haven't been).
+    """
+
+    def __getattr__(self, name):
+        if name not in self.__all__:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        module = sys.modules.get('%s.%s' % (self.__name__, name)) or LazyModule('%s.%s' % (self.__name__, name))
+        setattr(self, name, module)
+        return module
+
+
+def _install_lazy_package():
+    # Python 2 has no module level __getattr__, so the package is replaced in sys.modules by an equivalent module
+    # of a type that provides one.  The original module is kept referenced so that its globals are not cleared.
+    module = sys.modules[__name__]
+    package = _MethodsPackage(__name__, __doc__)
+    package.__dict__.update(module.__dict__)
+    package._original_module = module
+    sys.modules[__name__] = package
+
+
+_install_lazy_package()
@@ -1,4 +1,17 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_authorization_configs', 'GET', '/v1/accounts/{account_id}/account_authorization_configs', ('account_id', 'per_page')),
+    ('create_authorization_config', 'POST', '/v1/accounts/{account_id}/account_authorization_configs', ('account_id',)),
+    ('update_authorization_config', 'PUT', '/v1/accounts/{account_id}/account_authorization_configs/{id}', ('account_id', 'id')),
+    ('get_authorization_config', 'GET', '/v1/accounts/{account_id}/account_authorization_configs/{id}', ('account_id', 'id')),
+    ('delete_authorization_config', 'DELETE', '/v1/accounts/{account_id}/account_authorization_configs/{id}', ('account_id', 'id')),
+    ('get_discovery_url', 'GET', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url', ('account_id',)),
+    ('set_discovery_url', 'PUT', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url', ('account_id',)),
+    ('delete_discovery_url', 'DELETE', '/v1/accounts/{account_id}/account_authorization_configs/discovery_url', ('account_id',)),
+])
+
 
 def list_authorization_configs(request_ctx, account_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +28,7 @@ def list_authorization_configs(request_ctx, account_id, per_page=None, **request
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/account_authorization_configs'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_authorization_configs'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def create_authorization_config(request_ctx, account_id, **request_kwargs):
@@ -212,11 +216,7 @@ def create_authorization_config(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_authorization_config'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def update_authorization_config(request_ctx, account_id, id, **request_kwargs):
@@ -235,11 +235,7 @@ def update_authorization_config(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_authorization_config'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def get_authorization_config(request_ctx, account_id, id, **request_kwargs):
@@ -257,11 +253,7 @@ def get_authorization_config(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_authorization_config'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def delete_authorization_config(request_ctx, account_id, id, **request_kwargs):
@@ -279,11 +271,7 @@ def delete_authorization_config(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_authorization_config'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def get_discovery_url(request_ctx, account_id, **request_kwargs):
@@ -299,11 +287,7 @@ def get_discovery_url(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_discovery_url'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def set_discovery_url(request_ctx, account_id, **request_kwargs):
@@ -325,11 +309,7 @@ def set_discovery_url(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['set_discovery_url'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def delete_discovery_url(request_ctx, account_id, **request_kwargs):
@@ -345,10 +325,6 @@ def delete_discovery_url(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/account_authorization_configs/discovery_url'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_discovery_url'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('search_account_domains', 'GET', '/v1/accounts/search', ('name', 'domain', 'latitude', 'longitude')),
+])
+
 
 def search_account_domains(request_ctx, name=None, domain=None, latitude=None, longitude=None, **request_kwargs):
     """
@@ -21,16 +27,6 @@ def search_account_domains(request_ctx, name=None, domain=None, latitude=None, l
 
     """
 
-    path = '/v1/accounts/search'
-    payload = {
-        'name' : name,
-        'domain' : domain,
-        'latitude' : latitude,
-        'longitude' : longitude,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['search_account_domains'].request(request_ctx, request_kwargs, (), {'name': name, 'domain': domain, 'latitude': latitude, 'longitude': longitude})
 
 
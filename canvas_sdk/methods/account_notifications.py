@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('create_global_notification', 'POST', '/v1/accounts/{account_id}/account_notifications', ('account_id', ('account_notification[subject]', 'account_notification_subject'), ('account_notification[message]', 'account_notification_message'), ('account_notification[start_at]', 'account_notification_start_at'), ('account_notification[end_at]', 'account_notification_end_at'), ('account_notification[icon]', 'account_notification_icon'), 'account_notification_roles'), (('account_notification_icon', ('warning', 'information', 'question', 'error', 'calendar')),)),
+])
+
 
 def create_global_notification(request_ctx, account_id, account_notification_subject=None, account_notification_message=None, account_notification_start_at=None, account_notification_end_at=None, account_notification_icon=None, account_notification_roles=None, **request_kwargs):
     """
@@ -25,20 +31,6 @@ def create_global_notification(request_ctx, account_id, account_notification_sub
 
     """
 
-    account_notification_icon_types = ('warning', 'information', 'question', 'error', 'calendar')
-    utils.validate_attr_is_acceptable(account_notification_icon, account_notification_icon_types)
-    path = '/v1/accounts/{account_id}/account_notifications'
-    payload = {
-        'account_notification[subject]' : account_notification_subject,
-        'account_notification[message]' : account_notification_message,
-        'account_notification[start_at]' : account_notification_start_at,
-        'account_notification[end_at]' : account_notification_end_at,
-        'account_notification[icon]' : account_notification_icon,
-        'account_notification_roles' : account_notification_roles,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_global_notification'].request(request_ctx, request_kwargs, (account_id,), {'account_notification[subject]': account_notification_subject, 'account_notification[message]': account_notification_message, 'account_notification[start_at]': account_notification_start_at, 'account_notification[end_at]': account_notification_end_at, 'account_notification[icon]': account_notification_icon, 'account_notification_roles': account_notification_roles})
 
 
@@ -1,5 +1,13 @@
 from canvas_sdk import client, utils
 import re
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_available_reports', 'GET', '/v1/accounts/{account_id}/reports', ('account_id',)),
+    ('index_of_reports', 'GET', '/v1/accounts/{account_id}/reports/{report}', ('account_id', 'report', 'per_page')),
+    ('status_of_report', 'GET', '/v1/accounts/{account_id}/reports/{report}/{id}', ('account_id', 'report', 'id')),
+    ('delete_report', 'DELETE', '/v1/accounts/{account_id}/reports/{report}/{id}', ('account_id', 'report', 'id')),
+])
 
 
 def list_available_reports(request_ctx, account_id, **request_kwargs):
@@ -15,11 +23,7 @@ def list_available_reports(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/reports'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_available_reports'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def start_report(request_ctx, account_id, report, parameters, **request_kwargs):
@@ -52,6 +56,7 @@ def start_report(request_ctx, account_id, report, parameters, **request_kwargs):
     return response
 
 
+
 def index_of_reports(request_ctx, account_id, report, per_page=None, **request_kwargs):
     """
     Shows all reports that have been run for the account of a specific type.
@@ -69,16 +74,7 @@ def index_of_reports(request_ctx, account_id, report, per_page=None, **request_k
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/reports/{report}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['index_of_reports'].request(request_ctx, request_kwargs, (account_id, report), {'per_page': per_page})
 
 
 def status_of_report(request_ctx, account_id, report, id, **request_kwargs):
@@ -98,11 +94,7 @@ def status_of_report(request_ctx, account_id, report, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/reports/{report}/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['status_of_report'].request(request_ctx, request_kwargs, (account_id, report, id), None)
 
 
 def delete_report(request_ctx, account_id, report, id, **request_kwargs):
@@ -122,8 +114,6 @@ def delete_report(request_ctx, account_id, report, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/reports/{report}/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, report=report, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
+    return ENDPOINTS['delete_report'].request(request_ctx, request_kwargs, (account_id, report, id), None)
+
 
-    return response
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_single_account', 'GET', '/v1/accounts/{id}', ('id',)),
+    ('list_active_courses_in_account', 'GET', '/v1/accounts/{account_id}/courses', ('account_id', 'with_enrollments', 'published', 'completed', 'by_teachers', 'by_subaccounts', 'hide_enrollmentless_courses', 'state', 'enrollment_term_id', 'search_term', 'include', 'per_page'), (('state', ('created', 'claimed', 'available', 'completed', 'deleted', 'all')), ('include', ('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections', 'storage_quota_used_mb')))),
+    ('update_account', 'PUT', '/v1/accounts/{id}', ('id', ('account[name]', 'account_name'), ('account[default_time_zone]', 'account_default_time_zone'), ('account[default_storage_quota_mb]', 'account_default_storage_quota_mb'), ('account[default_user_storage_quota_mb]', 'account_default_user_storage_quota_mb'), ('account[default_group_storage_quota_mb]', 'account_default_group_storage_quota_mb'))),
+    ('create_new_sub_account', 'POST', '/v1/accounts/{account_id}/sub_accounts', ('account_id', ('account[name]', 'account_name'), ('account[default_storage_quota_mb]', 'account_default_storage_quota_mb'), ('account[default_user_storage_quota_mb]', 'account_default_user_storage_quota_mb'), ('account[default_group_storage_quota_mb]', 'account_default_group_storage_quota_mb'), 'per_page')),
+])
+
 
 def list_accounts(request_ctx, per_page=None, as_user_id=None, **request_kwargs):
     """
@@ -31,6 +40,7 @@ def list_accounts(request_ctx, per_page=None, as_user_id=None, **request_kwargs)
     return response
 
 
+
 def get_single_account(request_ctx, id, **request_kwargs):
     """
     Retrieve information on an individual account, given by id or sis
@@ -45,11 +55,7 @@ def get_single_account(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_account'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def get_sub_accounts_of_account(request_ctx, account_id, recursive=None, per_page=None, as_user_id=None, **request_kwargs):
@@ -84,6 +90,7 @@ def get_sub_accounts_of_account(request_ctx, account_id, recursive=None, per_pag
     return response
 
 
+
 def list_active_courses_in_account(request_ctx, account_id, with_enrollments=None, published=None, completed=None, by_teachers=None, by_subaccounts=None, hide_enrollmentless_courses=None, state=None, enrollment_term_id=None, search_term=None, include=None, per_page=None, **request_kwargs):
     """
     Retrieve the list of courses in this account.
@@ -119,30 +126,7 @@ def list_active_courses_in_account(request_ctx, account_id, with_enrollments=Non
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('created', 'claimed', 'available', 'completed', 'deleted', 'all')
-    include_types = ('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections', 'storage_quota_used_mb')
-    utils.validate_attr_is_acceptable(state, state_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'with_enrollments' : with_enrollments,
-        'published' : published,
-        'completed' : completed,
-        'by_teachers' : by_teachers,
-        'by_subaccounts' : by_subaccounts,
-        'hide_enrollmentless_courses' : hide_enrollmentless_courses,
-        'state' : state,
-        'enrollment_term_id' : enrollment_term_id,
-        'search_term' : search_term,
-        'include' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_active_courses_in_account'].request(request_ctx, request_kwargs, (account_id,), {'with_enrollments': with_enrollments, 'published': published, 'completed': completed, 'by_teachers': by_teachers, 'by_subaccounts': by_subaccounts, 'hide_enrollmentless_courses': hide_enrollmentless_courses, 'state': state, 'enrollment_term_id': enrollment_term_id, 'search_term': search_term, 'include': include, 'per_page': per_page})
 
 
 def update_account(request_ctx, id, account_name=None, account_default_time_zone=None, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None, **request_kwargs):
@@ -168,18 +152,7 @@ def update_account(request_ctx, id, account_name=None, account_default_time_zone
 
     """
 
-    path = '/v1/accounts/{id}'
-    payload = {
-        'account[name]' : account_name,
-        'account[default_time_zone]' : account_default_time_zone,
-        'account[default_storage_quota_mb]' : account_default_storage_quota_mb,
-        'account[default_user_storage_quota_mb]' : account_default_user_storage_quota_mb,
-        'account[default_group_storage_quota_mb]' : account_default_group_storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_account'].request(request_ctx, request_kwargs, (id,), {'account[name]': account_name, 'account[default_time_zone]': account_default_time_zone, 'account[default_storage_quota_mb]': account_default_storage_quota_mb, 'account[default_user_storage_quota_mb]': account_default_user_storage_quota_mb, 'account[default_group_storage_quota_mb]': account_default_group_storage_quota_mb})
 
 
 def create_new_sub_account(request_ctx, account_id, account_name, account_default_storage_quota_mb=None, account_default_user_storage_quota_mb=None, account_default_group_storage_quota_mb=None, per_page=None, **request_kwargs):
@@ -205,17 +178,6 @@ def create_new_sub_account(request_ctx, account_id, account_name, account_defaul
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/sub_accounts'
-    payload = {
-        'account[name]' : account_name,
-        'account[default_storage_quota_mb]' : account_default_storage_quota_mb,
-        'account[default_user_storage_quota_mb]' : account_default_user_storage_quota_mb,
-        'account[default_group_storage_quota_mb]' : account_default_group_storage_quota_mb,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
+    return ENDPOINTS['create_new_sub_account'].request(request_ctx, request_kwargs, (account_id,), {'account[name]': account_name, 'account[default_storage_quota_mb]': account_default_storage_quota_mb, 'account[default_user_storage_quota_mb]': account_default_user_storage_quota_mb, 'account[default_group_storage_quota_mb]': account_default_group_storage_quota_mb, 'per_page': per_page})
+
 
-    return response
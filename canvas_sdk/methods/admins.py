@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('make_account_admin', 'POST', '/v1/accounts/{account_id}/admins', ('account_id', 'user_id', 'role', 'role_id', 'send_confirmation')),
+    ('remove_account_admin', 'DELETE', '/v1/accounts/{account_id}/admins/{user_id}', ('account_id', 'user_id', 'role', 'role_id')),
+    ('list_account_admins', 'GET', '/v1/accounts/{account_id}/admins', ('account_id', 'user_id', 'per_page')),
+])
+
 
 def make_account_admin(request_ctx, account_id, user_id, role=None, role_id=None, send_confirmation=None, **request_kwargs):
     """
@@ -25,17 +33,7 @@ the new admin if true. Default is true.
 
     """
 
-    path = '/v1/accounts/{account_id}/admins'
-    payload = {
-        'user_id' : user_id,
-        'role' : role,
-        'role_id' : role_id,
-        'send_confirmation' : send_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['make_account_admin'].request(request_ctx, request_kwargs, (account_id,), {'user_id': user_id, 'role': role, 'role_id': role_id, 'send_confirmation': send_confirmation})
 
 
 def remove_account_admin(request_ctx, account_id, user_id, role=None, role_id=None, **request_kwargs):
@@ -60,15 +58,7 @@ given role. Defaults to the built-in role for 'AccountAdmin'.
 
     """
 
-    path = '/v1/accounts/{account_id}/admins/{user_id}'
-    payload = {
-        'role' : role,
-        'role_id' : role_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, user_id=user_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_account_admin'].request(request_ctx, request_kwargs, (account_id, user_id), {'role': role, 'role_id': role_id})
 
 
 def list_account_admins(request_ctx, account_id, user_id=None, per_page=None, **request_kwargs):
@@ -88,16 +78,6 @@ def list_account_admins(request_ctx, account_id, user_id=None, per_page=None, **
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/admins'
-    payload = {
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_account_admins'].request(request_ctx, request_kwargs, (account_id,), {'user_id': user_id, 'per_page': per_page})
 
 
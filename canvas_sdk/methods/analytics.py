@@ -1,4 +1,24 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_department_level_participation_data_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/activity', ('account_id', 'term_id')),
+    ('get_department_level_participation_data_current', 'GET', '/v1/accounts/{account_id}/analytics/current/activity', ('account_id',)),
+    ('get_department_level_participation_data_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/activity', ('account_id',)),
+    ('get_department_level_grade_data_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/grades', ('account_id', 'term_id')),
+    ('get_department_level_grade_data_current', 'GET', '/v1/accounts/{account_id}/analytics/current/grades', ('account_id',)),
+    ('get_department_level_grade_data_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/grades', ('account_id',)),
+    ('get_department_level_statistics_terms', 'GET', '/v1/accounts/{account_id}/analytics/terms/{term_id}/statistics', ('account_id', 'term_id')),
+    ('get_department_level_statistics_current', 'GET', '/v1/accounts/{account_id}/analytics/current/statistics', ('account_id',)),
+    ('get_department_level_statistics_completed', 'GET', '/v1/accounts/{account_id}/analytics/completed/statistics', ('account_id',)),
+    ('get_course_level_participation_data', 'GET', '/v1/courses/{course_id}/analytics/activity', ('course_id',)),
+    ('get_course_level_assignment_data', 'GET', '/v1/courses/{course_id}/analytics/assignments', ('course_id', 'async')),
+    ('get_course_level_student_summary_data', 'GET', '/v1/courses/{course_id}/analytics/student_summaries', ('course_id',)),
+    ('get_user_in_a_course_level_participation_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/activity', ('course_id', 'student_id')),
+    ('get_user_in_a_course_level_assignment_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/assignments', ('course_id', 'student_id')),
+    ('get_user_in_a_course_level_messaging_data', 'GET', '/v1/courses/{course_id}/analytics/users/{student_id}/communication', ('course_id', 'student_id')),
+])
+
 
 def get_department_level_participation_data_terms(request_ctx, account_id, term_id, **request_kwargs):
     """
@@ -37,11 +57,7 @@ def get_department_level_participation_data_terms(request_ctx, account_id, term_
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_participation_data_terms'].request(request_ctx, request_kwargs, (account_id, term_id), None)
 
 
 def get_department_level_participation_data_current(request_ctx, account_id, **request_kwargs):
@@ -79,11 +95,7 @@ def get_department_level_participation_data_current(request_ctx, account_id, **r
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/current/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_participation_data_current'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_department_level_participation_data_completed(request_ctx, account_id, **request_kwargs):
@@ -121,11 +133,7 @@ def get_department_level_participation_data_completed(request_ctx, account_id, *
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/completed/activity'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_participation_data_completed'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_department_level_grade_data_terms(request_ctx, account_id, term_id, **request_kwargs):
@@ -153,11 +161,7 @@ def get_department_level_grade_data_terms(request_ctx, account_id, term_id, **re
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_grade_data_terms'].request(request_ctx, request_kwargs, (account_id, term_id), None)
 
 
 def get_department_level_grade_data_current(request_ctx, account_id, **request_kwargs):
@@ -183,11 +187,7 @@ def get_department_level_grade_data_current(request_ctx, account_id, **request_k
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/current/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_grade_data_current'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_department_level_grade_data_completed(request_ctx, account_id, **request_kwargs):
@@ -213,11 +213,7 @@ def get_department_level_grade_data_completed(request_ctx, account_id, **request
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/completed/grades'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_grade_data_completed'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_department_level_statistics_terms(request_ctx, account_id, term_id, **request_kwargs):
@@ -237,11 +233,7 @@ def get_department_level_statistics_terms(request_ctx, account_id, term_id, **re
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/terms/{term_id}/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, term_id=term_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_statistics_terms'].request(request_ctx, request_kwargs, (account_id, term_id), None)
 
 
 def get_department_level_statistics_current(request_ctx, account_id, **request_kwargs):
@@ -259,11 +251,7 @@ def get_department_level_statistics_current(request_ctx, account_id, **request_k
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/current/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_statistics_current'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_department_level_statistics_completed(request_ctx, account_id, **request_kwargs):
@@ -281,11 +269,7 @@ def get_department_level_statistics_completed(request_ctx, account_id, **request
 
     """
 
-    path = '/v1/accounts/{account_id}/analytics/completed/statistics'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_department_level_statistics_completed'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def get_course_level_participation_data(request_ctx, course_id, **request_kwargs):
@@ -305,11 +289,7 @@ def get_course_level_participation_data(request_ctx, course_id, **request_kwargs
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/activity'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_course_level_participation_data'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def get_course_level_assignment_data(request_ctx, course_id, async, **request_kwargs):
@@ -329,14 +309,7 @@ def get_course_level_assignment_data(request_ctx, course_id, async, **request_kw
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/assignments'
-    payload = {
-        'async' : async,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_course_level_assignment_data'].request(request_ctx, request_kwargs, (course_id,), {'async': async})
 
 
 def get_course_level_student_summary_data(request_ctx, course_id, **request_kwargs):
@@ -360,11 +333,7 @@ def get_course_level_student_summary_data(request_ctx, course_id, **request_kwar
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/student_summaries'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_course_level_student_summary_data'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def get_user_in_a_course_level_participation_data(request_ctx, course_id, student_id, **request_kwargs):
@@ -385,11 +354,7 @@ def get_user_in_a_course_level_participation_data(request_ctx, course_id, studen
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/activity'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_user_in_a_course_level_participation_data'].request(request_ctx, request_kwargs, (course_id, student_id), None)
 
 
 def get_user_in_a_course_level_assignment_data(request_ctx, course_id, student_id, **request_kwargs):
@@ -410,11 +375,7 @@ def get_user_in_a_course_level_assignment_data(request_ctx, course_id, student_i
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/assignments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_user_in_a_course_level_assignment_data'].request(request_ctx, request_kwargs, (course_id, student_id), None)
 
 
 def get_user_in_a_course_level_messaging_data(request_ctx, course_id, student_id, **request_kwargs):
@@ -436,10 +397,6 @@ def get_user_in_a_course_level_messaging_data(request_ctx, course_id, student_id
 
     """
 
-    path = '/v1/courses/{course_id}/analytics/users/{student_id}/communication'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, student_id=student_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_user_in_a_course_level_messaging_data'].request(request_ctx, request_kwargs, (course_id, student_id), None)
 
 
@@ -1,4 +1,15 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_external_feeds_courses', 'GET', '/v1/courses/{course_id}/external_feeds', ('course_id', 'per_page')),
+    ('list_external_feeds_groups', 'GET', '/v1/groups/{group_id}/external_feeds', ('group_id', 'per_page')),
+    ('create_external_feed_courses', 'POST', '/v1/courses/{course_id}/external_feeds', ('course_id', 'url', 'verbosity', 'header_match'), (('verbosity', ('full', 'truncate', 'link_only')),)),
+    ('create_external_feed_groups', 'POST', '/v1/groups/{group_id}/external_feeds', ('group_id', 'url', 'verbosity', 'header_match'), (('verbosity', ('full', 'truncate', 'link_only')),)),
+    ('delete_external_feed_courses', 'DELETE', '/v1/courses/{course_id}/external_feeds/{external_feed_id}', ('course_id', 'external_feed_id')),
+    ('delete_external_feed_groups', 'DELETE', '/v1/groups/{group_id}/external_feeds/{external_feed_id}', ('group_id', 'external_feed_id')),
+])
+
 
 def list_external_feeds_courses(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +26,7 @@ def list_external_feeds_courses(request_ctx, course_id, per_page=None, **request
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/external_feeds'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_external_feeds_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_external_feeds_groups(request_ctx, group_id, per_page=None, **request_kwargs):
@@ -42,16 +44,7 @@ def list_external_feeds_groups(request_ctx, group_id, per_page=None, **request_k
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/external_feeds'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_external_feeds_groups'].request(request_ctx, request_kwargs, (group_id,), {'per_page': per_page})
 
 
 def create_external_feed_courses(request_ctx, course_id, url, verbosity, header_match=None, **request_kwargs):
@@ -73,18 +66,7 @@ def create_external_feed_courses(request_ctx, course_id, url, verbosity, header_
 
     """
 
-    verbosity_types = ('full', 'truncate', 'link_only')
-    utils.validate_attr_is_acceptable(verbosity, verbosity_types)
-    path = '/v1/courses/{course_id}/external_feeds'
-    payload = {
-        'url' : url,
-        'header_match' : header_match,
-        'verbosity' : verbosity,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_external_feed_courses'].request(request_ctx, request_kwargs, (course_id,), {'url': url, 'verbosity': verbosity, 'header_match': header_match})
 
 
 def create_external_feed_groups(request_ctx, group_id, url, verbosity, header_match=None, **request_kwargs):
@@ -106,18 +88,7 @@ def create_external_feed_groups(request_ctx, group_id, url, verbosity, header_ma
 
     """
 
-    verbosity_types = ('full', 'truncate', 'link_only')
-    utils.validate_attr_is_acceptable(verbosity, verbosity_types)
-    path = '/v1/groups/{group_id}/external_feeds'
-    payload = {
-        'url' : url,
-        'header_match' : header_match,
-        'verbosity' : verbosity,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_external_feed_groups'].request(request_ctx, request_kwargs, (group_id,), {'url': url, 'verbosity': verbosity, 'header_match': header_match})
 
 
 def delete_external_feed_courses(request_ctx, course_id, external_feed_id, **request_kwargs):
@@ -135,11 +106,7 @@ def delete_external_feed_courses(request_ctx, course_id, external_feed_id, **req
 
     """
 
-    path = '/v1/courses/{course_id}/external_feeds/{external_feed_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_feed_id=external_feed_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_external_feed_courses'].request(request_ctx, request_kwargs, (course_id, external_feed_id), None)
 
 
 def delete_external_feed_groups(request_ctx, group_id, external_feed_id, **request_kwargs):
@@ -157,10 +124,6 @@ def delete_external_feed_groups(request_ctx, group_id, external_feed_id, **reque
 
     """
 
-    path = '/v1/groups/{group_id}/external_feeds/{external_feed_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, external_feed_id=external_feed_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_external_feed_groups'].request(request_ctx, request_kwargs, (group_id, external_feed_id), None)
 
 
@@ -1,4 +1,16 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_appointment_groups', 'GET', '/v1/appointment_groups', ('scope', 'context_codes', 'include_past_appointments', 'include'), (('scope', ('reservable', 'manageable')), ('include', ('appointments', 'child_events', 'participant_count', 'reserved_times')))),
+    ('create_appointment_group', 'POST', '/v1/appointment_groups', (('appointment_group[context_codes]', 'appointment_group_context_codes'), ('appointment_group[sub_context_codes]', 'appointment_group_sub_context_codes'), ('appointment_group[title]', 'appointment_group_title'), ('appointment_group[description]', 'appointment_group_description'), ('appointment_group[location_name]', 'appointment_group_location_name'), ('appointment_group[location_address]', 'appointment_group_location_address'), ('appointment_group[publish]', 'appointment_group_publish'), ('appointment_group[participants_per_appointment]', 'appointment_group_participants_per_appointment'), ('appointment_group[min_appointments_per_participant]', 'appointment_group_min_appointments_per_participant'), ('appointment_group[max_appointments_per_participant]', 'appointment_group_max_appointments_per_participant'), ('appointment_group[new_appointments][X]', 'appointment_group_new_appointments_X'), ('appointment_group[participant_visibility]', 'appointment_group_participant_visibility')), (('appointment_group_participant_visibility', ('private', 'protected')),)),
+    ('get_single_appointment_group', 'GET', '/v1/appointment_groups/{id}', ('id', 'include'), (('include', ('child_events', 'appointments')),)),
+    ('update_appointment_group', 'PUT', '/v1/appointment_groups/{id}', ('id', ('appointment_group[context_codes]', 'appointment_group_context_codes'), ('appointment_group[sub_context_codes]', 'appointment_group_sub_context_codes'), ('appointment_group[title]', 'appointment_group_title'), ('appointment_group[description]', 'appointment_group_description'), ('appointment_group[location_name]', 'appointment_group_location_name'), ('appointment_group[location_address]', 'appointment_group_location_address'), ('appointment_group[publish]', 'appointment_group_publish'), ('appointment_group[participants_per_appointment]', 'appointment_group_participants_per_appointment'), ('appointment_group[min_appointments_per_participant]', 'appointment_group_min_appointments_per_participant'), ('appointment_group[max_appointments_per_participant]', 'appointment_group_max_appointments_per_participant'), ('appointment_group[new_appointments][X]', 'appointment_group_new_appointments_X'), ('appointment_group[participant_visibility]', 'appointment_group_participant_visibility')), (('appointment_group_participant_visibility', ('private', 'protected')),)),
+    ('delete_appointment_group', 'DELETE', '/v1/appointment_groups/{id}', ('id', 'cancel_reason')),
+    ('list_user_participants', 'GET', '/v1/appointment_groups/{id}/users', ('id', 'registration_status'), (('registration_status', ('all', 'registered', 'registered')),)),
+    ('list_student_group_participants', 'GET', '/v1/appointment_groups/{id}/groups', ('id', 'registration_status'), (('registration_status', ('all', 'registered', 'registered')),)),
+])
+
 
 def list_appointment_groups(request_ctx, scope=None, context_codes=None, include_past_appointments=None, include=None, **request_kwargs):
     """
@@ -20,21 +32,7 @@ def list_appointment_groups(request_ctx, scope=None, context_codes=None, include
 
     """
 
-    scope_types = ('reservable', 'manageable')
-    include_types = ('appointments', 'child_events', 'participant_count', 'reserved_times')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/appointment_groups'
-    payload = {
-        'scope' : scope,
-        'context_codes' : context_codes,
-        'include_past_appointments' : include_past_appointments,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_appointment_groups'].request(request_ctx, request_kwargs, (), {'scope': scope, 'context_codes': context_codes, 'include_past_appointments': include_past_appointments, 'include': include})
 
 
 def create_appointment_group(request_ctx, appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None, **request_kwargs):
@@ -74,27 +72,7 @@ def create_appointment_group(request_ctx, appointment_group_context_codes, appoi
 
     """
 
-    appointment_group_participant_visibility_types = ('private', 'protected')
-    utils.validate_attr_is_acceptable(appointment_group_participant_visibility, appointment_group_participant_visibility_types)
-    path = '/v1/appointment_groups'
-    payload = {
-        'appointment_group[context_codes]' : appointment_group_context_codes,
-        'appointment_group[sub_context_codes]' : appointment_group_sub_context_codes,
-        'appointment_group[title]' : appointment_group_title,
-        'appointment_group[description]' : appointment_group_description,
-        'appointment_group[location_name]' : appointment_group_location_name,
-        'appointment_group[location_address]' : appointment_group_location_address,
-        'appointment_group[publish]' : appointment_group_publish,
-        'appointment_group[participants_per_appointment]' : appointment_group_participants_per_appointment,
-        'appointment_group[min_appointments_per_participant]' : appointment_group_min_appointments_per_participant,
-        'appointment_group[max_appointments_per_participant]' : appointment_group_max_appointments_per_participant,
-        'appointment_group[new_appointments][X]' : appointment_group_new_appointments_X,
-        'appointment_group[participant_visibility]' : appointment_group_participant_visibility,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_appointment_group'].request(request_ctx, request_kwargs, (), {'appointment_group[context_codes]': appointment_group_context_codes, 'appointment_group[sub_context_codes]': appointment_group_sub_context_codes, 'appointment_group[title]': appointment_group_title, 'appointment_group[description]': appointment_group_description, 'appointment_group[location_name]': appointment_group_location_name, 'appointment_group[location_address]': appointment_group_location_address, 'appointment_group[publish]': appointment_group_publish, 'appointment_group[participants_per_appointment]': appointment_group_participants_per_appointment, 'appointment_group[min_appointments_per_participant]': appointment_group_min_appointments_per_participant, 'appointment_group[max_appointments_per_participant]': appointment_group_max_appointments_per_participant, 'appointment_group[new_appointments][X]': appointment_group_new_appointments_X, 'appointment_group[participant_visibility]': appointment_group_participant_visibility})
 
 
 def get_single_appointment_group(request_ctx, id, include=None, **request_kwargs):
@@ -112,16 +90,7 @@ def get_single_appointment_group(request_ctx, id, include=None, **request_kwargs
 
     """
 
-    include_types = ('child_events', 'appointments')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_appointment_group'].request(request_ctx, request_kwargs, (id,), {'include': include})
 
 
 def update_appointment_group(request_ctx, id, appointment_group_context_codes, appointment_group_sub_context_codes=None, appointment_group_title=None, appointment_group_description=None, appointment_group_location_name=None, appointment_group_location_address=None, appointment_group_publish=None, appointment_group_participants_per_appointment=None, appointment_group_min_appointments_per_participant=None, appointment_group_max_appointments_per_participant=None, appointment_group_new_appointments_X=None, appointment_group_participant_visibility=None, **request_kwargs):
@@ -163,27 +132,7 @@ def update_appointment_group(request_ctx, id, appointment_group_context_codes, a
 
     """
 
-    appointment_group_participant_visibility_types = ('private', 'protected')
-    utils.validate_attr_is_acceptable(appointment_group_participant_visibility, appointment_group_participant_visibility_types)
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'appointment_group[context_codes]' : appointment_group_context_codes,
-        'appointment_group[sub_context_codes]' : appointment_group_sub_context_codes,
-        'appointment_group[title]' : appointment_group_title,
-        'appointment_group[description]' : appointment_group_description,
-        'appointment_group[location_name]' : appointment_group_location_name,
-        'appointment_group[location_address]' : appointment_group_location_address,
-        'appointment_group[publish]' : appointment_group_publish,
-        'appointment_group[participants_per_appointment]' : appointment_group_participants_per_appointment,
-        'appointment_group[min_appointments_per_participant]' : appointment_group_min_appointments_per_participant,
-        'appointment_group[max_appointments_per_participant]' : appointment_group_max_appointments_per_participant,
-        'appointment_group[new_appointments][X]' : appointment_group_new_appointments_X,
-        'appointment_group[participant_visibility]' : appointment_group_participant_visibility,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_appointment_group'].request(request_ctx, request_kwargs, (id,), {'appointment_group[context_codes]': appointment_group_context_codes, 'appointment_group[sub_context_codes]': appointment_group_sub_context_codes, 'appointment_group[title]': appointment_group_title, 'appointment_group[description]': appointment_group_description, 'appointment_group[location_name]': appointment_group_location_name, 'appointment_group[location_address]': appointment_group_location_address, 'appointment_group[publish]': appointment_group_publish, 'appointment_group[participants_per_appointment]': appointment_group_participants_per_appointment, 'appointment_group[min_appointments_per_participant]': appointment_group_min_appointments_per_participant, 'appointment_group[max_appointments_per_participant]': appointment_group_max_appointments_per_participant, 'appointment_group[new_appointments][X]': appointment_group_new_appointments_X, 'appointment_group[participant_visibility]': appointment_group_participant_visibility})
 
 
 def delete_appointment_group(request_ctx, id, cancel_reason=None, **request_kwargs):
@@ -202,14 +151,7 @@ def delete_appointment_group(request_ctx, id, cancel_reason=None, **request_kwar
 
     """
 
-    path = '/v1/appointment_groups/{id}'
-    payload = {
-        'cancel_reason' : cancel_reason,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_appointment_group'].request(request_ctx, request_kwargs, (id,), {'cancel_reason': cancel_reason})
 
 
 def list_user_participants(request_ctx, id, registration_status=None, **request_kwargs):
@@ -229,16 +171,7 @@ def list_user_participants(request_ctx, id, registration_status=None, **request_
 
     """
 
-    registration_status_types = ('all', 'registered', 'registered')
-    utils.validate_attr_is_acceptable(registration_status, registration_status_types)
-    path = '/v1/appointment_groups/{id}/users'
-    payload = {
-        'registration_status' : registration_status,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_user_participants'].request(request_ctx, request_kwargs, (id,), {'registration_status': registration_status})
 
 
 def list_student_group_participants(request_ctx, id, registration_status=None, **request_kwargs):
@@ -258,15 +191,6 @@ def list_student_group_participants(request_ctx, id, registration_status=None, *
 
     """
 
-    registration_status_types = ('all', 'registered', 'registered')
-    utils.validate_attr_is_acceptable(registration_status, registration_status_types)
-    path = '/v1/appointment_groups/{id}/groups'
-    payload = {
-        'registration_status' : registration_status,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_student_group_participants'].request(request_ctx, request_kwargs, (id,), {'registration_status': registration_status})
 
 
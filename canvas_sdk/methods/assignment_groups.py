@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_assignment_groups', 'GET', '/v1/courses/{course_id}/assignment_groups', ('course_id', 'include', 'override_assignment_dates', 'per_page'), (('include', ('assignments', 'discussion_topic', 'all_dates')),)),
+    ('get_assignment_group', 'GET', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}', ('course_id', 'assignment_group_id', 'include', 'override_assignment_dates'), (('include', ('assignments', 'discussion_topic')),)),
+    ('create_assignment_group', 'POST', '/v1/courses/{course_id}/assignment_groups', ('course_id', 'name', 'position', 'group_weight', 'rules')),
+    ('edit_assignment_group', 'PUT', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}', ('course_id', 'assignment_group_id')),
+    ('destroy_assignment_group', 'DELETE', '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}', ('course_id', 'assignment_group_id', 'move_assignment_to')),
+])
+
 
 def list_assignment_groups(request_ctx, course_id, include, override_assignment_dates=None, per_page=None, **request_kwargs):
     """
@@ -20,20 +30,7 @@ def list_assignment_groups(request_ctx, course_id, include, override_assignment_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('assignments', 'discussion_topic', 'all_dates')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignment_groups'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_assignment_groups'].request(request_ctx, request_kwargs, (course_id,), {'include': include, 'override_assignment_dates': override_assignment_dates, 'per_page': per_page})
 
 
 def get_assignment_group(request_ctx, course_id, assignment_group_id, include, override_assignment_dates=None, **request_kwargs):
@@ -55,17 +52,7 @@ def get_assignment_group(request_ctx, course_id, assignment_group_id, include, o
 
     """
 
-    include_types = ('assignments', 'discussion_topic')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_assignment_group'].request(request_ctx, request_kwargs, (course_id, assignment_group_id), {'include': include, 'override_assignment_dates': override_assignment_dates})
 
 
 def create_assignment_group(request_ctx, course_id, name=None, position=None, group_weight=None, rules=None, **request_kwargs):
@@ -89,17 +76,7 @@ def create_assignment_group(request_ctx, course_id, name=None, position=None, gr
 
     """
 
-    path = '/v1/courses/{course_id}/assignment_groups'
-    payload = {
-        'name' : name,
-        'position' : position,
-        'group_weight' : group_weight,
-        'rules' : rules,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_assignment_group'].request(request_ctx, request_kwargs, (course_id,), {'name': name, 'position': position, 'group_weight': group_weight, 'rules': rules})
 
 
 def edit_assignment_group(request_ctx, course_id, assignment_group_id, **request_kwargs):
@@ -118,11 +95,7 @@ def edit_assignment_group(request_ctx, course_id, assignment_group_id, **request
 
     """
 
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_assignment_group'].request(request_ctx, request_kwargs, (course_id, assignment_group_id), None)
 
 
 def destroy_assignment_group(request_ctx, course_id, assignment_group_id, move_assignment_to, **request_kwargs):
@@ -142,13 +115,6 @@ def destroy_assignment_group(request_ctx, course_id, assignment_group_id, move_a
 
     """
 
-    path = '/v1/courses/{course_id}/assignment_groups/{assignment_group_id}'
-    payload = {
-        'move_assignment_to' : move_assignment_to,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_group_id=assignment_group_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['destroy_assignment_group'].request(request_ctx, request_kwargs, (course_id, assignment_group_id), {'move_assignment_to': move_assignment_to})
 
 
@@ -1,4 +1,22 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('delete_assignment', 'DELETE', '/v1/courses/{course_id}/assignments/{id}', ('course_id', 'id')),
+    ('list_assignments', 'GET', '/v1/courses/{course_id}/assignments', ('course_id', 'include', 'search_term', 'override_assignment_dates', 'per_page'), (('include', ('submission',)),)),
+    ('get_single_assignment', 'GET', '/v1/courses/{course_id}/assignments/{id}', ('course_id', 'id', 'include', 'override_assignment_dates'), (('include', ('submission',)),)),
+    ('list_assignment_overrides', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides', ('course_id', 'assignment_id', 'per_page')),
+    ('get_single_assignment_override', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}', ('course_id', 'assignment_id', 'id')),
+    ('redirect_to_assignment_override_for_group', 'GET', '/v1/groups/{group_id}/assignments/{assignment_id}/override', ('group_id', 'assignment_id')),
+    ('redirect_to_assignment_override_for_section', 'GET', '/v1/sections/{course_section_id}/assignments/{assignment_id}/override', ('course_section_id', 'assignment_id')),
+    ('create_assignment_override', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides', ('course_id', 'assignment_id', ('assignment_override[student_ids]', 'assignment_override_student_ids'), ('assignment_override[title]', 'assignment_override_title'), ('assignment_override[group_id]', 'assignment_override_group_id'), ('assignment_override[course_section_id]', 'assignment_override_course_section_id'), ('assignment_override[due_at]', 'assignment_override_due_at'), ('assignment_override[unlock_at]', 'assignment_override_unlock_at'), ('assignment_override[lock_at]', 'assignment_override_lock_at'))),
+    ('update_assignment_override', 'PUT', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}', ('course_id', 'assignment_id', 'id', ('assignment_override[student_ids]', 'assignment_override_student_ids'), ('assignment_override[title]', 'assignment_override_title'), ('assignment_override[due_at]', 'assignment_override_due_at'), ('assignment_override[unlock_at]', 'assignment_override_unlock_at'), ('assignment_override[lock_at]', 'assignment_override_lock_at'))),
+    ('delete_assignment_override', 'DELETE', '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}', ('course_id', 'assignment_id', 'id')),
+])
+
+ASSIGNMENT_SUBMISSION_TYPES_TYPES = frozenset(('online_quiz', 'none', 'on_paper', 'online_quiz', 'discussion_topic', 'external_tool', 'online_upload', 'online_text_entry', 'online_url', 'media_recording'))
+ASSIGNMENT_GRADING_TYPE_TYPES = frozenset(('pass_fail', 'percent', 'letter_grade', 'gpa_scale', 'points'))
+
 
 def delete_assignment(request_ctx, course_id, id, **request_kwargs):
     """
@@ -15,11 +33,7 @@ def delete_assignment(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_assignment'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def list_assignments(request_ctx, course_id, include, search_term=None, override_assignment_dates=None, per_page=None, **request_kwargs):
@@ -43,21 +57,7 @@ def list_assignments(request_ctx, course_id, include, search_term=None, override
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('submission')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'override_assignment_dates' : override_assignment_dates,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_assignments'].request(request_ctx, request_kwargs, (course_id,), {'include': include, 'search_term': search_term, 'override_assignment_dates': override_assignment_dates, 'per_page': per_page})
 
 
 def get_single_assignment(request_ctx, course_id, id, include, override_assignment_dates=None, **request_kwargs):
@@ -79,17 +79,7 @@ def get_single_assignment(request_ctx, course_id, id, include, override_assignme
 
     """
 
-    include_types = ('submission')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{id}'
-    payload = {
-        'include' : include,
-        'override_assignment_dates' : override_assignment_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_assignment'].request(request_ctx, request_kwargs, (course_id, id), {'include': include, 'override_assignment_dates': override_assignment_dates})
 
 
 def create_assignment(request_ctx, course_id, assignment_name, assignment_submission_types, assignment_position=None, assignment_allowed_extensions=None, assignment_turnitin_enabled=None, assignment_integration_data=None, assignment_integration_id=None, assignment_turnitin_settings=None, assignment_peer_reviews=None, assignment_automatic_peer_reviews=None, assignment_notify_of_update=None, assignment_group_category_id=None, assignment_grade_group_students_individually=None, assignment_external_tool_tag_attributes=None, assignment_points_possible=None, assignment_grading_type=None, assignment_due_at=None, assignment_lock_at=None, assignment_unlock_at=None, assignment_description=None, assignment_assignment_group_id=None, assignment_muted=None, assignment_assignment_overrides=None, assignment_only_visible_to_overrides=None, assignment_published=None, assignment_grading_standard_id=None, **request_kwargs):
@@ -158,10 +148,8 @@ def create_assignment(request_ctx, course_id, assignment_name, assignment_submis
 
     """
 
-    assignment_submission_types_types = ('online_quiz', 'none', 'on_paper', 'online_quiz', 'discussion_topic', 'external_tool', 'online_upload', 'online_text_entry', 'online_url', 'media_recording')
-    assignment_grading_type_types = ('pass_fail', 'percent', 'letter_grade', 'gpa_scale', 'points')
-    utils.validate_attr_is_acceptable(assignment_submission_types, assignment_submission_types_types)
-    utils.validate_attr_is_acceptable(assignment_grading_type, assignment_grading_type_types)
+    utils.validate_attr_is_acceptable(assignment_submission_types, ASSIGNMENT_SUBMISSION_TYPES_TYPES)
+    utils.validate_attr_is_acceptable(assignment_grading_type, ASSIGNMENT_GRADING_TYPE_TYPES)
     path = '/v1/courses/{course_id}/assignments'
     payload = {
         'assignment[name]' : assignment_name,
@@ -198,6 +186,7 @@ def create_assignment(request_ctx, course_id, assignment_name, assignment_submis
     return response
 
 
+
 def edit_assignment(request_ctx, course_id, id, assignment_name=None, assignment_position=None, assignment_submission_types=None, assignment_allowed_extensions=None, assignment_turnitin_enabled=None, assignment_turnitin_settings=None, assignment_peer_reviews=None, assignment_automatic_peer_reviews=None, assignment_notify_of_update=None, assignment_group_category_id=None, assignment_grade_group_students_individually=None, assignment_external_tool_tag_attributes=None, assignment_points_possible=None, assignment_grading_type=None, assignment_due_at=None, assignment_lock_at=None, assignment_unlock_at=None, assignment_description=None, assignment_assignment_group_id=None, assignment_muted=None, assignment_assignment_overrides=None, assignment_only_visible_to_overrides=None, assignment_published=None, assignment_grading_standard_id=None, **request_kwargs):
     """
     Modify an existing assignment.
@@ -268,10 +257,8 @@ def edit_assignment(request_ctx, course_id, id, assignment_name=None, assignment
 
     """
 
-    assignment_submission_types_types = ('online_quiz', 'none', 'on_paper', 'online_quiz', 'discussion_topic', 'external_tool', 'online_upload', 'online_text_entry', 'online_url', 'media_recording')
-    assignment_grading_type_types = ('pass_fail', 'percent', 'letter_grade', 'gpa_scale', 'points')
-    utils.validate_attr_is_acceptable(assignment_submission_types, assignment_submission_types_types)
-    utils.validate_attr_is_acceptable(assignment_grading_type, assignment_grading_type_types)
+    utils.validate_attr_is_acceptable(assignment_submission_types, ASSIGNMENT_SUBMISSION_TYPES_TYPES)
+    utils.validate_attr_is_acceptable(assignment_grading_type, ASSIGNMENT_GRADING_TYPE_TYPES)
     path = '/v1/courses/{course_id}/assignments/{id}'
     payload = {
         'assignment[name]' : assignment_name,
@@ -306,6 +293,7 @@ def edit_assignment(request_ctx, course_id, id, assignment_name=None, assignment
     return response
 
 
+
 def list_assignment_overrides(request_ctx, course_id, assignment_id, per_page=None, **request_kwargs):
     """
     Returns the list of overrides for this assignment that target
@@ -324,16 +312,7 @@ def list_assignment_overrides(request_ctx, course_id, assignment_id, per_page=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_assignment_overrides'].request(request_ctx, request_kwargs, (course_id, assignment_id), {'per_page': per_page})
 
 
 def get_single_assignment_override(request_ctx, course_id, assignment_id, id, **request_kwargs):
@@ -353,11 +332,7 @@ def get_single_assignment_override(request_ctx, course_id, assignment_id, id, **
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_assignment_override'].request(request_ctx, request_kwargs, (course_id, assignment_id, id), None)
 
 
 def redirect_to_assignment_override_for_group(request_ctx, group_id, assignment_id, **request_kwargs):
@@ -376,11 +351,7 @@ def redirect_to_assignment_override_for_group(request_ctx, group_id, assignment_
 
     """
 
-    path = '/v1/groups/{group_id}/assignments/{assignment_id}/override'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['redirect_to_assignment_override_for_group'].request(request_ctx, request_kwargs, (group_id, assignment_id), None)
 
 
 def redirect_to_assignment_override_for_section(request_ctx, course_section_id, assignment_id, **request_kwargs):
@@ -399,11 +370,7 @@ def redirect_to_assignment_override_for_section(request_ctx, course_section_id,
 
     """
 
-    path = '/v1/sections/{course_section_id}/assignments/{assignment_id}/override'
-    url = request_ctx.base_api_url + path.format(course_section_id=course_section_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['redirect_to_assignment_override_for_section'].request(request_ctx, request_kwargs, (course_section_id, assignment_id), None)
 
 
 def create_assignment_override(request_ctx, course_id, assignment_id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_group_id=None, assignment_override_course_section_id=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None, **request_kwargs):
@@ -438,20 +405,7 @@ def create_assignment_override(request_ctx, course_id, assignment_id, assignment
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides'
-    payload = {
-        'assignment_override[student_ids]' : assignment_override_student_ids,
-        'assignment_override[title]' : assignment_override_title,
-        'assignment_override[group_id]' : assignment_override_group_id,
-        'assignment_override[course_section_id]' : assignment_override_course_section_id,
-        'assignment_override[due_at]' : assignment_override_due_at,
-        'assignment_override[unlock_at]' : assignment_override_unlock_at,
-        'assignment_override[lock_at]' : assignment_override_lock_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_assignment_override'].request(request_ctx, request_kwargs, (course_id, assignment_id), {'assignment_override[student_ids]': assignment_override_student_ids, 'assignment_override[title]': assignment_override_title, 'assignment_override[group_id]': assignment_override_group_id, 'assignment_override[course_section_id]': assignment_override_course_section_id, 'assignment_override[due_at]': assignment_override_due_at, 'assignment_override[unlock_at]': assignment_override_unlock_at, 'assignment_override[lock_at]': assignment_override_lock_at})
 
 
 def update_assignment_override(request_ctx, course_id, assignment_id, id, assignment_override_student_ids=None, assignment_override_title=None, assignment_override_due_at=None, assignment_override_unlock_at=None, assignment_override_lock_at=None, **request_kwargs):
@@ -485,18 +439,7 @@ def update_assignment_override(request_ctx, course_id, assignment_id, id, assign
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    payload = {
-        'assignment_override[student_ids]' : assignment_override_student_ids,
-        'assignment_override[title]' : assignment_override_title,
-        'assignment_override[due_at]' : assignment_override_due_at,
-        'assignment_override[unlock_at]' : assignment_override_unlock_at,
-        'assignment_override[lock_at]' : assignment_override_lock_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_assignment_override'].request(request_ctx, request_kwargs, (course_id, assignment_id, id), {'assignment_override[student_ids]': assignment_override_student_ids, 'assignment_override[title]': assignment_override_title, 'assignment_override[due_at]': assignment_override_due_at, 'assignment_override[unlock_at]': assignment_override_unlock_at, 'assignment_override[lock_at]': assignment_override_lock_at})
 
 
 def delete_assignment_override(request_ctx, course_id, assignment_id, id, **request_kwargs):
@@ -516,10 +459,6 @@ def delete_assignment_override(request_ctx, course_id, assignment_id, id, **requ
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/overrides/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_assignment_override'].request(request_ctx, request_kwargs, (course_id, assignment_id, id), None)
 
 
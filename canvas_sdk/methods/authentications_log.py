@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('query_by_login', 'GET', '/v1/audit/authentication/logins/{login_id}', ('login_id', 'start_time', 'end_time')),
+    ('query_by_account', 'GET', '/v1/audit/authentication/accounts/{account_id}', ('account_id', 'start_time', 'end_time')),
+    ('query_by_user', 'GET', '/v1/audit/authentication/users/{user_id}', ('user_id', 'start_time', 'end_time')),
+])
+
 
 def query_by_login(request_ctx, login_id, start_time=None, end_time=None, **request_kwargs):
     """
@@ -17,15 +25,7 @@ def query_by_login(request_ctx, login_id, start_time=None, end_time=None, **requ
 
     """
 
-    path = '/v1/audit/authentication/logins/{login_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(login_id=login_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_login'].request(request_ctx, request_kwargs, (login_id,), {'start_time': start_time, 'end_time': end_time})
 
 
 def query_by_account(request_ctx, account_id, start_time=None, end_time=None, **request_kwargs):
@@ -45,15 +45,7 @@ def query_by_account(request_ctx, account_id, start_time=None, end_time=None, **
 
     """
 
-    path = '/v1/audit/authentication/accounts/{account_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_account'].request(request_ctx, request_kwargs, (account_id,), {'start_time': start_time, 'end_time': end_time})
 
 
 def query_by_user(request_ctx, user_id, start_time=None, end_time=None, **request_kwargs):
@@ -73,14 +65,6 @@ def query_by_user(request_ctx, user_id, start_time=None, end_time=None, **reques
 
     """
 
-    path = '/v1/audit/authentication/users/{user_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_user'].request(request_ctx, request_kwargs, (user_id,), {'start_time': start_time, 'end_time': end_time})
 
 
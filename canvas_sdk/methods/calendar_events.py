@@ -1,4 +1,16 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_calendar_events', 'GET', '/v1/calendar_events', ('type', 'start_date', 'end_date', 'undated', 'all_events', 'context_codes', 'per_page'), (('type', ('event', 'assignment')),)),
+    ('create_calendar_event', 'POST', '/v1/calendar_events', (('calendar_event[context_code]', 'calendar_event_context_code'), ('calendar_event[title]', 'calendar_event_title'), ('calendar_event[description]', 'calendar_event_description'), ('calendar_event[start_at]', 'calendar_event_start_at'), ('calendar_event[end_at]', 'calendar_event_end_at'), ('calendar_event[location_name]', 'calendar_event_location_name'), ('calendar_event[location_address]', 'calendar_event_location_address'), ('calendar_event[time_zone_edited]', 'calendar_event_time_zone_edited'), ('calendar_event[child_event_data][X][start_at]', 'calendar_event_child_event_data_X_start_at'), ('calendar_event[child_event_data][X][end_at]', 'calendar_event_child_event_data_X_end_at'), ('calendar_event[child_event_data][X][context_code]', 'calendar_event_child_event_data_X_context_code'))),
+    ('get_single_calendar_event_or_assignment', 'GET', '/v1/calendar_events/{id}', ('id',)),
+    ('reserve_time_slot', 'POST', '/v1/calendar_events/{id}/reservations', ('id', 'participant_id', 'cancel_existing')),
+    ('reserve_time_slot_participant_id', 'POST', '/v1/calendar_events/{id}/reservations/{participant_id}', ('id', 'participant_id', 'cancel_existing')),
+    ('update_calendar_event', 'PUT', '/v1/calendar_events/{id}', ('id', ('calendar_event[context_code]', 'calendar_event_context_code'), ('calendar_event[title]', 'calendar_event_title'), ('calendar_event[description]', 'calendar_event_description'), ('calendar_event[start_at]', 'calendar_event_start_at'), ('calendar_event[end_at]', 'calendar_event_end_at'), ('calendar_event[location_name]', 'calendar_event_location_name'), ('calendar_event[location_address]', 'calendar_event_location_address'), ('calendar_event[time_zone_edited]', 'calendar_event_time_zone_edited'), ('calendar_event[child_event_data][X][start_at]', 'calendar_event_child_event_data_X_start_at'), ('calendar_event[child_event_data][X][end_at]', 'calendar_event_child_event_data_X_end_at'), ('calendar_event[child_event_data][X][context_code]', 'calendar_event_child_event_data_X_context_code'))),
+    ('delete_calendar_event', 'DELETE', '/v1/calendar_events/{id}', ('id', 'cancel_reason')),
+])
+
 
 def list_calendar_events(request_ctx, type=None, start_date=None, end_date=None, undated=None, all_events=None, context_codes=None, per_page=None, **request_kwargs):
     """
@@ -25,24 +37,7 @@ def list_calendar_events(request_ctx, type=None, start_date=None, end_date=None,
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    type_types = ('event', 'assignment')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/calendar_events'
-    payload = {
-        'type' : type,
-        'start_date' : start_date,
-        'end_date' : end_date,
-        'undated' : undated,
-        'all_events' : all_events,
-        'context_codes' : context_codes,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_calendar_events'].request(request_ctx, request_kwargs, (), {'type': type, 'start_date': start_date, 'end_date': end_date, 'undated': undated, 'all_events': all_events, 'context_codes': context_codes, 'per_page': per_page})
 
 
 def create_calendar_event(request_ctx, calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None, **request_kwargs):
@@ -78,24 +73,7 @@ def create_calendar_event(request_ctx, calendar_event_context_code, calendar_eve
 
     """
 
-    path = '/v1/calendar_events'
-    payload = {
-        'calendar_event[context_code]' : calendar_event_context_code,
-        'calendar_event[title]' : calendar_event_title,
-        'calendar_event[description]' : calendar_event_description,
-        'calendar_event[start_at]' : calendar_event_start_at,
-        'calendar_event[end_at]' : calendar_event_end_at,
-        'calendar_event[location_name]' : calendar_event_location_name,
-        'calendar_event[location_address]' : calendar_event_location_address,
-        'calendar_event[time_zone_edited]' : calendar_event_time_zone_edited,
-        'calendar_event[child_event_data][X][start_at]' : calendar_event_child_event_data_X_start_at,
-        'calendar_event[child_event_data][X][end_at]' : calendar_event_child_event_data_X_end_at,
-        'calendar_event[child_event_data][X][context_code]' : calendar_event_child_event_data_X_context_code,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_calendar_event'].request(request_ctx, request_kwargs, (), {'calendar_event[context_code]': calendar_event_context_code, 'calendar_event[title]': calendar_event_title, 'calendar_event[description]': calendar_event_description, 'calendar_event[start_at]': calendar_event_start_at, 'calendar_event[end_at]': calendar_event_end_at, 'calendar_event[location_name]': calendar_event_location_name, 'calendar_event[location_address]': calendar_event_location_address, 'calendar_event[time_zone_edited]': calendar_event_time_zone_edited, 'calendar_event[child_event_data][X][start_at]': calendar_event_child_event_data_X_start_at, 'calendar_event[child_event_data][X][end_at]': calendar_event_child_event_data_X_end_at, 'calendar_event[child_event_data][X][context_code]': calendar_event_child_event_data_X_context_code})
 
 
 def get_single_calendar_event_or_assignment(request_ctx, id, **request_kwargs):
@@ -110,11 +88,7 @@ def get_single_calendar_event_or_assignment(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/calendar_events/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_calendar_event_or_assignment'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def reserve_time_slot(request_ctx, id, participant_id=None, cancel_existing=None, **request_kwargs):
@@ -134,15 +108,7 @@ def reserve_time_slot(request_ctx, id, participant_id=None, cancel_existing=None
 
     """
 
-    path = '/v1/calendar_events/{id}/reservations'
-    payload = {
-        'participant_id' : participant_id,
-        'cancel_existing' : cancel_existing,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reserve_time_slot'].request(request_ctx, request_kwargs, (id,), {'participant_id': participant_id, 'cancel_existing': cancel_existing})
 
 
 def reserve_time_slot_participant_id(request_ctx, id, participant_id=None, cancel_existing=None, **request_kwargs):
@@ -162,14 +128,7 @@ def reserve_time_slot_participant_id(request_ctx, id, participant_id=None, cance
 
     """
 
-    path = '/v1/calendar_events/{id}/reservations/{participant_id}'
-    payload = {
-        'cancel_existing' : cancel_existing,
-    }
-    url = request_ctx.base_api_url + path.format(id=id, participant_id=participant_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reserve_time_slot_participant_id'].request(request_ctx, request_kwargs, (id, participant_id), {'cancel_existing': cancel_existing})
 
 
 def update_calendar_event(request_ctx, id, calendar_event_context_code, calendar_event_title=None, calendar_event_description=None, calendar_event_start_at=None, calendar_event_end_at=None, calendar_event_location_name=None, calendar_event_location_address=None, calendar_event_time_zone_edited=None, calendar_event_child_event_data_X_start_at=None, calendar_event_child_event_data_X_end_at=None, calendar_event_child_event_data_X_context_code=None, **request_kwargs):
@@ -207,24 +166,7 @@ def update_calendar_event(request_ctx, id, calendar_event_context_code, calendar
 
     """
 
-    path = '/v1/calendar_events/{id}'
-    payload = {
-        'calendar_event[context_code]' : calendar_event_context_code,
-        'calendar_event[title]' : calendar_event_title,
-        'calendar_event[description]' : calendar_event_description,
-        'calendar_event[start_at]' : calendar_event_start_at,
-        'calendar_event[end_at]' : calendar_event_end_at,
-        'calendar_event[location_name]' : calendar_event_location_name,
-        'calendar_event[location_address]' : calendar_event_location_address,
-        'calendar_event[time_zone_edited]' : calendar_event_time_zone_edited,
-        'calendar_event[child_event_data][X][start_at]' : calendar_event_child_event_data_X_start_at,
-        'calendar_event[child_event_data][X][end_at]' : calendar_event_child_event_data_X_end_at,
-        'calendar_event[child_event_data][X][context_code]' : calendar_event_child_event_data_X_context_code,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_calendar_event'].request(request_ctx, request_kwargs, (id,), {'calendar_event[context_code]': calendar_event_context_code, 'calendar_event[title]': calendar_event_title, 'calendar_event[description]': calendar_event_description, 'calendar_event[start_at]': calendar_event_start_at, 'calendar_event[end_at]': calendar_event_end_at, 'calendar_event[location_name]': calendar_event_location_name, 'calendar_event[location_address]': calendar_event_location_address, 'calendar_event[time_zone_edited]': calendar_event_time_zone_edited, 'calendar_event[child_event_data][X][start_at]': calendar_event_child_event_data_X_start_at, 'calendar_event[child_event_data][X][end_at]': calendar_event_child_event_data_X_end_at, 'calendar_event[child_event_data][X][context_code]': calendar_event_child_event_data_X_context_code})
 
 
 def delete_calendar_event(request_ctx, id, cancel_reason=None, **request_kwargs):
@@ -242,13 +184,6 @@ def delete_calendar_event(request_ctx, id, cancel_reason=None, **request_kwargs)
 
     """
 
-    path = '/v1/calendar_events/{id}'
-    payload = {
-        'cancel_reason' : cancel_reason,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_calendar_event'].request(request_ctx, request_kwargs, (id,), {'cancel_reason': cancel_reason})
 
 
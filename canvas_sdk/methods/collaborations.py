@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_members_of_collaboration', 'GET', '/v1/collaborations/{id}/members', ('id', 'per_page')),
+])
+
 
 def list_members_of_collaboration(request_ctx, id, per_page=None, **request_kwargs):
     """
@@ -17,15 +23,6 @@ def list_members_of_collaboration(request_ctx, id, per_page=None, **request_kwar
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/collaborations/{id}/members'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_members_of_collaboration'].request(request_ctx, request_kwargs, (id,), {'per_page': per_page})
 
 
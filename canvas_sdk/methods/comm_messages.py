@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_of_commmessages_for_user', 'GET', '/v1/comm_messages', ('user_id', 'start_time', 'end_time', 'per_page')),
+])
+
 
 def list_of_commmessages_for_user(request_ctx, user_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
     """
@@ -19,18 +25,6 @@ def list_of_commmessages_for_user(request_ctx, user_id, start_time=None, end_tim
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/comm_messages'
-    payload = {
-        'user_id' : user_id,
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_of_commmessages_for_user'].request(request_ctx, request_kwargs, (), {'user_id': user_id, 'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_user_communication_channels', 'GET', '/v1/users/{user_id}/communication_channels', ('user_id', 'per_page')),
+    ('create_communication_channel', 'POST', '/v1/users/{user_id}/communication_channels', ('user_id', ('communication_channel[address]', 'communication_channel_address'), ('communication_channel[type]', 'communication_channel_type'), 'skip_confirmation'), (('communication_channel_type', ('email', 'sms', 'push')),)),
+    ('delete_communication_channel_id', 'DELETE', '/v1/users/{user_id}/communication_channels/{id}', ('user_id', 'id')),
+    ('delete_communication_channel_type', 'DELETE', '/v1/users/{user_id}/communication_channels/{type}/{address}', ('user_id', 'type', 'address')),
+])
+
 
 def list_user_communication_channels(request_ctx, user_id, per_page=None, **request_kwargs):
     """
@@ -16,16 +25,7 @@ def list_user_communication_channels(request_ctx, user_id, per_page=None, **requ
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_user_communication_channels'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def create_communication_channel(request_ctx, user_id, communication_channel_address, communication_channel_type, skip_confirmation=None, **request_kwargs):
@@ -47,18 +47,7 @@ def create_communication_channel(request_ctx, user_id, communication_channel_add
 
     """
 
-    communication_channel_type_types = ('email', 'sms', 'push')
-    utils.validate_attr_is_acceptable(communication_channel_type, communication_channel_type_types)
-    path = '/v1/users/{user_id}/communication_channels'
-    payload = {
-        'communication_channel[address]' : communication_channel_address,
-        'communication_channel[type]' : communication_channel_type,
-        'skip_confirmation' : skip_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_communication_channel'].request(request_ctx, request_kwargs, (user_id,), {'communication_channel[address]': communication_channel_address, 'communication_channel[type]': communication_channel_type, 'skip_confirmation': skip_confirmation})
 
 
 def delete_communication_channel_id(request_ctx, user_id, id, **request_kwargs):
@@ -76,11 +65,7 @@ def delete_communication_channel_id(request_ctx, user_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/communication_channels/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_communication_channel_id'].request(request_ctx, request_kwargs, (user_id, id), None)
 
 
 def delete_communication_channel_type(request_ctx, user_id, type, address, **request_kwargs):
@@ -100,10 +85,6 @@ def delete_communication_channel_type(request_ctx, user_id, type, address, **req
 
     """
 
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_communication_channel_type'].request(request_ctx, request_kwargs, (user_id, type, address), None)
 
 
@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_conferences_courses', 'GET', '/v1/courses/{course_id}/conferences', ('course_id', 'per_page')),
+    ('list_conferences_groups', 'GET', '/v1/groups/{group_id}/conferences', ('group_id', 'per_page')),
+])
+
 
 def list_conferences_courses(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -25,16 +32,7 @@ def list_conferences_courses(request_ctx, course_id, per_page=None, **request_kw
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/conferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_conferences_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_conferences_groups(request_ctx, group_id, per_page=None, **request_kwargs):
@@ -62,15 +60,6 @@ def list_conferences_groups(request_ctx, group_id, per_page=None, **request_kwar
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/conferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_conferences_groups'].request(request_ctx, request_kwargs, (group_id,), {'per_page': per_page})
 
 
@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_content_exports', 'GET', '/v1/courses/{course_id}/content_exports', ('course_id', 'per_page')),
+    ('show_content_export', 'GET', '/v1/courses/{course_id}/content_exports/{id}', ('course_id', 'id')),
+    ('export_course_content', 'POST', '/v1/courses/{course_id}/content_exports', ('course_id', 'export_type'), (('export_type', ('common_cartridge', 'qti')),)),
+])
+
 
 def list_content_exports(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -16,16 +24,7 @@ def list_content_exports(request_ctx, course_id, per_page=None, **request_kwargs
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_exports'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_content_exports'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def show_content_export(request_ctx, course_id, id, **request_kwargs):
@@ -43,11 +42,7 @@ def show_content_export(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/content_exports/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_content_export'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def export_course_content(request_ctx, course_id, export_type, **request_kwargs):
@@ -72,15 +67,6 @@ def export_course_content(request_ctx, course_id, export_type, **request_kwargs)
 
     """
 
-    export_type_types = ('common_cartridge', 'qti')
-    utils.validate_attr_is_acceptable(export_type, export_type_types)
-    path = '/v1/courses/{course_id}/content_exports'
-    payload = {
-        'export_type' : export_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['export_course_content'].request(request_ctx, request_kwargs, (course_id,), {'export_type': export_type})
 
 
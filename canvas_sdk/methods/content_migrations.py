@@ -1,4 +1,41 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_migration_issues_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues', ('account_id', 'content_migration_id', 'per_page')),
+    ('list_migration_issues_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues', ('course_id', 'content_migration_id', 'per_page')),
+    ('list_migration_issues_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues', ('group_id', 'content_migration_id', 'per_page')),
+    ('list_migration_issues_users', 'GET', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues', ('user_id', 'content_migration_id', 'per_page')),
+    ('get_migration_issue_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('account_id', 'content_migration_id', 'id')),
+    ('get_migration_issue_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('course_id', 'content_migration_id', 'id')),
+    ('get_migration_issue_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('group_id', 'content_migration_id', 'id')),
+    ('get_migration_issue_users', 'GET', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('user_id', 'content_migration_id', 'id')),
+    ('update_migration_issue_accounts', 'PUT', '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('account_id', 'content_migration_id', 'id', 'workflow_state'), (('workflow_state', ('active', 'resolved')),)),
+    ('update_migration_issue_courses', 'PUT', '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('course_id', 'content_migration_id', 'id', 'workflow_state'), (('workflow_state', ('active', 'resolved')),)),
+    ('update_migration_issue_groups', 'PUT', '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('group_id', 'content_migration_id', 'id', 'workflow_state'), (('workflow_state', ('active', 'resolved')),)),
+    ('update_migration_issue_users', 'PUT', '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}', ('user_id', 'content_migration_id', 'id', 'workflow_state'), (('workflow_state', ('active', 'resolved')),)),
+    ('list_content_migrations_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations', ('account_id', 'per_page')),
+    ('list_content_migrations_courses', 'GET', '/v1/courses/{course_id}/content_migrations', ('course_id', 'per_page')),
+    ('list_content_migrations_groups', 'GET', '/v1/groups/{group_id}/content_migrations', ('group_id', 'per_page')),
+    ('list_content_migrations_users', 'GET', '/v1/users/{user_id}/content_migrations', ('user_id', 'per_page')),
+    ('get_content_migration_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/{id}', ('account_id', 'id')),
+    ('get_content_migration_courses', 'GET', '/v1/courses/{course_id}/content_migrations/{id}', ('course_id', 'id')),
+    ('get_content_migration_groups', 'GET', '/v1/groups/{group_id}/content_migrations/{id}', ('group_id', 'id')),
+    ('get_content_migration_users', 'GET', '/v1/users/{user_id}/content_migrations/{id}', ('user_id', 'id')),
+    ('create_content_migration_accounts', 'POST', '/v1/accounts/{account_id}/content_migrations', ('account_id', 'migration_type', ('pre_attachment[name]', 'pre_attachment_name'), ('pre_attachment[content_type]', 'pre_attachment_content_type'), ('pre_attachment[parent_folder_id]', 'pre_attachment_parent_folder_id'), ('pre_attachment[parent_folder_path]', 'pre_attachment_parent_folder_path'), ('pre_attachment[folder]', 'pre_attachment_folder'), ('pre_attachment[on_duplicate]', 'pre_attachment_on_duplicate'), ('settings[file_url]', 'settings_file_url'), ('settings[source_course_id]', 'settings_source_course_id'), ('settings[folder_id]', 'settings_folder_id'), ('settings[overwrite_quizzes]', 'settings_overwrite_quizzes'), ('settings[question_bank_id]', 'settings_question_bank_id'), ('settings[question_bank_name]', 'settings_question_bank_name'), ('date_shift_options[shift_dates]', 'date_shift_options_shift_dates'), ('date_shift_options[old_start_date]', 'date_shift_options_old_start_date'), ('date_shift_options[old_end_date]', 'date_shift_options_old_end_date'), ('date_shift_options[new_start_date]', 'date_shift_options_new_start_date'), ('date_shift_options[new_end_date]', 'date_shift_options_new_end_date'), ('date_shift_options[day_substitutions][X]', 'date_shift_options_day_substitutions_X'), ('date_shift_options[remove_dates]', 'date_shift_options_remove_dates'))),
+    ('create_content_migration_courses', 'POST', '/v1/courses/{course_id}/content_migrations', ('course_id', 'migration_type', ('pre_attachment[name]', 'pre_attachment_name'), ('pre_attachment[content_type]', 'pre_attachment_content_type'), ('pre_attachment[parent_folder_id]', 'pre_attachment_parent_folder_id'), ('pre_attachment[parent_folder_path]', 'pre_attachment_parent_folder_path'), ('pre_attachment[folder]', 'pre_attachment_folder'), ('pre_attachment[on_duplicate]', 'pre_attachment_on_duplicate'), ('settings[file_url]', 'settings_file_url'), ('settings[source_course_id]', 'settings_source_course_id'), ('settings[folder_id]', 'settings_folder_id'), ('settings[overwrite_quizzes]', 'settings_overwrite_quizzes'), ('settings[question_bank_id]', 'settings_question_bank_id'), ('settings[question_bank_name]', 'settings_question_bank_name'), ('date_shift_options[shift_dates]', 'date_shift_options_shift_dates'), ('date_shift_options[old_start_date]', 'date_shift_options_old_start_date'), ('date_shift_options[old_end_date]', 'date_shift_options_old_end_date'), ('date_shift_options[new_start_date]', 'date_shift_options_new_start_date'), ('date_shift_options[new_end_date]', 'date_shift_options_new_end_date'), ('date_shift_options[day_substitutions][X]', 'date_shift_options_day_substitutions_X'), ('date_shift_options[remove_dates]', 'date_shift_options_remove_dates'))),
+    ('create_content_migration_groups', 'POST', '/v1/groups/{group_id}/content_migrations', ('group_id', 'migration_type', ('pre_attachment[name]', 'pre_attachment_name'), ('pre_attachment[content_type]', 'pre_attachment_content_type'), ('pre_attachment[parent_folder_id]', 'pre_attachment_parent_folder_id'), ('pre_attachment[parent_folder_path]', 'pre_attachment_parent_folder_path'), ('pre_attachment[folder]', 'pre_attachment_folder'), ('pre_attachment[on_duplicate]', 'pre_attachment_on_duplicate'), ('settings[file_url]', 'settings_file_url'), ('settings[source_course_id]', 'settings_source_course_id'), ('settings[folder_id]', 'settings_folder_id'), ('settings[overwrite_quizzes]', 'settings_overwrite_quizzes'), ('settings[question_bank_id]', 'settings_question_bank_id'), ('settings[question_bank_name]', 'settings_question_bank_name'), ('date_shift_options[shift_dates]', 'date_shift_options_shift_dates'), ('date_shift_options[old_start_date]', 'date_shift_options_old_start_date'), ('date_shift_options[old_end_date]', 'date_shift_options_old_end_date'), ('date_shift_options[new_start_date]', 'date_shift_options_new_start_date'), ('date_shift_options[new_end_date]', 'date_shift_options_new_end_date'), ('date_shift_options[day_substitutions][X]', 'date_shift_options_day_substitutions_X'), ('date_shift_options[remove_dates]', 'date_shift_options_remove_dates'))),
+    ('create_content_migration_users', 'POST', '/v1/users/{user_id}/content_migrations', ('user_id', 'migration_type', ('pre_attachment[name]', 'pre_attachment_name'), ('pre_attachment[content_type]', 'pre_attachment_content_type'), ('pre_attachment[parent_folder_id]', 'pre_attachment_parent_folder_id'), ('pre_attachment[parent_folder_path]', 'pre_attachment_parent_folder_path'), ('pre_attachment[folder]', 'pre_attachment_folder'), ('pre_attachment[on_duplicate]', 'pre_attachment_on_duplicate'), ('settings[file_url]', 'settings_file_url'), ('settings[source_course_id]', 'settings_source_course_id'), ('settings[folder_id]', 'settings_folder_id'), ('settings[overwrite_quizzes]', 'settings_overwrite_quizzes'), ('settings[question_bank_id]', 'settings_question_bank_id'), ('settings[question_bank_name]', 'settings_question_bank_name'), ('date_shift_options[shift_dates]', 'date_shift_options_shift_dates'), ('date_shift_options[old_start_date]', 'date_shift_options_old_start_date'), ('date_shift_options[old_end_date]', 'date_shift_options_old_end_date'), ('date_shift_options[new_start_date]', 'date_shift_options_new_start_date'), ('date_shift_options[new_end_date]', 'date_shift_options_new_end_date'), ('date_shift_options[day_substitutions][X]', 'date_shift_options_day_substitutions_X'), ('date_shift_options[remove_dates]', 'date_shift_options_remove_dates'))),
+    ('update_content_migration_accounts', 'PUT', '/v1/accounts/{account_id}/content_migrations/{id}', ('account_id', 'id')),
+    ('update_content_migration_courses', 'PUT', '/v1/courses/{course_id}/content_migrations/{id}', ('course_id', 'id')),
+    ('update_content_migration_groups', 'PUT', '/v1/groups/{group_id}/content_migrations/{id}', ('group_id', 'id')),
+    ('update_content_migration_users', 'PUT', '/v1/users/{user_id}/content_migrations/{id}', ('user_id', 'id')),
+    ('list_migration_systems_accounts', 'GET', '/v1/accounts/{account_id}/content_migrations/migrators', ('account_id', 'per_page')),
+    ('list_migration_systems_courses', 'GET', '/v1/courses/{course_id}/content_migrations/migrators', ('course_id', 'per_page')),
+    ('list_migration_systems_groups', 'GET', '/v1/groups/{group_id}/content_migrations/migrators', ('group_id', 'per_page')),
+    ('list_migration_systems_users', 'GET', '/v1/users/{user_id}/content_migrations/migrators', ('user_id', 'per_page')),
+])
+
 
 def list_migration_issues_accounts(request_ctx, account_id, content_migration_id, per_page=None, **request_kwargs):
     """
@@ -17,16 +54,7 @@ def list_migration_issues_accounts(request_ctx, account_id, content_migration_id
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_issues_accounts'].request(request_ctx, request_kwargs, (account_id, content_migration_id), {'per_page': per_page})
 
 
 def list_migration_issues_courses(request_ctx, course_id, content_migration_id, per_page=None, **request_kwargs):
@@ -46,16 +74,7 @@ def list_migration_issues_courses(request_ctx, course_id, content_migration_id,
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_issues_courses'].request(request_ctx, request_kwargs, (course_id, content_migration_id), {'per_page': per_page})
 
 
 def list_migration_issues_groups(request_ctx, group_id, content_migration_id, per_page=None, **request_kwargs):
@@ -75,16 +94,7 @@ def list_migration_issues_groups(request_ctx, group_id, content_migration_id, pe
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_issues_groups'].request(request_ctx, request_kwargs, (group_id, content_migration_id), {'per_page': per_page})
 
 
 def list_migration_issues_users(request_ctx, user_id, content_migration_id, per_page=None, **request_kwargs):
@@ -104,16 +114,7 @@ def list_migration_issues_users(request_ctx, user_id, content_migration_id, per_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_issues_users'].request(request_ctx, request_kwargs, (user_id, content_migration_id), {'per_page': per_page})
 
 
 def get_migration_issue_accounts(request_ctx, account_id, content_migration_id, id, **request_kwargs):
@@ -133,11 +134,7 @@ def get_migration_issue_accounts(request_ctx, account_id, content_migration_id,
 
     """
 
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_migration_issue_accounts'].request(request_ctx, request_kwargs, (account_id, content_migration_id, id), None)
 
 
 def get_migration_issue_courses(request_ctx, course_id, content_migration_id, id, **request_kwargs):
@@ -157,11 +154,7 @@ def get_migration_issue_courses(request_ctx, course_id, content_migration_id, id
 
     """
 
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_migration_issue_courses'].request(request_ctx, request_kwargs, (course_id, content_migration_id, id), None)
 
 
 def get_migration_issue_groups(request_ctx, group_id, content_migration_id, id, **request_kwargs):
@@ -181,11 +174,7 @@ def get_migration_issue_groups(request_ctx, group_id, content_migration_id, id,
 
     """
 
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_migration_issue_groups'].request(request_ctx, request_kwargs, (group_id, content_migration_id, id), None)
 
 
 def get_migration_issue_users(request_ctx, user_id, content_migration_id, id, **request_kwargs):
@@ -205,11 +194,7 @@ def get_migration_issue_users(request_ctx, user_id, content_migration_id, id, **
 
     """
 
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_migration_issue_users'].request(request_ctx, request_kwargs, (user_id, content_migration_id, id), None)
 
 
 def update_migration_issue_accounts(request_ctx, account_id, content_migration_id, id, workflow_state, **request_kwargs):
@@ -231,16 +216,7 @@ def update_migration_issue_accounts(request_ctx, account_id, content_migration_i
 
     """
 
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/accounts/{account_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_migration_issue_accounts'].request(request_ctx, request_kwargs, (account_id, content_migration_id, id), {'workflow_state': workflow_state})
 
 
 def update_migration_issue_courses(request_ctx, course_id, content_migration_id, id, workflow_state, **request_kwargs):
@@ -262,16 +238,7 @@ def update_migration_issue_courses(request_ctx, course_id, content_migration_id,
 
     """
 
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/courses/{course_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_migration_issue_courses'].request(request_ctx, request_kwargs, (course_id, content_migration_id, id), {'workflow_state': workflow_state})
 
 
 def update_migration_issue_groups(request_ctx, group_id, content_migration_id, id, workflow_state, **request_kwargs):
@@ -293,16 +260,7 @@ def update_migration_issue_groups(request_ctx, group_id, content_migration_id, i
 
     """
 
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_migration_issue_groups'].request(request_ctx, request_kwargs, (group_id, content_migration_id, id), {'workflow_state': workflow_state})
 
 
 def update_migration_issue_users(request_ctx, user_id, content_migration_id, id, workflow_state, **request_kwargs):
@@ -324,16 +282,7 @@ def update_migration_issue_users(request_ctx, user_id, content_migration_id, id,
 
     """
 
-    workflow_state_types = ('active', 'resolved')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/users/{user_id}/content_migrations/{content_migration_id}/migration_issues/{id}'
-    payload = {
-        'workflow_state' : workflow_state,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, content_migration_id=content_migration_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_migration_issue_users'].request(request_ctx, request_kwargs, (user_id, content_migration_id, id), {'workflow_state': workflow_state})
 
 
 def list_content_migrations_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
@@ -351,16 +300,7 @@ def list_content_migrations_accounts(request_ctx, account_id, per_page=None, **r
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_content_migrations_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def list_content_migrations_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -378,16 +318,7 @@ def list_content_migrations_courses(request_ctx, course_id, per_page=None, **req
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_content_migrations_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_content_migrations_groups(request_ctx, group_id, per_page=None, **request_kwargs):
@@ -405,16 +336,7 @@ def list_content_migrations_groups(request_ctx, group_id, per_page=None, **reque
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_content_migrations_groups'].request(request_ctx, request_kwargs, (group_id,), {'per_page': per_page})
 
 
 def list_content_migrations_users(request_ctx, user_id, per_page=None, **request_kwargs):
@@ -432,16 +354,7 @@ def list_content_migrations_users(request_ctx, user_id, per_page=None, **request
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_content_migrations_users'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def get_content_migration_accounts(request_ctx, account_id, id, **request_kwargs):
@@ -459,11 +372,7 @@ def get_content_migration_accounts(request_ctx, account_id, id, **request_kwargs
 
     """
 
-    path = '/v1/accounts/{account_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_content_migration_accounts'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def get_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
@@ -481,11 +390,7 @@ def get_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_content_migration_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def get_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
@@ -503,11 +408,7 @@ def get_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_content_migration_groups'].request(request_ctx, request_kwargs, (group_id, id), None)
 
 
 def get_content_migration_users(request_ctx, user_id, id, **request_kwargs):
@@ -525,11 +426,7 @@ def get_content_migration_users(request_ctx, user_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_content_migration_users'].request(request_ctx, request_kwargs, (user_id, id), None)
 
 
 def create_content_migration_accounts(request_ctx, account_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
@@ -611,33 +508,7 @@ def create_content_migration_accounts(request_ctx, account_id, migration_type, p
 
     """
 
-    path = '/v1/accounts/{account_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_content_migration_accounts'].request(request_ctx, request_kwargs, (account_id,), {'migration_type': migration_type, 'pre_attachment[name]': pre_attachment_name, 'pre_attachment[content_type]': pre_attachment_content_type, 'pre_attachment[parent_folder_id]': pre_attachment_parent_folder_id, 'pre_attachment[parent_folder_path]': pre_attachment_parent_folder_path, 'pre_attachment[folder]': pre_attachment_folder, 'pre_attachment[on_duplicate]': pre_attachment_on_duplicate, 'settings[file_url]': settings_file_url, 'settings[source_course_id]': settings_source_course_id, 'settings[folder_id]': settings_folder_id, 'settings[overwrite_quizzes]': settings_overwrite_quizzes, 'settings[question_bank_id]': settings_question_bank_id, 'settings[question_bank_name]': settings_question_bank_name, 'date_shift_options[shift_dates]': date_shift_options_shift_dates, 'date_shift_options[old_start_date]': date_shift_options_old_start_date, 'date_shift_options[old_end_date]': date_shift_options_old_end_date, 'date_shift_options[new_start_date]': date_shift_options_new_start_date, 'date_shift_options[new_end_date]': date_shift_options_new_end_date, 'date_shift_options[day_substitutions][X]': date_shift_options_day_substitutions_X, 'date_shift_options[remove_dates]': date_shift_options_remove_dates})
 
 
 def create_content_migration_courses(request_ctx, course_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
@@ -719,33 +590,7 @@ def create_content_migration_courses(request_ctx, course_id, migration_type, pre
 
     """
 
-    path = '/v1/courses/{course_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_content_migration_courses'].request(request_ctx, request_kwargs, (course_id,), {'migration_type': migration_type, 'pre_attachment[name]': pre_attachment_name, 'pre_attachment[content_type]': pre_attachment_content_type, 'pre_attachment[parent_folder_id]': pre_attachment_parent_folder_id, 'pre_attachment[parent_folder_path]': pre_attachment_parent_folder_path, 'pre_attachment[folder]': pre_attachment_folder, 'pre_attachment[on_duplicate]': pre_attachment_on_duplicate, 'settings[file_url]': settings_file_url, 'settings[source_course_id]': settings_source_course_id, 'settings[folder_id]': settings_folder_id, 'settings[overwrite_quizzes]': settings_overwrite_quizzes, 'settings[question_bank_id]': settings_question_bank_id, 'settings[question_bank_name]': settings_question_bank_name, 'date_shift_options[shift_dates]': date_shift_options_shift_dates, 'date_shift_options[old_start_date]': date_shift_options_old_start_date, 'date_shift_options[old_end_date]': date_shift_options_old_end_date, 'date_shift_options[new_start_date]': date_shift_options_new_start_date, 'date_shift_options[new_end_date]': date_shift_options_new_end_date, 'date_shift_options[day_substitutions][X]': date_shift_options_day_substitutions_X, 'date_shift_options[remove_dates]': date_shift_options_remove_dates})
 
 
 def create_content_migration_groups(request_ctx, group_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
@@ -827,33 +672,7 @@ def create_content_migration_groups(request_ctx, group_id, migration_type, pre_a
 
     """
 
-    path = '/v1/groups/{group_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_content_migration_groups'].request(request_ctx, request_kwargs, (group_id,), {'migration_type': migration_type, 'pre_attachment[name]': pre_attachment_name, 'pre_attachment[content_type]': pre_attachment_content_type, 'pre_attachment[parent_folder_id]': pre_attachment_parent_folder_id, 'pre_attachment[parent_folder_path]': pre_attachment_parent_folder_path, 'pre_attachment[folder]': pre_attachment_folder, 'pre_attachment[on_duplicate]': pre_attachment_on_duplicate, 'settings[file_url]': settings_file_url, 'settings[source_course_id]': settings_source_course_id, 'settings[folder_id]': settings_folder_id, 'settings[overwrite_quizzes]': settings_overwrite_quizzes, 'settings[question_bank_id]': settings_question_bank_id, 'settings[question_bank_name]': settings_question_bank_name, 'date_shift_options[shift_dates]': date_shift_options_shift_dates, 'date_shift_options[old_start_date]': date_shift_options_old_start_date, 'date_shift_options[old_end_date]': date_shift_options_old_end_date, 'date_shift_options[new_start_date]': date_shift_options_new_start_date, 'date_shift_options[new_end_date]': date_shift_options_new_end_date, 'date_shift_options[day_substitutions][X]': date_shift_options_day_substitutions_X, 'date_shift_options[remove_dates]': date_shift_options_remove_dates})
 
 
 def create_content_migration_users(request_ctx, user_id, migration_type, pre_attachment_name=None, pre_attachment_content_type=None, pre_attachment_parent_folder_id=None, pre_attachment_parent_folder_path=None, pre_attachment_folder=None, pre_attachment_on_duplicate=None, settings_file_url=None, settings_source_course_id=None, settings_folder_id=None, settings_overwrite_quizzes=None, settings_question_bank_id=None, settings_question_bank_name=None, date_shift_options_shift_dates=None, date_shift_options_old_start_date=None, date_shift_options_old_end_date=None, date_shift_options_new_start_date=None, date_shift_options_new_end_date=None, date_shift_options_day_substitutions_X=None, date_shift_options_remove_dates=None, **request_kwargs):
@@ -935,33 +754,7 @@ def create_content_migration_users(request_ctx, user_id, migration_type, pre_att
 
     """
 
-    path = '/v1/users/{user_id}/content_migrations'
-    payload = {
-        'migration_type' : migration_type,
-        'pre_attachment[name]' : pre_attachment_name,
-        'pre_attachment[content_type]' : pre_attachment_content_type,
-        'pre_attachment[parent_folder_id]' : pre_attachment_parent_folder_id,
-        'pre_attachment[parent_folder_path]' : pre_attachment_parent_folder_path,
-        'pre_attachment[folder]' : pre_attachment_folder,
-        'pre_attachment[on_duplicate]' : pre_attachment_on_duplicate,
-        'settings[file_url]' : settings_file_url,
-        'settings[source_course_id]' : settings_source_course_id,
-        'settings[folder_id]' : settings_folder_id,
-        'settings[overwrite_quizzes]' : settings_overwrite_quizzes,
-        'settings[question_bank_id]' : settings_question_bank_id,
-        'settings[question_bank_name]' : settings_question_bank_name,
-        'date_shift_options[shift_dates]' : date_shift_options_shift_dates,
-        'date_shift_options[old_start_date]' : date_shift_options_old_start_date,
-        'date_shift_options[old_end_date]' : date_shift_options_old_end_date,
-        'date_shift_options[new_start_date]' : date_shift_options_new_start_date,
-        'date_shift_options[new_end_date]' : date_shift_options_new_end_date,
-        'date_shift_options[day_substitutions][X]' : date_shift_options_day_substitutions_X,
-        'date_shift_options[remove_dates]' : date_shift_options_remove_dates,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_content_migration_users'].request(request_ctx, request_kwargs, (user_id,), {'migration_type': migration_type, 'pre_attachment[name]': pre_attachment_name, 'pre_attachment[content_type]': pre_attachment_content_type, 'pre_attachment[parent_folder_id]': pre_attachment_parent_folder_id, 'pre_attachment[parent_folder_path]': pre_attachment_parent_folder_path, 'pre_attachment[folder]': pre_attachment_folder, 'pre_attachment[on_duplicate]': pre_attachment_on_duplicate, 'settings[file_url]': settings_file_url, 'settings[source_course_id]': settings_source_course_id, 'settings[folder_id]': settings_folder_id, 'settings[overwrite_quizzes]': settings_overwrite_quizzes, 'settings[question_bank_id]': settings_question_bank_id, 'settings[question_bank_name]': settings_question_bank_name, 'date_shift_options[shift_dates]': date_shift_options_shift_dates, 'date_shift_options[old_start_date]': date_shift_options_old_start_date, 'date_shift_options[old_end_date]': date_shift_options_old_end_date, 'date_shift_options[new_start_date]': date_shift_options_new_start_date, 'date_shift_options[new_end_date]': date_shift_options_new_end_date, 'date_shift_options[day_substitutions][X]': date_shift_options_day_substitutions_X, 'date_shift_options[remove_dates]': date_shift_options_remove_dates})
 
 
 def update_content_migration_accounts(request_ctx, account_id, id, **request_kwargs):
@@ -984,11 +777,7 @@ def update_content_migration_accounts(request_ctx, account_id, id, **request_kwa
 
     """
 
-    path = '/v1/accounts/{account_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_content_migration_accounts'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def update_content_migration_courses(request_ctx, course_id, id, **request_kwargs):
@@ -1011,11 +800,7 @@ def update_content_migration_courses(request_ctx, course_id, id, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_content_migration_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def update_content_migration_groups(request_ctx, group_id, id, **request_kwargs):
@@ -1038,11 +823,7 @@ def update_content_migration_groups(request_ctx, group_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/groups/{group_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_content_migration_groups'].request(request_ctx, request_kwargs, (group_id, id), None)
 
 
 def update_content_migration_users(request_ctx, user_id, id, **request_kwargs):
@@ -1065,11 +846,7 @@ def update_content_migration_users(request_ctx, user_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/content_migrations/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_content_migration_users'].request(request_ctx, request_kwargs, (user_id, id), None)
 
 
 def list_migration_systems_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
@@ -1087,16 +864,7 @@ def list_migration_systems_accounts(request_ctx, account_id, per_page=None, **re
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_systems_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def list_migration_systems_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -1114,16 +882,7 @@ def list_migration_systems_courses(request_ctx, course_id, per_page=None, **requ
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_systems_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_migration_systems_groups(request_ctx, group_id, per_page=None, **request_kwargs):
@@ -1141,16 +900,7 @@ def list_migration_systems_groups(request_ctx, group_id, per_page=None, **reques
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_systems_groups'].request(request_ctx, request_kwargs, (group_id,), {'per_page': per_page})
 
 
 def list_migration_systems_users(request_ctx, user_id, per_page=None, **request_kwargs):
@@ -1168,15 +918,6 @@ def list_migration_systems_users(request_ctx, user_id, per_page=None, **request_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/content_migrations/migrators'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_migration_systems_users'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
@@ -1,4 +1,22 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_conversations', 'GET', '/v1/conversations', ('interleave_submissions', 'include_all_conversation_ids', 'scope', 'filter', 'filter_mode', 'per_page'), (('scope', ('unread', 'starred', 'archived')), ('filter_mode', ('and', 'or', 'default or] When filter[] contains multiple filters', 'filtering conversations that at have at least all of the contexts (and) or at least one of the contexts (or)')))),
+    ('create_conversation', 'POST', '/v1/conversations', ('recipients', 'body', 'group_conversation', 'attachment_ids', 'media_comment_id', 'media_comment_type', 'mode', 'subject', 'user_note', 'scope', 'filter', 'filter_mode', 'context_code'), (('media_comment_type', ('audio', 'video')), ('mode', ('sync', 'async')), ('scope', ('unread', 'starred', 'archived')), ('filter_mode', ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')))),
+    ('get_running_batches', 'GET', '/v1/conversations/batches', ()),
+    ('get_single_conversation', 'GET', '/v1/conversations/{id}', ('id', 'interleave_submissions', 'auto_mark_as_read', 'scope', 'filter', 'filter_mode'), (('scope', ('unread', 'starred', 'archived')), ('filter_mode', ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')))),
+    ('edit_conversation', 'PUT', '/v1/conversations/{id}', ('id', ('conversation[subject]', 'conversation_subject'), ('conversation[workflow_state]', 'conversation_workflow_state'), ('conversation[subscribed]', 'conversation_subscribed'), ('conversation[starred]', 'conversation_starred'), 'scope', 'filter', 'filter_mode'), (('conversation_workflow_state', ('read', 'unread', 'archived')), ('scope', ('unread', 'starred', 'archived')), ('filter_mode', ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')))),
+    ('mark_all_as_read', 'POST', '/v1/conversations/mark_all_as_read', ()),
+    ('delete_conversation', 'DELETE', '/v1/conversations/{id}', ('id',)),
+    ('add_recipients', 'POST', '/v1/conversations/{id}/add_recipients', ('id', 'recipients')),
+    ('add_message', 'POST', '/v1/conversations/{id}/add_message', ('id', 'body', 'attachment_ids', 'media_comment_id', 'media_comment_type', 'recipients', 'included_messages', 'user_note'), (('media_comment_type', ('audio', 'video')),)),
+    ('delete_message', 'POST', '/v1/conversations/{id}/remove_messages', ('id', 'remove')),
+    ('batch_update_conversations', 'PUT', '/v1/conversations', ('conversation_ids', 'event'), (('event', ('mark_as_read', 'mark_as_unread', 'star', 'unstar', 'archive', 'destroy')),)),
+    ('find_recipients', 'GET', '/v1/conversations/find_recipients', ()),
+    ('unread_count', 'GET', '/v1/conversations/unread_count', ()),
+])
+
 
 def list_conversations(request_ctx, interleave_submissions, include_all_conversation_ids, scope=None, filter=None, filter_mode=None, per_page=None, **request_kwargs):
     """
@@ -23,25 +41,7 @@ def list_conversations(request_ctx, interleave_submissions, include_all_conversa
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] When filter[] contains multiple filters', 'filtering conversations that at have at least all of the contexts (and) or at least one of the contexts (or)')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations'
-    payload = {
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'interleave_submissions' : interleave_submissions,
-        'include_all_conversation_ids' : include_all_conversation_ids,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_conversations'].request(request_ctx, request_kwargs, (), {'interleave_submissions': interleave_submissions, 'include_all_conversation_ids': include_all_conversation_ids, 'scope': scope, 'filter': filter, 'filter_mode': filter_mode, 'per_page': per_page})
 
 
 def create_conversation(request_ctx, recipients, body, group_conversation, attachment_ids, media_comment_id, media_comment_type, mode, subject=None, user_note=None, scope=None, filter=None, filter_mode=None, context_code=None, **request_kwargs):
@@ -83,34 +83,7 @@ def create_conversation(request_ctx, recipients, body, group_conversation, attac
 
     """
 
-    media_comment_type_types = ('audio', 'video')
-    mode_types = ('sync', 'async')
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(media_comment_type, media_comment_type_types)
-    utils.validate_attr_is_acceptable(mode, mode_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations'
-    payload = {
-        'recipients' : recipients,
-        'subject' : subject,
-        'body' : body,
-        'group_conversation' : group_conversation,
-        'attachment_ids' : attachment_ids,
-        'media_comment_id' : media_comment_id,
-        'media_comment_type' : media_comment_type,
-        'user_note' : user_note,
-        'mode' : mode,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'context_code' : context_code,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_conversation'].request(request_ctx, request_kwargs, (), {'recipients': recipients, 'body': body, 'group_conversation': group_conversation, 'attachment_ids': attachment_ids, 'media_comment_id': media_comment_id, 'media_comment_type': media_comment_type, 'mode': mode, 'subject': subject, 'user_note': user_note, 'scope': scope, 'filter': filter, 'filter_mode': filter_mode, 'context_code': context_code})
 
 
 def get_running_batches(request_ctx, **request_kwargs):
@@ -126,11 +99,7 @@ def get_running_batches(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/batches'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_running_batches'].request(request_ctx, request_kwargs, (), None)
 
 
 def get_single_conversation(request_ctx, id, interleave_submissions, auto_mark_as_read, scope=None, filter=None, filter_mode=None, **request_kwargs):
@@ -158,22 +127,7 @@ def get_single_conversation(request_ctx, id, interleave_submissions, auto_mark_a
 
     """
 
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations/{id}'
-    payload = {
-        'interleave_submissions' : interleave_submissions,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-        'auto_mark_as_read' : auto_mark_as_read,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_conversation'].request(request_ctx, request_kwargs, (id,), {'interleave_submissions': interleave_submissions, 'auto_mark_as_read': auto_mark_as_read, 'scope': scope, 'filter': filter, 'filter_mode': filter_mode})
 
 
 def edit_conversation(request_ctx, id, conversation_subject, conversation_workflow_state, conversation_subscribed, conversation_starred, scope=None, filter=None, filter_mode=None, **request_kwargs):
@@ -203,26 +157,7 @@ def edit_conversation(request_ctx, id, conversation_subject, conversation_workfl
 
     """
 
-    conversation_workflow_state_types = ('read', 'unread', 'archived')
-    scope_types = ('unread', 'starred', 'archived')
-    filter_mode_types = ('and', 'or', 'default or] Used when generating visible in the API response. See the explanation under the {api:ConversationsController#index index API action}')
-    utils.validate_attr_is_acceptable(conversation_workflow_state, conversation_workflow_state_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    utils.validate_attr_is_acceptable(filter_mode, filter_mode_types)
-    path = '/v1/conversations/{id}'
-    payload = {
-        'conversation[subject]' : conversation_subject,
-        'conversation[workflow_state]' : conversation_workflow_state,
-        'conversation[subscribed]' : conversation_subscribed,
-        'conversation[starred]' : conversation_starred,
-        'scope' : scope,
-        'filter' : filter,
-        'filter_mode' : filter_mode,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_conversation'].request(request_ctx, request_kwargs, (id,), {'conversation[subject]': conversation_subject, 'conversation[workflow_state]': conversation_workflow_state, 'conversation[subscribed]': conversation_subscribed, 'conversation[starred]': conversation_starred, 'scope': scope, 'filter': filter, 'filter_mode': filter_mode})
 
 
 def mark_all_as_read(request_ctx, **request_kwargs):
@@ -236,11 +171,7 @@ def mark_all_as_read(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/mark_all_as_read'
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_as_read'].request(request_ctx, request_kwargs, (), None)
 
 
 def delete_conversation(request_ctx, id, **request_kwargs):
@@ -259,11 +190,7 @@ def delete_conversation(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_conversation'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def add_recipients(request_ctx, id, recipients, **request_kwargs):
@@ -283,14 +210,7 @@ def add_recipients(request_ctx, id, recipients, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/{id}/add_recipients'
-    payload = {
-        'recipients' : recipients,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['add_recipients'].request(request_ctx, request_kwargs, (id,), {'recipients': recipients})
 
 
 def add_message(request_ctx, id, body, attachment_ids, media_comment_id, media_comment_type, recipients=None, included_messages=None, user_note=None, **request_kwargs):
@@ -330,22 +250,7 @@ def add_message(request_ctx, id, body, attachment_ids, media_comment_id, media_c
 
     """
 
-    media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(media_comment_type, media_comment_type_types)
-    path = '/v1/conversations/{id}/add_message'
-    payload = {
-        'body' : body,
-        'attachment_ids' : attachment_ids,
-        'media_comment_id' : media_comment_id,
-        'media_comment_type' : media_comment_type,
-        'recipients' : recipients,
-        'included_messages' : included_messages,
-        'user_note' : user_note,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['add_message'].request(request_ctx, request_kwargs, (id,), {'body': body, 'attachment_ids': attachment_ids, 'media_comment_id': media_comment_id, 'media_comment_type': media_comment_type, 'recipients': recipients, 'included_messages': included_messages, 'user_note': user_note})
 
 
 def delete_message(request_ctx, id, remove, **request_kwargs):
@@ -365,14 +270,7 @@ def delete_message(request_ctx, id, remove, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/{id}/remove_messages'
-    payload = {
-        'remove' : remove,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_message'].request(request_ctx, request_kwargs, (id,), {'remove': remove})
 
 
 def batch_update_conversations(request_ctx, conversation_ids, event, **request_kwargs):
@@ -391,17 +289,7 @@ def batch_update_conversations(request_ctx, conversation_ids, event, **request_k
 
     """
 
-    event_types = ('mark_as_read', 'mark_as_unread', 'star', 'unstar', 'archive', 'destroy')
-    utils.validate_attr_is_acceptable(event, event_types)
-    path = '/v1/conversations'
-    payload = {
-        'conversation_ids' : conversation_ids,
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['batch_update_conversations'].request(request_ctx, request_kwargs, (), {'conversation_ids': conversation_ids, 'event': event})
 
 
 def find_recipients(request_ctx, **request_kwargs):
@@ -415,11 +303,7 @@ def find_recipients(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/find_recipients'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['find_recipients'].request(request_ctx, request_kwargs, (), None)
 
 
 def unread_count(request_ctx, **request_kwargs):
@@ -433,10 +317,6 @@ def unread_count(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/conversations/unread_count'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unread_count'].request(request_ctx, request_kwargs, (), None)
 
 
@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('query_by_course', 'GET', '/v1/audit/course/courses/{course_id}', ('course_id', 'start_time', 'end_time', 'per_page')),
+])
+
 
 def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
     """
@@ -19,17 +25,6 @@ def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/course/courses/{course_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_course'].request(request_ctx, request_kwargs, (course_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
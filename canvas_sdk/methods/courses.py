@@ -1,4 +1,31 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('create_new_course', 'POST', '/v1/accounts/{account_id}/courses', ('account_id', ('course[name]', 'course_name'), ('course[course_code]', 'course_course_code'), ('course[start_at]', 'course_start_at'), ('course[end_at]', 'course_end_at'), ('course[license]', 'course_license'), ('course[is_public]', 'course_is_public'), ('course[is_public_to_auth_users]', 'course_is_public_to_auth_users'), ('course[public_syllabus]', 'course_public_syllabus'), ('course[public_description]', 'course_public_description'), ('course[allow_student_wiki_edits]', 'course_allow_student_wiki_edits'), ('course[allow_wiki_comments]', 'course_allow_wiki_comments'), ('course[allow_student_forum_attachments]', 'course_allow_student_forum_attachments'), ('course[open_enrollment]', 'course_open_enrollment'), ('course[self_enrollment]', 'course_self_enrollment'), ('course[restrict_enrollments_to_course_dates]', 'course_restrict_enrollments_to_course_dates'), ('course[term_id]', 'course_term_id'), ('course[sis_course_id]', 'course_sis_course_id'), ('course[integration_id]', 'course_integration_id'), ('course[hide_final_grades]', 'course_hide_final_grades'), ('course[apply_assignment_group_weights]', 'course_apply_assignment_group_weights'), 'offer', 'enroll_me', ('course[syllabus_body]', 'course_syllabus_body'))),
+    ('upload_file', 'POST', '/v1/courses/{course_id}/files', ('course_id',)),
+    ('list_students', 'GET', '/v1/courses/{course_id}/students', ('course_id', 'per_page')),
+    ('list_users_in_course_users', 'GET', '/v1/courses/{course_id}/users', ('course_id', ('include[]', 'include'), 'search_term', 'enrollment_type', 'enrollment_role', 'user_id', 'per_page'), (('enrollment_type', ('teacher', 'student', 'ta', 'observer', 'designer')), ('include', ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')))),
+    ('list_users_in_course_search_users', 'GET', '/v1/courses/{course_id}/search_users', ('course_id', ('include[]', 'include'), 'search_term', 'enrollment_type', 'enrollment_role', 'user_id', 'per_page'), (('enrollment_type', ('teacher', 'student', 'ta', 'observer', 'designer')), ('include', ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')))),
+    ('list_recently_logged_in_students', 'GET', '/v1/courses/{course_id}/recent_students', ('course_id', 'per_page')),
+    ('get_single_user', 'GET', '/v1/courses/{course_id}/users/{id}', ('course_id', 'id')),
+    ('preview_processed_html', 'POST', '/v1/courses/{course_id}/preview_html', ('course_id', 'html')),
+    ('course_activity_stream', 'GET', '/v1/courses/{course_id}/activity_stream', ('course_id',)),
+    ('course_activity_stream_summary', 'GET', '/v1/courses/{course_id}/activity_stream/summary', ('course_id',)),
+    ('course_todo_items', 'GET', '/v1/courses/{course_id}/todo', ('course_id',)),
+    ('conclude_course', 'DELETE', '/v1/courses/{id}', ('id', 'event'), (('event', ('delete', 'conclude')),)),
+    ('get_course_settings', 'GET', '/v1/courses/{course_id}/settings', ('course_id',)),
+    ('update_course_settings', 'PUT', '/v1/courses/{course_id}/settings', ('course_id', 'allow_student_discussion_topics', 'allow_student_forum_attachments', 'allow_student_discussion_editing')),
+    ('get_single_course_courses', 'GET', '/v1/courses/{id}', ('id', 'include'), (('include', ('needs_grading_count', 'syllabus_body', 'public_description', 'total_scores', 'current_grading_period_scores', 'term', 'course_progress', 'sections', 'storage_quota_used_mb', 'total_students', 'passback_status', 'favorites', 'teachers', 'observed_users', 'all_courses', 'permissions', 'observed_users')),)),
+    ('get_single_course_accounts', 'GET', '/v1/accounts/{account_id}/courses/{id}', ('account_id', 'id', ('include[]', 'include')), (('include', ('all_courses', 'permissions')),)),
+    ('update_courses', 'PUT', '/v1/accounts/{account_id}/courses', ('account_id', ('course_ids[]', 'course_ids'), 'event')),
+    ('get_course_copy_status', 'GET', '/v1/courses/{course_id}/course_copy/{id}', ('course_id', 'id')),
+    ('copy_course_content', 'POST', '/v1/courses/{course_id}/course_copy', ('course_id', 'source_course', ('except[]', 'var_except'), ('only[]', 'only')), (('var_except', ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')), ('only', ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')))),
+])
+
+ENROLLMENT_TYPE_TYPES = frozenset(('teacher', 'student', 'ta', 'observer', 'designer'))
+INCLUDE_TYPES = frozenset(('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections'))
+STATE_TYPES = frozenset(('unpublished', 'available', 'completed', 'deleted'))
 
 
 def list_your_courses(request_ctx, include, enrollment_type=None, enrollment_role=None, state=None, per_page=None, as_user_id=None, **request_kwargs):
@@ -24,12 +51,9 @@ def list_your_courses(request_ctx, include, enrollment_type=None, enrollment_rol
 
     if per_page is None:
         per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('needs_grading_count', 'syllabus_body', 'total_scores', 'term', 'course_progress', 'sections')
-    state_types = ('unpublished', 'available', 'completed', 'deleted')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(state, state_types)
+    utils.validate_attr_is_acceptable(enrollment_type, ENROLLMENT_TYPE_TYPES)
+    utils.validate_attr_is_acceptable(include, INCLUDE_TYPES)
+    utils.validate_attr_is_acceptable(state, STATE_TYPES)
     path = '/v1/courses'
     payload = {
         'enrollment_type' : enrollment_type,
@@ -46,6 +70,7 @@ def list_your_courses(request_ctx, include, enrollment_type=None, enrollment_rol
     return response
 
 
+
 def create_new_course(request_ctx, account_id, course_name=None, course_course_code=None, course_start_at=None, course_end_at=None, course_license=None, course_is_public=None, course_is_public_to_auth_users=None, course_public_syllabus=None, course_public_description=None, course_allow_student_wiki_edits=None, course_allow_wiki_comments=None, course_allow_student_forum_attachments=None, course_open_enrollment=None, course_self_enrollment=None, course_restrict_enrollments_to_course_dates=None, course_term_id=None, course_sis_course_id=None, course_integration_id=None, course_hide_final_grades=None, course_apply_assignment_group_weights=None, offer=None, enroll_me=None, course_syllabus_body=None, **request_kwargs):
     """
     Create a new course
@@ -105,36 +130,7 @@ def create_new_course(request_ctx, account_id, course_name=None, course_course_c
 
     """
 
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'course[name]' : course_name,
-        'course[course_code]' : course_course_code,
-        'course[start_at]' : course_start_at,
-        'course[end_at]' : course_end_at,
-        'course[license]' : course_license,
-        'course[is_public]' : course_is_public,
-        'course[is_public_to_auth_users]' : course_is_public_to_auth_users,
-        'course[public_syllabus]' : course_public_syllabus,
-        'course[public_description]' : course_public_description,
-        'course[allow_student_wiki_edits]' : course_allow_student_wiki_edits,
-        'course[allow_wiki_comments]' : course_allow_wiki_comments,
-        'course[allow_student_forum_attachments]' : course_allow_student_forum_attachments,
-        'course[open_enrollment]' : course_open_enrollment,
-        'course[self_enrollment]' : course_self_enrollment,
-        'course[restrict_enrollments_to_course_dates]' : course_restrict_enrollments_to_course_dates,
-        'course[term_id]' : course_term_id,
-        'course[sis_course_id]' : course_sis_course_id,
-        'course[integration_id]' : course_integration_id,
-        'course[hide_final_grades]' : course_hide_final_grades,
-        'course[apply_assignment_group_weights]' : course_apply_assignment_group_weights,
-        'offer' : offer,
-        'enroll_me' : enroll_me,
-        'course[syllabus_body]' : course_syllabus_body,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_course'].request(request_ctx, request_kwargs, (account_id,), {'course[name]': course_name, 'course[course_code]': course_course_code, 'course[start_at]': course_start_at, 'course[end_at]': course_end_at, 'course[license]': course_license, 'course[is_public]': course_is_public, 'course[is_public_to_auth_users]': course_is_public_to_auth_users, 'course[public_syllabus]': course_public_syllabus, 'course[public_description]': course_public_description, 'course[allow_student_wiki_edits]': course_allow_student_wiki_edits, 'course[allow_wiki_comments]': course_allow_wiki_comments, 'course[allow_student_forum_attachments]': course_allow_student_forum_attachments, 'course[open_enrollment]': course_open_enrollment, 'course[self_enrollment]': course_self_enrollment, 'course[restrict_enrollments_to_course_dates]': course_restrict_enrollments_to_course_dates, 'course[term_id]': course_term_id, 'course[sis_course_id]': course_sis_course_id, 'course[integration_id]': course_integration_id, 'course[hide_final_grades]': course_hide_final_grades, 'course[apply_assignment_group_weights]': course_apply_assignment_group_weights, 'offer': offer, 'enroll_me': enroll_me, 'course[syllabus_body]': course_syllabus_body})
 
 
 def upload_file(request_ctx, course_id, **request_kwargs):
@@ -157,11 +153,7 @@ def upload_file(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def list_students(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -182,16 +174,7 @@ def list_students(request_ctx, course_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/students'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_students'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_users_in_course_users(request_ctx, course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None, **request_kwargs):
@@ -219,25 +202,7 @@ def list_users_in_course_users(request_ctx, course_id, include, search_term=None
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'enrollment_type' : enrollment_type,
-        'enrollment_role' : enrollment_role,
-        'include[]' : include,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_users_in_course_users'].request(request_ctx, request_kwargs, (course_id,), {'include[]': include, 'search_term': search_term, 'enrollment_type': enrollment_type, 'enrollment_role': enrollment_role, 'user_id': user_id, 'per_page': per_page})
 
 
 def list_users_in_course_search_users(request_ctx, course_id, include, search_term=None, enrollment_type=None, enrollment_role=None, user_id=None, per_page=None, **request_kwargs):
@@ -265,25 +230,7 @@ def list_users_in_course_search_users(request_ctx, course_id, include, search_te
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    enrollment_type_types = ('teacher', 'student', 'ta', 'observer', 'designer')
-    include_types = ('email', 'enrollments', 'locked', 'avatar_url', 'test_student')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/search_users'
-    payload = {
-        'search_term' : search_term,
-        'enrollment_type' : enrollment_type,
-        'enrollment_role' : enrollment_role,
-        'include[]' : include,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_users_in_course_search_users'].request(request_ctx, request_kwargs, (course_id,), {'include[]': include, 'search_term': search_term, 'enrollment_type': enrollment_type, 'enrollment_role': enrollment_role, 'user_id': user_id, 'per_page': per_page})
 
 
 def list_recently_logged_in_students(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -304,16 +251,7 @@ def list_recently_logged_in_students(request_ctx, course_id, per_page=None, **re
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/recent_students'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_recently_logged_in_students'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def get_single_user(request_ctx, course_id, id, **request_kwargs):
@@ -334,11 +272,7 @@ def get_single_user(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/users/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_user'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def preview_processed_html(request_ctx, course_id, html, **request_kwargs):
@@ -356,14 +290,7 @@ def preview_processed_html(request_ctx, course_id, html, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/preview_html'
-    payload = {
-        'html' : html,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['preview_processed_html'].request(request_ctx, request_kwargs, (course_id,), {'html': html})
 
 
 def course_activity_stream(request_ctx, course_id, **request_kwargs):
@@ -382,11 +309,7 @@ def course_activity_stream(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/activity_stream'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['course_activity_stream'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def course_activity_stream_summary(request_ctx, course_id, **request_kwargs):
@@ -405,11 +328,7 @@ def course_activity_stream_summary(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['course_activity_stream_summary'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def course_todo_items(request_ctx, course_id, **request_kwargs):
@@ -427,11 +346,7 @@ def course_todo_items(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/todo'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['course_todo_items'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def conclude_course(request_ctx, id, event, **request_kwargs):
@@ -449,16 +364,7 @@ def conclude_course(request_ctx, id, event, **request_kwargs):
 
     """
 
-    event_types = ('delete', 'conclude')
-    utils.validate_attr_is_acceptable(event, event_types)
-    path = '/v1/courses/{id}'
-    payload = {
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['conclude_course'].request(request_ctx, request_kwargs, (id,), {'event': event})
 
 
 def get_course_settings(request_ctx, course_id, **request_kwargs):
@@ -474,11 +380,7 @@ def get_course_settings(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/settings'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_course_settings'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def update_course_settings(request_ctx, course_id, allow_student_discussion_topics, allow_student_forum_attachments, allow_student_discussion_editing, **request_kwargs):
@@ -500,16 +402,7 @@ def update_course_settings(request_ctx, course_id, allow_student_discussion_topi
 
     """
 
-    path = '/v1/courses/{course_id}/settings'
-    payload = {
-        'allow_student_discussion_topics' : allow_student_discussion_topics,
-        'allow_student_forum_attachments' : allow_student_forum_attachments,
-        'allow_student_discussion_editing' : allow_student_discussion_editing,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_course_settings'].request(request_ctx, request_kwargs, (course_id,), {'allow_student_discussion_topics': allow_student_discussion_topics, 'allow_student_forum_attachments': allow_student_forum_attachments, 'allow_student_discussion_editing': allow_student_discussion_editing})
 
 
 def get_single_course_courses(request_ctx, id, include=None, **request_kwargs):
@@ -533,21 +426,7 @@ def get_single_course_courses(request_ctx, id, include=None, **request_kwargs):
 
     """
 
-    include_types = (
-        'needs_grading_count', 'syllabus_body', 'public_description',
-        'total_scores', 'current_grading_period_scores', 'term',
-        'course_progress', 'sections', 'storage_quota_used_mb',
-        'total_students', 'passback_status', 'favorites', 'teachers',
-        'observed_users', 'all_courses', 'permissions', 'observed_users')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{id}'
-    payload = {
-        'include': include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_course_courses'].request(request_ctx, request_kwargs, (id,), {'include': include})
 
 
 def get_single_course_accounts(request_ctx, account_id, id, include, **request_kwargs):
@@ -569,16 +448,7 @@ def get_single_course_accounts(request_ctx, account_id, id, include, **request_k
 
     """
 
-    include_types = ('all_courses', 'permissions')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/courses/{id}'
-    payload = {
-        'include[]' : include,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_course_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'include[]': include})
 
 
 def update_course(request_ctx, id, course_account_id=None, course_name=None, course_course_code=None,
@@ -714,6 +584,7 @@ def update_course(request_ctx, id, course_account_id=None, course_name=None, cou
     return response
 
 
+
 def update_courses(request_ctx, account_id, course_ids, event, **request_kwargs):
     """
     Update multiple courses in an account.  Operates asynchronously; use the `ProgressController#show <https://github.com/instructure/canvas-lms/blob/master/app/controllers/progress_controller.rb>`_
@@ -732,15 +603,7 @@ def update_courses(request_ctx, account_id, course_ids, event, **request_kwargs)
 
     """
 
-    path = '/v1/accounts/{account_id}/courses'
-    payload = {
-        'course_ids[]' : course_ids,
-        'event' : event,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_courses'].request(request_ctx, request_kwargs, (account_id,), {'course_ids[]': course_ids, 'event': event})
 
 
 def get_course_copy_status(request_ctx, course_id, id, **request_kwargs):
@@ -760,11 +623,7 @@ def get_course_copy_status(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/course_copy/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_course_copy_status'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def copy_course_content(request_ctx, course_id, source_course, var_except, only, **request_kwargs):
@@ -792,17 +651,6 @@ def copy_course_content(request_ctx, course_id, source_course, var_except, only,
 
     """
 
-    var_except_types = ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')
-    only_types = ('course_settings', 'assignments', 'external_tools', 'files', 'topics', 'calendar_events', 'quizzes', 'wiki_pages', 'modules', 'outcomes')
-    utils.validate_attr_is_acceptable(var_except, var_except_types)
-    utils.validate_attr_is_acceptable(only, only_types)
-    path = '/v1/courses/{course_id}/course_copy'
-    payload = {
-        'source_course' : source_course,
-        'except[]' : var_except,
-        'only[]' : only,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
+    return ENDPOINTS['copy_course_content'].request(request_ctx, request_kwargs, (course_id,), {'source_course': source_course, 'except[]': var_except, 'only[]': only})
+
 
-    return response
@@ -1,4 +1,16 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_custom_gradebook_columns', 'GET', '/v1/courses/{course_id}/custom_gradebook_columns', ('course_id', 'per_page')),
+    ('create_custom_gradebook_column', 'POST', '/v1/courses/{course_id}/custom_gradebook_columns', ('course_id', ('column[title]', 'column_title'), ('column[position]', 'column_position'), ('column[hidden]', 'column_hidden'), ('column[teacher_notes]', 'column_teacher_notes'))),
+    ('update_custom_gradebook_column', 'PUT', '/v1/courses/{course_id}/custom_gradebook_columns/{id}', ('course_id', 'id')),
+    ('delete_custom_gradebook_column', 'DELETE', '/v1/courses/{course_id}/custom_gradebook_columns/{id}', ('course_id', 'id')),
+    ('reorder_custom_columns', 'POST', '/v1/courses/{course_id}/custom_gradebook_columns/reorder', ('course_id', 'order')),
+    ('list_entries_for_column', 'GET', '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data', ('course_id', 'id', 'per_page')),
+    ('update_column_data', 'PUT', '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data/{user_id}', ('course_id', 'id', 'user_id', ('column_data[content]', 'column_data_content'))),
+])
+
 
 def list_custom_gradebook_columns(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +27,7 @@ def list_custom_gradebook_columns(request_ctx, course_id, per_page=None, **reque
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/custom_gradebook_columns'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_custom_gradebook_columns'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def create_custom_gradebook_column(request_ctx, course_id, column_title, column_position, column_hidden=None, column_teacher_notes=None, **request_kwargs):
@@ -48,17 +51,7 @@ def create_custom_gradebook_column(request_ctx, course_id, column_title, column_
 
     """
 
-    path = '/v1/courses/{course_id}/custom_gradebook_columns'
-    payload = {
-        'column[title]' : column_title,
-        'column[position]' : column_position,
-        'column[hidden]' : column_hidden,
-        'column[teacher_notes]' : column_teacher_notes,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_custom_gradebook_column'].request(request_ctx, request_kwargs, (course_id,), {'column[title]': column_title, 'column[position]': column_position, 'column[hidden]': column_hidden, 'column[teacher_notes]': column_teacher_notes})
 
 
 def update_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs):
@@ -76,11 +69,7 @@ def update_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_custom_gradebook_column'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def delete_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs):
@@ -98,11 +87,7 @@ def delete_custom_gradebook_column(request_ctx, course_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_custom_gradebook_column'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def reorder_custom_columns(request_ctx, course_id, order, **request_kwargs):
@@ -122,14 +107,7 @@ def reorder_custom_columns(request_ctx, course_id, order, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_custom_columns'].request(request_ctx, request_kwargs, (course_id,), {'order': order})
 
 
 def list_entries_for_column(request_ctx, course_id, id, per_page=None, **request_kwargs):
@@ -149,16 +127,7 @@ def list_entries_for_column(request_ctx, course_id, id, per_page=None, **request
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entries_for_column'].request(request_ctx, request_kwargs, (course_id, id), {'per_page': per_page})
 
 
 def update_column_data(request_ctx, course_id, id, user_id, column_data_content, **request_kwargs):
@@ -180,13 +149,6 @@ def update_column_data(request_ctx, course_id, id, user_id, column_data_content,
 
     """
 
-    path = '/v1/courses/{course_id}/custom_gradebook_columns/{id}/data/{user_id}'
-    payload = {
-        'column_data[content]' : column_data_content,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_column_data'].request(request_ctx, request_kwargs, (course_id, id, user_id), {'column_data[content]': column_data_content})
 
 
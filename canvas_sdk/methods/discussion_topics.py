@@ -1,4 +1,74 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_discussion_topics_courses', 'GET', '/v1/courses/{course_id}/discussion_topics', ('course_id', 'order_by', 'scope', 'only_announcements', 'search_term'), (('order_by', ('position', 'recent_activity')), ('scope', ('locked', 'unlocked', 'pinned', 'unpinned')))),
+    ('list_discussion_topics_groups', 'GET', '/v1/groups/{group_id}/discussion_topics', ('group_id', 'order_by', 'scope', 'only_announcements', 'search_term'), (('order_by', ('position', 'recent_activity')), ('scope', ('locked', 'unlocked', 'pinned', 'unpinned')))),
+    ('create_new_discussion_topic_courses', 'POST', '/v1/courses/{course_id}/discussion_topics', ('course_id', 'title', 'message', 'require_initial_post', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled', 'podcast_has_student_posts', 'assignment', 'is_announcement', 'position_after', 'group_category_id'), (('discussion_type', ('side_comment', 'threaded')),)),
+    ('create_new_discussion_topic_groups', 'POST', '/v1/groups/{group_id}/discussion_topics', ('group_id', 'title', 'message', 'require_initial_post', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled', 'podcast_has_student_posts', 'assignment', 'is_announcement', 'position_after', 'group_category_id'), (('discussion_type', ('side_comment', 'threaded')),)),
+    ('create_new_discussion_topic_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics', ('collection_item_id', 'title', 'message', 'require_initial_post', 'discussion_type', 'published', 'delayed_post_at', 'lock_at', 'podcast_enabled', 'podcast_has_student_posts', 'assignment', 'is_announcement', 'position_after', 'group_category_id'), (('discussion_type', ('side_comment', 'threaded')),)),
+    ('update_topic_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}', ('course_id', 'topic_id')),
+    ('update_topic_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}', ('group_id', 'topic_id')),
+    ('update_topic_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}', ('collection_item_id', 'topic_id')),
+    ('delete_topic_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}', ('course_id', 'topic_id')),
+    ('delete_topic_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}', ('group_id', 'topic_id')),
+    ('delete_topic_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}', ('collection_item_id', 'topic_id')),
+    ('reorder_pinned_topics_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/reorder', ('course_id', 'order')),
+    ('reorder_pinned_topics_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/reorder', ('group_id', 'order')),
+    ('reorder_pinned_topics_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/reorder', ('collection_item_id', 'order')),
+    ('update_entry_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}', ('course_id', 'topic_id', 'id', 'message')),
+    ('update_entry_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}', ('group_id', 'topic_id', 'id', 'message')),
+    ('update_entry_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}', ('collection_item_id', 'topic_id', 'id', 'message')),
+    ('delete_entry_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}', ('course_id', 'topic_id', 'id')),
+    ('delete_entry_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}', ('group_id', 'topic_id', 'id')),
+    ('delete_entry_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}', ('collection_item_id', 'topic_id', 'id')),
+    ('get_single_topic_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}', ('course_id', 'topic_id')),
+    ('get_single_topic_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}', ('group_id', 'topic_id')),
+    ('get_single_topic_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}', ('collection_item_id', 'topic_id')),
+    ('get_full_topic_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/view', ('course_id', 'topic_id')),
+    ('get_full_topic_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/view', ('group_id', 'topic_id')),
+    ('get_full_topic_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/view', ('collection_item_id', 'topic_id')),
+    ('post_entry_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries', ('course_id', 'topic_id', 'message', 'attachment')),
+    ('post_entry_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries', ('group_id', 'topic_id', 'message', 'attachment')),
+    ('post_entry_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries', ('collection_item_id', 'topic_id', 'message', 'attachment')),
+    ('list_topic_entries_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries', ('course_id', 'topic_id')),
+    ('list_topic_entries_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries', ('group_id', 'topic_id')),
+    ('list_topic_entries_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries', ('collection_item_id', 'topic_id')),
+    ('post_reply_courses', 'POST', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('course_id', 'topic_id', 'entry_id', 'message', 'attachment')),
+    ('post_reply_groups', 'POST', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('group_id', 'topic_id', 'entry_id', 'message', 'attachment')),
+    ('post_reply_collection_items', 'POST', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('collection_item_id', 'topic_id', 'entry_id', 'message', 'attachment')),
+    ('list_entry_replies_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('course_id', 'topic_id', 'entry_id')),
+    ('list_entry_replies_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('group_id', 'topic_id', 'entry_id')),
+    ('list_entry_replies_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies', ('collection_item_id', 'topic_id', 'entry_id')),
+    ('list_entries_courses', 'GET', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entry_list', ('course_id', 'topic_id', 'ids')),
+    ('list_entries_groups', 'GET', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entry_list', ('group_id', 'topic_id', 'ids')),
+    ('list_entries_collection_items', 'GET', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entry_list', ('collection_item_id', 'topic_id', 'ids')),
+    ('mark_topic_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read', ('course_id', 'topic_id')),
+    ('mark_topic_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read', ('group_id', 'topic_id')),
+    ('mark_topic_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read', ('collection_item_id', 'topic_id')),
+    ('mark_topic_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read', ('course_id', 'topic_id')),
+    ('mark_topic_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read', ('group_id', 'topic_id')),
+    ('mark_topic_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read', ('collection_item_id', 'topic_id')),
+    ('mark_all_entries_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all', ('course_id', 'topic_id', 'forced_read_state')),
+    ('mark_all_entries_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all', ('group_id', 'topic_id', 'forced_read_state')),
+    ('mark_all_entries_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all', ('collection_item_id', 'topic_id', 'forced_read_state')),
+    ('mark_all_entries_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all', ('course_id', 'topic_id', 'forced_read_state')),
+    ('mark_all_entries_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all', ('group_id', 'topic_id', 'forced_read_state')),
+    ('mark_all_entries_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all', ('collection_item_id', 'topic_id', 'forced_read_state')),
+    ('mark_entry_as_read_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('course_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('mark_entry_as_read_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('group_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('mark_entry_as_read_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('collection_item_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('mark_entry_as_unread_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('course_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('mark_entry_as_unread_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('group_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('mark_entry_as_unread_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read', ('collection_item_id', 'topic_id', 'entry_id', 'forced_read_state')),
+    ('subscribe_to_topic_courses', 'PUT', '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed', ('course_id', 'topic_id')),
+    ('subscribe_to_topic_groups', 'PUT', '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed', ('group_id', 'topic_id')),
+    ('subscribe_to_topic_collection_items', 'PUT', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed', ('collection_item_id', 'topic_id')),
+    ('unsubscribe_from_topic_courses', 'DELETE', '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed', ('course_id', 'topic_id')),
+    ('unsubscribe_from_topic_groups', 'DELETE', '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed', ('group_id', 'topic_id')),
+    ('unsubscribe_from_topic_collection_items', 'DELETE', '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed', ('collection_item_id', 'topic_id')),
+])
+
 
 def list_discussion_topics_courses(request_ctx, course_id, order_by=None, scope=None, only_announcements=None, search_term=None, **request_kwargs):
     """
@@ -21,21 +91,7 @@ def list_discussion_topics_courses(request_ctx, course_id, order_by=None, scope=
 
     """
 
-    order_by_types = ('position', 'recent_activity')
-    scope_types = ('locked', 'unlocked', 'pinned', 'unpinned')
-    utils.validate_attr_is_acceptable(order_by, order_by_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    path = '/v1/courses/{course_id}/discussion_topics'
-    payload = {
-        'order_by' : order_by,
-        'scope' : scope,
-        'only_announcements' : only_announcements,
-        'search_term' : search_term,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_discussion_topics_courses'].request(request_ctx, request_kwargs, (course_id,), {'order_by': order_by, 'scope': scope, 'only_announcements': only_announcements, 'search_term': search_term})
 
 
 def list_discussion_topics_groups(request_ctx, group_id, order_by=None, scope=None, only_announcements=None, search_term=None, **request_kwargs):
@@ -59,21 +115,7 @@ def list_discussion_topics_groups(request_ctx, group_id, order_by=None, scope=No
 
     """
 
-    order_by_types = ('position', 'recent_activity')
-    scope_types = ('locked', 'unlocked', 'pinned', 'unpinned')
-    utils.validate_attr_is_acceptable(order_by, order_by_types)
-    utils.validate_attr_is_acceptable(scope, scope_types)
-    path = '/v1/groups/{group_id}/discussion_topics'
-    payload = {
-        'order_by' : order_by,
-        'scope' : scope,
-        'only_announcements' : only_announcements,
-        'search_term' : search_term,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_discussion_topics_groups'].request(request_ctx, request_kwargs, (group_id,), {'order_by': order_by, 'scope': scope, 'only_announcements': only_announcements, 'search_term': search_term})
 
 
 def create_new_discussion_topic_courses(request_ctx, course_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
@@ -115,28 +157,7 @@ def create_new_discussion_topic_courses(request_ctx, course_id, title, message,
 
     """
 
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/courses/{course_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_discussion_topic_courses'].request(request_ctx, request_kwargs, (course_id,), {'title': title, 'message': message, 'require_initial_post': require_initial_post, 'discussion_type': discussion_type, 'published': published, 'delayed_post_at': delayed_post_at, 'lock_at': lock_at, 'podcast_enabled': podcast_enabled, 'podcast_has_student_posts': podcast_has_student_posts, 'assignment': assignment, 'is_announcement': is_announcement, 'position_after': position_after, 'group_category_id': group_category_id})
 
 
 def create_new_discussion_topic_groups(request_ctx, group_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
@@ -178,28 +199,7 @@ def create_new_discussion_topic_groups(request_ctx, group_id, title, message, re
 
     """
 
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/groups/{group_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_discussion_topic_groups'].request(request_ctx, request_kwargs, (group_id,), {'title': title, 'message': message, 'require_initial_post': require_initial_post, 'discussion_type': discussion_type, 'published': published, 'delayed_post_at': delayed_post_at, 'lock_at': lock_at, 'podcast_enabled': podcast_enabled, 'podcast_has_student_posts': podcast_has_student_posts, 'assignment': assignment, 'is_announcement': is_announcement, 'position_after': position_after, 'group_category_id': group_category_id})
 
 
 def create_new_discussion_topic_collection_items(request_ctx, collection_item_id, title, message, require_initial_post, discussion_type=None, published=None, delayed_post_at=None, lock_at=None, podcast_enabled=None, podcast_has_student_posts=None, assignment=None, is_announcement=None, position_after=None, group_category_id=None, **request_kwargs):
@@ -241,28 +241,7 @@ def create_new_discussion_topic_collection_items(request_ctx, collection_item_id
 
     """
 
-    discussion_type_types = ('side_comment', 'threaded')
-    utils.validate_attr_is_acceptable(discussion_type, discussion_type_types)
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics'
-    payload = {
-        'title' : title,
-        'message' : message,
-        'discussion_type' : discussion_type,
-        'published' : published,
-        'delayed_post_at' : delayed_post_at,
-        'lock_at' : lock_at,
-        'podcast_enabled' : podcast_enabled,
-        'podcast_has_student_posts' : podcast_has_student_posts,
-        'require_initial_post' : require_initial_post,
-        'assignment' : assignment,
-        'is_announcement' : is_announcement,
-        'position_after' : position_after,
-        'group_category_id' : group_category_id,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_discussion_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id,), {'title': title, 'message': message, 'require_initial_post': require_initial_post, 'discussion_type': discussion_type, 'published': published, 'delayed_post_at': delayed_post_at, 'lock_at': lock_at, 'podcast_enabled': podcast_enabled, 'podcast_has_student_posts': podcast_has_student_posts, 'assignment': assignment, 'is_announcement': is_announcement, 'position_after': position_after, 'group_category_id': group_category_id})
 
 
 def update_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -280,11 +259,7 @@ def update_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def update_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -302,11 +277,7 @@ def update_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def update_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -324,11 +295,7 @@ def update_topic_collection_items(request_ctx, collection_item_id, topic_id, **r
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def delete_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -347,11 +314,7 @@ def delete_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def delete_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -370,11 +333,7 @@ def delete_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def delete_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -393,11 +352,7 @@ def delete_topic_collection_items(request_ctx, collection_item_id, topic_id, **r
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def reorder_pinned_topics_courses(request_ctx, course_id, order=None, **request_kwargs):
@@ -416,14 +371,7 @@ def reorder_pinned_topics_courses(request_ctx, course_id, order=None, **request_
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_pinned_topics_courses'].request(request_ctx, request_kwargs, (course_id,), {'order': order})
 
 
 def reorder_pinned_topics_groups(request_ctx, group_id, order=None, **request_kwargs):
@@ -442,14 +390,7 @@ def reorder_pinned_topics_groups(request_ctx, group_id, order=None, **request_kw
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_pinned_topics_groups'].request(request_ctx, request_kwargs, (group_id,), {'order': order})
 
 
 def reorder_pinned_topics_collection_items(request_ctx, collection_item_id, order=None, **request_kwargs):
@@ -468,14 +409,7 @@ def reorder_pinned_topics_collection_items(request_ctx, collection_item_id, orde
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/reorder'
-    payload = {
-        'order' : order,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_pinned_topics_collection_items'].request(request_ctx, request_kwargs, (collection_item_id,), {'order': order})
 
 
 def update_entry_courses(request_ctx, course_id, topic_id, id, message, **request_kwargs):
@@ -500,14 +434,7 @@ def update_entry_courses(request_ctx, course_id, topic_id, id, message, **reques
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_entry_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, id), {'message': message})
 
 
 def update_entry_groups(request_ctx, group_id, topic_id, id, message, **request_kwargs):
@@ -532,14 +459,7 @@ def update_entry_groups(request_ctx, group_id, topic_id, id, message, **request_
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_entry_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, id), {'message': message})
 
 
 def update_entry_collection_items(request_ctx, collection_item_id, topic_id, id, message, **request_kwargs):
@@ -564,14 +484,7 @@ def update_entry_collection_items(request_ctx, collection_item_id, topic_id, id,
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}'
-    payload = {
-        'message' : message,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_entry_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, id), {'message': message})
 
 
 def delete_entry_courses(request_ctx, course_id, topic_id, id, **request_kwargs):
@@ -596,11 +509,7 @@ def delete_entry_courses(request_ctx, course_id, topic_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_entry_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, id), None)
 
 
 def delete_entry_groups(request_ctx, group_id, topic_id, id, **request_kwargs):
@@ -625,11 +534,7 @@ def delete_entry_groups(request_ctx, group_id, topic_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_entry_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, id), None)
 
 
 def delete_entry_collection_items(request_ctx, collection_item_id, topic_id, id, **request_kwargs):
@@ -654,11 +559,7 @@ def delete_entry_collection_items(request_ctx, collection_item_id, topic_id, id,
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_entry_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, id), None)
 
 
 def get_single_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -676,11 +577,7 @@ def get_single_topic_courses(request_ctx, course_id, topic_id, **request_kwargs)
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def get_single_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -698,11 +595,7 @@ def get_single_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def get_single_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -720,11 +613,7 @@ def get_single_topic_collection_items(request_ctx, collection_item_id, topic_id,
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def get_full_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -770,11 +659,7 @@ def get_full_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_full_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def get_full_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -820,11 +705,7 @@ def get_full_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_full_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def get_full_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -870,11 +751,7 @@ def get_full_topic_collection_items(request_ctx, collection_item_id, topic_id, *
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/view'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_full_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def post_entry_courses(request_ctx, course_id, topic_id, message, attachment=None, **request_kwargs):
@@ -897,15 +774,7 @@ def post_entry_courses(request_ctx, course_id, topic_id, message, attachment=Non
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_entry_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), {'message': message, 'attachment': attachment})
 
 
 def post_entry_groups(request_ctx, group_id, topic_id, message, attachment=None, **request_kwargs):
@@ -928,15 +797,7 @@ def post_entry_groups(request_ctx, group_id, topic_id, message, attachment=None,
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_entry_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), {'message': message, 'attachment': attachment})
 
 
 def post_entry_collection_items(request_ctx, collection_item_id, topic_id, message, attachment=None, **request_kwargs):
@@ -959,15 +820,7 @@ def post_entry_collection_items(request_ctx, collection_item_id, topic_id, messa
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_entry_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), {'message': message, 'attachment': attachment})
 
 
 def list_topic_entries_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -998,11 +851,7 @@ def list_topic_entries_courses(request_ctx, course_id, topic_id, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_topic_entries_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def list_topic_entries_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -1033,11 +882,7 @@ def list_topic_entries_groups(request_ctx, group_id, topic_id, **request_kwargs)
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_topic_entries_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def list_topic_entries_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -1068,11 +913,7 @@ def list_topic_entries_collection_items(request_ctx, collection_item_id, topic_i
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_topic_entries_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def post_reply_courses(request_ctx, course_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
@@ -1102,15 +943,7 @@ def post_reply_courses(request_ctx, course_id, topic_id, entry_id, message, atta
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_reply_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, entry_id), {'message': message, 'attachment': attachment})
 
 
 def post_reply_groups(request_ctx, group_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
@@ -1140,15 +973,7 @@ def post_reply_groups(request_ctx, group_id, topic_id, entry_id, message, attach
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_reply_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, entry_id), {'message': message, 'attachment': attachment})
 
 
 def post_reply_collection_items(request_ctx, collection_item_id, topic_id, entry_id, message, attachment=None, **request_kwargs):
@@ -1178,15 +1003,7 @@ def post_reply_collection_items(request_ctx, collection_item_id, topic_id, entry
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    payload = {
-        'message' : message,
-        'attachment' : attachment,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['post_reply_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, entry_id), {'message': message, 'attachment': attachment})
 
 
 def list_entry_replies_courses(request_ctx, course_id, topic_id, entry_id, **request_kwargs):
@@ -1213,11 +1030,7 @@ def list_entry_replies_courses(request_ctx, course_id, topic_id, entry_id, **req
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entry_replies_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, entry_id), None)
 
 
 def list_entry_replies_groups(request_ctx, group_id, topic_id, entry_id, **request_kwargs):
@@ -1244,11 +1057,7 @@ def list_entry_replies_groups(request_ctx, group_id, topic_id, entry_id, **reque
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entry_replies_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, entry_id), None)
 
 
 def list_entry_replies_collection_items(request_ctx, collection_item_id, topic_id, entry_id, **request_kwargs):
@@ -1275,11 +1084,7 @@ def list_entry_replies_collection_items(request_ctx, collection_item_id, topic_i
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/replies'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entry_replies_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, entry_id), None)
 
 
 def list_entries_courses(request_ctx, course_id, topic_id, ids, **request_kwargs):
@@ -1303,14 +1108,7 @@ def list_entries_courses(request_ctx, course_id, topic_id, ids, **request_kwargs
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entries_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), {'ids': ids})
 
 
 def list_entries_groups(request_ctx, group_id, topic_id, ids, **request_kwargs):
@@ -1334,14 +1132,7 @@ def list_entries_groups(request_ctx, group_id, topic_id, ids, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entries_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), {'ids': ids})
 
 
 def list_entries_collection_items(request_ctx, collection_item_id, topic_id, ids, **request_kwargs):
@@ -1365,14 +1156,7 @@ def list_entries_collection_items(request_ctx, collection_item_id, topic_id, ids
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entry_list'
-    payload = {
-        'ids' : ids,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_entries_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), {'ids': ids})
 
 
 def mark_topic_as_read_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -1394,11 +1178,7 @@ def mark_topic_as_read_courses(request_ctx, course_id, topic_id, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_read_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def mark_topic_as_read_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -1420,11 +1200,7 @@ def mark_topic_as_read_groups(request_ctx, group_id, topic_id, **request_kwargs)
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_read_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def mark_topic_as_read_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -1446,11 +1222,7 @@ def mark_topic_as_read_collection_items(request_ctx, collection_item_id, topic_i
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_read_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def mark_topic_as_unread_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -1472,11 +1244,7 @@ def mark_topic_as_unread_courses(request_ctx, course_id, topic_id, **request_kwa
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_unread_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def mark_topic_as_unread_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -1498,11 +1266,7 @@ def mark_topic_as_unread_groups(request_ctx, group_id, topic_id, **request_kwarg
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_unread_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def mark_topic_as_unread_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -1524,11 +1288,7 @@ def mark_topic_as_unread_collection_items(request_ctx, collection_item_id, topic
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_topic_as_unread_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def mark_all_entries_as_read_courses(request_ctx, course_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1552,14 +1312,7 @@ def mark_all_entries_as_read_courses(request_ctx, course_id, topic_id, forced_re
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_read_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_all_entries_as_read_groups(request_ctx, group_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1583,14 +1336,7 @@ def mark_all_entries_as_read_groups(request_ctx, group_id, topic_id, forced_read
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_read_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_all_entries_as_read_collection_items(request_ctx, collection_item_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1614,14 +1360,7 @@ def mark_all_entries_as_read_collection_items(request_ctx, collection_item_id, t
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_read_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_all_entries_as_unread_courses(request_ctx, course_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1645,14 +1384,7 @@ def mark_all_entries_as_unread_courses(request_ctx, course_id, topic_id, forced_
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_unread_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_all_entries_as_unread_groups(request_ctx, group_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1676,14 +1408,7 @@ def mark_all_entries_as_unread_groups(request_ctx, group_id, topic_id, forced_re
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_unread_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_all_entries_as_unread_collection_items(request_ctx, collection_item_id, topic_id, forced_read_state=None, **request_kwargs):
@@ -1707,14 +1432,7 @@ def mark_all_entries_as_unread_collection_items(request_ctx, collection_item_id,
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/read_all'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_all_entries_as_unread_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_read_courses(request_ctx, course_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1740,14 +1458,7 @@ def mark_entry_as_read_courses(request_ctx, course_id, topic_id, entry_id, force
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_read_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_read_groups(request_ctx, group_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1773,14 +1484,7 @@ def mark_entry_as_read_groups(request_ctx, group_id, topic_id, entry_id, forced_
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_read_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_read_collection_items(request_ctx, collection_item_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1806,14 +1510,7 @@ def mark_entry_as_read_collection_items(request_ctx, collection_item_id, topic_i
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_read_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_unread_courses(request_ctx, course_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1839,14 +1536,7 @@ def mark_entry_as_unread_courses(request_ctx, course_id, topic_id, entry_id, for
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_unread_courses'].request(request_ctx, request_kwargs, (course_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_unread_groups(request_ctx, group_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1872,14 +1562,7 @@ def mark_entry_as_unread_groups(request_ctx, group_id, topic_id, entry_id, force
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_unread_groups'].request(request_ctx, request_kwargs, (group_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def mark_entry_as_unread_collection_items(request_ctx, collection_item_id, topic_id, entry_id, forced_read_state=None, **request_kwargs):
@@ -1905,14 +1588,7 @@ def mark_entry_as_unread_collection_items(request_ctx, collection_item_id, topic
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/entries/{entry_id}/read'
-    payload = {
-        'forced_read_state' : forced_read_state,
-    }
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id, entry_id=entry_id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['mark_entry_as_unread_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id, entry_id), {'forced_read_state': forced_read_state})
 
 
 def subscribe_to_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -1932,11 +1608,7 @@ def subscribe_to_topic_courses(request_ctx, course_id, topic_id, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['subscribe_to_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def subscribe_to_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -1956,11 +1628,7 @@ def subscribe_to_topic_groups(request_ctx, group_id, topic_id, **request_kwargs)
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['subscribe_to_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def subscribe_to_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -1980,11 +1648,7 @@ def subscribe_to_topic_collection_items(request_ctx, collection_item_id, topic_i
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['subscribe_to_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
 def unsubscribe_from_topic_courses(request_ctx, course_id, topic_id, **request_kwargs):
@@ -2004,11 +1668,7 @@ def unsubscribe_from_topic_courses(request_ctx, course_id, topic_id, **request_k
 
     """
 
-    path = '/v1/courses/{course_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unsubscribe_from_topic_courses'].request(request_ctx, request_kwargs, (course_id, topic_id), None)
 
 
 def unsubscribe_from_topic_groups(request_ctx, group_id, topic_id, **request_kwargs):
@@ -2028,11 +1688,7 @@ def unsubscribe_from_topic_groups(request_ctx, group_id, topic_id, **request_kwa
 
     """
 
-    path = '/v1/groups/{group_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unsubscribe_from_topic_groups'].request(request_ctx, request_kwargs, (group_id, topic_id), None)
 
 
 def unsubscribe_from_topic_collection_items(request_ctx, collection_item_id, topic_id, **request_kwargs):
@@ -2052,10 +1708,6 @@ def unsubscribe_from_topic_collection_items(request_ctx, collection_item_id, top
 
     """
 
-    path = '/v1/collection_items/{collection_item_id}/discussion_topics/{topic_id}/subscribed'
-    url = request_ctx.base_api_url + path.format(collection_item_id=collection_item_id, topic_id=topic_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unsubscribe_from_topic_collection_items'].request(request_ctx, request_kwargs, (collection_item_id, topic_id), None)
 
 
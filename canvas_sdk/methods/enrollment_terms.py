@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_enrollment_terms', 'GET', '/v1/accounts/{account_id}/terms', ('account_id', 'workflow_state', 'per_page')),
+])
+
 
 def list_enrollment_terms(request_ctx, account_id, workflow_state=None, per_page=None, **request_kwargs):
     """
@@ -19,16 +25,6 @@ def list_enrollment_terms(request_ctx, account_id, workflow_state=None, per_page
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/terms'
-    payload = {
-        'workflow_state' : workflow_state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enrollment_terms'].request(request_ctx, request_kwargs, (account_id,), {'workflow_state': workflow_state, 'per_page': per_page})
 
 
@@ -1,4 +1,17 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_enrollments_courses', 'GET', '/v1/courses/{course_id}/enrollments', ('course_id', ('type[]', 'type'), ('role[]', 'role'), ('role_id[]', 'role_id'), ('state[]', 'state'), 'user_id', 'per_page'), (('state', ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')),)),
+    ('list_enrollments_sections', 'GET', '/v1/sections/{section_id}/enrollments', ('section_id', ('type[]', 'type'), ('role[]', 'role'), ('role_id[]', 'role_id'), ('state[]', 'state'), 'user_id', 'per_page'), (('state', ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')),)),
+    ('list_enrollments_users', 'GET', '/v1/users/{user_id}/enrollments', ('user_id', ('type[]', 'type'), ('role[]', 'role'), ('role_id[]', 'role_id'), ('state[]', 'state'), 'per_page'), (('state', ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')),)),
+    ('enrollment_by_id', 'GET', '/v1/accounts/{account_id}/enrollments/{id}', ('account_id', 'id')),
+    ('conclude_enrollment', 'DELETE', '/v1/courses/{course_id}/enrollments/{id}', ('course_id', 'id', 'task'), (('task', ('conclude', 'delete')),)),
+])
+
+ENROLLMENT_TYPE_TYPES = frozenset(('StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', 'DesignerEnrollment'))
+ENROLLMENT_ENROLLMENT_STATE_TYPES = frozenset(('active', 'invited'))
+
 
 def list_enrollments_courses(request_ctx, course_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None, **request_kwargs):
     """
@@ -34,23 +47,7 @@ def list_enrollments_courses(request_ctx, course_id, type=None, role=None, role_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/courses/{course_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enrollments_courses'].request(request_ctx, request_kwargs, (course_id,), {'type[]': type, 'role[]': role, 'role_id[]': role_id, 'state[]': state, 'user_id': user_id, 'per_page': per_page})
 
 
 def list_enrollments_sections(request_ctx, section_id, type=None, role=None, role_id=None, state=None, user_id=None, per_page=None, **request_kwargs):
@@ -87,23 +84,7 @@ def list_enrollments_sections(request_ctx, section_id, type=None, role=None, rol
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/sections/{section_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'user_id' : user_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enrollments_sections'].request(request_ctx, request_kwargs, (section_id,), {'type[]': type, 'role[]': role, 'role_id[]': role_id, 'state[]': state, 'user_id': user_id, 'per_page': per_page})
 
 
 def list_enrollments_users(request_ctx, user_id, type=None, role=None, role_id=None, state=None, per_page=None, **request_kwargs):
@@ -138,22 +119,7 @@ def list_enrollments_users(request_ctx, user_id, type=None, role=None, role_id=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'invited', 'creation_pending', 'deleted', 'rejected', 'completed', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/users/{user_id}/enrollments'
-    payload = {
-        'type[]' : type,
-        'role[]' : role,
-        'role_id[]' : role_id,
-        'state[]' : state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enrollments_users'].request(request_ctx, request_kwargs, (user_id,), {'type[]': type, 'role[]': role, 'role_id[]': role_id, 'state[]': state, 'per_page': per_page})
 
 
 def enrollment_by_id(request_ctx, account_id, id, **request_kwargs):
@@ -171,11 +137,7 @@ def enrollment_by_id(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/enrollments/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['enrollment_by_id'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def enroll_user_courses(request_ctx, course_id, enrollment_user_id, enrollment_type=None, enrollment_role=None, enrollment_role_id=None, enrollment_enrollment_state=None, enrollment_course_section_id=None, enrollment_limit_privileges_to_course_section=None, enrollment_notify=None, enrollment_self_enrollment_code=None, enrollment_self_enrolled=None, **request_kwargs):
@@ -211,11 +173,9 @@ def enroll_user_courses(request_ctx, course_id, enrollment_user_id, enrollment_t
 
     """
 
-    enrollment_type_types = ('StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', 'DesignerEnrollment')
-    enrollment_enrollment_state_types = ('active', 'invited')
     enrollment_role_type_choices = ('enrollment_role', 'enrollment_role_id', 'enrollment_type')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(enrollment_enrollment_state, enrollment_enrollment_state_types)
+    utils.validate_attr_is_acceptable(enrollment_type, ENROLLMENT_TYPE_TYPES)
+    utils.validate_attr_is_acceptable(enrollment_enrollment_state, ENROLLMENT_ENROLLMENT_STATE_TYPES)
     utils.validate_any(enrollment_role_type_choices,
                        enrollment_role, enrollment_role_id, enrollment_type)
     path = '/v1/courses/{course_id}/enrollments'
@@ -237,6 +197,7 @@ def enroll_user_courses(request_ctx, course_id, enrollment_user_id, enrollment_t
     return response
 
 
+
 def enroll_user_sections(request_ctx, section_id, enrollment_user_id, enrollment_type=None, enrollment_role=None, enrollment_role_id=None, enrollment_enrollment_state=None, enrollment_course_section_id=None, enrollment_limit_privileges_to_course_section=None, enrollment_notify=None, enrollment_self_enrollment_code=None, enrollment_self_enrolled=None, **request_kwargs):
     """
     Create a new user enrollment for a course or section.
@@ -270,11 +231,9 @@ def enroll_user_sections(request_ctx, section_id, enrollment_user_id, enrollment
 
     """
 
-    enrollment_type_types = ('StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', 'DesignerEnrollment')
-    enrollment_enrollment_state_types = ('active', 'invited')
     enrollment_role_type_choices = ('enrollment_role', 'enrollment_role_id', 'enrollment_type')
-    utils.validate_attr_is_acceptable(enrollment_type, enrollment_type_types)
-    utils.validate_attr_is_acceptable(enrollment_enrollment_state, enrollment_enrollment_state_types)
+    utils.validate_attr_is_acceptable(enrollment_type, ENROLLMENT_TYPE_TYPES)
+    utils.validate_attr_is_acceptable(enrollment_enrollment_state, ENROLLMENT_ENROLLMENT_STATE_TYPES)
     utils.validate_any(enrollment_role_type_choices,
                        enrollment_role, enrollment_role_id, enrollment_type)
     path = '/v1/sections/{section_id}/enrollments'
@@ -296,6 +255,7 @@ def enroll_user_sections(request_ctx, section_id, enrollment_user_id, enrollment
     return response
 
 
+
 def conclude_enrollment(request_ctx, course_id, id, task=None, **request_kwargs):
     """
     Delete or conclude an enrollment.
@@ -313,13 +273,6 @@ def conclude_enrollment(request_ctx, course_id, id, task=None, **request_kwargs)
 
     """
 
-    task_types = ('conclude', 'delete')
-    utils.validate_attr_is_acceptable(task, task_types)
-    path = '/v1/courses/{course_id}/enrollments/{id}'
-    payload = {
-        'task' : task,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
+    return ENDPOINTS['conclude_enrollment'].request(request_ctx, request_kwargs, (course_id, id), {'task': task})
+
 
-    return response
@@ -1,4 +1,21 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_external_tools_courses', 'GET', '/v1/courses/{course_id}/external_tools', ('course_id', 'search_term', 'selectable', 'per_page')),
+    ('list_external_tools_accounts', 'GET', '/v1/accounts/{account_id}/external_tools', ('account_id', 'search_term', 'selectable', 'per_page')),
+    ('get_sessionless_launch_url_for_external_tool_courses', 'GET', '/v1/courses/{course_id}/external_tools/sessionless_launch', ('course_id', 'id', 'url', 'assignment_id', 'launch_type')),
+    ('get_sessionless_launch_url_for_external_tool_accounts', 'GET', '/v1/accounts/{account_id}/external_tools/sessionless_launch', ('account_id', 'id', 'url', 'assignment_id', 'launch_type')),
+    ('get_single_external_tool_courses', 'GET', '/v1/courses/{course_id}/external_tools/{external_tool_id}', ('course_id', 'external_tool_id')),
+    ('get_single_external_tool_accounts', 'GET', '/v1/accounts/{account_id}/external_tools/{external_tool_id}', ('account_id', 'external_tool_id')),
+    ('create_external_tool_courses', 'POST', '/v1/courses/{course_id}/external_tools', ('course_id', 'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url', 'text', 'not_selectable', 'custom_fields', ('account_navigation[url]', 'account_navigation_url'), ('account_navigation[enabled]', 'account_navigation_enabled'), ('account_navigation[text]', 'account_navigation_text'), ('user_navigation[url]', 'user_navigation_url'), ('user_navigation[enabled]', 'user_navigation_enabled'), ('user_navigation[text]', 'user_navigation_text'), ('course_navigation[url]', 'course_navigation_url'), ('course_navigation[enabled]', 'course_navigation_enabled'), ('course_navigation[text]', 'course_navigation_text'), ('course_navigation[visibility]', 'course_navigation_visibility'), ('course_navigation[default]', 'course_navigation_default'), ('editor_button[url]', 'editor_button_url'), ('editor_button[enabled]', 'editor_button_enabled'), ('editor_button[icon_url]', 'editor_button_icon_url'), ('editor_button[selection_width]', 'editor_button_selection_width'), ('editor_button[selection_height]', 'editor_button_selection_height'), ('resource_selection[url]', 'resource_selection_url'), ('resource_selection[enabled]', 'resource_selection_enabled'), ('resource_selection[icon_url]', 'resource_selection_icon_url'), ('resource_selection[selection_width]', 'resource_selection_selection_width'), ('resource_selection[selection_height]', 'resource_selection_selection_height'), 'config_type', 'config_xml', 'config_url'), (('privacy_level', ('anonymous', 'name_only', 'public')), ('course_navigation_visibility', ('admins', 'members')))),
+    ('create_external_tool_accounts', 'POST', '/v1/accounts/{account_id}/external_tools', ('account_id', 'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url', 'text', 'not_selectable', 'custom_fields', ('account_navigation[url]', 'account_navigation_url'), ('account_navigation[enabled]', 'account_navigation_enabled'), ('account_navigation[text]', 'account_navigation_text'), ('user_navigation[url]', 'user_navigation_url'), ('user_navigation[enabled]', 'user_navigation_enabled'), ('user_navigation[text]', 'user_navigation_text'), ('course_navigation[url]', 'course_navigation_url'), ('course_navigation[enabled]', 'course_navigation_enabled'), ('course_navigation[text]', 'course_navigation_text'), ('course_navigation[visibility]', 'course_navigation_visibility'), ('course_navigation[default]', 'course_navigation_default'), ('editor_button[url]', 'editor_button_url'), ('editor_button[enabled]', 'editor_button_enabled'), ('editor_button[icon_url]', 'editor_button_icon_url'), ('editor_button[selection_width]', 'editor_button_selection_width'), ('editor_button[selection_height]', 'editor_button_selection_height'), ('resource_selection[url]', 'resource_selection_url'), ('resource_selection[enabled]', 'resource_selection_enabled'), ('resource_selection[icon_url]', 'resource_selection_icon_url'), ('resource_selection[selection_width]', 'resource_selection_selection_width'), ('resource_selection[selection_height]', 'resource_selection_selection_height'), 'config_type', 'config_xml', 'config_url'), (('privacy_level', ('anonymous', 'name_only', 'public')), ('course_navigation_visibility', ('admins', 'members')))),
+    ('edit_external_tool_courses', 'PUT', '/v1/courses/{course_id}/external_tools/{external_tool_id}', ('course_id', 'external_tool_id', 'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url', 'text', 'custom_fields', ('account_navigation[url]', 'account_navigation_url'), ('account_navigation[enabled]', 'account_navigation_enabled'), ('account_navigation[text]', 'account_navigation_text'), ('user_navigation[url]', 'user_navigation_url'), ('user_navigation[enabled]', 'user_navigation_enabled'), ('user_navigation[text]', 'user_navigation_text'), ('course_navigation[url]', 'course_navigation_url'), ('course_navigation[enabled]', 'course_navigation_enabled'), ('course_navigation[text]', 'course_navigation_text'), ('course_navigation[visibility]', 'course_navigation_visibility'), ('course_navigation[default]', 'course_navigation_default'), ('editor_button[url]', 'editor_button_url'), ('editor_button[enabled]', 'editor_button_enabled'), ('editor_button[icon_url]', 'editor_button_icon_url'), ('editor_button[selection_width]', 'editor_button_selection_width'), ('editor_button[selection_height]', 'editor_button_selection_height'), ('resource_selection[url]', 'resource_selection_url'), ('resource_selection[enabled]', 'resource_selection_enabled'), ('resource_selection[icon_url]', 'resource_selection_icon_url'), ('resource_selection[selection_width]', 'resource_selection_selection_width'), ('resource_selection[selection_height]', 'resource_selection_selection_height'), 'config_type', 'config_xml', 'config_url'), (('privacy_level', ('anonymous', 'name_only', 'public')), ('course_navigation_visibility', ('admins', 'members')))),
+    ('edit_external_tool_accounts', 'PUT', '/v1/accounts/{account_id}/external_tools/{external_tool_id}', ('account_id', 'external_tool_id', 'name', 'privacy_level', 'consumer_key', 'shared_secret', 'description', 'url', 'domain', 'icon_url', 'text', 'custom_fields', ('account_navigation[url]', 'account_navigation_url'), ('account_navigation[enabled]', 'account_navigation_enabled'), ('account_navigation[text]', 'account_navigation_text'), ('user_navigation[url]', 'user_navigation_url'), ('user_navigation[enabled]', 'user_navigation_enabled'), ('user_navigation[text]', 'user_navigation_text'), ('course_navigation[url]', 'course_navigation_url'), ('course_navigation[enabled]', 'course_navigation_enabled'), ('course_navigation[text]', 'course_navigation_text'), ('course_navigation[visibility]', 'course_navigation_visibility'), ('course_navigation[default]', 'course_navigation_default'), ('editor_button[url]', 'editor_button_url'), ('editor_button[enabled]', 'editor_button_enabled'), ('editor_button[icon_url]', 'editor_button_icon_url'), ('editor_button[selection_width]', 'editor_button_selection_width'), ('editor_button[selection_height]', 'editor_button_selection_height'), ('resource_selection[url]', 'resource_selection_url'), ('resource_selection[enabled]', 'resource_selection_enabled'), ('resource_selection[icon_url]', 'resource_selection_icon_url'), ('resource_selection[selection_width]', 'resource_selection_selection_width'), ('resource_selection[selection_height]', 'resource_selection_selection_height'), 'config_type', 'config_xml', 'config_url'), (('privacy_level', ('anonymous', 'name_only', 'public')), ('course_navigation_visibility', ('admins', 'members')))),
+    ('delete_external_tool_courses', 'DELETE', '/v1/courses/{course_id}/external_tools/{external_tool_id}', ('course_id', 'external_tool_id')),
+    ('delete_external_tool_accounts', 'DELETE', '/v1/accounts/{account_id}/external_tools/{external_tool_id}', ('account_id', 'external_tool_id')),
+])
+
 
 def list_external_tools_courses(request_ctx, course_id, search_term=None, selectable=None, per_page=None, **request_kwargs):
     """
@@ -20,18 +37,7 @@ def list_external_tools_courses(request_ctx, course_id, search_term=None, select
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/external_tools'
-    payload = {
-        'search_term' : search_term,
-        'selectable' : selectable,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_external_tools_courses'].request(request_ctx, request_kwargs, (course_id,), {'search_term': search_term, 'selectable': selectable, 'per_page': per_page})
 
 
 def list_external_tools_accounts(request_ctx, account_id, search_term=None, selectable=None, per_page=None, **request_kwargs):
@@ -54,18 +60,7 @@ def list_external_tools_accounts(request_ctx, account_id, search_term=None, sele
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/external_tools'
-    payload = {
-        'search_term' : search_term,
-        'selectable' : selectable,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_external_tools_accounts'].request(request_ctx, request_kwargs, (account_id,), {'search_term': search_term, 'selectable': selectable, 'per_page': per_page})
 
 
 def get_sessionless_launch_url_for_external_tool_courses(request_ctx, course_id, id=None, url=None, assignment_id=None, launch_type=None, **request_kwargs):
@@ -91,17 +86,7 @@ def get_sessionless_launch_url_for_external_tool_courses(request_ctx, course_id,
 
     """
 
-    path = '/v1/courses/{course_id}/external_tools/sessionless_launch'
-    payload = {
-        'id' : id,
-        'url' : url,
-        'assignment_id' : assignment_id,
-        'launch_type' : launch_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_sessionless_launch_url_for_external_tool_courses'].request(request_ctx, request_kwargs, (course_id,), {'id': id, 'url': url, 'assignment_id': assignment_id, 'launch_type': launch_type})
 
 
 def get_sessionless_launch_url_for_external_tool_accounts(request_ctx, account_id, id=None, url=None, assignment_id=None, launch_type=None, **request_kwargs):
@@ -127,17 +112,7 @@ def get_sessionless_launch_url_for_external_tool_accounts(request_ctx, account_i
 
     """
 
-    path = '/v1/accounts/{account_id}/external_tools/sessionless_launch'
-    payload = {
-        'id' : id,
-        'url' : url,
-        'assignment_id' : assignment_id,
-        'launch_type' : launch_type,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_sessionless_launch_url_for_external_tool_accounts'].request(request_ctx, request_kwargs, (account_id,), {'id': id, 'url': url, 'assignment_id': assignment_id, 'launch_type': launch_type})
 
 
 def get_single_external_tool_courses(request_ctx, course_id, external_tool_id, **request_kwargs):
@@ -155,11 +130,7 @@ def get_single_external_tool_courses(request_ctx, course_id, external_tool_id, *
 
     """
 
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_external_tool_courses'].request(request_ctx, request_kwargs, (course_id, external_tool_id), None)
 
 
 def get_single_external_tool_accounts(request_ctx, account_id, external_tool_id, **request_kwargs):
@@ -177,11 +148,7 @@ def get_single_external_tool_accounts(request_ctx, account_id, external_tool_id,
 
     """
 
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_external_tool_accounts'].request(request_ctx, request_kwargs, (account_id, external_tool_id), None)
 
 
 def create_external_tool_courses(request_ctx, course_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
@@ -268,52 +235,7 @@ def create_external_tool_courses(request_ctx, course_id, name, privacy_level, co
 
     """
 
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/courses/{course_id}/external_tools'
-    payload = {
-        'name' : name,
-        'privacy_level' : privacy_level,
-        'consumer_key' : consumer_key,
-        'shared_secret' : shared_secret,
-        'description' : description,
-        'url' : url,
-        'domain' : domain,
-        'icon_url' : icon_url,
-        'text' : text,
-        'not_selectable' : not_selectable,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_external_tool_courses'].request(request_ctx, request_kwargs, (course_id,), {'name': name, 'privacy_level': privacy_level, 'consumer_key': consumer_key, 'shared_secret': shared_secret, 'description': description, 'url': url, 'domain': domain, 'icon_url': icon_url, 'text': text, 'not_selectable': not_selectable, 'custom_fields': custom_fields, 'account_navigation[url]': account_navigation_url, 'account_navigation[enabled]': account_navigation_enabled, 'account_navigation[text]': account_navigation_text, 'user_navigation[url]': user_navigation_url, 'user_navigation[enabled]': user_navigation_enabled, 'user_navigation[text]': user_navigation_text, 'course_navigation[url]': course_navigation_url, 'course_navigation[enabled]': course_navigation_enabled, 'course_navigation[text]': course_navigation_text, 'course_navigation[visibility]': course_navigation_visibility, 'course_navigation[default]': course_navigation_default, 'editor_button[url]': editor_button_url, 'editor_button[enabled]': editor_button_enabled, 'editor_button[icon_url]': editor_button_icon_url, 'editor_button[selection_width]': editor_button_selection_width, 'editor_button[selection_height]': editor_button_selection_height, 'resource_selection[url]': resource_selection_url, 'resource_selection[enabled]': resource_selection_enabled, 'resource_selection[icon_url]': resource_selection_icon_url, 'resource_selection[selection_width]': resource_selection_selection_width, 'resource_selection[selection_height]': resource_selection_selection_height, 'config_type': config_type, 'config_xml': config_xml, 'config_url': config_url})
 
 
 def create_external_tool_accounts(request_ctx, account_id, name, privacy_level, consumer_key, shared_secret, description=None, url=None, domain=None, icon_url=None, text=None, not_selectable=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
@@ -400,52 +322,7 @@ def create_external_tool_accounts(request_ctx, account_id, name, privacy_level,
 
     """
 
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/accounts/{account_id}/external_tools'
-    payload = {
-        'name' : name,
-        'privacy_level' : privacy_level,
-        'consumer_key' : consumer_key,
-        'shared_secret' : shared_secret,
-        'description' : description,
-        'url' : url,
-        'domain' : domain,
-        'icon_url' : icon_url,
-        'text' : text,
-        'not_selectable' : not_selectable,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_external_tool_accounts'].request(request_ctx, request_kwargs, (account_id,), {'name': name, 'privacy_level': privacy_level, 'consumer_key': consumer_key, 'shared_secret': shared_secret, 'description': description, 'url': url, 'domain': domain, 'icon_url': icon_url, 'text': text, 'not_selectable': not_selectable, 'custom_fields': custom_fields, 'account_navigation[url]': account_navigation_url, 'account_navigation[enabled]': account_navigation_enabled, 'account_navigation[text]': account_navigation_text, 'user_navigation[url]': user_navigation_url, 'user_navigation[enabled]': user_navigation_enabled, 'user_navigation[text]': user_navigation_text, 'course_navigation[url]': course_navigation_url, 'course_navigation[enabled]': course_navigation_enabled, 'course_navigation[text]': course_navigation_text, 'course_navigation[visibility]': course_navigation_visibility, 'course_navigation[default]': course_navigation_default, 'editor_button[url]': editor_button_url, 'editor_button[enabled]': editor_button_enabled, 'editor_button[icon_url]': editor_button_icon_url, 'editor_button[selection_width]': editor_button_selection_width, 'editor_button[selection_height]': editor_button_selection_height, 'resource_selection[url]': resource_selection_url, 'resource_selection[enabled]': resource_selection_enabled, 'resource_selection[icon_url]': resource_selection_icon_url, 'resource_selection[selection_width]': resource_selection_selection_width, 'resource_selection[selection_height]': resource_selection_selection_height, 'config_type': config_type, 'config_xml': config_xml, 'config_url': config_url})
 
 
 def edit_external_tool_courses(request_ctx, course_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
@@ -530,51 +407,8 @@ def edit_external_tool_courses(request_ctx, course_id, external_tool_id, name=No
         :rtype: requests.Response (with void data)
 
     """
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    payload = {
-        'name': name,
-        'privacy_level': privacy_level,
-        'consumer_key': consumer_key,
-        'shared_secret': shared_secret,
-        'description': description,
-        'url': url,
-        'domain': domain,
-        'icon_url': icon_url,
-        'text' : text,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+
+    return ENDPOINTS['edit_external_tool_courses'].request(request_ctx, request_kwargs, (course_id, external_tool_id), {'name': name, 'privacy_level': privacy_level, 'consumer_key': consumer_key, 'shared_secret': shared_secret, 'description': description, 'url': url, 'domain': domain, 'icon_url': icon_url, 'text': text, 'custom_fields': custom_fields, 'account_navigation[url]': account_navigation_url, 'account_navigation[enabled]': account_navigation_enabled, 'account_navigation[text]': account_navigation_text, 'user_navigation[url]': user_navigation_url, 'user_navigation[enabled]': user_navigation_enabled, 'user_navigation[text]': user_navigation_text, 'course_navigation[url]': course_navigation_url, 'course_navigation[enabled]': course_navigation_enabled, 'course_navigation[text]': course_navigation_text, 'course_navigation[visibility]': course_navigation_visibility, 'course_navigation[default]': course_navigation_default, 'editor_button[url]': editor_button_url, 'editor_button[enabled]': editor_button_enabled, 'editor_button[icon_url]': editor_button_icon_url, 'editor_button[selection_width]': editor_button_selection_width, 'editor_button[selection_height]': editor_button_selection_height, 'resource_selection[url]': resource_selection_url, 'resource_selection[enabled]': resource_selection_enabled, 'resource_selection[icon_url]': resource_selection_icon_url, 'resource_selection[selection_width]': resource_selection_selection_width, 'resource_selection[selection_height]': resource_selection_selection_height, 'config_type': config_type, 'config_xml': config_xml, 'config_url': config_url})
 
 
 def edit_external_tool_accounts(request_ctx, account_id, external_tool_id, name=None, privacy_level=None, consumer_key=None, shared_secret=None, description=None, url=None, domain=None, icon_url=None, text=None, custom_fields=None, account_navigation_url=None, account_navigation_enabled=None, account_navigation_text=None, user_navigation_url=None, user_navigation_enabled=None, user_navigation_text=None, course_navigation_url=None, course_navigation_enabled=None, course_navigation_text=None, course_navigation_visibility=None, course_navigation_default=None, editor_button_url=None, editor_button_enabled=None, editor_button_icon_url=None, editor_button_selection_width=None, editor_button_selection_height=None, resource_selection_url=None, resource_selection_enabled=None, resource_selection_icon_url=None, resource_selection_selection_width=None, resource_selection_selection_height=None, config_type=None, config_xml=None, config_url=None, **request_kwargs):
@@ -660,51 +494,7 @@ def edit_external_tool_accounts(request_ctx, account_id, external_tool_id, name=
 
     """
 
-    privacy_level_types = ('anonymous', 'name_only', 'public')
-    course_navigation_visibility_types = ('admins', 'members')
-    utils.validate_attr_is_acceptable(privacy_level, privacy_level_types)
-    utils.validate_attr_is_acceptable(course_navigation_visibility, course_navigation_visibility_types)
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    payload = {
-        'name': name,
-        'privacy_level': privacy_level,
-        'consumer_key': consumer_key,
-        'shared_secret': shared_secret,
-        'description': description,
-        'url': url,
-        'domain': domain,
-        'icon_url': icon_url,
-        'text' : text,
-        'custom_fields' : custom_fields,
-        'account_navigation[url]' : account_navigation_url,
-        'account_navigation[enabled]' : account_navigation_enabled,
-        'account_navigation[text]' : account_navigation_text,
-        'user_navigation[url]' : user_navigation_url,
-        'user_navigation[enabled]' : user_navigation_enabled,
-        'user_navigation[text]' : user_navigation_text,
-        'course_navigation[url]' : course_navigation_url,
-        'course_navigation[enabled]' : course_navigation_enabled,
-        'course_navigation[text]' : course_navigation_text,
-        'course_navigation[visibility]' : course_navigation_visibility,
-        'course_navigation[default]' : course_navigation_default,
-        'editor_button[url]' : editor_button_url,
-        'editor_button[enabled]' : editor_button_enabled,
-        'editor_button[icon_url]' : editor_button_icon_url,
-        'editor_button[selection_width]' : editor_button_selection_width,
-        'editor_button[selection_height]' : editor_button_selection_height,
-        'resource_selection[url]' : resource_selection_url,
-        'resource_selection[enabled]' : resource_selection_enabled,
-        'resource_selection[icon_url]' : resource_selection_icon_url,
-        'resource_selection[selection_width]' : resource_selection_selection_width,
-        'resource_selection[selection_height]' : resource_selection_selection_height,
-        'config_type' : config_type,
-        'config_xml' : config_xml,
-        'config_url' : config_url,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_external_tool_accounts'].request(request_ctx, request_kwargs, (account_id, external_tool_id), {'name': name, 'privacy_level': privacy_level, 'consumer_key': consumer_key, 'shared_secret': shared_secret, 'description': description, 'url': url, 'domain': domain, 'icon_url': icon_url, 'text': text, 'custom_fields': custom_fields, 'account_navigation[url]': account_navigation_url, 'account_navigation[enabled]': account_navigation_enabled, 'account_navigation[text]': account_navigation_text, 'user_navigation[url]': user_navigation_url, 'user_navigation[enabled]': user_navigation_enabled, 'user_navigation[text]': user_navigation_text, 'course_navigation[url]': course_navigation_url, 'course_navigation[enabled]': course_navigation_enabled, 'course_navigation[text]': course_navigation_text, 'course_navigation[visibility]': course_navigation_visibility, 'course_navigation[default]': course_navigation_default, 'editor_button[url]': editor_button_url, 'editor_button[enabled]': editor_button_enabled, 'editor_button[icon_url]': editor_button_icon_url, 'editor_button[selection_width]': editor_button_selection_width, 'editor_button[selection_height]': editor_button_selection_height, 'resource_selection[url]': resource_selection_url, 'resource_selection[enabled]': resource_selection_enabled, 'resource_selection[icon_url]': resource_selection_icon_url, 'resource_selection[selection_width]': resource_selection_selection_width, 'resource_selection[selection_height]': resource_selection_selection_height, 'config_type': config_type, 'config_xml': config_xml, 'config_url': config_url})
 
 
 def delete_external_tool_courses(request_ctx, course_id, external_tool_id, **request_kwargs):
@@ -722,11 +512,7 @@ def delete_external_tool_courses(request_ctx, course_id, external_tool_id, **req
 
     """
 
-    path = '/v1/courses/{course_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, external_tool_id=external_tool_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_external_tool_courses'].request(request_ctx, request_kwargs, (course_id, external_tool_id), None)
 
 
 def delete_external_tool_accounts(request_ctx, account_id, external_tool_id, **request_kwargs):
@@ -744,10 +530,6 @@ def delete_external_tool_accounts(request_ctx, account_id, external_tool_id, **r
 
     """
 
-    path = '/v1/accounts/{account_id}/external_tools/{external_tool_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, external_tool_id=external_tool_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_external_tool_accounts'].request(request_ctx, request_kwargs, (account_id, external_tool_id), None)
 
 
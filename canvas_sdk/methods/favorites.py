@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_favorite_courses', 'GET', '/v1/users/self/favorites/courses', ('per_page',)),
+    ('add_course_to_favorites', 'POST', '/v1/users/self/favorites/courses/{id}', ('id',)),
+    ('remove_course_from_favorites', 'DELETE', '/v1/users/self/favorites/courses/{id}', ('id',)),
+    ('reset_course_favorites', 'DELETE', '/v1/users/self/favorites/courses', ()),
+])
+
 
 def list_favorite_courses(request_ctx, per_page=None, **request_kwargs):
     """
@@ -16,16 +25,7 @@ def list_favorite_courses(request_ctx, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/self/favorites/courses'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_favorite_courses'].request(request_ctx, request_kwargs, (), {'per_page': per_page})
 
 
 def add_course_to_favorites(request_ctx, id, **request_kwargs):
@@ -42,11 +42,7 @@ def add_course_to_favorites(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/favorites/courses/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['add_course_to_favorites'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def remove_course_from_favorites(request_ctx, id, **request_kwargs):
@@ -62,11 +58,7 @@ def remove_course_from_favorites(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/favorites/courses/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_course_from_favorites'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def reset_course_favorites(request_ctx, **request_kwargs):
@@ -81,10 +73,6 @@ def reset_course_favorites(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/favorites/courses'
-    url = request_ctx.base_api_url + path.format()
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reset_course_favorites'].request(request_ctx, request_kwargs, (), None)
 
 
@@ -1,4 +1,24 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_features_courses', 'GET', '/v1/courses/{course_id}/features', ('course_id', 'per_page')),
+    ('list_features_accounts', 'GET', '/v1/accounts/{account_id}/features', ('account_id', 'per_page')),
+    ('list_features_users', 'GET', '/v1/users/{user_id}/features', ('user_id', 'per_page')),
+    ('list_enabled_features_courses', 'GET', '/v1/courses/{course_id}/features/enabled', ('course_id',)),
+    ('list_enabled_features_accounts', 'GET', '/v1/accounts/{account_id}/features/enabled', ('account_id',)),
+    ('list_enabled_features_users', 'GET', '/v1/users/{user_id}/features/enabled', ('user_id',)),
+    ('get_feature_flag_courses', 'GET', '/v1/courses/{course_id}/features/flags/{feature}', ('course_id', 'feature')),
+    ('get_feature_flag_accounts', 'GET', '/v1/accounts/{account_id}/features/flags/{feature}', ('account_id', 'feature')),
+    ('get_feature_flag_users', 'GET', '/v1/users/{user_id}/features/flags/{feature}', ('user_id', 'feature')),
+    ('set_feature_flag_courses', 'PUT', '/v1/courses/{course_id}/features/flags/{feature}', ('course_id', 'feature', 'state', 'locking_account_id'), (('state', ('off', 'allowed', 'on')),)),
+    ('set_feature_flag_accounts', 'PUT', '/v1/accounts/{account_id}/features/flags/{feature}', ('account_id', 'feature', 'state', 'locking_account_id'), (('state', ('off', 'allowed', 'on')),)),
+    ('set_feature_flag_users', 'PUT', '/v1/users/{user_id}/features/flags/{feature}', ('user_id', 'feature', 'state', 'locking_account_id'), (('state', ('off', 'allowed', 'on')),)),
+    ('remove_feature_flag_courses', 'DELETE', '/v1/courses/{course_id}/features/flags/{feature}', ('course_id', 'feature')),
+    ('remove_feature_flag_accounts', 'DELETE', '/v1/accounts/{account_id}/features/flags/{feature}', ('account_id', 'feature')),
+    ('remove_feature_flag_users', 'DELETE', '/v1/users/{user_id}/features/flags/{feature}', ('user_id', 'feature')),
+])
+
 
 def list_features_courses(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +35,7 @@ def list_features_courses(request_ctx, course_id, per_page=None, **request_kwarg
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_features_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def list_features_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
@@ -42,16 +53,7 @@ def list_features_accounts(request_ctx, account_id, per_page=None, **request_kwa
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_features_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def list_features_users(request_ctx, user_id, per_page=None, **request_kwargs):
@@ -69,16 +71,7 @@ def list_features_users(request_ctx, user_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/features'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_features_users'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def list_enabled_features_courses(request_ctx, course_id, **request_kwargs):
@@ -95,11 +88,7 @@ def list_enabled_features_courses(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enabled_features_courses'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def list_enabled_features_accounts(request_ctx, account_id, **request_kwargs):
@@ -116,11 +105,7 @@ def list_enabled_features_accounts(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enabled_features_accounts'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def list_enabled_features_users(request_ctx, user_id, **request_kwargs):
@@ -137,11 +122,7 @@ def list_enabled_features_users(request_ctx, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/features/enabled'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_enabled_features_users'].request(request_ctx, request_kwargs, (user_id,), None)
 
 
 def get_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
@@ -163,11 +144,7 @@ def get_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_feature_flag_courses'].request(request_ctx, request_kwargs, (course_id, feature), None)
 
 
 def get_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs):
@@ -189,11 +166,7 @@ def get_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs
 
     """
 
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_feature_flag_accounts'].request(request_ctx, request_kwargs, (account_id, feature), None)
 
 
 def get_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
@@ -215,11 +188,7 @@ def get_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_feature_flag_users'].request(request_ctx, request_kwargs, (user_id, feature), None)
 
 
 def set_feature_flag_courses(request_ctx, course_id, feature, state=None, locking_account_id=None, **request_kwargs):
@@ -242,17 +211,7 @@ def set_feature_flag_courses(request_ctx, course_id, feature, state=None, lockin
 
     """
 
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['set_feature_flag_courses'].request(request_ctx, request_kwargs, (course_id, feature), {'state': state, 'locking_account_id': locking_account_id})
 
 
 def set_feature_flag_accounts(request_ctx, account_id, feature, state=None, locking_account_id=None, **request_kwargs):
@@ -275,17 +234,7 @@ def set_feature_flag_accounts(request_ctx, account_id, feature, state=None, lock
 
     """
 
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['set_feature_flag_accounts'].request(request_ctx, request_kwargs, (account_id, feature), {'state': state, 'locking_account_id': locking_account_id})
 
 
 def set_feature_flag_users(request_ctx, user_id, feature, state=None, locking_account_id=None, **request_kwargs):
@@ -308,17 +257,7 @@ def set_feature_flag_users(request_ctx, user_id, feature, state=None, locking_ac
 
     """
 
-    state_types = ('off', 'allowed', 'on')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    payload = {
-        'state' : state,
-        'locking_account_id' : locking_account_id,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['set_feature_flag_users'].request(request_ctx, request_kwargs, (user_id, feature), {'state': state, 'locking_account_id': locking_account_id})
 
 
 def remove_feature_flag_courses(request_ctx, course_id, feature, **request_kwargs):
@@ -339,11 +278,7 @@ def remove_feature_flag_courses(request_ctx, course_id, feature, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_feature_flag_courses'].request(request_ctx, request_kwargs, (course_id, feature), None)
 
 
 def remove_feature_flag_accounts(request_ctx, account_id, feature, **request_kwargs):
@@ -364,11 +299,7 @@ def remove_feature_flag_accounts(request_ctx, account_id, feature, **request_kwa
 
     """
 
-    path = '/v1/accounts/{account_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_feature_flag_accounts'].request(request_ctx, request_kwargs, (account_id, feature), None)
 
 
 def remove_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
@@ -389,10 +320,6 @@ def remove_feature_flag_users(request_ctx, user_id, feature, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/features/flags/{feature}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, feature=feature)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_feature_flag_users'].request(request_ctx, request_kwargs, (user_id, feature), None)
 
 
@@ -1,4 +1,36 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_quota_information_courses', 'GET', '/v1/courses/{course_id}/files/quota', ('course_id',)),
+    ('get_quota_information_groups', 'GET', '/v1/groups/{group_id}/files/quota', ('group_id',)),
+    ('get_quota_information_users', 'GET', '/v1/users/{user_id}/files/quota', ('user_id',)),
+    ('list_files_courses', 'GET', '/v1/courses/{course_id}/files', ('course_id', 'content_types', 'search_term', 'include', 'sort', 'order', 'per_page'), (('include', ('user',)), ('sort', ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')), ('order', ('asc', 'desc')))),
+    ('list_files_folders', 'GET', '/v1/folders/{id}/files', ('id', 'content_types', 'search_term', 'include', 'sort', 'order', 'per_page'), (('include', ('user',)), ('sort', ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')), ('order', ('asc', 'desc')))),
+    ('get_quota_information', 'GET', '/v1/files/{id}/public_url', ('id',)),
+    ('get_file', 'GET', '/v1/files/{id}', ('id', 'include'), (('include', ('user',)),)),
+    ('update_file', 'PUT', '/v1/files/{id}', ('id', 'name', 'parent_folder_id', 'lock_at', 'unlock_at', 'locked', 'hidden')),
+    ('delete_file', 'DELETE', '/v1/files/{id}', ('id',)),
+    ('list_folders', 'GET', '/v1/folders/{id}/folders', ('id', 'per_page')),
+    ('resolve_path_courses_full_path', 'GET', '/v1/courses/{course_id}/folders/by_path/{full_path}', ('course_id', 'full_path', 'per_page')),
+    ('resolve_path_courses', 'GET', '/v1/courses/{course_id}/folders/by_path', ('course_id', 'per_page')),
+    ('resolve_path_users_full_path', 'GET', '/v1/users/{user_id}/folders/by_path/{full_path}', ('user_id', 'full_path', 'per_page')),
+    ('resolve_path_users', 'GET', '/v1/users/{user_id}/folders/by_path', ('user_id', 'per_page')),
+    ('resolve_path_groups_full_path', 'GET', '/v1/groups/{group_id}/folders/by_path/{full_path}', ('group_id', 'full_path', 'per_page')),
+    ('resolve_path_groups', 'GET', '/v1/groups/{group_id}/folders/by_path', ('group_id', 'per_page')),
+    ('get_folder_courses', 'GET', '/v1/courses/{course_id}/folders/{id}', ('course_id', 'id')),
+    ('get_folder_users', 'GET', '/v1/users/{user_id}/folders/{id}', ('user_id', 'id')),
+    ('get_folder_groups', 'GET', '/v1/groups/{group_id}/folders/{id}', ('group_id', 'id')),
+    ('get_folder_folders', 'GET', '/v1/folders/{id}', ('id',)),
+    ('update_folder', 'PUT', '/v1/folders/{id}', ('id', 'name', 'parent_folder_id', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position')),
+    ('create_folder_courses', 'POST', '/v1/courses/{course_id}/folders', ('course_id', 'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position')),
+    ('create_folder_users', 'POST', '/v1/users/{user_id}/folders', ('user_id', 'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position')),
+    ('create_folder_groups', 'POST', '/v1/groups/{group_id}/folders', ('group_id', 'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position')),
+    ('create_folder_folders', 'POST', '/v1/folders/{folder_id}/folders', ('folder_id', 'name', 'parent_folder_id', 'parent_folder_path', 'lock_at', 'unlock_at', 'locked', 'hidden', 'position')),
+    ('delete_folder', 'DELETE', '/v1/folders/{id}', ('id', 'force')),
+    ('upload_file', 'POST', '/v1/folders/{folder_id}/files', ('folder_id',)),
+])
+
 
 def get_quota_information_courses(request_ctx, course_id, **request_kwargs):
     """
@@ -13,11 +45,7 @@ def get_quota_information_courses(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_quota_information_courses'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def get_quota_information_groups(request_ctx, group_id, **request_kwargs):
@@ -33,11 +61,7 @@ def get_quota_information_groups(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_quota_information_groups'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def get_quota_information_users(request_ctx, user_id, **request_kwargs):
@@ -53,11 +77,7 @@ def get_quota_information_users(request_ctx, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/files/quota'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_quota_information_users'].request(request_ctx, request_kwargs, (user_id,), None)
 
 
 def list_files_courses(request_ctx, course_id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None, **request_kwargs):
@@ -85,27 +105,7 @@ def list_files_courses(request_ctx, course_id, content_types=None, search_term=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('user')
-    sort_types = ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/courses/{course_id}/files'
-    payload = {
-        'content_types' : content_types,
-        'search_term' : search_term,
-        'include' : include,
-        'sort' : sort,
-        'order' : order,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_files_courses'].request(request_ctx, request_kwargs, (course_id,), {'content_types': content_types, 'search_term': search_term, 'include': include, 'sort': sort, 'order': order, 'per_page': per_page})
 
 
 def list_files_folders(request_ctx, id, content_types=None, search_term=None, include=None, sort=None, order=None, per_page=None, **request_kwargs):
@@ -133,27 +133,7 @@ def list_files_folders(request_ctx, id, content_types=None, search_term=None, in
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('user')
-    sort_types = ('name', 'size', 'created_at', 'updated_at', 'content_type', 'user')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(include, include_types)
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/folders/{id}/files'
-    payload = {
-        'content_types' : content_types,
-        'search_term' : search_term,
-        'include' : include,
-        'sort' : sort,
-        'order' : order,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_files_folders'].request(request_ctx, request_kwargs, (id,), {'content_types': content_types, 'search_term': search_term, 'include': include, 'sort': sort, 'order': order, 'per_page': per_page})
 
 
 def get_quota_information(request_ctx, id, **request_kwargs):
@@ -169,11 +149,7 @@ def get_quota_information(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/files/{id}/public_url'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_quota_information'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def get_file(request_ctx, id, include=None, **request_kwargs):
@@ -191,16 +167,7 @@ def get_file(request_ctx, id, include=None, **request_kwargs):
 
     """
 
-    include_types = ('user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/files/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_file'].request(request_ctx, request_kwargs, (id,), {'include': include})
 
 
 def update_file(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, locked, hidden, **request_kwargs):
@@ -228,19 +195,7 @@ def update_file(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, loc
 
     """
 
-    path = '/v1/files/{id}'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_file'].request(request_ctx, request_kwargs, (id,), {'name': name, 'parent_folder_id': parent_folder_id, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden})
 
 
 def delete_file(request_ctx, id, **request_kwargs):
@@ -259,11 +214,7 @@ def delete_file(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/files/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_file'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def list_folders(request_ctx, id, per_page=None, **request_kwargs):
@@ -281,16 +232,7 @@ def list_folders(request_ctx, id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/folders/{id}/folders'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_folders'].request(request_ctx, request_kwargs, (id,), {'per_page': per_page})
 
 
 def resolve_path_courses_full_path(request_ctx, course_id, full_path, per_page=None, **request_kwargs):
@@ -315,16 +257,7 @@ def resolve_path_courses_full_path(request_ctx, course_id, full_path, per_page=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_courses_full_path'].request(request_ctx, request_kwargs, (course_id, full_path), {'per_page': per_page})
 
 
 def resolve_path_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -347,16 +280,7 @@ def resolve_path_courses(request_ctx, course_id, per_page=None, **request_kwargs
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def resolve_path_users_full_path(request_ctx, user_id, full_path, per_page=None, **request_kwargs):
@@ -381,16 +305,7 @@ def resolve_path_users_full_path(request_ctx, user_id, full_path, per_page=None,
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_users_full_path'].request(request_ctx, request_kwargs, (user_id, full_path), {'per_page': per_page})
 
 
 def resolve_path_users(request_ctx, user_id, per_page=None, **request_kwargs):
@@ -413,16 +328,7 @@ def resolve_path_users(request_ctx, user_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_users'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def resolve_path_groups_full_path(request_ctx, group_id, full_path, per_page=None, **request_kwargs):
@@ -447,16 +353,7 @@ def resolve_path_groups_full_path(request_ctx, group_id, full_path, per_page=Non
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/folders/by_path/{full_path}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, full_path=full_path)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_groups_full_path'].request(request_ctx, request_kwargs, (group_id, full_path), {'per_page': per_page})
 
 
 def resolve_path_groups(request_ctx, group_id, per_page=None, **request_kwargs):
@@ -479,16 +376,7 @@ def resolve_path_groups(request_ctx, group_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/folders/by_path'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['resolve_path_groups'].request(request_ctx, request_kwargs, (group_id,), {'per_page': per_page})
 
 
 def get_folder_courses(request_ctx, course_id, id, **request_kwargs):
@@ -509,11 +397,7 @@ def get_folder_courses(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_folder_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def get_folder_users(request_ctx, user_id, id, **request_kwargs):
@@ -534,11 +418,7 @@ def get_folder_users(request_ctx, user_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_folder_users'].request(request_ctx, request_kwargs, (user_id, id), None)
 
 
 def get_folder_groups(request_ctx, group_id, id, **request_kwargs):
@@ -559,11 +439,7 @@ def get_folder_groups(request_ctx, group_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/folders/{id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_folder_groups'].request(request_ctx, request_kwargs, (group_id, id), None)
 
 
 def get_folder_folders(request_ctx, id, **request_kwargs):
@@ -582,11 +458,7 @@ def get_folder_folders(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/folders/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_folder_folders'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def update_folder(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
@@ -616,20 +488,7 @@ def update_folder(request_ctx, id, name, parent_folder_id, lock_at, unlock_at, l
 
     """
 
-    path = '/v1/folders/{id}'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_folder'].request(request_ctx, request_kwargs, (id,), {'name': name, 'parent_folder_id': parent_folder_id, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden, 'position': position})
 
 
 def create_folder_courses(request_ctx, course_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
@@ -661,21 +520,7 @@ def create_folder_courses(request_ctx, course_id, name, parent_folder_id, parent
 
     """
 
-    path = '/v1/courses/{course_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_folder_courses'].request(request_ctx, request_kwargs, (course_id,), {'name': name, 'parent_folder_id': parent_folder_id, 'parent_folder_path': parent_folder_path, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden, 'position': position})
 
 
 def create_folder_users(request_ctx, user_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
@@ -707,21 +552,7 @@ def create_folder_users(request_ctx, user_id, name, parent_folder_id, parent_fol
 
     """
 
-    path = '/v1/users/{user_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_folder_users'].request(request_ctx, request_kwargs, (user_id,), {'name': name, 'parent_folder_id': parent_folder_id, 'parent_folder_path': parent_folder_path, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden, 'position': position})
 
 
 def create_folder_groups(request_ctx, group_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
@@ -753,21 +584,7 @@ def create_folder_groups(request_ctx, group_id, name, parent_folder_id, parent_f
 
     """
 
-    path = '/v1/groups/{group_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_folder_groups'].request(request_ctx, request_kwargs, (group_id,), {'name': name, 'parent_folder_id': parent_folder_id, 'parent_folder_path': parent_folder_path, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden, 'position': position})
 
 
 def create_folder_folders(request_ctx, folder_id, name, parent_folder_id, parent_folder_path, lock_at, unlock_at, locked, hidden, position, **request_kwargs):
@@ -799,21 +616,7 @@ def create_folder_folders(request_ctx, folder_id, name, parent_folder_id, parent
 
     """
 
-    path = '/v1/folders/{folder_id}/folders'
-    payload = {
-        'name' : name,
-        'parent_folder_id' : parent_folder_id,
-        'parent_folder_path' : parent_folder_path,
-        'lock_at' : lock_at,
-        'unlock_at' : unlock_at,
-        'locked' : locked,
-        'hidden' : hidden,
-        'position' : position,
-    }
-    url = request_ctx.base_api_url + path.format(folder_id=folder_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_folder_folders'].request(request_ctx, request_kwargs, (folder_id,), {'name': name, 'parent_folder_id': parent_folder_id, 'parent_folder_path': parent_folder_path, 'lock_at': lock_at, 'unlock_at': unlock_at, 'locked': locked, 'hidden': hidden, 'position': position})
 
 
 def delete_folder(request_ctx, id, force, **request_kwargs):
@@ -832,14 +635,7 @@ def delete_folder(request_ctx, id, force, **request_kwargs):
 
     """
 
-    path = '/v1/folders/{id}'
-    payload = {
-        'force' : force,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_folder'].request(request_ctx, request_kwargs, (id,), {'force': force})
 
 
 def upload_file(request_ctx, folder_id, **request_kwargs):
@@ -862,10 +658,6 @@ def upload_file(request_ctx, folder_id, **request_kwargs):
 
     """
 
-    path = '/v1/folders/{folder_id}/files'
-    url = request_ctx.base_api_url + path.format(folder_id=folder_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (folder_id,), None)
 
 
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('query_by_assignment', 'GET', '/v1/audit/grade_change/assignments/{assignment_id}', ('assignment_id', 'start_time', 'end_time', 'per_page')),
+    ('query_by_course', 'GET', '/v1/audit/grade_change/courses/{course_id}', ('course_id', 'start_time', 'end_time', 'per_page')),
+    ('query_by_student', 'GET', '/v1/audit/grade_change/students/{student_id}', ('student_id', 'start_time', 'end_time', 'per_page')),
+    ('query_by_grader', 'GET', '/v1/audit/grade_change/graders/{grader_id}', ('grader_id', 'start_time', 'end_time', 'per_page')),
+])
+
 
 def query_by_assignment(request_ctx, assignment_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
     """
@@ -19,18 +28,7 @@ def query_by_assignment(request_ctx, assignment_id, start_time=None, end_time=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/assignments/{assignment_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_assignment'].request(request_ctx, request_kwargs, (assignment_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
 def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
@@ -52,18 +50,7 @@ def query_by_course(request_ctx, course_id, start_time=None, end_time=None, per_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/courses/{course_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_course'].request(request_ctx, request_kwargs, (course_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
 def query_by_student(request_ctx, student_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
@@ -85,18 +72,7 @@ def query_by_student(request_ctx, student_id, start_time=None, end_time=None, pe
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/students/{student_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(student_id=student_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_student'].request(request_ctx, request_kwargs, (student_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
 def query_by_grader(request_ctx, grader_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
@@ -118,17 +94,6 @@ def query_by_grader(request_ctx, grader_id, start_time=None, end_time=None, per_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/audit/grade_change/graders/{grader_id}'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(grader_id=grader_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_by_grader'].request(request_ctx, request_kwargs, (grader_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('days_in_gradebook_history_for_this_course', 'GET', '/v1/courses/{course_id}/gradebook_history/days', ('course_id', 'per_page')),
+    ('details_for_given_date_in_gradebook_history_for_this_course', 'GET', '/v1/courses/{course_id}/gradebook_history/{date}', ('course_id', 'date', 'per_page')),
+    ('lists_submissions', 'GET', '/v1/courses/{course_id}/gradebook_history/{date}/graders/{grader_id}/assignments/{assignment_id}/submissions', ('course_id', 'date', 'grader_id', 'assignment_id', 'per_page')),
+    ('list_uncollated_submission_versions', 'GET', '/v1/courses/{course_id}/gradebook_history/feed', ('course_id', 'assignment_id', 'user_id', 'ascending', 'per_page')),
+])
+
 
 def days_in_gradebook_history_for_this_course(request_ctx, course_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +24,7 @@ def days_in_gradebook_history_for_this_course(request_ctx, course_id, per_page=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/days'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['days_in_gradebook_history_for_this_course'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def details_for_given_date_in_gradebook_history_for_this_course(request_ctx, course_id, date, per_page=None, **request_kwargs):
@@ -46,16 +46,7 @@ def details_for_given_date_in_gradebook_history_for_this_course(request_ctx, cou
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/{date}'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, date=date)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['details_for_given_date_in_gradebook_history_for_this_course'].request(request_ctx, request_kwargs, (course_id, date), {'per_page': per_page})
 
 
 def lists_submissions(request_ctx, course_id, date, grader_id, assignment_id, per_page=None, **request_kwargs):
@@ -79,16 +70,7 @@ def lists_submissions(request_ctx, course_id, date, grader_id, assignment_id, pe
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/{date}/graders/{grader_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, date=date, grader_id=grader_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['lists_submissions'].request(request_ctx, request_kwargs, (course_id, date, grader_id, assignment_id), {'per_page': per_page})
 
 
 def list_uncollated_submission_versions(request_ctx, course_id, assignment_id=None, user_id=None, ascending=None, per_page=None, **request_kwargs):
@@ -115,18 +97,6 @@ def list_uncollated_submission_versions(request_ctx, course_id, assignment_id=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/gradebook_history/feed'
-    payload = {
-        'assignment_id' : assignment_id,
-        'user_id' : user_id,
-        'ascending' : ascending,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_uncollated_submission_versions'].request(request_ctx, request_kwargs, (course_id,), {'assignment_id': assignment_id, 'user_id': user_id, 'ascending': ascending, 'per_page': per_page})
 
 
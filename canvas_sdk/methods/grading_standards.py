@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('create_new_grading_standard_accounts', 'POST', '/v1/accounts/{account_id}/grading_standards', ('account_id', 'title', ('grading_scheme_entry[name]', 'grading_scheme_entry_name'), ('grading_scheme_entry[value]', 'grading_scheme_entry_value'))),
+    ('create_new_grading_standard_courses', 'POST', '/v1/courses/{course_id}/grading_standards', ('course_id', 'title', ('grading_scheme_entry[name]', 'grading_scheme_entry_name'), ('grading_scheme_entry[value]', 'grading_scheme_entry_value'))),
+])
+
 
 def create_new_grading_standard_accounts(request_ctx, account_id, title, grading_scheme_entry_name, grading_scheme_entry_value, **request_kwargs):
     """
@@ -34,16 +41,7 @@ def create_new_grading_standard_accounts(request_ctx, account_id, title, grading
 
     """
 
-    path = '/v1/accounts/{account_id}/grading_standards'
-    payload = {
-        'title' : title,
-        'grading_scheme_entry[name]' : grading_scheme_entry_name,
-        'grading_scheme_entry[value]' : grading_scheme_entry_value,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_grading_standard_accounts'].request(request_ctx, request_kwargs, (account_id,), {'title': title, 'grading_scheme_entry[name]': grading_scheme_entry_name, 'grading_scheme_entry[value]': grading_scheme_entry_value})
 
 
 def create_new_grading_standard_courses(request_ctx, course_id, title, grading_scheme_entry_name, grading_scheme_entry_value, **request_kwargs):
@@ -80,15 +78,6 @@ def create_new_grading_standard_courses(request_ctx, course_id, title, grading_s
 
     """
 
-    path = '/v1/courses/{course_id}/grading_standards'
-    payload = {
-        'title' : title,
-        'grading_scheme_entry[name]' : grading_scheme_entry_name,
-        'grading_scheme_entry[value]' : grading_scheme_entry_value,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_grading_standard_courses'].request(request_ctx, request_kwargs, (course_id,), {'title': title, 'grading_scheme_entry[name]': grading_scheme_entry_name, 'grading_scheme_entry[value]': grading_scheme_entry_value})
 
 
@@ -1,4 +1,19 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_group_categories_for_context_accounts', 'GET', '/v1/accounts/{account_id}/group_categories', ('account_id', 'per_page')),
+    ('list_group_categories_for_context_courses', 'GET', '/v1/courses/{course_id}/group_categories', ('course_id', 'per_page')),
+    ('get_single_group_category', 'GET', '/v1/group_categories/{group_category_id}', ('group_category_id',)),
+    ('create_group_category_accounts', 'POST', '/v1/accounts/{account_id}/group_categories', ('account_id', 'name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'), (('self_signup', ('enabled', 'restricted')), ('auto_leader', ('first', 'random')))),
+    ('create_group_category_courses', 'POST', '/v1/courses/{course_id}/group_categories', ('course_id', 'name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'), (('self_signup', ('enabled', 'restricted')), ('auto_leader', ('first', 'random')))),
+    ('update_group_category', 'PUT', '/v1/group_categories/{group_category_id}', ('group_category_id', 'name', 'self_signup', 'auto_leader', 'group_limit', 'create_group_count', 'split_group_count'), (('self_signup', ('enabled', 'restricted')), ('auto_leader', ('first', 'random')))),
+    ('delete_group_category', 'DELETE', '/v1/group_categories/{group_category_id}', ('group_category_id',)),
+    ('list_groups_in_group_category', 'GET', '/v1/group_categories/{group_category_id}/groups', ('group_category_id', 'per_page')),
+    ('list_users_in_group_category', 'GET', '/v1/group_categories/{group_category_id}/users', ('group_category_id', 'search_term', 'unassigned', 'per_page')),
+    ('assign_unassigned_members', 'POST', '/v1/group_categories/{group_category_id}/assign_unassigned_members', ('group_category_id', 'sync')),
+])
+
 
 def list_group_categories_for_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
     """
@@ -15,16 +30,7 @@ def list_group_categories_for_context_accounts(request_ctx, account_id, per_page
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/group_categories'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_group_categories_for_context_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def list_group_categories_for_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -42,16 +48,7 @@ def list_group_categories_for_context_courses(request_ctx, course_id, per_page=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/group_categories'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_group_categories_for_context_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def get_single_group_category(request_ctx, group_category_id, **request_kwargs):
@@ -68,11 +65,7 @@ def get_single_group_category(request_ctx, group_category_id, **request_kwargs):
 
     """
 
-    path = '/v1/group_categories/{group_category_id}'
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_group_category'].request(request_ctx, request_kwargs, (group_category_id,), None)
 
 
 def create_group_category_accounts(request_ctx, account_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
@@ -100,23 +93,7 @@ def create_group_category_accounts(request_ctx, account_id, name, self_signup=No
 
     """
 
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/accounts/{account_id}/group_categories'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_group_category_accounts'].request(request_ctx, request_kwargs, (account_id,), {'name': name, 'self_signup': self_signup, 'auto_leader': auto_leader, 'group_limit': group_limit, 'create_group_count': create_group_count, 'split_group_count': split_group_count})
 
 
 def create_group_category_courses(request_ctx, course_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
@@ -144,23 +121,7 @@ def create_group_category_courses(request_ctx, course_id, name, self_signup=None
 
     """
 
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/courses/{course_id}/group_categories'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_group_category_courses'].request(request_ctx, request_kwargs, (course_id,), {'name': name, 'self_signup': self_signup, 'auto_leader': auto_leader, 'group_limit': group_limit, 'create_group_count': create_group_count, 'split_group_count': split_group_count})
 
 
 def update_group_category(request_ctx, group_category_id, name, self_signup=None, auto_leader=None, group_limit=None, create_group_count=None, split_group_count=None, **request_kwargs):
@@ -188,23 +149,7 @@ def update_group_category(request_ctx, group_category_id, name, self_signup=None
 
     """
 
-    self_signup_types = ('enabled', 'restricted')
-    auto_leader_types = ('first', 'random')
-    utils.validate_attr_is_acceptable(self_signup, self_signup_types)
-    utils.validate_attr_is_acceptable(auto_leader, auto_leader_types)
-    path = '/v1/group_categories/{group_category_id}'
-    payload = {
-        'name' : name,
-        'self_signup' : self_signup,
-        'auto_leader' : auto_leader,
-        'group_limit' : group_limit,
-        'create_group_count' : create_group_count,
-        'split_group_count' : split_group_count,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_group_category'].request(request_ctx, request_kwargs, (group_category_id,), {'name': name, 'self_signup': self_signup, 'auto_leader': auto_leader, 'group_limit': group_limit, 'create_group_count': create_group_count, 'split_group_count': split_group_count})
 
 
 def delete_group_category(request_ctx, group_category_id, **request_kwargs):
@@ -221,11 +166,7 @@ def delete_group_category(request_ctx, group_category_id, **request_kwargs):
 
     """
 
-    path = '/v1/group_categories/{group_category_id}'
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_group_category'].request(request_ctx, request_kwargs, (group_category_id,), None)
 
 
 def list_groups_in_group_category(request_ctx, group_category_id, per_page=None, **request_kwargs):
@@ -243,16 +184,7 @@ def list_groups_in_group_category(request_ctx, group_category_id, per_page=None,
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/group_categories/{group_category_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_groups_in_group_category'].request(request_ctx, request_kwargs, (group_category_id,), {'per_page': per_page})
 
 
 def list_users_in_group_category(request_ctx, group_category_id, search_term=None, unassigned=None, per_page=None, **request_kwargs):
@@ -274,18 +206,7 @@ def list_users_in_group_category(request_ctx, group_category_id, search_term=Non
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/group_categories/{group_category_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'unassigned' : unassigned,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_users_in_group_category'].request(request_ctx, request_kwargs, (group_category_id,), {'search_term': search_term, 'unassigned': unassigned, 'per_page': per_page})
 
 
 def assign_unassigned_members(request_ctx, group_category_id, sync=None, **request_kwargs):
@@ -304,13 +225,6 @@ def assign_unassigned_members(request_ctx, group_category_id, sync=None, **reque
 
     """
 
-    path = '/v1/group_categories/{group_category_id}/assign_unassigned_members'
-    payload = {
-        'sync' : sync,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['assign_unassigned_members'].request(request_ctx, request_kwargs, (group_category_id,), {'sync': sync})
 
 
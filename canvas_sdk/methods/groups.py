@@ -1,4 +1,30 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_your_groups', 'GET', '/v1/users/self/groups', ('context_type', 'per_page'), (('context_type', ('Account', 'Course')),)),
+    ('list_groups_available_in_context_accounts', 'GET', '/v1/accounts/{account_id}/groups', ('account_id', 'per_page')),
+    ('list_groups_available_in_context_courses', 'GET', '/v1/courses/{course_id}/groups', ('course_id', 'per_page')),
+    ('get_single_group', 'GET', '/v1/groups/{group_id}', ('group_id', 'include'), (('include', ('permissions',)),)),
+    ('create_group_groups', 'POST', '/v1/groups', ('name', 'description', 'is_public', 'join_level', 'storage_quota_mb'), (('join_level', ('parent_context_auto_join', 'parent_context_request', 'invitation_only')),)),
+    ('create_group_group_categories', 'POST', '/v1/group_categories/{group_category_id}/groups', ('group_category_id', 'name', 'description', 'is_public', 'join_level', 'storage_quota_mb'), (('join_level', ('parent_context_auto_join', 'parent_context_request', 'invitation_only')),)),
+    ('edit_group', 'PUT', '/v1/groups/{group_id}', ('group_id', 'name', 'description', 'is_public', 'join_level', 'avatar_id', 'storage_quota_mb'), (('join_level', ('parent_context_auto_join', 'parent_context_request', 'invitation_only')),)),
+    ('delete_group', 'DELETE', '/v1/groups/{group_id}', ('group_id',)),
+    ('invite_others_to_group', 'POST', '/v1/groups/{group_id}/invite', ('group_id', 'invitees')),
+    ('list_group_s_users', 'GET', '/v1/groups/{group_id}/users', ('group_id', 'include', 'search_term', 'per_page'), (('include', ('avatar_url',)),)),
+    ('upload_file', 'POST', '/v1/groups/{group_id}/files', ('group_id',)),
+    ('preview_processed_html', 'POST', '/v1/groups/{group_id}/preview_html', ('group_id', 'html')),
+    ('group_activity_stream', 'GET', '/v1/groups/{group_id}/activity_stream', ('group_id',)),
+    ('group_activity_stream_summary', 'GET', '/v1/groups/{group_id}/activity_stream/summary', ('group_id',)),
+    ('list_group_memberships_memberships', 'GET', '/v1/groups/{group_id}/memberships', ('group_id', 'filter_states', 'per_page'), (('filter_states', ('accepted', 'invited', 'requested')),)),
+    ('list_group_memberships_users', 'GET', '/v1/groups/{group_id}/users', ('group_id', 'filter_states', 'per_page'), (('filter_states', ('accepted', 'invited', 'requested')),)),
+    ('create_membership', 'POST', '/v1/groups/{group_id}/memberships', ('group_id', 'user_id')),
+    ('update_membership_memberships', 'PUT', '/v1/groups/{group_id}/memberships/{membership_id}', ('group_id', 'membership_id', 'moderator', 'workflow_state'), (('workflow_state', ('accepted',)),)),
+    ('update_membership_users', 'PUT', '/v1/groups/{group_id}/users/{user_id}', ('group_id', 'user_id', 'moderator', 'workflow_state'), (('workflow_state', ('accepted',)),)),
+    ('leave_group_memberships', 'DELETE', '/v1/groups/{group_id}/memberships/{membership_id}', ('group_id', 'membership_id')),
+    ('leave_group_users', 'DELETE', '/v1/groups/{group_id}/users/{user_id}', ('group_id', 'user_id')),
+])
+
 
 def list_your_groups(request_ctx, context_type=None, per_page=None, **request_kwargs):
     """
@@ -15,19 +41,7 @@ def list_your_groups(request_ctx, context_type=None, per_page=None, **request_kw
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    context_type_types = ('Account', 'Course')
-    utils.validate_attr_is_acceptable(context_type, context_type_types)
-    path = '/v1/users/self/groups'
-    payload = {
-        'context_type' : context_type,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_your_groups'].request(request_ctx, request_kwargs, (), {'context_type': context_type, 'per_page': per_page})
 
 
 def list_groups_available_in_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
@@ -45,16 +59,7 @@ def list_groups_available_in_context_accounts(request_ctx, account_id, per_page=
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_groups_available_in_context_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def list_groups_available_in_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -72,16 +77,7 @@ def list_groups_available_in_context_courses(request_ctx, course_id, per_page=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_groups_available_in_context_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def get_single_group(request_ctx, group_id, include, **request_kwargs):
@@ -100,16 +96,7 @@ def get_single_group(request_ctx, group_id, include, **request_kwargs):
 
     """
 
-    include_types = ('permissions')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_group'].request(request_ctx, request_kwargs, (group_id,), {'include': include})
 
 
 def create_group_groups(request_ctx, name, description, is_public, join_level, storage_quota_mb, **request_kwargs):
@@ -134,20 +121,7 @@ def create_group_groups(request_ctx, name, description, is_public, join_level, s
 
     """
 
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/groups'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_group_groups'].request(request_ctx, request_kwargs, (), {'name': name, 'description': description, 'is_public': is_public, 'join_level': join_level, 'storage_quota_mb': storage_quota_mb})
 
 
 def create_group_group_categories(request_ctx, group_category_id, name, description, is_public, join_level, storage_quota_mb, **request_kwargs):
@@ -174,20 +148,7 @@ def create_group_group_categories(request_ctx, group_category_id, name, descript
 
     """
 
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/group_categories/{group_category_id}/groups'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(group_category_id=group_category_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_group_group_categories'].request(request_ctx, request_kwargs, (group_category_id,), {'name': name, 'description': description, 'is_public': is_public, 'join_level': join_level, 'storage_quota_mb': storage_quota_mb})
 
 
 def edit_group(request_ctx, group_id, name, description, is_public, join_level, avatar_id, storage_quota_mb, **request_kwargs):
@@ -219,21 +180,7 @@ def edit_group(request_ctx, group_id, name, description, is_public, join_level,
 
     """
 
-    join_level_types = ('parent_context_auto_join', 'parent_context_request', 'invitation_only')
-    utils.validate_attr_is_acceptable(join_level, join_level_types)
-    path = '/v1/groups/{group_id}'
-    payload = {
-        'name' : name,
-        'description' : description,
-        'is_public' : is_public,
-        'join_level' : join_level,
-        'avatar_id' : avatar_id,
-        'storage_quota_mb' : storage_quota_mb,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_group'].request(request_ctx, request_kwargs, (group_id,), {'name': name, 'description': description, 'is_public': is_public, 'join_level': join_level, 'avatar_id': avatar_id, 'storage_quota_mb': storage_quota_mb})
 
 
 def delete_group(request_ctx, group_id, **request_kwargs):
@@ -249,11 +196,7 @@ def delete_group(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_group'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def invite_others_to_group(request_ctx, group_id, invitees, **request_kwargs):
@@ -272,14 +215,7 @@ def invite_others_to_group(request_ctx, group_id, invitees, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/invite'
-    payload = {
-        'invitees' : invitees,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['invite_others_to_group'].request(request_ctx, request_kwargs, (group_id,), {'invitees': invitees})
 
 
 def list_group_s_users(request_ctx, group_id, include, search_term=None, per_page=None, **request_kwargs):
@@ -301,20 +237,7 @@ def list_group_s_users(request_ctx, group_id, include, search_term=None, per_pag
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('avatar_url')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}/users'
-    payload = {
-        'search_term' : search_term,
-        'include' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_group_s_users'].request(request_ctx, request_kwargs, (group_id,), {'include': include, 'search_term': search_term, 'per_page': per_page})
 
 
 def upload_file(request_ctx, group_id, **request_kwargs):
@@ -338,11 +261,7 @@ def upload_file(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/files'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def preview_processed_html(request_ctx, group_id, html, **request_kwargs):
@@ -360,14 +279,7 @@ def preview_processed_html(request_ctx, group_id, html, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/preview_html'
-    payload = {
-        'html' : html,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['preview_processed_html'].request(request_ctx, request_kwargs, (group_id,), {'html': html})
 
 
 def group_activity_stream(request_ctx, group_id, **request_kwargs):
@@ -386,11 +298,7 @@ def group_activity_stream(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/activity_stream'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['group_activity_stream'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def group_activity_stream_summary(request_ctx, group_id, **request_kwargs):
@@ -409,11 +317,7 @@ def group_activity_stream_summary(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['group_activity_stream_summary'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def list_group_memberships_memberships(request_ctx, group_id, filter_states=None, per_page=None, **request_kwargs):
@@ -433,19 +337,7 @@ def list_group_memberships_memberships(request_ctx, group_id, filter_states=None
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    filter_states_types = ('accepted', 'invited', 'requested')
-    utils.validate_attr_is_acceptable(filter_states, filter_states_types)
-    path = '/v1/groups/{group_id}/memberships'
-    payload = {
-        'filter_states' : filter_states,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_group_memberships_memberships'].request(request_ctx, request_kwargs, (group_id,), {'filter_states': filter_states, 'per_page': per_page})
 
 
 def list_group_memberships_users(request_ctx, group_id, filter_states=None, per_page=None, **request_kwargs):
@@ -465,19 +357,7 @@ def list_group_memberships_users(request_ctx, group_id, filter_states=None, per_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    filter_states_types = ('accepted', 'invited', 'requested')
-    utils.validate_attr_is_acceptable(filter_states, filter_states_types)
-    path = '/v1/groups/{group_id}/users'
-    payload = {
-        'filter_states' : filter_states,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_group_memberships_users'].request(request_ctx, request_kwargs, (group_id,), {'filter_states': filter_states, 'per_page': per_page})
 
 
 def create_membership(request_ctx, group_id, user_id, **request_kwargs):
@@ -497,14 +377,7 @@ def create_membership(request_ctx, group_id, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/memberships'
-    payload = {
-        'user_id' : user_id,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_membership'].request(request_ctx, request_kwargs, (group_id,), {'user_id': user_id})
 
 
 def update_membership_memberships(request_ctx, group_id, membership_id, moderator, workflow_state=None, **request_kwargs):
@@ -526,17 +399,7 @@ def update_membership_memberships(request_ctx, group_id, membership_id, moderato
 
     """
 
-    workflow_state_types = ('accepted')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/memberships/{membership_id}'
-    payload = {
-        'workflow_state' : workflow_state,
-        'moderator' : moderator,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, membership_id=membership_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_membership_memberships'].request(request_ctx, request_kwargs, (group_id, membership_id), {'moderator': moderator, 'workflow_state': workflow_state})
 
 
 def update_membership_users(request_ctx, group_id, user_id, moderator, workflow_state=None, **request_kwargs):
@@ -558,17 +421,7 @@ def update_membership_users(request_ctx, group_id, user_id, moderator, workflow_
 
     """
 
-    workflow_state_types = ('accepted')
-    utils.validate_attr_is_acceptable(workflow_state, workflow_state_types)
-    path = '/v1/groups/{group_id}/users/{user_id}'
-    payload = {
-        'workflow_state' : workflow_state,
-        'moderator' : moderator,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_membership_users'].request(request_ctx, request_kwargs, (group_id, user_id), {'moderator': moderator, 'workflow_state': workflow_state})
 
 
 def leave_group_memberships(request_ctx, group_id, membership_id, **request_kwargs):
@@ -588,11 +441,7 @@ def leave_group_memberships(request_ctx, group_id, membership_id, **request_kwar
 
     """
 
-    path = '/v1/groups/{group_id}/memberships/{membership_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, membership_id=membership_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['leave_group_memberships'].request(request_ctx, request_kwargs, (group_id, membership_id), None)
 
 
 def leave_group_users(request_ctx, group_id, user_id, **request_kwargs):
@@ -612,10 +461,6 @@ def leave_group_users(request_ctx, group_id, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/users/{user_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, user_id=user_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['leave_group_users'].request(request_ctx, request_kwargs, (group_id, user_id), None)
 
 
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('create_live_assessment_results', 'POST', '/v1/courses/{course_id}/live_assessments/{assessment_id}/results', ('course_id', 'assessment_id')),
+    ('list_live_assessment_results', 'GET', '/v1/courses/{course_id}/live_assessments/{assessment_id}/results', ('course_id', 'assessment_id', 'user_id')),
+    ('create_or_find_live_assessment', 'POST', '/v1/courses/{course_id}/live_assessments', ('course_id',)),
+    ('list_live_assessments', 'GET', '/v1/courses/{course_id}/live_assessments', ('course_id',)),
+])
+
 
 def create_live_assessment_results(request_ctx, course_id, assessment_id, **request_kwargs):
     """
@@ -15,11 +24,7 @@ def create_live_assessment_results(request_ctx, course_id, assessment_id, **requ
 
     """
 
-    path = '/v1/courses/{course_id}/live_assessments/{assessment_id}/results'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assessment_id=assessment_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_live_assessment_results'].request(request_ctx, request_kwargs, (course_id, assessment_id), None)
 
 
 def list_live_assessment_results(request_ctx, course_id, assessment_id, user_id=None, **request_kwargs):
@@ -39,14 +44,7 @@ def list_live_assessment_results(request_ctx, course_id, assessment_id, user_id=
 
     """
 
-    path = '/v1/courses/{course_id}/live_assessments/{assessment_id}/results'
-    payload = {
-        'user_id' : user_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assessment_id=assessment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_live_assessment_results'].request(request_ctx, request_kwargs, (course_id, assessment_id), {'user_id': user_id})
 
 
 def create_or_find_live_assessment(request_ctx, course_id, **request_kwargs):
@@ -63,11 +61,7 @@ def create_or_find_live_assessment(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/live_assessments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_or_find_live_assessment'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def list_live_assessments(request_ctx, course_id, **request_kwargs):
@@ -83,10 +77,6 @@ def list_live_assessments(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/live_assessments'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_live_assessments'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
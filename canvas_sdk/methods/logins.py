@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_user_logins_accounts', 'GET', '/v1/accounts/{account_id}/logins', ('account_id',)),
+    ('list_user_logins_users', 'GET', '/v1/users/{user_id}/logins', ('user_id',)),
+    ('create_user_login', 'POST', '/v1/accounts/{account_id}/logins', ('account_id', ('user[id]', 'user_id'), ('login[unique_id]', 'login_unique_id'), ('login[password]', 'login_password'), ('login[sis_user_id]', 'login_sis_user_id'))),
+    ('edit_user_login', 'PUT', '/v1/accounts/{account_id}/logins/{id}', ('account_id', 'id', ('login[unique_id]', 'login_unique_id'), ('login[password]', 'login_password'), ('login[sis_user_id]', 'login_sis_user_id'))),
+    ('delete_user_login', 'DELETE', '/v1/users/{user_id}/logins/{id}', ('user_id', 'id')),
+])
+
 
 def list_user_logins_accounts(request_ctx, account_id, **request_kwargs):
     """
@@ -13,11 +23,7 @@ def list_user_logins_accounts(request_ctx, account_id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/logins'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_user_logins_accounts'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def list_user_logins_users(request_ctx, user_id, **request_kwargs):
@@ -33,11 +39,7 @@ def list_user_logins_users(request_ctx, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/logins'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_user_logins_users'].request(request_ctx, request_kwargs, (user_id,), None)
 
 
 def create_user_login(request_ctx, account_id, user_id, login_unique_id, login_password=None, login_sis_user_id=None, **request_kwargs):
@@ -61,17 +63,7 @@ def create_user_login(request_ctx, account_id, user_id, login_unique_id, login_p
 
     """
 
-    path = '/v1/accounts/{account_id}/logins'
-    payload = {
-        'user[id]' : user_id,
-        'login[unique_id]' : login_unique_id,
-        'login[password]' : login_password,
-        'login[sis_user_id]' : login_sis_user_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_user_login'].request(request_ctx, request_kwargs, (account_id,), {'user[id]': user_id, 'login[unique_id]': login_unique_id, 'login[password]': login_password, 'login[sis_user_id]': login_sis_user_id})
 
 
 def edit_user_login(request_ctx, account_id, id, login_unique_id=None, login_password=None, login_sis_user_id=None, **request_kwargs):
@@ -95,16 +87,7 @@ def edit_user_login(request_ctx, account_id, id, login_unique_id=None, login_pas
 
     """
 
-    path = '/v1/accounts/{account_id}/logins/{id}'
-    payload = {
-        'login[unique_id]' : login_unique_id,
-        'login[password]' : login_password,
-        'login[sis_user_id]' : login_sis_user_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_user_login'].request(request_ctx, request_kwargs, (account_id, id), {'login[unique_id]': login_unique_id, 'login[password]': login_password, 'login[sis_user_id]': login_sis_user_id})
 
 
 def delete_user_login(request_ctx, user_id, id, **request_kwargs):
@@ -122,10 +105,6 @@ def delete_user_login(request_ctx, user_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/logins/{id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_user_login'].request(request_ctx, request_kwargs, (user_id, id), None)
 
 
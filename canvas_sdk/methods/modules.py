@@ -1,4 +1,21 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_modules', 'GET', '/v1/courses/{course_id}/modules', ('course_id', 'include', 'search_term', 'student_id', 'per_page'), (('include', ('items', 'content_details')),)),
+    ('show_module', 'GET', '/v1/courses/{course_id}/modules/{id}', ('course_id', 'id', 'include', 'student_id'), (('include', ('items', 'content_details')),)),
+    ('create_module', 'POST', '/v1/courses/{course_id}/modules', ('course_id', ('module[name]', 'module_name'), ('module[unlock_at]', 'module_unlock_at'), ('module[position]', 'module_position'), ('module[require_sequential_progress]', 'module_require_sequential_progress'), ('module[prerequisite_module_ids]', 'module_prerequisite_module_ids'), ('module[publish_final_grade]', 'module_publish_final_grade'))),
+    ('update_module', 'PUT', '/v1/courses/{course_id}/modules/{id}', ('course_id', 'id', ('module[name]', 'module_name'), ('module[unlock_at]', 'module_unlock_at'), ('module[position]', 'module_position'), ('module[require_sequential_progress]', 'module_require_sequential_progress'), ('module[prerequisite_module_ids]', 'module_prerequisite_module_ids'), ('module[publish_final_grade]', 'module_publish_final_grade'), ('module[published]', 'module_published'))),
+    ('delete_module', 'DELETE', '/v1/courses/{course_id}/modules/{id}', ('course_id', 'id')),
+    ('list_module_items', 'GET', '/v1/courses/{course_id}/modules/{module_id}/items', ('course_id', 'module_id', 'include', 'search_term', 'student_id', 'per_page'), (('include', ('content_details',)),)),
+    ('show_module_item', 'GET', '/v1/courses/{course_id}/modules/{module_id}/items/{id}', ('course_id', 'module_id', 'id', 'include', 'student_id'), (('include', ('content_details',)),)),
+    ('delete_module_item', 'DELETE', '/v1/courses/{course_id}/modules/{module_id}/items/{id}', ('course_id', 'module_id', 'id')),
+    ('get_module_item_sequence', 'GET', '/v1/courses/{course_id}/module_item_sequence', ('course_id', 'asset_type', 'asset_id'), (('asset_type', ('ModuleItem', 'File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'ExternalTool')),)),
+])
+
+MODULE_ITEM_TYPE_TYPES = frozenset(('File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'SubHeader', 'ExternalUrl', 'ExternalTool'))
+MODULE_ITEM_COMPLETION_REQUIREMENT_TYPE_TYPES = frozenset(('must_view', 'must_contribute', 'must_submit', 'min_score'))
+
 
 def list_modules(request_ctx, course_id, include, search_term=None, student_id=None, per_page=None, **request_kwargs):
     """
@@ -21,21 +38,7 @@ def list_modules(request_ctx, course_id, include, search_term=None, student_id=N
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('items', 'content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'student_id' : student_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_modules'].request(request_ctx, request_kwargs, (course_id,), {'include': include, 'search_term': search_term, 'student_id': student_id, 'per_page': per_page})
 
 
 def show_module(request_ctx, course_id, id, include, student_id=None, **request_kwargs):
@@ -57,17 +60,7 @@ def show_module(request_ctx, course_id, id, include, student_id=None, **request_
 
     """
 
-    include_types = ('items', 'content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{id}'
-    payload = {
-        'include' : include,
-        'student_id' : student_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_module'].request(request_ctx, request_kwargs, (course_id, id), {'include': include, 'student_id': student_id})
 
 
 def create_module(request_ctx, course_id, module_name, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None, **request_kwargs):
@@ -95,19 +88,7 @@ def create_module(request_ctx, course_id, module_name, module_unlock_at=None, mo
 
     """
 
-    path = '/v1/courses/{course_id}/modules'
-    payload = {
-        'module[name]' : module_name,
-        'module[unlock_at]' : module_unlock_at,
-        'module[position]' : module_position,
-        'module[require_sequential_progress]' : module_require_sequential_progress,
-        'module[prerequisite_module_ids]' : module_prerequisite_module_ids,
-        'module[publish_final_grade]' : module_publish_final_grade,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_module'].request(request_ctx, request_kwargs, (course_id,), {'module[name]': module_name, 'module[unlock_at]': module_unlock_at, 'module[position]': module_position, 'module[require_sequential_progress]': module_require_sequential_progress, 'module[prerequisite_module_ids]': module_prerequisite_module_ids, 'module[publish_final_grade]': module_publish_final_grade})
 
 
 def update_module(request_ctx, course_id, id, module_name=None, module_unlock_at=None, module_position=None, module_require_sequential_progress=None, module_prerequisite_module_ids=None, module_publish_final_grade=None, module_published=None, **request_kwargs):
@@ -139,20 +120,7 @@ def update_module(request_ctx, course_id, id, module_name=None, module_unlock_at
 
     """
 
-    path = '/v1/courses/{course_id}/modules/{id}'
-    payload = {
-        'module[name]' : module_name,
-        'module[unlock_at]' : module_unlock_at,
-        'module[position]' : module_position,
-        'module[require_sequential_progress]' : module_require_sequential_progress,
-        'module[prerequisite_module_ids]' : module_prerequisite_module_ids,
-        'module[publish_final_grade]' : module_publish_final_grade,
-        'module[published]' : module_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_module'].request(request_ctx, request_kwargs, (course_id, id), {'module[name]': module_name, 'module[unlock_at]': module_unlock_at, 'module[position]': module_position, 'module[require_sequential_progress]': module_require_sequential_progress, 'module[prerequisite_module_ids]': module_prerequisite_module_ids, 'module[publish_final_grade]': module_publish_final_grade, 'module[published]': module_published})
 
 
 def delete_module(request_ctx, course_id, id, **request_kwargs):
@@ -170,11 +138,7 @@ def delete_module(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/modules/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_module'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def list_module_items(request_ctx, course_id, module_id, include, search_term=None, student_id=None, per_page=None, **request_kwargs):
@@ -200,21 +164,7 @@ def list_module_items(request_ctx, course_id, module_id, include, search_term=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{module_id}/items'
-    payload = {
-        'include' : include,
-        'search_term' : search_term,
-        'student_id' : student_id,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_module_items'].request(request_ctx, request_kwargs, (course_id, module_id), {'include': include, 'search_term': search_term, 'student_id': student_id, 'per_page': per_page})
 
 
 def show_module_item(request_ctx, course_id, module_id, id, include, student_id=None, **request_kwargs):
@@ -238,17 +188,7 @@ def show_module_item(request_ctx, course_id, module_id, id, include, student_id=
 
     """
 
-    include_types = ('content_details')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/modules/{module_id}/items/{id}'
-    payload = {
-        'include' : include,
-        'student_id' : student_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_module_item'].request(request_ctx, request_kwargs, (course_id, module_id, id), {'include': include, 'student_id': student_id})
 
 
 def create_module_item(request_ctx, course_id, module_id, module_item_type, module_item_content_id, module_item_page_url=None, module_item_external_url=None, module_item_completion_requirement_min_score=None, module_item_title=None, module_item_position=None, module_item_indent=None, module_item_new_tab=None, module_item_completion_requirement_type=None, **request_kwargs):
@@ -286,10 +226,8 @@ def create_module_item(request_ctx, course_id, module_id, module_item_type, modu
 
     """
 
-    module_item_type_types = ('File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'SubHeader', 'ExternalUrl', 'ExternalTool')
-    module_item_completion_requirement_type_types = ('must_view', 'must_contribute', 'must_submit', 'min_score')
-    utils.validate_attr_is_acceptable(module_item_type, module_item_type_types)
-    utils.validate_attr_is_acceptable(module_item_completion_requirement_type, module_item_completion_requirement_type_types)
+    utils.validate_attr_is_acceptable(module_item_type, MODULE_ITEM_TYPE_TYPES)
+    utils.validate_attr_is_acceptable(module_item_completion_requirement_type, MODULE_ITEM_COMPLETION_REQUIREMENT_TYPE_TYPES)
     if module_item_type == 'Page' and module_item_page_url is None:
         raise ValueError('module_item_page_url must be set for Page items')
     if module_item_type in ('ExternalUrl', 'ExternalTool') and module_item_external_url is None:
@@ -315,6 +253,7 @@ def create_module_item(request_ctx, course_id, module_id, module_item_type, modu
     return response
 
 
+
 def update_module_item(request_ctx, course_id, module_id, id, module_item_completion_requirement_min_score=None, module_item_title=None, module_item_position=None, module_item_indent=None, module_item_external_url=None, module_item_new_tab=None, module_item_completion_requirement_type=None, module_item_published=None, module_item_module_id=None, **request_kwargs):
     """
     Update and return an existing module item
@@ -350,10 +289,7 @@ def update_module_item(request_ctx, course_id, module_id, id, module_item_comple
 
     """
 
-    module_item_completion_requirement_type_types = ('must_view', 'must_contribute', 'must_submit', 'min_score')
-    utils.validate_attr_is_acceptable(module_item_completion_requirement_type, module_item_completion_requirement_type_types)
-    if module_item_type in ('ExternalUrl', 'ExternalTool') and module_item_external_url is None:
-        raise ValueError('module_item_external_url must be set for ExternalUrl or ExternalTool items')
+    utils.validate_attr_is_acceptable(module_item_completion_requirement_type, MODULE_ITEM_COMPLETION_REQUIREMENT_TYPE_TYPES)
     if module_item_completion_requirement_type == 'min_score' and module_item_completion_requirement_min_score is None:
         raise ValueError('module_item_completion_requirement_min_score must be set for min_score requirement types')
 
@@ -375,6 +311,7 @@ def update_module_item(request_ctx, course_id, module_id, id, module_item_comple
     return response
 
 
+
 def delete_module_item(request_ctx, course_id, module_id, id, **request_kwargs):
     """
     Delete a module item
@@ -392,11 +329,7 @@ def delete_module_item(request_ctx, course_id, module_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/modules/{module_id}/items/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, module_id=module_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_module_item'].request(request_ctx, request_kwargs, (course_id, module_id, id), None)
 
 
 def get_module_item_sequence(request_ctx, course_id, asset_type, asset_id, **request_kwargs):
@@ -417,16 +350,6 @@ def get_module_item_sequence(request_ctx, course_id, asset_type, asset_id, **req
 
     """
 
-    asset_type_types = ('ModuleItem', 'File', 'Page', 'Discussion', 'Assignment', 'Quiz', 'ExternalTool')
-    utils.validate_attr_is_acceptable(asset_type, asset_type_types)
-    path = '/v1/courses/{course_id}/module_item_sequence'
-    payload = {
-        'asset_type' : asset_type,
-        'asset_id' : asset_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_module_item_sequence'].request(request_ctx, request_kwargs, (course_id,), {'asset_type': asset_type, 'asset_id': asset_id})
 
 
@@ -1,4 +1,17 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_preferences_communication_channel_id', 'GET', '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences', ('user_id', 'communication_channel_id', 'per_page')),
+    ('list_preferences_type', 'GET', '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences', ('user_id', 'type', 'address', 'per_page')),
+    ('get_preference_communication_channel_id', 'GET', '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences/{notification}', ('user_id', 'communication_channel_id', 'notification')),
+    ('get_preference_type', 'GET', '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences/{notification}', ('user_id', 'type', 'address', 'notification')),
+    ('update_preference_communication_channel_id', 'PUT', '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences/{notification}', ('communication_channel_id', 'notification', ('notification_preferences[frequency]', 'notification_preferences_frequency'))),
+    ('update_preference_type', 'PUT', '/v1/users/self/communication_channels/{type}/{address}/notification_preferences/{notification}', ('type', 'address', 'notification', ('notification_preferences[frequency]', 'notification_preferences_frequency'))),
+    ('update_multiple_preferences_communication_channel_id', 'PUT', '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences', ('communication_channel_id', ('notification_preferences[X][frequency]', 'notification_preferences_X_frequency'))),
+    ('update_multiple_preferences_type', 'PUT', '/v1/users/self/communication_channels/{type}/{address}/notification_preferences', ('type', 'address', ('notification_preferences[X][frequency]', 'notification_preferences_X_frequency'))),
+])
+
 
 def list_preferences_communication_channel_id(request_ctx, user_id, communication_channel_id, per_page=None, **request_kwargs):
     """
@@ -17,16 +30,7 @@ def list_preferences_communication_channel_id(request_ctx, user_id, communicatio
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, communication_channel_id=communication_channel_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_preferences_communication_channel_id'].request(request_ctx, request_kwargs, (user_id, communication_channel_id), {'per_page': per_page})
 
 
 def list_preferences_type(request_ctx, user_id, type, address, per_page=None, **request_kwargs):
@@ -48,16 +52,7 @@ def list_preferences_type(request_ctx, user_id, type, address, per_page=None, **
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_preferences_type'].request(request_ctx, request_kwargs, (user_id, type, address), {'per_page': per_page})
 
 
 def get_preference_communication_channel_id(request_ctx, user_id, communication_channel_id, notification, **request_kwargs):
@@ -77,11 +72,7 @@ def get_preference_communication_channel_id(request_ctx, user_id, communication_
 
     """
 
-    path = '/v1/users/{user_id}/communication_channels/{communication_channel_id}/notification_preferences/{notification}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, communication_channel_id=communication_channel_id, notification=notification)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_preference_communication_channel_id'].request(request_ctx, request_kwargs, (user_id, communication_channel_id, notification), None)
 
 
 def get_preference_type(request_ctx, user_id, type, address, notification, **request_kwargs):
@@ -103,11 +94,7 @@ def get_preference_type(request_ctx, user_id, type, address, notification, **req
 
     """
 
-    path = '/v1/users/{user_id}/communication_channels/{type}/{address}/notification_preferences/{notification}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, type=type, address=address, notification=notification)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_preference_type'].request(request_ctx, request_kwargs, (user_id, type, address, notification), None)
 
 
 def update_preference_communication_channel_id(request_ctx, communication_channel_id, notification, notification_preferences_frequency, **request_kwargs):
@@ -127,14 +114,7 @@ def update_preference_communication_channel_id(request_ctx, communication_channe
 
     """
 
-    path = '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences/{notification}'
-    payload = {
-        'notification_preferences[frequency]' : notification_preferences_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(communication_channel_id=communication_channel_id, notification=notification)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_preference_communication_channel_id'].request(request_ctx, request_kwargs, (communication_channel_id, notification), {'notification_preferences[frequency]': notification_preferences_frequency})
 
 
 def update_preference_type(request_ctx, type, address, notification, notification_preferences_frequency, **request_kwargs):
@@ -156,14 +136,7 @@ def update_preference_type(request_ctx, type, address, notification, notificatio
 
     """
 
-    path = '/v1/users/self/communication_channels/{type}/{address}/notification_preferences/{notification}'
-    payload = {
-        'notification_preferences[frequency]' : notification_preferences_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(type=type, address=address, notification=notification)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_preference_type'].request(request_ctx, request_kwargs, (type, address, notification), {'notification_preferences[frequency]': notification_preferences_frequency})
 
 
 def update_multiple_preferences_communication_channel_id(request_ctx, communication_channel_id, notification_preferences_X_frequency, **request_kwargs):
@@ -181,14 +154,7 @@ def update_multiple_preferences_communication_channel_id(request_ctx, communicat
 
     """
 
-    path = '/v1/users/self/communication_channels/{communication_channel_id}/notification_preferences'
-    payload = {
-        'notification_preferences[X][frequency]' : notification_preferences_X_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(communication_channel_id=communication_channel_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_multiple_preferences_communication_channel_id'].request(request_ctx, request_kwargs, (communication_channel_id,), {'notification_preferences[X][frequency]': notification_preferences_X_frequency})
 
 
 def update_multiple_preferences_type(request_ctx, type, address, notification_preferences_X_frequency, **request_kwargs):
@@ -208,13 +174,6 @@ def update_multiple_preferences_type(request_ctx, type, address, notification_pr
 
     """
 
-    path = '/v1/users/self/communication_channels/{type}/{address}/notification_preferences'
-    payload = {
-        'notification_preferences[X][frequency]' : notification_preferences_X_frequency,
-    }
-    url = request_ctx.base_api_url + path.format(type=type, address=address)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_multiple_preferences_type'].request(request_ctx, request_kwargs, (type, address), {'notification_preferences[X][frequency]': notification_preferences_X_frequency})
 
 
@@ -1,4 +1,46 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('redirect_to_root_outcome_group_for_context_global', 'GET', '/v1/global/root_outcome_group', ()),
+    ('redirect_to_root_outcome_group_for_context_accounts', 'GET', '/v1/accounts/{account_id}/root_outcome_group', ('account_id',)),
+    ('redirect_to_root_outcome_group_for_context_courses', 'GET', '/v1/courses/{course_id}/root_outcome_group', ('course_id',)),
+    ('get_all_outcome_groups_for_context_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups', ('account_id', 'per_page')),
+    ('get_all_outcome_groups_for_context_courses', 'GET', '/v1/courses/{course_id}/outcome_groups', ('course_id', 'per_page')),
+    ('get_all_outcome_links_for_context_accounts', 'GET', '/v1/accounts/{account_id}/outcome_group_links', ('account_id', 'outcome_style', 'outcome_group_style', 'per_page')),
+    ('get_all_outcome_links_for_context_courses', 'GET', '/v1/courses/{course_id}/outcome_group_links', ('course_id', 'outcome_style', 'outcome_group_style', 'per_page')),
+    ('show_outcome_group_global', 'GET', '/v1/global/outcome_groups/{id}', ('id',)),
+    ('show_outcome_group_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}', ('account_id', 'id')),
+    ('show_outcome_group_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}', ('course_id', 'id')),
+    ('update_outcome_group_global', 'PUT', '/v1/global/outcome_groups/{id}', ('id', 'title', 'description', 'vendor_guid', 'parent_outcome_group_id')),
+    ('update_outcome_group_accounts', 'PUT', '/v1/accounts/{account_id}/outcome_groups/{id}', ('account_id', 'id', 'title', 'description', 'vendor_guid', 'parent_outcome_group_id')),
+    ('update_outcome_group_courses', 'PUT', '/v1/courses/{course_id}/outcome_groups/{id}', ('course_id', 'id', 'title', 'description', 'vendor_guid', 'parent_outcome_group_id')),
+    ('delete_outcome_group_global', 'DELETE', '/v1/global/outcome_groups/{id}', ('id',)),
+    ('delete_outcome_group_accounts', 'DELETE', '/v1/accounts/{account_id}/outcome_groups/{id}', ('account_id', 'id')),
+    ('delete_outcome_group_courses', 'DELETE', '/v1/courses/{course_id}/outcome_groups/{id}', ('course_id', 'id')),
+    ('list_linked_outcomes_global', 'GET', '/v1/global/outcome_groups/{id}/outcomes', ('id', 'per_page')),
+    ('list_linked_outcomes_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes', ('account_id', 'id', 'per_page')),
+    ('list_linked_outcomes_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes', ('course_id', 'id', 'per_page')),
+    ('create_link_outcome_global', 'POST', '/v1/global/outcome_groups/{id}/outcomes', ('id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('create_link_outcome_global_outcome_id', 'PUT', '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}', ('id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('create_link_outcome_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes', ('account_id', 'id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('create_link_outcome_accounts_outcome_id', 'PUT', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}', ('account_id', 'id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('create_link_outcome_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes', ('course_id', 'id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('create_link_outcome_courses_outcome_id', 'PUT', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}', ('course_id', 'id', 'outcome_id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+    ('unlink_outcome_global', 'DELETE', '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}', ('id', 'outcome_id')),
+    ('unlink_outcome_accounts', 'DELETE', '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}', ('account_id', 'id', 'outcome_id')),
+    ('unlink_outcome_courses', 'DELETE', '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}', ('course_id', 'id', 'outcome_id')),
+    ('list_subgroups_global', 'GET', '/v1/global/outcome_groups/{id}/subgroups', ('id', 'per_page')),
+    ('list_subgroups_accounts', 'GET', '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups', ('account_id', 'id', 'per_page')),
+    ('list_subgroups_courses', 'GET', '/v1/courses/{course_id}/outcome_groups/{id}/subgroups', ('course_id', 'id', 'per_page')),
+    ('create_subgroup_global', 'POST', '/v1/global/outcome_groups/{id}/subgroups', ('id', 'title', 'description', 'vendor_guid')),
+    ('create_subgroup_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups', ('account_id', 'id', 'title', 'description', 'vendor_guid')),
+    ('create_subgroup_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/subgroups', ('course_id', 'id', 'title', 'description', 'vendor_guid')),
+    ('import_outcome_group_global', 'POST', '/v1/global/outcome_groups/{id}/import', ('id', 'source_outcome_group_id')),
+    ('import_outcome_group_accounts', 'POST', '/v1/accounts/{account_id}/outcome_groups/{id}/import', ('account_id', 'id', 'source_outcome_group_id')),
+    ('import_outcome_group_courses', 'POST', '/v1/courses/{course_id}/outcome_groups/{id}/import', ('course_id', 'id', 'source_outcome_group_id')),
+])
+
 
 def redirect_to_root_outcome_group_for_context_global(request_ctx, **request_kwargs):
     """
@@ -12,11 +54,7 @@ def redirect_to_root_outcome_group_for_context_global(request_ctx, **request_kwa
 
     """
 
-    path = '/v1/global/root_outcome_group'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['redirect_to_root_outcome_group_for_context_global'].request(request_ctx, request_kwargs, (), None)
 
 
 def redirect_to_root_outcome_group_for_context_accounts(request_ctx, account_id, **request_kwargs):
@@ -33,11 +71,7 @@ def redirect_to_root_outcome_group_for_context_accounts(request_ctx, account_id,
 
     """
 
-    path = '/v1/accounts/{account_id}/root_outcome_group'
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['redirect_to_root_outcome_group_for_context_accounts'].request(request_ctx, request_kwargs, (account_id,), None)
 
 
 def redirect_to_root_outcome_group_for_context_courses(request_ctx, course_id, **request_kwargs):
@@ -54,11 +88,7 @@ def redirect_to_root_outcome_group_for_context_courses(request_ctx, course_id, *
 
     """
 
-    path = '/v1/courses/{course_id}/root_outcome_group'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['redirect_to_root_outcome_group_for_context_courses'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def get_all_outcome_groups_for_context_accounts(request_ctx, account_id, per_page=None, **request_kwargs):
@@ -75,16 +105,7 @@ def get_all_outcome_groups_for_context_accounts(request_ctx, account_id, per_pag
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_outcome_groups_for_context_accounts'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def get_all_outcome_groups_for_context_courses(request_ctx, course_id, per_page=None, **request_kwargs):
@@ -101,16 +122,7 @@ def get_all_outcome_groups_for_context_courses(request_ctx, course_id, per_page=
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_outcome_groups_for_context_courses'].request(request_ctx, request_kwargs, (course_id,), {'per_page': per_page})
 
 
 def get_all_outcome_links_for_context_accounts(request_ctx, account_id, outcome_style=None, outcome_group_style=None, per_page=None, **request_kwargs):
@@ -131,18 +143,7 @@ def get_all_outcome_links_for_context_accounts(request_ctx, account_id, outcome_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_group_links'
-    payload = {
-        'outcome_style' : outcome_style,
-        'outcome_group_style' : outcome_group_style,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_outcome_links_for_context_accounts'].request(request_ctx, request_kwargs, (account_id,), {'outcome_style': outcome_style, 'outcome_group_style': outcome_group_style, 'per_page': per_page})
 
 
 def get_all_outcome_links_for_context_courses(request_ctx, course_id, outcome_style=None, outcome_group_style=None, per_page=None, **request_kwargs):
@@ -163,18 +164,7 @@ def get_all_outcome_links_for_context_courses(request_ctx, course_id, outcome_st
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_group_links'
-    payload = {
-        'outcome_style' : outcome_style,
-        'outcome_group_style' : outcome_group_style,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_outcome_links_for_context_courses'].request(request_ctx, request_kwargs, (course_id,), {'outcome_style': outcome_style, 'outcome_group_style': outcome_group_style, 'per_page': per_page})
 
 
 def show_outcome_group_global(request_ctx, id, **request_kwargs):
@@ -189,11 +179,7 @@ def show_outcome_group_global(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/global/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_outcome_group_global'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def show_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
@@ -210,11 +196,7 @@ def show_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_outcome_group_accounts'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def show_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
@@ -231,11 +213,7 @@ def show_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_outcome_group_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def update_outcome_group_global(request_ctx, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
@@ -264,17 +242,7 @@ def update_outcome_group_global(request_ctx, id, title=None, description=None, v
 
     """
 
-    path = '/v1/global/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_outcome_group_global'].request(request_ctx, request_kwargs, (id,), {'title': title, 'description': description, 'vendor_guid': vendor_guid, 'parent_outcome_group_id': parent_outcome_group_id})
 
 
 def update_outcome_group_accounts(request_ctx, account_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
@@ -305,17 +273,7 @@ def update_outcome_group_accounts(request_ctx, account_id, id, title=None, descr
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_outcome_group_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'title': title, 'description': description, 'vendor_guid': vendor_guid, 'parent_outcome_group_id': parent_outcome_group_id})
 
 
 def update_outcome_group_courses(request_ctx, course_id, id, title=None, description=None, vendor_guid=None, parent_outcome_group_id=None, **request_kwargs):
@@ -346,17 +304,7 @@ def update_outcome_group_courses(request_ctx, course_id, id, title=None, descrip
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'parent_outcome_group_id' : parent_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_outcome_group_courses'].request(request_ctx, request_kwargs, (course_id, id), {'title': title, 'description': description, 'vendor_guid': vendor_guid, 'parent_outcome_group_id': parent_outcome_group_id})
 
 
 def delete_outcome_group_global(request_ctx, id, **request_kwargs):
@@ -378,11 +326,7 @@ def delete_outcome_group_global(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/global/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_outcome_group_global'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def delete_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs):
@@ -406,11 +350,7 @@ def delete_outcome_group_accounts(request_ctx, account_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_outcome_group_accounts'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def delete_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
@@ -434,11 +374,7 @@ def delete_outcome_group_courses(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_outcome_group_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def list_linked_outcomes_global(request_ctx, id, per_page=None, **request_kwargs):
@@ -456,16 +392,7 @@ def list_linked_outcomes_global(request_ctx, id, per_page=None, **request_kwargs
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/global/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_linked_outcomes_global'].request(request_ctx, request_kwargs, (id,), {'per_page': per_page})
 
 
 def list_linked_outcomes_accounts(request_ctx, account_id, id, per_page=None, **request_kwargs):
@@ -485,16 +412,7 @@ def list_linked_outcomes_accounts(request_ctx, account_id, id, per_page=None, **
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_linked_outcomes_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'per_page': per_page})
 
 
 def list_linked_outcomes_courses(request_ctx, course_id, id, per_page=None, **request_kwargs):
@@ -514,16 +432,7 @@ def list_linked_outcomes_courses(request_ctx, course_id, id, per_page=None, **re
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_linked_outcomes_courses'].request(request_ctx, request_kwargs, (course_id, id), {'per_page': per_page})
 
 
 def create_link_outcome_global(request_ctx, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -576,21 +485,7 @@ def create_link_outcome_global(request_ctx, id, outcome_id=None, title=None, dis
 
     """
 
-    path = '/v1/global/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_global'].request(request_ctx, request_kwargs, (id,), {'outcome_id': outcome_id, 'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def create_link_outcome_global_outcome_id(request_ctx, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -643,20 +538,7 @@ def create_link_outcome_global_outcome_id(request_ctx, id, outcome_id=None, titl
 
     """
 
-    path = '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_global_outcome_id'].request(request_ctx, request_kwargs, (id, outcome_id), {'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def create_link_outcome_accounts(request_ctx, account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -711,21 +593,7 @@ def create_link_outcome_accounts(request_ctx, account_id, id, outcome_id=None, t
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'outcome_id': outcome_id, 'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def create_link_outcome_accounts_outcome_id(request_ctx, account_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -780,20 +648,7 @@ def create_link_outcome_accounts_outcome_id(request_ctx, account_id, id, outcome
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_accounts_outcome_id'].request(request_ctx, request_kwargs, (account_id, id, outcome_id), {'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def create_link_outcome_courses(request_ctx, course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -848,21 +703,7 @@ def create_link_outcome_courses(request_ctx, course_id, id, outcome_id=None, tit
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes'
-    payload = {
-        'outcome_id' : outcome_id,
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_courses'].request(request_ctx, request_kwargs, (course_id, id), {'outcome_id': outcome_id, 'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def create_link_outcome_courses_outcome_id(request_ctx, course_id, id, outcome_id=None, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -917,20 +758,7 @@ def create_link_outcome_courses_outcome_id(request_ctx, course_id, id, outcome_i
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, outcome_id=outcome_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_link_outcome_courses_outcome_id'].request(request_ctx, request_kwargs, (course_id, id, outcome_id), {'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
 def unlink_outcome_global(request_ctx, id, outcome_id, **request_kwargs):
@@ -951,11 +779,7 @@ def unlink_outcome_global(request_ctx, id, outcome_id, **request_kwargs):
 
     """
 
-    path = '/v1/global/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unlink_outcome_global'].request(request_ctx, request_kwargs, (id, outcome_id), None)
 
 
 def unlink_outcome_accounts(request_ctx, account_id, id, outcome_id, **request_kwargs):
@@ -978,11 +802,7 @@ def unlink_outcome_accounts(request_ctx, account_id, id, outcome_id, **request_k
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unlink_outcome_accounts'].request(request_ctx, request_kwargs, (account_id, id, outcome_id), None)
 
 
 def unlink_outcome_courses(request_ctx, course_id, id, outcome_id, **request_kwargs):
@@ -1005,11 +825,7 @@ def unlink_outcome_courses(request_ctx, course_id, id, outcome_id, **request_kwa
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/outcomes/{outcome_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id, outcome_id=outcome_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unlink_outcome_courses'].request(request_ctx, request_kwargs, (course_id, id, outcome_id), None)
 
 
 def list_subgroups_global(request_ctx, id, per_page=None, **request_kwargs):
@@ -1027,16 +843,7 @@ def list_subgroups_global(request_ctx, id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/global/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_subgroups_global'].request(request_ctx, request_kwargs, (id,), {'per_page': per_page})
 
 
 def list_subgroups_accounts(request_ctx, account_id, id, per_page=None, **request_kwargs):
@@ -1056,16 +863,7 @@ def list_subgroups_accounts(request_ctx, account_id, id, per_page=None, **reques
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_subgroups_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'per_page': per_page})
 
 
 def list_subgroups_courses(request_ctx, course_id, id, per_page=None, **request_kwargs):
@@ -1085,16 +883,7 @@ def list_subgroups_courses(request_ctx, course_id, id, per_page=None, **request_
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_subgroups_courses'].request(request_ctx, request_kwargs, (course_id, id), {'per_page': per_page})
 
 
 def create_subgroup_global(request_ctx, id, title, description=None, vendor_guid=None, **request_kwargs):
@@ -1117,16 +906,7 @@ def create_subgroup_global(request_ctx, id, title, description=None, vendor_guid
 
     """
 
-    path = '/v1/global/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_subgroup_global'].request(request_ctx, request_kwargs, (id,), {'title': title, 'description': description, 'vendor_guid': vendor_guid})
 
 
 def create_subgroup_accounts(request_ctx, account_id, id, title, description=None, vendor_guid=None, **request_kwargs):
@@ -1151,16 +931,7 @@ def create_subgroup_accounts(request_ctx, account_id, id, title, description=Non
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_subgroup_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'title': title, 'description': description, 'vendor_guid': vendor_guid})
 
 
 def create_subgroup_courses(request_ctx, course_id, id, title, description=None, vendor_guid=None, **request_kwargs):
@@ -1185,16 +956,7 @@ def create_subgroup_courses(request_ctx, course_id, id, title, description=None,
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/subgroups'
-    payload = {
-        'title' : title,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_subgroup_courses'].request(request_ctx, request_kwargs, (course_id, id), {'title': title, 'description': description, 'vendor_guid': vendor_guid})
 
 
 def import_outcome_group_global(request_ctx, id, source_outcome_group_id, **request_kwargs):
@@ -1223,14 +985,7 @@ def import_outcome_group_global(request_ctx, id, source_outcome_group_id, **requ
 
     """
 
-    path = '/v1/global/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['import_outcome_group_global'].request(request_ctx, request_kwargs, (id,), {'source_outcome_group_id': source_outcome_group_id})
 
 
 def import_outcome_group_accounts(request_ctx, account_id, id, source_outcome_group_id, **request_kwargs):
@@ -1261,14 +1016,7 @@ def import_outcome_group_accounts(request_ctx, account_id, id, source_outcome_gr
 
     """
 
-    path = '/v1/accounts/{account_id}/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['import_outcome_group_accounts'].request(request_ctx, request_kwargs, (account_id, id), {'source_outcome_group_id': source_outcome_group_id})
 
 
 def import_outcome_group_courses(request_ctx, course_id, id, source_outcome_group_id, **request_kwargs):
@@ -1299,13 +1047,6 @@ def import_outcome_group_courses(request_ctx, course_id, id, source_outcome_grou
 
     """
 
-    path = '/v1/courses/{course_id}/outcome_groups/{id}/import'
-    payload = {
-        'source_outcome_group_id' : source_outcome_group_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['import_outcome_group_courses'].request(request_ctx, request_kwargs, (course_id, id), {'source_outcome_group_id': source_outcome_group_id})
 
 
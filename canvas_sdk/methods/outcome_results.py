@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_outcome_results', 'GET', '/v1/courses/{course_id}/outcome_results', ('course_id', 'user_ids', 'outcome_ids', 'include'), (('include', ('alignments', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')),)),
+    ('get_outcome_result_rollups', 'GET', '/v1/courses/{course_id}/outcome_rollups', ('course_id', 'aggregate', 'user_ids', 'outcome_ids', 'include'), (('aggregate', ('course',)), ('include', ('courses', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')))),
+])
+
 
 def get_outcome_results(request_ctx, course_id, user_ids=None, outcome_ids=None, include=None, **request_kwargs):
     """
@@ -19,18 +26,7 @@ def get_outcome_results(request_ctx, course_id, user_ids=None, outcome_ids=None,
 
     """
 
-    include_types = ('alignments', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/outcome_results'
-    payload = {
-        'user_ids' : user_ids,
-        'outcome_ids' : outcome_ids,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_outcome_results'].request(request_ctx, request_kwargs, (course_id,), {'user_ids': user_ids, 'outcome_ids': outcome_ids, 'include': include})
 
 
 def get_outcome_result_rollups(request_ctx, course_id, aggregate=None, user_ids=None, outcome_ids=None, include=None, **request_kwargs):
@@ -55,20 +51,6 @@ def get_outcome_result_rollups(request_ctx, course_id, aggregate=None, user_ids=
 
     """
 
-    aggregate_types = ('course')
-    include_types = ('courses', 'outcomes', 'outcomes.alignments', 'outcome_groups', 'outcome_links', 'outcome_paths', 'users')
-    utils.validate_attr_is_acceptable(aggregate, aggregate_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/outcome_rollups'
-    payload = {
-        'aggregate' : aggregate,
-        'user_ids' : user_ids,
-        'outcome_ids' : outcome_ids,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_outcome_result_rollups'].request(request_ctx, request_kwargs, (course_id,), {'aggregate': aggregate, 'user_ids': user_ids, 'outcome_ids': outcome_ids, 'include': include})
 
 
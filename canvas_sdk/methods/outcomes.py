@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('show_outcome', 'GET', '/v1/outcomes/{id}', ('id',)),
+    ('update_outcome', 'PUT', '/v1/outcomes/{id}', ('id', 'title', 'display_name', 'description', 'vendor_guid', 'mastery_points', ('ratings[description]', 'ratings_description'), ('ratings[points]', 'ratings_points'))),
+])
+
 
 def show_outcome(request_ctx, id, **request_kwargs):
     """
@@ -13,11 +20,7 @@ def show_outcome(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/outcomes/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_outcome'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def update_outcome(request_ctx, id, title=None, display_name=None, description=None, vendor_guid=None, mastery_points=None, ratings_description=None, ratings_points=None, **request_kwargs):
@@ -58,19 +61,6 @@ def update_outcome(request_ctx, id, title=None, display_name=None, description=N
 
     """
 
-    path = '/v1/outcomes/{id}'
-    payload = {
-        'title' : title,
-        'display_name' : display_name,
-        'description' : description,
-        'vendor_guid' : vendor_guid,
-        'mastery_points' : mastery_points,
-        'ratings[description]' : ratings_description,
-        'ratings[points]' : ratings_points,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_outcome'].request(request_ctx, request_kwargs, (id,), {'title': title, 'display_name': display_name, 'description': description, 'vendor_guid': vendor_guid, 'mastery_points': mastery_points, 'ratings[description]': ratings_description, 'ratings[points]': ratings_points})
 
 
@@ -1,4 +1,31 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('show_front_page_courses', 'GET', '/v1/courses/{course_id}/front_page', ('course_id',)),
+    ('show_front_page_groups', 'GET', '/v1/groups/{group_id}/front_page', ('group_id',)),
+    ('update_create_front_page_courses', 'PUT', '/v1/courses/{course_id}/front_page', ('course_id', ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[published]', 'wiki_page_published')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('update_create_front_page_groups', 'PUT', '/v1/groups/{group_id}/front_page', ('group_id', ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[published]', 'wiki_page_published')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('list_pages_courses', 'GET', '/v1/courses/{course_id}/pages', ('course_id', 'sort', 'order', 'search_term', 'published', 'per_page'), (('sort', ('title', 'created_at', 'updated_at')), ('order', ('asc', 'desc')))),
+    ('list_pages_groups', 'GET', '/v1/groups/{group_id}/pages', ('group_id', 'sort', 'order', 'search_term', 'published', 'per_page'), (('sort', ('title', 'created_at', 'updated_at')), ('order', ('asc', 'desc')))),
+    ('create_page_courses', 'POST', '/v1/courses/{course_id}/pages', ('course_id', ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[published]', 'wiki_page_published'), ('wiki_page[front_page]', 'wiki_page_front_page')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('create_page_groups', 'POST', '/v1/groups/{group_id}/pages', ('group_id', ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[published]', 'wiki_page_published'), ('wiki_page[front_page]', 'wiki_page_front_page')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('show_page_courses', 'GET', '/v1/courses/{course_id}/pages/{url}', ('course_id', 'url')),
+    ('show_page_groups', 'GET', '/v1/groups/{group_id}/pages/{url}', ('group_id', 'url')),
+    ('update_create_page_courses', 'PUT', '/v1/courses/{course_id}/pages/{url}', ('course_id', 'url', ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[published]', 'wiki_page_published'), ('wiki_page[front_page]', 'wiki_page_front_page')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('update_create_page_groups', 'PUT', '/v1/groups/{group_id}/pages/{url}', ('group_id', 'url', ('wiki_page[title]', 'wiki_page_title'), ('wiki_page[body]', 'wiki_page_body'), ('wiki_page[hide_from_students]', 'wiki_page_hide_from_students'), ('wiki_page[notify_of_update]', 'wiki_page_notify_of_update'), ('wiki_page[editing_roles]', 'wiki_page_editing_roles'), ('wiki_page[published]', 'wiki_page_published'), ('wiki_page[front_page]', 'wiki_page_front_page')), (('wiki_page_editing_roles', ('teachers', 'students', 'members', 'public')),)),
+    ('delete_page_courses', 'DELETE', '/v1/courses/{course_id}/pages/{url}', ('course_id', 'url')),
+    ('delete_page_groups', 'DELETE', '/v1/groups/{group_id}/pages/{url}', ('group_id', 'url')),
+    ('list_revisions_courses', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions', ('course_id', 'url', 'per_page')),
+    ('list_revisions_groups', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions', ('group_id', 'url', 'per_page')),
+    ('show_revision_courses_latest', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions/latest', ('course_id', 'url', 'summary')),
+    ('show_revision_groups_latest', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions/latest', ('group_id', 'url', 'summary')),
+    ('show_revision_courses_revision_id', 'GET', '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}', ('course_id', 'url', 'revision_id', 'summary')),
+    ('show_revision_groups_revision_id', 'GET', '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}', ('group_id', 'url', 'revision_id', 'summary')),
+    ('revert_to_revision_courses', 'POST', '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}', ('course_id', 'url', 'revision_id')),
+    ('revert_to_revision_groups', 'POST', '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}', ('group_id', 'url', 'revision_id')),
+])
+
 
 def show_front_page_courses(request_ctx, course_id, **request_kwargs):
     """
@@ -13,11 +40,7 @@ def show_front_page_courses(request_ctx, course_id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/front_page'
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_front_page_courses'].request(request_ctx, request_kwargs, (course_id,), None)
 
 
 def show_front_page_groups(request_ctx, group_id, **request_kwargs):
@@ -33,11 +56,7 @@ def show_front_page_groups(request_ctx, group_id, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/front_page'
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_front_page_groups'].request(request_ctx, request_kwargs, (group_id,), None)
 
 
 def update_create_front_page_courses(request_ctx, course_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None, **request_kwargs):
@@ -65,21 +84,7 @@ def update_create_front_page_courses(request_ctx, course_id, wiki_page_body, wik
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/front_page'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_create_front_page_courses'].request(request_ctx, request_kwargs, (course_id,), {'wiki_page[body]': wiki_page_body, 'wiki_page[title]': wiki_page_title, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[published]': wiki_page_published})
 
 
 def update_create_front_page_groups(request_ctx, group_id, wiki_page_body, wiki_page_title=None, wiki_page_hide_from_students=None, wiki_page_editing_roles=None, wiki_page_notify_of_update=None, wiki_page_published=None, **request_kwargs):
@@ -107,21 +112,7 @@ def update_create_front_page_groups(request_ctx, group_id, wiki_page_body, wiki_
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/front_page'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_create_front_page_groups'].request(request_ctx, request_kwargs, (group_id,), {'wiki_page[body]': wiki_page_body, 'wiki_page[title]': wiki_page_title, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[published]': wiki_page_published})
 
 
 def list_pages_courses(request_ctx, course_id, sort=None, order=None, search_term=None, published=None, per_page=None, **request_kwargs):
@@ -147,24 +138,7 @@ def list_pages_courses(request_ctx, course_id, sort=None, order=None, search_ter
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    sort_types = ('title', 'created_at', 'updated_at')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/courses/{course_id}/pages'
-    payload = {
-        'sort' : sort,
-        'order' : order,
-        'search_term' : search_term,
-        'published' : published,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_pages_courses'].request(request_ctx, request_kwargs, (course_id,), {'sort': sort, 'order': order, 'search_term': search_term, 'published': published, 'per_page': per_page})
 
 
 def list_pages_groups(request_ctx, group_id, sort=None, order=None, search_term=None, published=None, per_page=None, **request_kwargs):
@@ -190,24 +164,7 @@ def list_pages_groups(request_ctx, group_id, sort=None, order=None, search_term=
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    sort_types = ('title', 'created_at', 'updated_at')
-    order_types = ('asc', 'desc')
-    utils.validate_attr_is_acceptable(sort, sort_types)
-    utils.validate_attr_is_acceptable(order, order_types)
-    path = '/v1/groups/{group_id}/pages'
-    payload = {
-        'sort' : sort,
-        'order' : order,
-        'search_term' : search_term,
-        'published' : published,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_pages_groups'].request(request_ctx, request_kwargs, (group_id,), {'sort': sort, 'order': order, 'search_term': search_term, 'published': published, 'per_page': per_page})
 
 
 def create_page_courses(request_ctx, course_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
@@ -237,22 +194,7 @@ def create_page_courses(request_ctx, course_id, wiki_page_title, wiki_page_body,
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/pages'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_page_courses'].request(request_ctx, request_kwargs, (course_id,), {'wiki_page[title]': wiki_page_title, 'wiki_page[body]': wiki_page_body, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[published]': wiki_page_published, 'wiki_page[front_page]': wiki_page_front_page})
 
 
 def create_page_groups(request_ctx, group_id, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
@@ -282,22 +224,7 @@ def create_page_groups(request_ctx, group_id, wiki_page_title, wiki_page_body, w
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/pages'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_page_groups'].request(request_ctx, request_kwargs, (group_id,), {'wiki_page[title]': wiki_page_title, 'wiki_page[body]': wiki_page_body, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[published]': wiki_page_published, 'wiki_page[front_page]': wiki_page_front_page})
 
 
 def show_page_courses(request_ctx, course_id, url, **request_kwargs):
@@ -315,11 +242,7 @@ def show_page_courses(request_ctx, course_id, url, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_page_courses'].request(request_ctx, request_kwargs, (course_id, url), None)
 
 
 def show_page_groups(request_ctx, group_id, url, **request_kwargs):
@@ -337,11 +260,7 @@ def show_page_groups(request_ctx, group_id, url, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_page_groups'].request(request_ctx, request_kwargs, (group_id, url), None)
 
 
 def update_create_page_courses(request_ctx, course_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
@@ -373,22 +292,7 @@ def update_create_page_courses(request_ctx, course_id, url, wiki_page_title, wik
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/courses/{course_id}/pages/{url}'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_create_page_courses'].request(request_ctx, request_kwargs, (course_id, url), {'wiki_page[title]': wiki_page_title, 'wiki_page[body]': wiki_page_body, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[published]': wiki_page_published, 'wiki_page[front_page]': wiki_page_front_page})
 
 
 def update_create_page_groups(request_ctx, group_id, url, wiki_page_title, wiki_page_body, wiki_page_hide_from_students, wiki_page_notify_of_update, wiki_page_editing_roles=None, wiki_page_published=None, wiki_page_front_page=None, **request_kwargs):
@@ -420,22 +324,7 @@ def update_create_page_groups(request_ctx, group_id, url, wiki_page_title, wiki_
 
     """
 
-    wiki_page_editing_roles_types = ('teachers', 'students', 'members', 'public')
-    utils.validate_attr_is_acceptable(wiki_page_editing_roles, wiki_page_editing_roles_types)
-    path = '/v1/groups/{group_id}/pages/{url}'
-    payload = {
-        'wiki_page[title]' : wiki_page_title,
-        'wiki_page[body]' : wiki_page_body,
-        'wiki_page[hide_from_students]' : wiki_page_hide_from_students,
-        'wiki_page[editing_roles]' : wiki_page_editing_roles,
-        'wiki_page[notify_of_update]' : wiki_page_notify_of_update,
-        'wiki_page[published]' : wiki_page_published,
-        'wiki_page[front_page]' : wiki_page_front_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_create_page_groups'].request(request_ctx, request_kwargs, (group_id, url), {'wiki_page[title]': wiki_page_title, 'wiki_page[body]': wiki_page_body, 'wiki_page[hide_from_students]': wiki_page_hide_from_students, 'wiki_page[notify_of_update]': wiki_page_notify_of_update, 'wiki_page[editing_roles]': wiki_page_editing_roles, 'wiki_page[published]': wiki_page_published, 'wiki_page[front_page]': wiki_page_front_page})
 
 
 def delete_page_courses(request_ctx, course_id, url, **request_kwargs):
@@ -453,11 +342,7 @@ def delete_page_courses(request_ctx, course_id, url, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_page_courses'].request(request_ctx, request_kwargs, (course_id, url), None)
 
 
 def delete_page_groups(request_ctx, group_id, url, **request_kwargs):
@@ -475,11 +360,7 @@ def delete_page_groups(request_ctx, group_id, url, **request_kwargs):
 
     """
 
-    path = '/v1/groups/{group_id}/pages/{url}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_page_groups'].request(request_ctx, request_kwargs, (group_id, url), None)
 
 
 def list_revisions_courses(request_ctx, course_id, url, per_page=None, **request_kwargs):
@@ -499,16 +380,7 @@ def list_revisions_courses(request_ctx, course_id, url, per_page=None, **request
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/pages/{url}/revisions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_revisions_courses'].request(request_ctx, request_kwargs, (course_id, url), {'per_page': per_page})
 
 
 def list_revisions_groups(request_ctx, group_id, url, per_page=None, **request_kwargs):
@@ -528,16 +400,7 @@ def list_revisions_groups(request_ctx, group_id, url, per_page=None, **request_k
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/groups/{group_id}/pages/{url}/revisions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_revisions_groups'].request(request_ctx, request_kwargs, (group_id, url), {'per_page': per_page})
 
 
 def show_revision_courses_latest(request_ctx, course_id, url, summary=None, **request_kwargs):
@@ -558,14 +421,7 @@ def show_revision_courses_latest(request_ctx, course_id, url, summary=None, **re
 
     """
 
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/latest'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_revision_courses_latest'].request(request_ctx, request_kwargs, (course_id, url), {'summary': summary})
 
 
 def show_revision_groups_latest(request_ctx, group_id, url, summary=None, **request_kwargs):
@@ -586,14 +442,7 @@ def show_revision_groups_latest(request_ctx, group_id, url, summary=None, **requ
 
     """
 
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/latest'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_revision_groups_latest'].request(request_ctx, request_kwargs, (group_id, url), {'summary': summary})
 
 
 def show_revision_courses_revision_id(request_ctx, course_id, url, revision_id, summary=None, **request_kwargs):
@@ -616,14 +465,7 @@ def show_revision_courses_revision_id(request_ctx, course_id, url, revision_id,
 
     """
 
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url, revision_id=revision_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_revision_courses_revision_id'].request(request_ctx, request_kwargs, (course_id, url, revision_id), {'summary': summary})
 
 
 def show_revision_groups_revision_id(request_ctx, group_id, url, revision_id, summary=None, **request_kwargs):
@@ -646,14 +488,7 @@ def show_revision_groups_revision_id(request_ctx, group_id, url, revision_id, su
 
     """
 
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}'
-    payload = {
-        'summary' : summary,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url, revision_id=revision_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_revision_groups_revision_id'].request(request_ctx, request_kwargs, (group_id, url, revision_id), {'summary': summary})
 
 
 def revert_to_revision_courses(request_ctx, course_id, url, revision_id, **request_kwargs):
@@ -673,11 +508,7 @@ def revert_to_revision_courses(request_ctx, course_id, url, revision_id, **reque
 
     """
 
-    path = '/v1/courses/{course_id}/pages/{url}/revisions/{revision_id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, url=url, revision_id=revision_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['revert_to_revision_courses'].request(request_ctx, request_kwargs, (course_id, url, revision_id), None)
 
 
 def revert_to_revision_groups(request_ctx, group_id, url, revision_id, **request_kwargs):
@@ -697,10 +528,6 @@ def revert_to_revision_groups(request_ctx, group_id, url, revision_id, **request
 
     """
 
-    path = '/v1/groups/{group_id}/pages/{url}/revisions/{revision_id}'
-    url = request_ctx.base_api_url + path.format(group_id=group_id, url=url, revision_id=revision_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['revert_to_revision_groups'].request(request_ctx, request_kwargs, (group_id, url, revision_id), None)
 
 
@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_poll_choices_in_poll', 'GET', '/v1/polls/{poll_id}/poll_choices', ('poll_id',)),
+    ('get_single_poll_choice', 'GET', '/v1/polls/{poll_id}/poll_choices/{id}', ('poll_id', 'id')),
+    ('create_single_poll_choice', 'POST', '/v1/polls/{poll_id}/poll_choices', ('poll_id', ('poll_choices[text]', 'poll_choices_text'), ('poll_choices[is_correct]', 'poll_choices_is_correct'), ('poll_choices[position]', 'poll_choices_position'))),
+    ('update_single_poll_choice', 'PUT', '/v1/polls/{poll_id}/poll_choices/{id}', ('poll_id', 'id', ('poll_choices[text]', 'poll_choices_text'), ('poll_choices[is_correct]', 'poll_choices_is_correct'), ('poll_choices[position]', 'poll_choices_position'))),
+    ('delete_poll_choice', 'DELETE', '/v1/polls/{poll_id}/poll_choices/{id}', ('poll_id', 'id')),
+])
+
 
 def list_poll_choices_in_poll(request_ctx, poll_id, **request_kwargs):
     """
@@ -13,11 +23,7 @@ def list_poll_choices_in_poll(request_ctx, poll_id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_choices'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_poll_choices_in_poll'].request(request_ctx, request_kwargs, (poll_id,), None)
 
 
 def get_single_poll_choice(request_ctx, poll_id, id, **request_kwargs):
@@ -35,11 +41,7 @@ def get_single_poll_choice(request_ctx, poll_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_poll_choice'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
 def create_single_poll_choice(request_ctx, poll_id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None, **request_kwargs):
@@ -61,16 +63,7 @@ def create_single_poll_choice(request_ctx, poll_id, poll_choices_text, poll_choi
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_choices'
-    payload = {
-        'poll_choices[text]' : poll_choices_text,
-        'poll_choices[is_correct]' : poll_choices_is_correct,
-        'poll_choices[position]' : poll_choices_position,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_single_poll_choice'].request(request_ctx, request_kwargs, (poll_id,), {'poll_choices[text]': poll_choices_text, 'poll_choices[is_correct]': poll_choices_is_correct, 'poll_choices[position]': poll_choices_position})
 
 
 def update_single_poll_choice(request_ctx, poll_id, id, poll_choices_text, poll_choices_is_correct=None, poll_choices_position=None, **request_kwargs):
@@ -94,16 +87,7 @@ def update_single_poll_choice(request_ctx, poll_id, id, poll_choices_text, poll_
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    payload = {
-        'poll_choices[text]' : poll_choices_text,
-        'poll_choices[is_correct]' : poll_choices_is_correct,
-        'poll_choices[position]' : poll_choices_position,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_single_poll_choice'].request(request_ctx, request_kwargs, (poll_id, id), {'poll_choices[text]': poll_choices_text, 'poll_choices[is_correct]': poll_choices_is_correct, 'poll_choices[position]': poll_choices_position})
 
 
 def delete_poll_choice(request_ctx, poll_id, id, **request_kwargs):
@@ -121,10 +105,6 @@ def delete_poll_choice(request_ctx, poll_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_choices/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_poll_choice'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
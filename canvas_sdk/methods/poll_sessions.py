@@ -1,4 +1,18 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_poll_sessions_for_poll', 'GET', '/v1/polls/{poll_id}/poll_sessions', ('poll_id',)),
+    ('get_results_for_single_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}', ('poll_id', 'id')),
+    ('create_single_poll_session', 'POST', '/v1/polls/{poll_id}/poll_sessions', ('poll_id', ('poll_sessions[course_id]', 'poll_sessions_course_id'), ('poll_sessions[course_section_id]', 'poll_sessions_course_section_id'), ('poll_sessions[has_public_results]', 'poll_sessions_has_public_results'))),
+    ('update_single_poll_session', 'PUT', '/v1/polls/{poll_id}/poll_sessions/{id}', ('poll_id', 'id', ('poll_sessions[course_id]', 'poll_sessions_course_id'), ('poll_sessions[course_section_id]', 'poll_sessions_course_section_id'), ('poll_sessions[has_public_results]', 'poll_sessions_has_public_results'))),
+    ('delete_poll_session', 'DELETE', '/v1/polls/{poll_id}/poll_sessions/{id}', ('poll_id', 'id')),
+    ('open_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}/open', ('poll_id', 'id')),
+    ('close_opened_poll_session', 'GET', '/v1/polls/{poll_id}/poll_sessions/{id}/close', ('poll_id', 'id')),
+    ('list_opened_poll_sessions', 'GET', '/v1/poll_sessions/opened', ()),
+    ('list_closed_poll_sessions', 'GET', '/v1/poll_sessions/closed', ()),
+])
+
 
 def list_poll_sessions_for_poll(request_ctx, poll_id, **request_kwargs):
     """
@@ -13,11 +27,7 @@ def list_poll_sessions_for_poll(request_ctx, poll_id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_poll_sessions_for_poll'].request(request_ctx, request_kwargs, (poll_id,), None)
 
 
 def get_results_for_single_poll_session(request_ctx, poll_id, id, **request_kwargs):
@@ -35,11 +45,7 @@ def get_results_for_single_poll_session(request_ctx, poll_id, id, **request_kwar
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_results_for_single_poll_session'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
 def create_single_poll_session(request_ctx, poll_id, poll_sessions_course_id, poll_sessions_course_section_id=None, poll_sessions_has_public_results=None, **request_kwargs):
@@ -61,16 +67,7 @@ def create_single_poll_session(request_ctx, poll_id, poll_sessions_course_id, po
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions'
-    payload = {
-        'poll_sessions[course_id]' : poll_sessions_course_id,
-        'poll_sessions[course_section_id]' : poll_sessions_course_section_id,
-        'poll_sessions[has_public_results]' : poll_sessions_has_public_results,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_single_poll_session'].request(request_ctx, request_kwargs, (poll_id,), {'poll_sessions[course_id]': poll_sessions_course_id, 'poll_sessions[course_section_id]': poll_sessions_course_section_id, 'poll_sessions[has_public_results]': poll_sessions_has_public_results})
 
 
 def update_single_poll_session(request_ctx, poll_id, id, poll_sessions_course_id, poll_sessions_course_section_id, poll_sessions_has_public_results=None, **request_kwargs):
@@ -94,16 +91,7 @@ def update_single_poll_session(request_ctx, poll_id, id, poll_sessions_course_id
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    payload = {
-        'poll_sessions[course_id]' : poll_sessions_course_id,
-        'poll_sessions[course_section_id]' : poll_sessions_course_section_id,
-        'poll_sessions[has_public_results]' : poll_sessions_has_public_results,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_single_poll_session'].request(request_ctx, request_kwargs, (poll_id, id), {'poll_sessions[course_id]': poll_sessions_course_id, 'poll_sessions[course_section_id]': poll_sessions_course_section_id, 'poll_sessions[has_public_results]': poll_sessions_has_public_results})
 
 
 def delete_poll_session(request_ctx, poll_id, id, **request_kwargs):
@@ -121,11 +109,7 @@ def delete_poll_session(request_ctx, poll_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_poll_session'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
 def open_poll_session(request_ctx, poll_id, id, **request_kwargs):
@@ -142,11 +126,7 @@ def open_poll_session(request_ctx, poll_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}/open'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['open_poll_session'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
 def close_opened_poll_session(request_ctx, poll_id, id, **request_kwargs):
@@ -163,11 +143,7 @@ def close_opened_poll_session(request_ctx, poll_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{id}/close'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['close_opened_poll_session'].request(request_ctx, request_kwargs, (poll_id, id), None)
 
 
 def list_opened_poll_sessions(request_ctx, **request_kwargs):
@@ -181,11 +157,7 @@ def list_opened_poll_sessions(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/poll_sessions/opened'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_opened_poll_sessions'].request(request_ctx, request_kwargs, (), None)
 
 
 def list_closed_poll_sessions(request_ctx, **request_kwargs):
@@ -199,10 +171,6 @@ def list_closed_poll_sessions(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/poll_sessions/closed'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_closed_poll_sessions'].request(request_ctx, request_kwargs, (), None)
 
 
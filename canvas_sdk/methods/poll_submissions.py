@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_single_poll_submission', 'GET', '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions/{id}', ('poll_id', 'poll_session_id', 'id')),
+    ('create_single_poll_submission', 'POST', '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions', ('poll_id', 'poll_session_id', ('poll_submissions[poll_choice_id]', 'poll_submissions_poll_choice_id'))),
+])
+
 
 def get_single_poll_submission(request_ctx, poll_id, poll_session_id, id, **request_kwargs):
     """
@@ -17,11 +24,7 @@ def get_single_poll_submission(request_ctx, poll_id, poll_session_id, id, **requ
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions/{id}'
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, poll_session_id=poll_session_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_poll_submission'].request(request_ctx, request_kwargs, (poll_id, poll_session_id, id), None)
 
 
 def create_single_poll_submission(request_ctx, poll_id, poll_session_id, poll_submissions_poll_choice_id, **request_kwargs):
@@ -41,13 +44,6 @@ def create_single_poll_submission(request_ctx, poll_id, poll_session_id, poll_su
 
     """
 
-    path = '/v1/polls/{poll_id}/poll_sessions/{poll_session_id}/poll_submissions'
-    payload = {
-        'poll_submissions[poll_choice_id]' : poll_submissions_poll_choice_id,
-    }
-    url = request_ctx.base_api_url + path.format(poll_id=poll_id, poll_session_id=poll_session_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_single_poll_submission'].request(request_ctx, request_kwargs, (poll_id, poll_session_id), {'poll_submissions[poll_choice_id]': poll_submissions_poll_choice_id})
 
 
@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_polls', 'GET', '/v1/polls', ()),
+    ('get_single_poll', 'GET', '/v1/polls/{id}', ('id',)),
+    ('create_single_poll', 'POST', '/v1/polls', (('polls[question]', 'polls_question'), ('polls[description]', 'polls_description'))),
+    ('update_single_poll', 'PUT', '/v1/polls/{id}', ('id', ('polls[question]', 'polls_question'), ('polls[description]', 'polls_description'))),
+    ('delete_poll', 'DELETE', '/v1/polls/{id}', ('id',)),
+])
+
 
 def list_polls(request_ctx, **request_kwargs):
     """
@@ -11,11 +21,7 @@ def list_polls(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/polls'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_polls'].request(request_ctx, request_kwargs, (), None)
 
 
 def get_single_poll(request_ctx, id, **request_kwargs):
@@ -31,11 +37,7 @@ def get_single_poll(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_poll'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def create_single_poll(request_ctx, polls_question, polls_description=None, **request_kwargs):
@@ -53,15 +55,7 @@ def create_single_poll(request_ctx, polls_question, polls_description=None, **re
 
     """
 
-    path = '/v1/polls'
-    payload = {
-        'polls[question]' : polls_question,
-        'polls[description]' : polls_description,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_single_poll'].request(request_ctx, request_kwargs, (), {'polls[question]': polls_question, 'polls[description]': polls_description})
 
 
 def update_single_poll(request_ctx, id, polls_question, polls_description=None, **request_kwargs):
@@ -81,15 +75,7 @@ def update_single_poll(request_ctx, id, polls_question, polls_description=None,
 
     """
 
-    path = '/v1/polls/{id}'
-    payload = {
-        'polls[question]' : polls_question,
-        'polls[description]' : polls_description,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_single_poll'].request(request_ctx, request_kwargs, (id,), {'polls[question]': polls_question, 'polls[description]': polls_description})
 
 
 def delete_poll(request_ctx, id, **request_kwargs):
@@ -105,10 +91,6 @@ def delete_poll(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/polls/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_poll'].request(request_ctx, request_kwargs, (id,), None)
 
 
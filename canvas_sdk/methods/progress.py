@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('query_progress', 'GET', '/v1/progress/{id}', ('id',)),
+])
+
 
 def query_progress(request_ctx, id, **request_kwargs):
     """
@@ -13,10 +19,6 @@ def query_progress(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/progress/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['query_progress'].request(request_ctx, request_kwargs, (id,), None)
 
 
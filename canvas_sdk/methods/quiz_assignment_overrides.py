@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('retrieve_assignment_overridden_dates_for_quizzes', 'GET', '/v1/courses/{course_id}/quizzes/assignment_overrides', ('course_id', ('quiz_assignment_overrides[0][quiz_ids]', 'quiz_assignment_overrides_0_quiz_ids'), 'per_page')),
+])
+
 
 def retrieve_assignment_overridden_dates_for_quizzes(request_ctx, course_id, quiz_assignment_overrides_0_quiz_ids=None, per_page=None, **request_kwargs):
     """
@@ -18,16 +24,6 @@ def retrieve_assignment_overridden_dates_for_quizzes(request_ctx, course_id, qui
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/assignment_overrides'
-    payload = {
-        'quiz_assignment_overrides[0][quiz_ids]' : quiz_assignment_overrides_0_quiz_ids,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['retrieve_assignment_overridden_dates_for_quizzes'].request(request_ctx, request_kwargs, (course_id,), {'quiz_assignment_overrides[0][quiz_ids]': quiz_assignment_overrides_0_quiz_ids, 'per_page': per_page})
 
 
@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('set_extensions_for_student_quiz_submissions', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/extensions', ('course_id', 'quiz_id', 'user_id', 'extra_attempts', 'extra_time', 'manually_unlocked', 'extend_from_now', 'extend_from_end_at')),
+])
+
 
 def set_extensions_for_student_quiz_submissions(request_ctx, course_id, quiz_id, user_id, extra_attempts=None, extra_time=None, manually_unlocked=None, extend_from_now=None, extend_from_end_at=None, **request_kwargs):
     """
@@ -30,18 +36,6 @@ def set_extensions_for_student_quiz_submissions(request_ctx, course_id, quiz_id,
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/extensions'
-    payload = {
-        'user_id' : user_id,
-        'extra_attempts' : extra_attempts,
-        'extra_time' : extra_time,
-        'manually_unlocked' : manually_unlocked,
-        'extend_from_now' : extend_from_now,
-        'extend_from_end_at' : extend_from_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['set_extensions_for_student_quiz_submissions'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'user_id': user_id, 'extra_attempts': extra_attempts, 'extra_time': extra_time, 'manually_unlocked': manually_unlocked, 'extend_from_now': extend_from_now, 'extend_from_end_at': extend_from_end_at})
 
 
@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_available_quiz_ip_filters', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/ip_filters', ('course_id', 'quiz_id')),
+])
+
 
 def get_available_quiz_ip_filters(request_ctx, course_id, quiz_id, **request_kwargs):
     """
@@ -17,10 +23,6 @@ def get_available_quiz_ip_filters(request_ctx, course_id, quiz_id, **request_kwa
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/ip_filters'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_available_quiz_ip_filters'].request(request_ctx, request_kwargs, (course_id, quiz_id), None)
 
 
@@ -1,4 +1,13 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('create_question_group', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups', ('course_id', 'quiz_id', ('quiz_groups[name]', 'quiz_groups_name'), ('quiz_groups[pick_count]', 'quiz_groups_pick_count'), ('quiz_groups[question_points]', 'quiz_groups_question_points'), ('quiz_groups[assessment_question_bank_id]', 'quiz_groups_assessment_question_bank_id'))),
+    ('update_question_group', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}', ('course_id', 'quiz_id', 'id', ('quiz_groups[name]', 'quiz_groups_name'), ('quiz_groups[pick_count]', 'quiz_groups_pick_count'), ('quiz_groups[question_points]', 'quiz_groups_question_points'))),
+    ('delete_question_group', 'DELETE', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}', ('course_id', 'quiz_id', 'id')),
+    ('reorder_question_groups', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}/reorder', ('course_id', 'quiz_id', 'id', ('order[id]', 'order_id'), ('order[type]', 'order_type')), (('order_type', ('question',)),)),
+])
+
 
 def create_question_group(request_ctx, course_id, quiz_id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None, quiz_groups_assessment_question_bank_id=None, **request_kwargs):
     """
@@ -25,17 +34,7 @@ def create_question_group(request_ctx, course_id, quiz_id, quiz_groups_name=None
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups'
-    payload = {
-        'quiz_groups[name]' : quiz_groups_name,
-        'quiz_groups[pick_count]' : quiz_groups_pick_count,
-        'quiz_groups[question_points]' : quiz_groups_question_points,
-        'quiz_groups[assessment_question_bank_id]' : quiz_groups_assessment_question_bank_id,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_question_group'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'quiz_groups[name]': quiz_groups_name, 'quiz_groups[pick_count]': quiz_groups_pick_count, 'quiz_groups[question_points]': quiz_groups_question_points, 'quiz_groups[assessment_question_bank_id]': quiz_groups_assessment_question_bank_id})
 
 
 def update_question_group(request_ctx, course_id, quiz_id, id, quiz_groups_name=None, quiz_groups_pick_count=None, quiz_groups_question_points=None, **request_kwargs):
@@ -61,16 +60,7 @@ def update_question_group(request_ctx, course_id, quiz_id, id, quiz_groups_name=
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}'
-    payload = {
-        'quiz_groups[name]' : quiz_groups_name,
-        'quiz_groups[pick_count]' : quiz_groups_pick_count,
-        'quiz_groups[question_points]' : quiz_groups_question_points,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_question_group'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'quiz_groups[name]': quiz_groups_name, 'quiz_groups[pick_count]': quiz_groups_pick_count, 'quiz_groups[question_points]': quiz_groups_question_points})
 
 
 def delete_question_group(request_ctx, course_id, quiz_id, id, **request_kwargs):
@@ -92,11 +82,7 @@ def delete_question_group(request_ctx, course_id, quiz_id, id, **request_kwargs)
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_question_group'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), None)
 
 
 def reorder_question_groups(request_ctx, course_id, quiz_id, id, order_id, order_type, **request_kwargs):
@@ -122,16 +108,6 @@ def reorder_question_groups(request_ctx, course_id, quiz_id, id, order_id, order
 
     """
 
-    order_type_types = ('question')
-    utils.validate_attr_is_acceptable(order_type, order_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/groups/{id}/reorder'
-    payload = {
-        'order[id]' : order_id,
-        'order[type]' : order_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_question_groups'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'order[id]': order_id, 'order[type]': order_type})
 
 
@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_questions_in_quiz', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions', ('course_id', 'quiz_id', 'per_page')),
+    ('get_single_quiz_question', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}', ('course_id', 'quiz_id', 'id')),
+    ('create_single_quiz_question', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions', ('course_id', 'quiz_id', ('question[question_name]', 'question_question_name'), ('question[question_text]', 'question_question_text'), ('question[question_type]', 'question_question_type'), ('question[quiz_group_id]', 'question_quiz_group_id'), ('question[position]', 'question_position'), ('question[points_possible]', 'question_points_possible'), ('question[correct_comments]', 'question_correct_comments'), ('question[incorrect_comments]', 'question_incorrect_comments'), ('question[neutral_comments]', 'question_neutral_comments'), ('question[text_after_answers]', 'question_text_after_answers'), ('question[answers]', 'question_answers')), (('question_question_type', ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')),)),
+    ('update_existing_quiz_question', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}', ('course_id', 'quiz_id', 'id', ('question[question_name]', 'question_question_name'), ('question[question_text]', 'question_question_text'), ('question[question_type]', 'question_question_type'), ('question[quiz_group_id]', 'question_quiz_group_id'), ('question[position]', 'question_position'), ('question[points_possible]', 'question_points_possible'), ('question[correct_comments]', 'question_correct_comments'), ('question[incorrect_comments]', 'question_incorrect_comments'), ('question[neutral_comments]', 'question_neutral_comments'), ('question[text_after_answers]', 'question_text_after_answers'), ('question[answers]', 'question_answers')), (('question_question_type', ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')),)),
+    ('delete_quiz_question', 'DELETE', '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}', ('course_id', 'quiz_id', 'id')),
+])
+
 
 def list_questions_in_quiz(request_ctx, course_id, quiz_id, per_page=None, **request_kwargs):
     """
@@ -17,16 +27,7 @@ def list_questions_in_quiz(request_ctx, course_id, quiz_id, per_page=None, **req
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_questions_in_quiz'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'per_page': per_page})
 
 
 def get_single_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
@@ -46,11 +47,7 @@ def get_single_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwar
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_quiz_question'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), None)
 
 
 def create_single_quiz_question(request_ctx, course_id, quiz_id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None, **request_kwargs):
@@ -90,26 +87,7 @@ def create_single_quiz_question(request_ctx, course_id, quiz_id, question_questi
 
     """
 
-    question_question_type_types = ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')
-    utils.validate_attr_is_acceptable(question_question_type, question_question_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions'
-    payload = {
-        'question[question_name]' : question_question_name,
-        'question[question_text]' : question_question_text,
-        'question[quiz_group_id]' : question_quiz_group_id,
-        'question[question_type]' : question_question_type,
-        'question[position]' : question_position,
-        'question[points_possible]' : question_points_possible,
-        'question[correct_comments]' : question_correct_comments,
-        'question[incorrect_comments]' : question_incorrect_comments,
-        'question[neutral_comments]' : question_neutral_comments,
-        'question[text_after_answers]' : question_text_after_answers,
-        'question[answers]' : question_answers,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_single_quiz_question'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'question[question_name]': question_question_name, 'question[question_text]': question_question_text, 'question[question_type]': question_question_type, 'question[quiz_group_id]': question_quiz_group_id, 'question[position]': question_position, 'question[points_possible]': question_points_possible, 'question[correct_comments]': question_correct_comments, 'question[incorrect_comments]': question_incorrect_comments, 'question[neutral_comments]': question_neutral_comments, 'question[text_after_answers]': question_text_after_answers, 'question[answers]': question_answers})
 
 
 def update_existing_quiz_question(request_ctx, course_id, quiz_id, id, question_question_name, question_question_text, question_question_type, question_quiz_group_id=None, question_position=None, question_points_possible=None, question_correct_comments=None, question_incorrect_comments=None, question_neutral_comments=None, question_text_after_answers=None, question_answers=None, **request_kwargs):
@@ -151,26 +129,7 @@ def update_existing_quiz_question(request_ctx, course_id, quiz_id, id, question_
 
     """
 
-    question_question_type_types = ('calculated_question', 'essay_question', 'file_upload_question', 'fill_in_multiple_blanks_question', 'matching_question', 'multiple_answers_question', 'multiple_choice_question', 'multiple_dropdowns_question', 'numerical_question', 'short_answer_question', 'text_only_question')
-    utils.validate_attr_is_acceptable(question_question_type, question_question_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    payload = {
-        'question[question_name]' : question_question_name,
-        'question[question_text]' : question_question_text,
-        'question[quiz_group_id]' : question_quiz_group_id,
-        'question[question_type]' : question_question_type,
-        'question[position]' : question_position,
-        'question[points_possible]' : question_points_possible,
-        'question[correct_comments]' : question_correct_comments,
-        'question[incorrect_comments]' : question_incorrect_comments,
-        'question[neutral_comments]' : question_neutral_comments,
-        'question[text_after_answers]' : question_text_after_answers,
-        'question[answers]' : question_answers,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_existing_quiz_question'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'question[question_name]': question_question_name, 'question[question_text]': question_question_text, 'question[question_type]': question_question_type, 'question[quiz_group_id]': question_quiz_group_id, 'question[position]': question_position, 'question[points_possible]': question_points_possible, 'question[correct_comments]': question_correct_comments, 'question[incorrect_comments]': question_incorrect_comments, 'question[neutral_comments]': question_neutral_comments, 'question[text_after_answers]': question_text_after_answers, 'question[answers]': question_answers})
 
 
 def delete_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
@@ -190,10 +149,6 @@ def delete_quiz_question(request_ctx, course_id, quiz_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/questions/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_quiz_question'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), None)
 
 
@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('retrieve_all_quiz_reports', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports', ('course_id', 'quiz_id', 'includes_all_versions', 'per_page')),
+    ('create_quiz_report', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports', ('course_id', 'quiz_id', ('quiz_report[report_type]', 'quiz_report_report_type'), ('quiz_report[includes_all_versions]', 'quiz_report_includes_all_versions'), 'include'), (('quiz_report_report_type', ('student_analysis', 'item_analysis')), ('include', ('file', 'progress')))),
+    ('get_quiz_report', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/reports/{id}', ('course_id', 'quiz_id', 'id', 'include'), (('include', ('file', 'progress')),)),
+])
+
 
 def retrieve_all_quiz_reports(request_ctx, course_id, quiz_id, includes_all_versions=None, per_page=None, **request_kwargs):
     """
@@ -19,17 +27,7 @@ def retrieve_all_quiz_reports(request_ctx, course_id, quiz_id, includes_all_vers
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports'
-    payload = {
-        'includes_all_versions' : includes_all_versions,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['retrieve_all_quiz_reports'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'includes_all_versions': includes_all_versions, 'per_page': per_page})
 
 
 def create_quiz_report(request_ctx, course_id, quiz_id, quiz_report_report_type, quiz_report_includes_all_versions=None, include=None, **request_kwargs):
@@ -55,20 +53,7 @@ def create_quiz_report(request_ctx, course_id, quiz_id, quiz_report_report_type,
 
     """
 
-    quiz_report_report_type_types = ('student_analysis', 'item_analysis')
-    include_types = ('file', 'progress')
-    utils.validate_attr_is_acceptable(quiz_report_report_type, quiz_report_report_type_types)
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports'
-    payload = {
-        'quiz_report[report_type]' : quiz_report_report_type,
-        'quiz_report[includes_all_versions]' : quiz_report_includes_all_versions,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_quiz_report'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'quiz_report[report_type]': quiz_report_report_type, 'quiz_report[includes_all_versions]': quiz_report_includes_all_versions, 'include': include})
 
 
 def get_quiz_report(request_ctx, course_id, quiz_id, id, include=None, **request_kwargs):
@@ -90,15 +75,6 @@ def get_quiz_report(request_ctx, course_id, quiz_id, id, include=None, **request
 
     """
 
-    include_types = ('file', 'progress')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/reports/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_quiz_report'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'include': include})
 
 
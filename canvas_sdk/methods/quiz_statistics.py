@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('fetching_latest_quiz_statistics', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/statistics', ('course_id', 'quiz_id', 'all_versions')),
+])
+
 
 def fetching_latest_quiz_statistics(request_ctx, course_id, quiz_id, all_versions, **request_kwargs):
     """
@@ -21,13 +27,6 @@ def fetching_latest_quiz_statistics(request_ctx, course_id, quiz_id, all_version
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/statistics'
-    payload = {
-        'all_versions' : all_versions,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['fetching_latest_quiz_statistics'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'all_versions': all_versions})
 
 
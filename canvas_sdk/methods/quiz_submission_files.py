@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('upload_file', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/self/files', ('course_id', 'quiz_id', 'name', 'on_duplicate')),
+])
+
 
 def upload_file(request_ctx, course_id, quiz_id, name, on_duplicate, **request_kwargs):
     """
@@ -24,14 +30,6 @@ def upload_file(request_ctx, course_id, quiz_id, name, on_duplicate, **request_k
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/self/files'
-    payload = {
-        'name' : name,
-        'on_duplicate' : on_duplicate,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'name': name, 'on_duplicate': on_duplicate})
 
 
@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_all_quiz_submission_questions', 'GET', '/v1/quiz_submissions/{quiz_submission_id}/questions', ('quiz_submission_id', 'include'), (('include', ('quiz_question',)),)),
+    ('get_single_quiz_submission_question', 'GET', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}', ('quiz_submission_id', 'id', 'include'), (('include', ('quiz_question',)),)),
+    ('answering_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}', ('quiz_submission_id', 'id', 'attempt', 'validation_token', 'access_code', 'answer')),
+    ('flagging_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/flag', ('quiz_submission_id', 'id', 'attempt', 'validation_token', 'access_code')),
+    ('unflagging_question', 'PUT', '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/unflag', ('quiz_submission_id', 'id', 'attempt', 'validation_token', 'access_code')),
+])
+
 
 def get_all_quiz_submission_questions(request_ctx, quiz_submission_id, include, **request_kwargs):
     """
@@ -17,16 +27,7 @@ def get_all_quiz_submission_questions(request_ctx, quiz_submission_id, include,
 
     """
 
-    include_types = ('quiz_question')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_quiz_submission_questions'].request(request_ctx, request_kwargs, (quiz_submission_id,), {'include': include})
 
 
 def get_single_quiz_submission_question(request_ctx, quiz_submission_id, id, include, **request_kwargs):
@@ -48,16 +49,7 @@ def get_single_quiz_submission_question(request_ctx, quiz_submission_id, id, inc
 
     """
 
-    include_types = ('quiz_question')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_quiz_submission_question'].request(request_ctx, request_kwargs, (quiz_submission_id, id), {'include': include})
 
 
 def answering_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, answer=None, **request_kwargs):
@@ -83,17 +75,7 @@ def answering_question(request_ctx, quiz_submission_id, id, attempt, validation_
 
     """
 
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-        'answer' : answer,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['answering_question'].request(request_ctx, request_kwargs, (quiz_submission_id, id), {'attempt': attempt, 'validation_token': validation_token, 'access_code': access_code, 'answer': answer})
 
 
 def flagging_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, **request_kwargs):
@@ -118,16 +100,7 @@ def flagging_question(request_ctx, quiz_submission_id, id, attempt, validation_t
 
     """
 
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/flag'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['flagging_question'].request(request_ctx, request_kwargs, (quiz_submission_id, id), {'attempt': attempt, 'validation_token': validation_token, 'access_code': access_code})
 
 
 def unflagging_question(request_ctx, quiz_submission_id, id, attempt, validation_token, access_code=None, **request_kwargs):
@@ -152,15 +125,6 @@ def unflagging_question(request_ctx, quiz_submission_id, id, attempt, validation
 
     """
 
-    path = '/v1/quiz_submissions/{quiz_submission_id}/questions/{id}/unflag'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(quiz_submission_id=quiz_submission_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['unflagging_question'].request(request_ctx, request_kwargs, (quiz_submission_id, id), {'attempt': attempt, 'validation_token': validation_token, 'access_code': access_code})
 
 
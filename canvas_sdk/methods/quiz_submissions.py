@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_all_quiz_submissions', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions', ('course_id', 'quiz_id', 'include'), (('include', ('submission', 'quiz', 'user')),)),
+    ('get_single_quiz_submission', 'GET', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}', ('course_id', 'quiz_id', 'id', 'include'), (('include', ('submission', 'quiz', 'user')),)),
+    ('create_quiz_submission_start_quiz_taking_session', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions', ('course_id', 'quiz_id', 'access_code', 'preview')),
+    ('update_student_question_scores_and_comments', 'PUT', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}', ('course_id', 'quiz_id', 'id', 'attempt', 'fudge_points', 'questions')),
+    ('complete_quiz_submission_turn_it_in', 'POST', '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}/complete', ('course_id', 'quiz_id', 'id', 'attempt', 'validation_token', 'access_code')),
+])
+
 
 def get_all_quiz_submissions(request_ctx, course_id, quiz_id, include, **request_kwargs):
     """
@@ -19,16 +29,7 @@ def get_all_quiz_submissions(request_ctx, course_id, quiz_id, include, **request
 
     """
 
-    include_types = ('submission', 'quiz', 'user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_all_quiz_submissions'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'include': include})
 
 
 def get_single_quiz_submission(request_ctx, course_id, quiz_id, id, include, **request_kwargs):
@@ -52,16 +53,7 @@ def get_single_quiz_submission(request_ctx, course_id, quiz_id, id, include, **r
 
     """
 
-    include_types = ('submission', 'quiz', 'user')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_quiz_submission'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'include': include})
 
 
 def create_quiz_submission_start_quiz_taking_session(request_ctx, course_id, quiz_id, access_code=None, preview=None, **request_kwargs):
@@ -92,15 +84,7 @@ def create_quiz_submission_start_quiz_taking_session(request_ctx, course_id, qui
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions'
-    payload = {
-        'access_code' : access_code,
-        'preview' : preview,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_quiz_submission_start_quiz_taking_session'].request(request_ctx, request_kwargs, (course_id, quiz_id), {'access_code': access_code, 'preview': preview})
 
 
 def update_student_question_scores_and_comments(request_ctx, course_id, quiz_id, id, attempt, fudge_points=None, questions=None, **request_kwargs):
@@ -135,16 +119,7 @@ def update_student_question_scores_and_comments(request_ctx, course_id, quiz_id,
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}'
-    payload = {
-        'attempt' : attempt,
-        'fudge_points' : fudge_points,
-        'questions' : questions,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_student_question_scores_and_comments'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'attempt': attempt, 'fudge_points': fudge_points, 'questions': questions})
 
 
 def complete_quiz_submission_turn_it_in(request_ctx, course_id, quiz_id, id, attempt, validation_token, access_code=None, **request_kwargs):
@@ -182,15 +157,6 @@ def complete_quiz_submission_turn_it_in(request_ctx, course_id, quiz_id, id, att
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{quiz_id}/submissions/{id}/complete'
-    payload = {
-        'attempt' : attempt,
-        'validation_token' : validation_token,
-        'access_code' : access_code,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, quiz_id=quiz_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['complete_quiz_submission_turn_it_in'].request(request_ctx, request_kwargs, (course_id, quiz_id, id), {'attempt': attempt, 'validation_token': validation_token, 'access_code': access_code})
 
 
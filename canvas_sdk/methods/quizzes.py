@@ -1,4 +1,15 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_quizzes_in_course', 'GET', '/v1/courses/{course_id}/quizzes', ('course_id', 'search_term', 'per_page')),
+    ('get_single_quiz', 'GET', '/v1/courses/{course_id}/quizzes/{id}', ('course_id', 'id')),
+    ('create_quiz', 'POST', '/v1/courses/{course_id}/quizzes', ('course_id', ('quiz[title]', 'quiz_title'), ('quiz[quiz_type]', 'quiz_quiz_type'), ('quiz[description]', 'quiz_description'), ('quiz[assignment_group_id]', 'quiz_assignment_group_id'), ('quiz[time_limit]', 'quiz_time_limit'), ('quiz[shuffle_answers]', 'quiz_shuffle_answers'), ('quiz[hide_results]', 'quiz_hide_results'), ('quiz[show_correct_answers]', 'quiz_show_correct_answers'), ('quiz[show_correct_answers_at]', 'quiz_show_correct_answers_at'), ('quiz[hide_correct_answers_at]', 'quiz_hide_correct_answers_at'), ('quiz[allowed_attempts]', 'quiz_allowed_attempts'), ('quiz[scoring_policy]', 'quiz_scoring_policy'), ('quiz[one_question_at_a_time]', 'quiz_one_question_at_a_time'), ('quiz[cant_go_back]', 'quiz_cant_go_back'), ('quiz[access_code]', 'quiz_access_code'), ('quiz[ip_filter]', 'quiz_ip_filter'), ('quiz[due_at]', 'quiz_due_at'), ('quiz[lock_at]', 'quiz_lock_at'), ('quiz[unlock_at]', 'quiz_unlock_at'), ('quiz[published]', 'quiz_published')), (('quiz_quiz_type', ('practice_quiz', 'assignment', 'graded_survey', 'survey')), ('quiz_hide_results', ('always', 'until_after_last_attempt')), ('quiz_scoring_policy', ('keep_highest', 'keep_latest')))),
+    ('edit_quiz', 'PUT', '/v1/courses/{course_id}/quizzes/{id}', ('course_id', 'id', ('quiz[notify_of_update]', 'quiz_notify_of_update'))),
+    ('delete_quiz', 'DELETE', '/v1/courses/{course_id}/quizzes/{id}', ('course_id', 'id')),
+    ('reorder_quiz_items', 'POST', '/v1/courses/{course_id}/quizzes/{id}/reorder', ('course_id', 'id', ('order[id]', 'order_id'), ('order[type]', 'order_type')), (('order_type', ('question', 'group')),)),
+])
+
 
 def list_quizzes_in_course(request_ctx, course_id, search_term=None, per_page=None, **request_kwargs):
     """
@@ -17,17 +28,7 @@ def list_quizzes_in_course(request_ctx, course_id, search_term=None, per_page=No
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/courses/{course_id}/quizzes'
-    payload = {
-        'search_term' : search_term,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_quizzes_in_course'].request(request_ctx, request_kwargs, (course_id,), {'search_term': search_term, 'per_page': per_page})
 
 
 def get_single_quiz(request_ctx, course_id, id, **request_kwargs):
@@ -45,11 +46,7 @@ def get_single_quiz(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_quiz'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def create_quiz(request_ctx, course_id, quiz_title, quiz_quiz_type, quiz_description=None, quiz_assignment_group_id=None, quiz_time_limit=None, quiz_shuffle_answers=None, quiz_hide_results=None, quiz_show_correct_answers=None, quiz_show_correct_answers_at=None, quiz_hide_correct_answers_at=None, quiz_allowed_attempts=None, quiz_scoring_policy=None, quiz_one_question_at_a_time=None, quiz_cant_go_back=None, quiz_access_code=None, quiz_ip_filter=None, quiz_due_at=None, quiz_lock_at=None, quiz_unlock_at=None, quiz_published=None, **request_kwargs):
@@ -105,39 +102,7 @@ def create_quiz(request_ctx, course_id, quiz_title, quiz_quiz_type, quiz_descrip
 
     """
 
-    quiz_quiz_type_types = ('practice_quiz', 'assignment', 'graded_survey', 'survey')
-    quiz_hide_results_types = ('always', 'until_after_last_attempt')
-    quiz_scoring_policy_types = ('keep_highest', 'keep_latest')
-    utils.validate_attr_is_acceptable(quiz_quiz_type, quiz_quiz_type_types)
-    utils.validate_attr_is_acceptable(quiz_hide_results, quiz_hide_results_types)
-    utils.validate_attr_is_acceptable(quiz_scoring_policy, quiz_scoring_policy_types)
-    path = '/v1/courses/{course_id}/quizzes'
-    payload = {
-        'quiz[title]' : quiz_title,
-        'quiz[description]' : quiz_description,
-        'quiz[quiz_type]' : quiz_quiz_type,
-        'quiz[assignment_group_id]' : quiz_assignment_group_id,
-        'quiz[time_limit]' : quiz_time_limit,
-        'quiz[shuffle_answers]' : quiz_shuffle_answers,
-        'quiz[hide_results]' : quiz_hide_results,
-        'quiz[show_correct_answers]' : quiz_show_correct_answers,
-        'quiz[show_correct_answers_at]' : quiz_show_correct_answers_at,
-        'quiz[hide_correct_answers_at]' : quiz_hide_correct_answers_at,
-        'quiz[allowed_attempts]' : quiz_allowed_attempts,
-        'quiz[scoring_policy]' : quiz_scoring_policy,
-        'quiz[one_question_at_a_time]' : quiz_one_question_at_a_time,
-        'quiz[cant_go_back]' : quiz_cant_go_back,
-        'quiz[access_code]' : quiz_access_code,
-        'quiz[ip_filter]' : quiz_ip_filter,
-        'quiz[due_at]' : quiz_due_at,
-        'quiz[lock_at]' : quiz_lock_at,
-        'quiz[unlock_at]' : quiz_unlock_at,
-        'quiz[published]' : quiz_published,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_quiz'].request(request_ctx, request_kwargs, (course_id,), {'quiz[title]': quiz_title, 'quiz[quiz_type]': quiz_quiz_type, 'quiz[description]': quiz_description, 'quiz[assignment_group_id]': quiz_assignment_group_id, 'quiz[time_limit]': quiz_time_limit, 'quiz[shuffle_answers]': quiz_shuffle_answers, 'quiz[hide_results]': quiz_hide_results, 'quiz[show_correct_answers]': quiz_show_correct_answers, 'quiz[show_correct_answers_at]': quiz_show_correct_answers_at, 'quiz[hide_correct_answers_at]': quiz_hide_correct_answers_at, 'quiz[allowed_attempts]': quiz_allowed_attempts, 'quiz[scoring_policy]': quiz_scoring_policy, 'quiz[one_question_at_a_time]': quiz_one_question_at_a_time, 'quiz[cant_go_back]': quiz_cant_go_back, 'quiz[access_code]': quiz_access_code, 'quiz[ip_filter]': quiz_ip_filter, 'quiz[due_at]': quiz_due_at, 'quiz[lock_at]': quiz_lock_at, 'quiz[unlock_at]': quiz_unlock_at, 'quiz[published]': quiz_published})
 
 
 def edit_quiz(request_ctx, course_id, id, quiz_notify_of_update, **request_kwargs):
@@ -159,14 +124,7 @@ def edit_quiz(request_ctx, course_id, id, quiz_notify_of_update, **request_kwarg
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    payload = {
-        'quiz[notify_of_update]' : quiz_notify_of_update,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_quiz'].request(request_ctx, request_kwargs, (course_id, id), {'quiz[notify_of_update]': quiz_notify_of_update})
 
 
 def delete_quiz(request_ctx, course_id, id, **request_kwargs):
@@ -183,11 +141,7 @@ def delete_quiz(request_ctx, course_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/courses/{course_id}/quizzes/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_quiz'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def reorder_quiz_items(request_ctx, course_id, id, order_id, order_type, **request_kwargs):
@@ -211,16 +165,6 @@ def reorder_quiz_items(request_ctx, course_id, id, order_id, order_type, **reque
 
     """
 
-    order_type_types = ('question', 'group')
-    utils.validate_attr_is_acceptable(order_type, order_type_types)
-    path = '/v1/courses/{course_id}/quizzes/{id}/reorder'
-    payload = {
-        'order[id]' : order_id,
-        'order[type]' : order_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['reorder_quiz_items'].request(request_ctx, request_kwargs, (course_id, id), {'order[id]': order_id, 'order[type]': order_type})
 
 
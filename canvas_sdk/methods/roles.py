@@ -1,4 +1,15 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_roles', 'GET', '/v1/accounts/{account_id}/roles', ('account_id', 'state', 'per_page'), (('state', ('active', 'inactive')),)),
+    ('get_single_role', 'GET', '/v1/accounts/{account_id}/roles/{role}', ('account_id', 'role')),
+    ('create_new_role', 'POST', '/v1/accounts/{account_id}/roles', ('account_id', 'role', 'base_role_type', ('permissions[X][explicit]', 'permissions_X_explicit'), ('permissions[X][enabled]', 'permissions_X_enabled'), ('permissions[X][locked]', 'permissions_X_locked')), (('base_role_type', ('AccountMembership', 'StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', 'DesignerEnrollment')),)),
+    ('deactivate_role', 'DELETE', '/v1/accounts/{account_id}/roles/{role}', ('account_id', 'role')),
+    ('activate_role', 'POST', '/v1/accounts/{account_id}/roles/{role}/activate', ('account_id', 'role')),
+    ('update_role', 'PUT', '/v1/accounts/{account_id}/roles/{role}', ('account_id', 'role', ('permissions[X][explicit]', 'permissions_X_explicit'), ('permissions[X][enabled]', 'permissions_X_enabled'))),
+])
+
 
 def list_roles(request_ctx, account_id, state, per_page=None, **request_kwargs):
     """
@@ -17,19 +28,7 @@ def list_roles(request_ctx, account_id, state, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    state_types = ('active', 'inactive')
-    utils.validate_attr_is_acceptable(state, state_types)
-    path = '/v1/accounts/{account_id}/roles'
-    payload = {
-        'state' : state,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_roles'].request(request_ctx, request_kwargs, (account_id,), {'state': state, 'per_page': per_page})
 
 
 def get_single_role(request_ctx, account_id, role, **request_kwargs):
@@ -47,11 +46,7 @@ def get_single_role(request_ctx, account_id, role, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/roles/{role}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_role'].request(request_ctx, request_kwargs, (account_id, role), None)
 
 
 def create_new_role(request_ctx, account_id, role, base_role_type=None, permissions_X_explicit=None, permissions_X_enabled=None, permissions_X_locked=None, **request_kwargs):
@@ -77,20 +72,7 @@ def create_new_role(request_ctx, account_id, role, base_role_type=None, permissi
 
     """
 
-    base_role_type_types = ('AccountMembership', 'StudentEnrollment', 'TeacherEnrollment', 'TaEnrollment', 'ObserverEnrollment', 'DesignerEnrollment')
-    utils.validate_attr_is_acceptable(base_role_type, base_role_type_types)
-    path = '/v1/accounts/{account_id}/roles'
-    payload = {
-        'role' : role,
-        'base_role_type' : base_role_type,
-        'permissions[X][explicit]' : permissions_X_explicit,
-        'permissions[X][enabled]' : permissions_X_enabled,
-        'permissions[X][locked]' : permissions_X_locked,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_new_role'].request(request_ctx, request_kwargs, (account_id,), {'role': role, 'base_role_type': base_role_type, 'permissions[X][explicit]': permissions_X_explicit, 'permissions[X][enabled]': permissions_X_enabled, 'permissions[X][locked]': permissions_X_locked})
 
 
 def deactivate_role(request_ctx, account_id, role, **request_kwargs):
@@ -111,11 +93,7 @@ def deactivate_role(request_ctx, account_id, role, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/roles/{role}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['deactivate_role'].request(request_ctx, request_kwargs, (account_id, role), None)
 
 
 def activate_role(request_ctx, account_id, role, **request_kwargs):
@@ -133,11 +111,7 @@ def activate_role(request_ctx, account_id, role, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/roles/{role}/activate'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['activate_role'].request(request_ctx, request_kwargs, (account_id, role), None)
 
 
 def update_role(request_ctx, account_id, role, permissions_X_explicit=None, permissions_X_enabled=None, **request_kwargs):
@@ -168,14 +142,6 @@ def update_role(request_ctx, account_id, role, permissions_X_explicit=None, perm
 
     """
 
-    path = '/v1/accounts/{account_id}/roles/{role}'
-    payload = {
-        'permissions[X][explicit]' : permissions_X_explicit,
-        'permissions[X][enabled]' : permissions_X_enabled,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id, role=role)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_role'].request(request_ctx, request_kwargs, (account_id, role), {'permissions[X][explicit]': permissions_X_explicit, 'permissions[X][enabled]': permissions_X_enabled})
 
 
@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('find_recipients_conversations', 'GET', '/v1/conversations/find_recipients', ('search', 'context', 'exclude', 'type', 'user_id', 'from_conversation_id', 'permissions'), (('type', ('user', 'context')),)),
+    ('find_recipients_search', 'GET', '/v1/search/recipients', ('search', 'context', 'exclude', 'type', 'user_id', 'from_conversation_id', 'permissions'), (('type', ('user', 'context')),)),
+])
+
 
 def find_recipients_conversations(request_ctx, search, context, exclude, type, user_id, from_conversation_id, permissions, **request_kwargs):
     """
@@ -29,22 +36,7 @@ def find_recipients_conversations(request_ctx, search, context, exclude, type, u
 
     """
 
-    type_types = ('user', 'context')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/conversations/find_recipients'
-    payload = {
-        'search' : search,
-        'context' : context,
-        'exclude' : exclude,
-        'type' : type,
-        'user_id' : user_id,
-        'from_conversation_id' : from_conversation_id,
-        'permissions' : permissions,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['find_recipients_conversations'].request(request_ctx, request_kwargs, (), {'search': search, 'context': context, 'exclude': exclude, 'type': type, 'user_id': user_id, 'from_conversation_id': from_conversation_id, 'permissions': permissions})
 
 
 def find_recipients_search(request_ctx, search, context, exclude, type, user_id, from_conversation_id, permissions, **request_kwargs):
@@ -76,21 +68,6 @@ def find_recipients_search(request_ctx, search, context, exclude, type, user_id,
 
     """
 
-    type_types = ('user', 'context')
-    utils.validate_attr_is_acceptable(type, type_types)
-    path = '/v1/search/recipients'
-    payload = {
-        'search' : search,
-        'context' : context,
-        'exclude' : exclude,
-        'type' : type,
-        'user_id' : user_id,
-        'from_conversation_id' : from_conversation_id,
-        'permissions' : permissions,
-    }
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['find_recipients_search'].request(request_ctx, request_kwargs, (), {'search': search, 'context': context, 'exclude': exclude, 'type': type, 'user_id': user_id, 'from_conversation_id': from_conversation_id, 'permissions': permissions})
 
 
@@ -1,4 +1,17 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_course_sections', 'GET', '/v1/courses/{course_id}/sections', ('course_id', ('include[]', 'include'), 'per_page'), (('include', ('students', 'avatar_url')),)),
+    ('create_course_section', 'POST', '/v1/courses/{course_id}/sections', ('course_id', ('course_section[name]', 'course_section_name'), ('course_section[sis_section_id]', 'course_section_sis_section_id'), ('course_section[start_at]', 'course_section_start_at'), ('course_section[end_at]', 'course_section_end_at'))),
+    ('cross_list_section', 'POST', '/v1/sections/{id}/crosslist/{new_course_id}', ('id', 'new_course_id')),
+    ('de_cross_list_section', 'DELETE', '/v1/sections/{id}/crosslist', ('id',)),
+    ('edit_section', 'PUT', '/v1/sections/{id}', ('id', ('course_section[name]', 'course_section_name'), ('course_section[sis_section_id]', 'course_section_sis_section_id'), ('course_section[start_at]', 'course_section_start_at'), ('course_section[end_at]', 'course_section_end_at'))),
+    ('get_section_information_courses', 'GET', '/v1/courses/{course_id}/sections/{id}', ('course_id', 'id')),
+    ('get_section_information_sections', 'GET', '/v1/sections/{id}', ('id',)),
+    ('delete_section', 'DELETE', '/v1/sections/{id}', ('id',)),
+])
+
 
 def list_course_sections(request_ctx, course_id, include=None, per_page=None, **request_kwargs):
     """
@@ -17,19 +30,7 @@ def list_course_sections(request_ctx, course_id, include=None, per_page=None, **
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('students', 'avatar_url')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/sections'
-    payload = {
-        'include[]' : include,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_course_sections'].request(request_ctx, request_kwargs, (course_id,), {'include[]': include, 'per_page': per_page})
 
 
 def create_course_section(request_ctx, course_id, course_section_name, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None, **request_kwargs):
@@ -53,17 +54,7 @@ def create_course_section(request_ctx, course_id, course_section_name, course_se
 
     """
 
-    path = '/v1/courses/{course_id}/sections'
-    payload = {
-        'course_section[name]' : course_section_name,
-        'course_section[sis_section_id]' : course_section_sis_section_id,
-        'course_section[start_at]' : course_section_start_at,
-        'course_section[end_at]' : course_section_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_course_section'].request(request_ctx, request_kwargs, (course_id,), {'course_section[name]': course_section_name, 'course_section[sis_section_id]': course_section_sis_section_id, 'course_section[start_at]': course_section_start_at, 'course_section[end_at]': course_section_end_at})
 
 
 def cross_list_section(request_ctx, id, new_course_id, **request_kwargs):
@@ -82,11 +73,7 @@ def cross_list_section(request_ctx, id, new_course_id, **request_kwargs):
 
     """
 
-    path = '/v1/sections/{id}/crosslist/{new_course_id}'
-    url = request_ctx.base_api_url + path.format(id=id, new_course_id=new_course_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['cross_list_section'].request(request_ctx, request_kwargs, (id, new_course_id), None)
 
 
 def de_cross_list_section(request_ctx, id, **request_kwargs):
@@ -102,11 +89,7 @@ def de_cross_list_section(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/sections/{id}/crosslist'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['de_cross_list_section'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def edit_section(request_ctx, id, course_section_name=None, course_section_sis_section_id=None, course_section_start_at=None, course_section_end_at=None, **request_kwargs):
@@ -127,16 +110,8 @@ def edit_section(request_ctx, id, course_section_name=None, course_section_sis_s
     :return: Edit a section
     :rtype: requests.Response (with Section data)
     """
-    path = '/v1/sections/{id}'
-    payload = {
-        'course_section[name]' : course_section_name,
-        'course_section[sis_section_id]' : course_section_sis_section_id,
-        'course_section[start_at]' : course_section_start_at,
-        'course_section[end_at]' : course_section_end_at,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-    return response
+
+    return ENDPOINTS['edit_section'].request(request_ctx, request_kwargs, (id,), {'course_section[name]': course_section_name, 'course_section[sis_section_id]': course_section_sis_section_id, 'course_section[start_at]': course_section_start_at, 'course_section[end_at]': course_section_end_at})
 
 
 def get_section_information_courses(request_ctx, course_id, id, **request_kwargs):
@@ -154,11 +129,7 @@ def get_section_information_courses(request_ctx, course_id, id, **request_kwargs
 
     """
 
-    path = '/v1/courses/{course_id}/sections/{id}'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_section_information_courses'].request(request_ctx, request_kwargs, (course_id, id), None)
 
 
 def get_section_information_sections(request_ctx, id, **request_kwargs):
@@ -174,11 +145,7 @@ def get_section_information_sections(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/sections/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_section_information_sections'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def delete_section(request_ctx, id, **request_kwargs):
@@ -194,10 +161,6 @@ def delete_section(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/sections/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_section'].request(request_ctx, request_kwargs, (id,), None)
 
 
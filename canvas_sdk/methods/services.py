@@ -1,4 +1,11 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_kaltura_config', 'GET', '/v1/services/kaltura', ()),
+    ('start_kaltura_session', 'POST', '/v1/services/kaltura_session', ()),
+])
+
 
 def get_kaltura_config(request_ctx, **request_kwargs):
     """
@@ -11,11 +18,7 @@ def get_kaltura_config(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/services/kaltura'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_kaltura_config'].request(request_ctx, request_kwargs, (), None)
 
 
 def start_kaltura_session(request_ctx, **request_kwargs):
@@ -30,10 +33,6 @@ def start_kaltura_session(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/services/kaltura_session'
-    url = request_ctx.base_api_url + path.format()
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['start_kaltura_session'].request(request_ctx, request_kwargs, (), None)
 
 
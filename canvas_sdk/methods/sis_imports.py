@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('get_sis_import_list', 'GET', '/v1/accounts/{account_id}/sis_imports', ('account_id', 'per_page')),
+    ('import_sis_data', 'POST', '/v1/accounts/{account_id}/sis_imports', ('account_id', 'attachment', 'import_type', 'extension', 'batch_mode', 'batch_mode_term_id', 'override_sis_stickiness', 'add_sis_stickiness', 'clear_sis_stickiness')),
+    ('get_sis_import_status', 'GET', '/v1/accounts/{account_id}/sis_imports/{id}', ('account_id', 'id')),
+])
+
 
 def get_sis_import_list(request_ctx, account_id, per_page=None, **request_kwargs):
     """
@@ -19,16 +27,7 @@ def get_sis_import_list(request_ctx, account_id, per_page=None, **request_kwargs
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/accounts/{account_id}/sis_imports'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_sis_import_list'].request(request_ctx, request_kwargs, (account_id,), {'per_page': per_page})
 
 
 def import_sis_data(request_ctx, account_id, attachment, import_type=None, extension=None, batch_mode=None, batch_mode_term_id=None, override_sis_stickiness=None, add_sis_stickiness=None, clear_sis_stickiness=None, **request_kwargs):
@@ -64,21 +63,7 @@ def import_sis_data(request_ctx, account_id, attachment, import_type=None, exten
 
     """
 
-    path = '/v1/accounts/{account_id}/sis_imports'
-    payload = {
-        'import_type' : import_type,
-        'attachment' : attachment,
-        'extension' : extension,
-        'batch_mode' : batch_mode,
-        'batch_mode_term_id' : batch_mode_term_id,
-        'override_sis_stickiness' : override_sis_stickiness,
-        'add_sis_stickiness' : add_sis_stickiness,
-        'clear_sis_stickiness' : clear_sis_stickiness,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['import_sis_data'].request(request_ctx, request_kwargs, (account_id,), {'attachment': attachment, 'import_type': import_type, 'extension': extension, 'batch_mode': batch_mode, 'batch_mode_term_id': batch_mode_term_id, 'override_sis_stickiness': override_sis_stickiness, 'add_sis_stickiness': add_sis_stickiness, 'clear_sis_stickiness': clear_sis_stickiness})
 
 
 def get_sis_import_status(request_ctx, account_id, id, **request_kwargs):
@@ -100,10 +85,6 @@ def get_sis_import_status(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/sis_imports/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_sis_import_status'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
@@ -1,4 +1,10 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('upload_file', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/comments/files', ('course_id', 'assignment_id', 'user_id')),
+])
+
 
 def upload_file(request_ctx, course_id, assignment_id, user_id, **request_kwargs):
     """
@@ -23,10 +29,6 @@ def upload_file(request_ctx, course_id, assignment_id, user_id, **request_kwargs
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/comments/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (course_id, assignment_id, user_id), None)
 
 
@@ -1,4 +1,21 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('submit_assignment_courses', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions', ('course_id', 'assignment_id', ('submission[submission_type]', 'submission_submission_type'), ('comment[text_comment]', 'comment_text_comment'), ('submission[body]', 'submission_body'), ('submission[url]', 'submission_url'), ('submission[file_ids]', 'submission_file_ids'), ('submission[media_comment_id]', 'submission_media_comment_id'), ('submission[media_comment_type]', 'submission_media_comment_type')), (('submission_submission_type', ('online_text_entry', 'online_url', 'online_upload', 'media_recording')), ('submission_media_comment_type', ('audio', 'video')))),
+    ('submit_assignment_sections', 'POST', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions', ('section_id', 'assignment_id', ('submission[submission_type]', 'submission_submission_type'), ('comment[text_comment]', 'comment_text_comment'), ('submission[body]', 'submission_body'), ('submission[url]', 'submission_url'), ('submission[file_ids]', 'submission_file_ids'), ('submission[media_comment_id]', 'submission_media_comment_id'), ('submission[media_comment_type]', 'submission_media_comment_type')), (('submission_submission_type', ('online_text_entry', 'online_url', 'online_upload', 'media_recording')), ('submission_media_comment_type', ('audio', 'video')))),
+    ('list_assignment_submissions_courses', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions', ('course_id', 'assignment_id', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')),)),
+    ('list_assignment_submissions_sections', 'GET', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions', ('section_id', 'assignment_id', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')),)),
+    ('list_submissions_for_multiple_assignments_courses', 'GET', '/v1/courses/{course_id}/students/submissions', ('course_id', 'student_ids', 'assignment_ids', 'grouped', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')),)),
+    ('list_submissions_for_multiple_assignments_sections', 'GET', '/v1/sections/{section_id}/students/submissions', ('section_id', 'student_ids', 'assignment_ids', 'grouped', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')),)),
+    ('get_single_submission_courses', 'GET', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}', ('course_id', 'assignment_id', 'user_id', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment')),)),
+    ('get_single_submission_sections', 'GET', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}', ('section_id', 'assignment_id', 'user_id', 'include'), (('include', ('submission_history', 'submission_comments', 'rubric_assessment')),)),
+    ('upload_file_courses', 'POST', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/files', ('course_id', 'assignment_id', 'user_id')),
+    ('upload_file_sections', 'POST', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}/files', ('section_id', 'assignment_id', 'user_id')),
+    ('grade_or_comment_on_submission_courses', 'PUT', '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}', ('course_id', 'assignment_id', 'user_id', ('comment[text_comment]', 'comment_text_comment'), ('comment[group_comment]', 'comment_group_comment'), ('comment[media_comment_id]', 'comment_media_comment_id'), ('comment[media_comment_type]', 'comment_media_comment_type'), ('comment[file_ids]', 'comment_file_ids'), ('submission[posted_grade]', 'submission_posted_grade'), 'rubric_assessment'), (('comment_media_comment_type', ('audio', 'video')),)),
+    ('grade_or_comment_on_submission_sections', 'PUT', '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}', ('section_id', 'assignment_id', 'user_id', ('comment[text_comment]', 'comment_text_comment'), ('comment[group_comment]', 'comment_group_comment'), ('comment[media_comment_id]', 'comment_media_comment_id'), ('comment[media_comment_type]', 'comment_media_comment_type'), ('comment[file_ids]', 'comment_file_ids'), ('submission[posted_grade]', 'submission_posted_grade'), 'rubric_assessment'), (('comment_media_comment_type', ('audio', 'video')),)),
+])
+
 
 def submit_assignment_courses(request_ctx, course_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None, **request_kwargs):
     """
@@ -37,24 +54,7 @@ def submit_assignment_courses(request_ctx, course_id, assignment_id, submission_
 
     """
 
-    submission_submission_type_types = ('online_text_entry', 'online_url', 'online_upload', 'media_recording')
-    submission_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(submission_submission_type, submission_submission_type_types)
-    utils.validate_attr_is_acceptable(submission_media_comment_type, submission_media_comment_type_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'submission[submission_type]' : submission_submission_type,
-        'submission[body]' : submission_body,
-        'submission[url]' : submission_url,
-        'submission[file_ids]' : submission_file_ids,
-        'submission[media_comment_id]' : submission_media_comment_id,
-        'submission[media_comment_type]' : submission_media_comment_type,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['submit_assignment_courses'].request(request_ctx, request_kwargs, (course_id, assignment_id), {'submission[submission_type]': submission_submission_type, 'comment[text_comment]': comment_text_comment, 'submission[body]': submission_body, 'submission[url]': submission_url, 'submission[file_ids]': submission_file_ids, 'submission[media_comment_id]': submission_media_comment_id, 'submission[media_comment_type]': submission_media_comment_type})
 
 
 def submit_assignment_sections(request_ctx, section_id, assignment_id, submission_submission_type, comment_text_comment=None, submission_body=None, submission_url=None, submission_file_ids=None, submission_media_comment_id=None, submission_media_comment_type=None, **request_kwargs):
@@ -94,24 +94,7 @@ def submit_assignment_sections(request_ctx, section_id, assignment_id, submissio
 
     """
 
-    submission_submission_type_types = ('online_text_entry', 'online_url', 'online_upload', 'media_recording')
-    submission_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(submission_submission_type, submission_submission_type_types)
-    utils.validate_attr_is_acceptable(submission_media_comment_type, submission_media_comment_type_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'submission[submission_type]' : submission_submission_type,
-        'submission[body]' : submission_body,
-        'submission[url]' : submission_url,
-        'submission[file_ids]' : submission_file_ids,
-        'submission[media_comment_id]' : submission_media_comment_id,
-        'submission[media_comment_type]' : submission_media_comment_type,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['submit_assignment_sections'].request(request_ctx, request_kwargs, (section_id, assignment_id), {'submission[submission_type]': submission_submission_type, 'comment[text_comment]': comment_text_comment, 'submission[body]': submission_body, 'submission[url]': submission_url, 'submission[file_ids]': submission_file_ids, 'submission[media_comment_id]': submission_media_comment_id, 'submission[media_comment_type]': submission_media_comment_type})
 
 
 def list_assignment_submissions_courses(request_ctx, course_id, assignment_id, include, **request_kwargs):
@@ -131,16 +114,7 @@ def list_assignment_submissions_courses(request_ctx, course_id, assignment_id, i
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_assignment_submissions_courses'].request(request_ctx, request_kwargs, (course_id, assignment_id), {'include': include})
 
 
 def list_assignment_submissions_sections(request_ctx, section_id, assignment_id, include, **request_kwargs):
@@ -160,16 +134,7 @@ def list_assignment_submissions_sections(request_ctx, section_id, assignment_id,
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_assignment_submissions_sections'].request(request_ctx, request_kwargs, (section_id, assignment_id), {'include': include})
 
 
 def list_submissions_for_multiple_assignments_courses(request_ctx, course_id, student_ids, assignment_ids, grouped, include, **request_kwargs):
@@ -193,19 +158,7 @@ def list_submissions_for_multiple_assignments_courses(request_ctx, course_id, st
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/students/submissions'
-    payload = {
-        'student_ids' : student_ids,
-        'assignment_ids' : assignment_ids,
-        'grouped' : grouped,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_submissions_for_multiple_assignments_courses'].request(request_ctx, request_kwargs, (course_id,), {'student_ids': student_ids, 'assignment_ids': assignment_ids, 'grouped': grouped, 'include': include})
 
 
 def list_submissions_for_multiple_assignments_sections(request_ctx, section_id, student_ids, assignment_ids, grouped, include, **request_kwargs):
@@ -229,19 +182,7 @@ def list_submissions_for_multiple_assignments_sections(request_ctx, section_id,
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment', 'assignment', 'total_scores')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/students/submissions'
-    payload = {
-        'student_ids' : student_ids,
-        'assignment_ids' : assignment_ids,
-        'grouped' : grouped,
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_submissions_for_multiple_assignments_sections'].request(request_ctx, request_kwargs, (section_id,), {'student_ids': student_ids, 'assignment_ids': assignment_ids, 'grouped': grouped, 'include': include})
 
 
 def get_single_submission_courses(request_ctx, course_id, assignment_id, user_id, include, **request_kwargs):
@@ -263,16 +204,7 @@ def get_single_submission_courses(request_ctx, course_id, assignment_id, user_id
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_submission_courses'].request(request_ctx, request_kwargs, (course_id, assignment_id, user_id), {'include': include})
 
 
 def get_single_submission_sections(request_ctx, section_id, assignment_id, user_id, include, **request_kwargs):
@@ -294,16 +226,7 @@ def get_single_submission_sections(request_ctx, section_id, assignment_id, user_
 
     """
 
-    include_types = ('submission_history', 'submission_comments', 'rubric_assessment')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_single_submission_sections'].request(request_ctx, request_kwargs, (section_id, assignment_id, user_id), {'include': include})
 
 
 def upload_file_courses(request_ctx, course_id, assignment_id, user_id, **request_kwargs):
@@ -330,11 +253,7 @@ def upload_file_courses(request_ctx, course_id, assignment_id, user_id, **reques
 
     """
 
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file_courses'].request(request_ctx, request_kwargs, (course_id, assignment_id, user_id), None)
 
 
 def upload_file_sections(request_ctx, section_id, assignment_id, user_id, **request_kwargs):
@@ -361,11 +280,7 @@ def upload_file_sections(request_ctx, section_id, assignment_id, user_id, **requ
 
     """
 
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file_sections'].request(request_ctx, request_kwargs, (section_id, assignment_id, user_id), None)
 
 
 def grade_or_comment_on_submission_courses(request_ctx, course_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None, **request_kwargs):
@@ -402,22 +317,7 @@ def grade_or_comment_on_submission_courses(request_ctx, course_id, assignment_id
 
     """
 
-    comment_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(comment_media_comment_type, comment_media_comment_type_types)
-    path = '/v1/courses/{course_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'comment[group_comment]' : comment_group_comment,
-        'comment[media_comment_id]' : comment_media_comment_id,
-        'comment[media_comment_type]' : comment_media_comment_type,
-        'comment[file_ids]' : comment_file_ids,
-        'submission[posted_grade]' : submission_posted_grade,
-        'rubric_assessment' : rubric_assessment,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['grade_or_comment_on_submission_courses'].request(request_ctx, request_kwargs, (course_id, assignment_id, user_id), {'comment[text_comment]': comment_text_comment, 'comment[group_comment]': comment_group_comment, 'comment[media_comment_id]': comment_media_comment_id, 'comment[media_comment_type]': comment_media_comment_type, 'comment[file_ids]': comment_file_ids, 'submission[posted_grade]': submission_posted_grade, 'rubric_assessment': rubric_assessment})
 
 
 def grade_or_comment_on_submission_sections(request_ctx, section_id, assignment_id, user_id, comment_text_comment=None, comment_group_comment=None, comment_media_comment_id=None, comment_media_comment_type=None, comment_file_ids=None, submission_posted_grade=None, rubric_assessment=None, **request_kwargs):
@@ -454,21 +354,6 @@ def grade_or_comment_on_submission_sections(request_ctx, section_id, assignment_
 
     """
 
-    comment_media_comment_type_types = ('audio', 'video')
-    utils.validate_attr_is_acceptable(comment_media_comment_type, comment_media_comment_type_types)
-    path = '/v1/sections/{section_id}/assignments/{assignment_id}/submissions/{user_id}'
-    payload = {
-        'comment[text_comment]' : comment_text_comment,
-        'comment[group_comment]' : comment_group_comment,
-        'comment[media_comment_id]' : comment_media_comment_id,
-        'comment[media_comment_type]' : comment_media_comment_type,
-        'comment[file_ids]' : comment_file_ids,
-        'submission[posted_grade]' : submission_posted_grade,
-        'rubric_assessment' : rubric_assessment,
-    }
-    url = request_ctx.base_api_url + path.format(section_id=section_id, assignment_id=assignment_id, user_id=user_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['grade_or_comment_on_submission_sections'].request(request_ctx, request_kwargs, (section_id, assignment_id, user_id), {'comment[text_comment]': comment_text_comment, 'comment[group_comment]': comment_group_comment, 'comment[media_comment_id]': comment_media_comment_id, 'comment[media_comment_type]': comment_media_comment_type, 'comment[file_ids]': comment_file_ids, 'submission[posted_grade]': submission_posted_grade, 'rubric_assessment': rubric_assessment})
 
 
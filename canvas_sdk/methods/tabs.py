@@ -1,4 +1,12 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_available_tabs_for_course_or_group_courses', 'GET', '/v1/courses/{course_id}/tabs', ('course_id', 'include'), (('include', ('external',)),)),
+    ('list_available_tabs_for_course_or_group_groups', 'GET', '/v1/groups/{group_id}/tabs', ('group_id', 'include'), (('include', ('external',)),)),
+    ('update_tab_for_course', 'PUT', '/v1/courses/{course_id}/tabs/{tab_id}', ('course_id', 'tab_id', 'position', 'hidden')),
+])
+
 
 def list_available_tabs_for_course_or_group_courses(request_ctx, course_id, include, **request_kwargs):
     """
@@ -15,16 +23,7 @@ def list_available_tabs_for_course_or_group_courses(request_ctx, course_id, incl
 
     """
 
-    include_types = ('external')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/courses/{course_id}/tabs'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_available_tabs_for_course_or_group_courses'].request(request_ctx, request_kwargs, (course_id,), {'include': include})
 
 
 def list_available_tabs_for_course_or_group_groups(request_ctx, group_id, include, **request_kwargs):
@@ -42,16 +41,7 @@ def list_available_tabs_for_course_or_group_groups(request_ctx, group_id, includ
 
     """
 
-    include_types = ('external')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/groups/{group_id}/tabs'
-    payload = {
-        'include' : include,
-    }
-    url = request_ctx.base_api_url + path.format(group_id=group_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_available_tabs_for_course_or_group_groups'].request(request_ctx, request_kwargs, (group_id,), {'include': include})
 
 
 def update_tab_for_course(request_ctx, course_id, tab_id, position, hidden, **request_kwargs):
@@ -75,14 +65,6 @@ def update_tab_for_course(request_ctx, course_id, tab_id, position, hidden, **re
 
     """
 
-    path = '/v1/courses/{course_id}/tabs/{tab_id}'
-    payload = {
-        'position' : position,
-        'hidden' : hidden,
-    }
-    url = request_ctx.base_api_url + path.format(course_id=course_id, tab_id=tab_id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_tab_for_course'].request(request_ctx, request_kwargs, (course_id, tab_id), {'position': position, 'hidden': hidden})
 
 
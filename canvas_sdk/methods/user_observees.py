@@ -1,4 +1,14 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_observees', 'GET', '/v1/users/{user_id}/observees', ('user_id', 'per_page')),
+    ('add_observee_with_credentials', 'POST', '/v1/users/{user_id}/observees', ('user_id', ('observee[unique_id]', 'observee_unique_id'), ('observee[password]', 'observee_password'))),
+    ('show_observee', 'GET', '/v1/users/{user_id}/observees/{observee_id}', ('user_id', 'observee_id')),
+    ('add_observee', 'PUT', '/v1/users/{user_id}/observees/{observee_id}', ('user_id', 'observee_id')),
+    ('remove_observee', 'DELETE', '/v1/users/{user_id}/observees/{observee_id}', ('user_id', 'observee_id')),
+])
+
 
 def list_observees(request_ctx, user_id, per_page=None, **request_kwargs):
     """
@@ -18,16 +28,7 @@ def list_observees(request_ctx, user_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/observees'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_observees'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def add_observee_with_credentials(request_ctx, user_id, observee_unique_id=None, observee_password=None, **request_kwargs):
@@ -51,15 +52,7 @@ def add_observee_with_credentials(request_ctx, user_id, observee_unique_id=None,
 
     """
 
-    path = '/v1/users/{user_id}/observees'
-    payload = {
-        'observee[unique_id]' : observee_unique_id,
-        'observee[password]' : observee_password,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['add_observee_with_credentials'].request(request_ctx, request_kwargs, (user_id,), {'observee[unique_id]': observee_unique_id, 'observee[password]': observee_password})
 
 
 def show_observee(request_ctx, user_id, observee_id, **request_kwargs):
@@ -79,11 +72,7 @@ def show_observee(request_ctx, user_id, observee_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['show_observee'].request(request_ctx, request_kwargs, (user_id, observee_id), None)
 
 
 def add_observee(request_ctx, user_id, observee_id, **request_kwargs):
@@ -101,11 +90,7 @@ def add_observee(request_ctx, user_id, observee_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['add_observee'].request(request_ctx, request_kwargs, (user_id, observee_id), None)
 
 
 def remove_observee(request_ctx, user_id, observee_id, **request_kwargs):
@@ -123,10 +108,6 @@ def remove_observee(request_ctx, user_id, observee_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/observees/{observee_id}'
-    url = request_ctx.base_api_url + path.format(user_id=user_id, observee_id=observee_id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['remove_observee'].request(request_ctx, request_kwargs, (user_id, observee_id), None)
 
 
@@ -1,4 +1,29 @@
 from canvas_sdk import client, utils
+from canvas_sdk.endpoints import Endpoint
+
+ENDPOINTS = Endpoint.table([
+    ('list_users_in_account', 'GET', '/v1/accounts/{account_id}/users', ('account_id', 'search_term', ('include[]', 'include'), 'per_page'), (('include', ('avatar_url', 'email', 'last_login', 'time_zone')),)),
+    ('list_activity_stream_self', 'GET', '/v1/users/self/activity_stream', ()),
+    ('list_activity_stream_activity_stream', 'GET', '/v1/users/activity_stream', ()),
+    ('activity_stream_summary', 'GET', '/v1/users/self/activity_stream/summary', ()),
+    ('list_todo_items', 'GET', '/v1/users/self/todo', ()),
+    ('list_upcoming_assignments_calendar_events', 'GET', '/v1/users/self/upcoming_events', ()),
+    ('hide_stream_item', 'DELETE', '/v1/users/self/activity_stream/{id}', ('id',)),
+    ('hide_all_stream_items', 'DELETE', '/v1/users/self/activity_stream', ()),
+    ('upload_file', 'POST', '/v1/users/{user_id}/files', ('user_id',)),
+    ('create_user', 'POST', '/v1/accounts/{account_id}/users', ('account_id', ('pseudonym[unique_id]', 'pseudonym_unique_id'), ('user[name]', 'user_name'), ('user[short_name]', 'user_short_name'), ('user[sortable_name]', 'user_sortable_name'), ('user[time_zone]', 'user_time_zone'), ('user[locale]', 'user_locale'), ('user[birthdate]', 'user_birthdate'), ('user[terms_of_use]', 'user_terms_of_use'), ('pseudonym[password]', 'pseudonym_password'), ('pseudonym[sis_user_id]', 'pseudonym_sis_user_id'), ('pseudonym[send_confirmation]', 'pseudonym_send_confirmation'), ('communication_channel[type]', 'communication_channel_type'), ('communication_channel[address]', 'communication_channel_address'), ('communication_channel[skip_confirmation]', 'communication_channel_skip_confirmation'))),
+    ('update_user_settings', 'GET', '/v1/users/{id}/settings', ('id', 'manual_mark_as_read')),
+    ('edit_user', 'PUT', '/v1/users/{id}', ('id', ('user[name]', 'user_name'), ('user[short_name]', 'user_short_name'), ('user[sortable_name]', 'user_sortable_name'), ('user[time_zone]', 'user_time_zone'), ('user[locale]', 'user_locale'), ('user[avatar][token]', 'user_avatar_token'), ('user[avatar][url]', 'user_avatar_url'))),
+    ('delete_user', 'DELETE', '/v1/accounts/{account_id}/users/{id}', ('account_id', 'id')),
+    ('merge_user_into_another_user_destination_user_id', 'PUT', '/v1/users/{id}/merge_into/{destination_user_id}', ('id', 'destination_user_id')),
+    ('merge_user_into_another_user_accounts', 'PUT', '/v1/users/{id}/merge_into/accounts/{destination_account_id}/users/{destination_user_id}', ('id', 'destination_account_id', 'destination_user_id')),
+    ('get_user_profile', 'GET', '/v1/users/{user_id}/profile', ('user_id',)),
+    ('list_avatar_options', 'GET', '/v1/users/{user_id}/avatars', ('user_id', 'per_page')),
+    ('list_user_page_views', 'GET', '/v1/users/{user_id}/page_views', ('user_id', 'start_time', 'end_time', 'per_page')),
+    ('store_custom_data', 'PUT', '/v1/users/{user_id}/custom_data/{scope}', ('user_id', 'scope', 'ns', 'data')),
+    ('load_custom_data', 'GET', '/v1/users/{user_id}/custom_data/{scope}', ('user_id', 'scope', 'ns')),
+    ('delete_custom_data', 'DELETE', '/v1/users/{user_id}/custom_data/{scope}', ('user_id', 'scope', 'ns')),
+])
 
 
 def list_users_in_account(request_ctx, account_id, search_term=None,
@@ -33,20 +58,7 @@ administrative queries will only be compared against name.
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    include_types = ('avatar_url', 'email', 'last_login', 'time_zone')
-    utils.validate_attr_is_acceptable(include, include_types)
-    path = '/v1/accounts/{account_id}/users'
-    payload = {
-        'include[]': include,
-        'search_term': search_term,
-        'per_page': per_page,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_users_in_account'].request(request_ctx, request_kwargs, (account_id,), {'search_term': search_term, 'include[]': include, 'per_page': per_page})
 
 
 def list_activity_stream_self(request_ctx, **request_kwargs):
@@ -150,11 +162,7 @@ def list_activity_stream_self(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_activity_stream_self'].request(request_ctx, request_kwargs, (), None)
 
 
 def list_activity_stream_activity_stream(request_ctx, **request_kwargs):
@@ -258,11 +266,7 @@ def list_activity_stream_activity_stream(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_activity_stream_activity_stream'].request(request_ctx, request_kwargs, (), None)
 
 
 def activity_stream_summary(request_ctx, **request_kwargs):
@@ -276,11 +280,7 @@ def activity_stream_summary(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/activity_stream/summary'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['activity_stream_summary'].request(request_ctx, request_kwargs, (), None)
 
 
 def list_todo_items(request_ctx, **request_kwargs):
@@ -303,11 +303,7 @@ def list_todo_items(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/todo'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_todo_items'].request(request_ctx, request_kwargs, (), None)
 
 
 def list_upcoming_assignments_calendar_events(request_ctx, **request_kwargs):
@@ -322,11 +318,7 @@ def list_upcoming_assignments_calendar_events(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/upcoming_events'
-    url = request_ctx.base_api_url + path.format()
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_upcoming_assignments_calendar_events'].request(request_ctx, request_kwargs, (), None)
 
 
 def hide_stream_item(request_ctx, id, **request_kwargs):
@@ -342,11 +334,7 @@ def hide_stream_item(request_ctx, id, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/activity_stream/{id}'
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['hide_stream_item'].request(request_ctx, request_kwargs, (id,), None)
 
 
 def hide_all_stream_items(request_ctx, **request_kwargs):
@@ -360,11 +348,7 @@ def hide_all_stream_items(request_ctx, **request_kwargs):
 
     """
 
-    path = '/v1/users/self/activity_stream'
-    url = request_ctx.base_api_url + path.format()
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['hide_all_stream_items'].request(request_ctx, request_kwargs, (), None)
 
 
 def upload_file(request_ctx, user_id, **request_kwargs):
@@ -388,11 +372,7 @@ def upload_file(request_ctx, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/files'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.post(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['upload_file'].request(request_ctx, request_kwargs, (user_id,), None)
 
 
 def create_user(request_ctx, account_id, pseudonym_unique_id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_birthdate=None, user_terms_of_use=None, pseudonym_password=None, pseudonym_sis_user_id=None, pseudonym_send_confirmation=None, communication_channel_type=None, communication_channel_address=None, communication_channel_skip_confirmation=None, **request_kwargs):
@@ -441,27 +421,7 @@ def create_user(request_ctx, account_id, pseudonym_unique_id, user_name=None, us
 
     """
 
-    path = '/v1/accounts/{account_id}/users'
-    payload = {
-        'user[name]' : user_name,
-        'user[short_name]' : user_short_name,
-        'user[sortable_name]' : user_sortable_name,
-        'user[time_zone]' : user_time_zone,
-        'user[locale]' : user_locale,
-        'user[birthdate]' : user_birthdate,
-        'user[terms_of_use]' : user_terms_of_use,
-        'pseudonym[unique_id]' : pseudonym_unique_id,
-        'pseudonym[password]' : pseudonym_password,
-        'pseudonym[sis_user_id]' : pseudonym_sis_user_id,
-        'pseudonym[send_confirmation]' : pseudonym_send_confirmation,
-        'communication_channel[type]' : communication_channel_type,
-        'communication_channel[address]' : communication_channel_address,
-        'communication_channel[skip_confirmation]' : communication_channel_skip_confirmation,
-    }
-    url = request_ctx.base_api_url + path.format(account_id=account_id)
-    response = client.post(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['create_user'].request(request_ctx, request_kwargs, (account_id,), {'pseudonym[unique_id]': pseudonym_unique_id, 'user[name]': user_name, 'user[short_name]': user_short_name, 'user[sortable_name]': user_sortable_name, 'user[time_zone]': user_time_zone, 'user[locale]': user_locale, 'user[birthdate]': user_birthdate, 'user[terms_of_use]': user_terms_of_use, 'pseudonym[password]': pseudonym_password, 'pseudonym[sis_user_id]': pseudonym_sis_user_id, 'pseudonym[send_confirmation]': pseudonym_send_confirmation, 'communication_channel[type]': communication_channel_type, 'communication_channel[address]': communication_channel_address, 'communication_channel[skip_confirmation]': communication_channel_skip_confirmation})
 
 
 def update_user_settings(request_ctx, id, manual_mark_as_read, **request_kwargs):
@@ -479,14 +439,7 @@ def update_user_settings(request_ctx, id, manual_mark_as_read, **request_kwargs)
 
     """
 
-    path = '/v1/users/{id}/settings'
-    payload = {
-        'manual_mark_as_read' : manual_mark_as_read,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['update_user_settings'].request(request_ctx, request_kwargs, (id,), {'manual_mark_as_read': manual_mark_as_read})
 
 
 def edit_user(request_ctx, id, user_name=None, user_short_name=None, user_sortable_name=None, user_time_zone=None, user_locale=None, user_avatar_token=None, user_avatar_url=None, **request_kwargs):
@@ -516,20 +469,7 @@ def edit_user(request_ctx, id, user_name=None, user_short_name=None, user_sortab
 
     """
 
-    path = '/v1/users/{id}'
-    payload = {
-        'user[name]' : user_name,
-        'user[short_name]' : user_short_name,
-        'user[sortable_name]' : user_sortable_name,
-        'user[time_zone]' : user_time_zone,
-        'user[locale]' : user_locale,
-        'user[avatar][token]' : user_avatar_token,
-        'user[avatar][url]' : user_avatar_url,
-    }
-    url = request_ctx.base_api_url + path.format(id=id)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['edit_user'].request(request_ctx, request_kwargs, (id,), {'user[name]': user_name, 'user[short_name]': user_short_name, 'user[sortable_name]': user_sortable_name, 'user[time_zone]': user_time_zone, 'user[locale]': user_locale, 'user[avatar][token]': user_avatar_token, 'user[avatar][url]': user_avatar_url})
 
 
 def delete_user(request_ctx, account_id, id, **request_kwargs):
@@ -550,11 +490,7 @@ def delete_user(request_ctx, account_id, id, **request_kwargs):
 
     """
 
-    path = '/v1/accounts/{account_id}/users/{id}'
-    url = request_ctx.base_api_url + path.format(account_id=account_id, id=id)
-    response = client.delete(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_user'].request(request_ctx, request_kwargs, (account_id, id), None)
 
 
 def merge_user_into_another_user_destination_user_id(request_ctx, id, destination_user_id, **request_kwargs):
@@ -578,11 +514,7 @@ def merge_user_into_another_user_destination_user_id(request_ctx, id, destinatio
 
     """
 
-    path = '/v1/users/{id}/merge_into/{destination_user_id}'
-    url = request_ctx.base_api_url + path.format(id=id, destination_user_id=destination_user_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['merge_user_into_another_user_destination_user_id'].request(request_ctx, request_kwargs, (id, destination_user_id), None)
 
 
 def merge_user_into_another_user_accounts(request_ctx, id, destination_account_id, destination_user_id, **request_kwargs):
@@ -608,11 +540,7 @@ def merge_user_into_another_user_accounts(request_ctx, id, destination_account_i
 
     """
 
-    path = '/v1/users/{id}/merge_into/accounts/{destination_account_id}/users/{destination_user_id}'
-    url = request_ctx.base_api_url + path.format(id=id, destination_account_id=destination_account_id, destination_user_id=destination_user_id)
-    response = client.put(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['merge_user_into_another_user_accounts'].request(request_ctx, request_kwargs, (id, destination_account_id, destination_user_id), None)
 
 
 def get_user_profile(request_ctx, user_id, **request_kwargs):
@@ -631,11 +559,7 @@ def get_user_profile(request_ctx, user_id, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/profile'
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, **request_kwargs)
-
-    return response
+    return ENDPOINTS['get_user_profile'].request(request_ctx, request_kwargs, (user_id,), None)
 
 
 def list_avatar_options(request_ctx, user_id, per_page=None, **request_kwargs):
@@ -661,16 +585,7 @@ def list_avatar_options(request_ctx, user_id, per_page=None, **request_kwargs):
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/avatars'
-    payload = {
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_avatar_options'].request(request_ctx, request_kwargs, (user_id,), {'per_page': per_page})
 
 
 def list_user_page_views(request_ctx, user_id, start_time=None, end_time=None, per_page=None, **request_kwargs):
@@ -694,18 +609,7 @@ def list_user_page_views(request_ctx, user_id, start_time=None, end_time=None, p
 
     """
 
-    if per_page is None:
-        per_page = request_ctx.per_page
-    path = '/v1/users/{user_id}/page_views'
-    payload = {
-        'start_time' : start_time,
-        'end_time' : end_time,
-        'per_page' : per_page,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['list_user_page_views'].request(request_ctx, request_kwargs, (user_id,), {'start_time': start_time, 'end_time': end_time, 'per_page': per_page})
 
 
 def store_custom_data(request_ctx, user_id, scope, ns, data, **request_kwargs):
@@ -867,15 +771,7 @@ def store_custom_data(request_ctx, user_id, scope, ns, data, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-        'data' : data,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.put(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['store_custom_data'].request(request_ctx, request_kwargs, (user_id, scope), {'ns': ns, 'data': data})
 
 
 def load_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
@@ -905,14 +801,7 @@ def load_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['load_custom_data'].request(request_ctx, request_kwargs, (user_id, scope), {'ns': ns})
 
 
 def delete_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
@@ -1034,13 +923,6 @@ def delete_custom_data(request_ctx, user_id, scope, ns, **request_kwargs):
 
     """
 
-    path = '/v1/users/{user_id}/custom_data/{scope}'
-    payload = {
-        'ns' : ns,
-    }
-    url = request_ctx.base_api_url + path.format(user_id=user_id, scope=scope)
-    response = client.delete(request_ctx, url, payload=payload, **request_kwargs)
-
-    return response
+    return ENDPOINTS['delete_custom_data'].request(request_ctx, request_kwargs, (user_id, scope), {'ns': ns})
 
 
@@ -0,0 +1,298 @@
+"""
+Resumable file transfers.  A :class:`TransferManager` records the progress of its uploads and downloads in a
+:class:`TransferJournal`, a JSON-lines file on disk, so that a bulk migration that dies halfway picks up where it
+left off when it is run again with the same journal:
+
+    journal = TransferJournal('/var/tmp/migration.journal')
+    manager = TransferManager(request_context, journal, workers=4)
+    result = manager.download_folder(folder_id, '/data/course-files')
+
+Downloads are written to a '.part' file next to their destination and resumed from its size with an HTTP Range
+request.  Uploads can't be resumed partway (the upload url takes the whole file in a single multipart post), so
+they are resumed file by file: files the journal records as uploaded are skipped.  Either way, the finished items
+are checked against a single listing of the remote folder rather than a request per item.
+"""
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+from canvas_sdk import utils
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import files
+from canvas_sdk.uploads import upload_file_stream
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TRANSFER_WORKERS = 4
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Number of bytes downloaded between the checkpoints recorded in the journal
+DEFAULT_CHECKPOINT_BYTES = 8 * 1024 * 1024
+
+
+class TransferJournal(object):
+
+    """
+    An append-only JSON-lines journal of transfer states, keyed by item.  Each line is a json object with a "key"
+    and the item's latest state; the last line for a key wins.  A line cut short by a crash is ignored.  The
+    journal is compacted to one line per key when it is opened, and is safe to record to from several threads.
+
+    :param str path: Path of the journal file, created if it doesn't exist
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'rb') as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        log.warning('Ignoring an incomplete line in transfer journal %s', path)
+                        continue
+                    self.entries[entry.pop('key')] = entry
+            self.compact()
+        self._file = open(path, 'ab')
+
+    def get(self, key):
+        """
+        Return the latest entry recorded for a key, or None.
+        """
+        return self.entries.get(key)
+
+    def is_done(self, key):
+        entry = self.entries.get(key)
+        return entry is not None and entry.get('state') == 'done'
+
+    def record(self, key, **entry):
+        """
+        Record an entry for a key, replacing its previous entry, and flush it to disk.
+        """
+        line = json.dumps(dict(entry, key=key), sort_keys=True) + '\n'
+        with self._lock:
+            self.entries[key] = entry
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def compact(self):
+        """
+        Rewrite the journal with only the latest entry for each key.
+        """
+        temporary_path = self.path + '.tmp'
+        with open(temporary_path, 'wb') as journal_file:
+            for key in sorted(self.entries):
+                journal_file.write(json.dumps(dict(self.entries[key], key=key), sort_keys=True) + '\n')
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        _replace(temporary_path, self.path)
+
+    def close(self):
+        self._file.close()
+
+
+def _replace(source, destination):
+    """
+    Rename source to destination, replacing it if it exists.
+    """
+    if os.name == 'nt' and os.path.exists(destination):
+        os.remove(destination)
+    os.rename(source, destination)
+
+
+def _safe_name(name):
+    """
+    Make a remote file name safe to use as a local file name.
+    """
+    return name.replace('/', '_').replace(os.sep, '_')
+
+
+class TransferResult(namedtuple('TransferResult', ('transferred', 'skipped', 'failed'))):
+
+    """
+    The outcome of a batch of transfers: lists of the items transferred and skipped, and of (item, exception)
+    pairs for the transfers that failed.  Items are local paths for uploads and remote file ids for downloads.
+    """
+
+    __slots__ = ()
+
+
+class TransferManager(object):
+
+    """
+    Uploads and downloads files of the :py:mod:`canvas_sdk.methods.files` api on a pool of worker threads,
+    journaling their progress so that an interrupted batch can be resumed.  Since the workers share the request
+    context, create it with ``thread_local_sessions=True``.
+
+    :param RequestContext request_context: The context required to make an API call
+    :param TransferJournal journal: The journal of transfer states
+    :param int workers: (optional) Number of concurrent transfers.  Defaults to DEFAULT_TRANSFER_WORKERS.
+    :param int chunk_size: (optional) Number of bytes read or written at a time
+    :param int checkpoint_bytes: (optional) Number of bytes downloaded between journal checkpoints
+    """
+
+    def __init__(self, request_context, journal, workers=DEFAULT_TRANSFER_WORKERS, chunk_size=DEFAULT_CHUNK_SIZE,
+                 checkpoint_bytes=DEFAULT_CHECKPOINT_BYTES):
+        self.request_context = request_context
+        self.journal = journal
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.checkpoint_bytes = checkpoint_bytes
+
+    def list_folder(self, folder_id):
+        """
+        Return the json of the files in a remote folder, keyed by id.  This is the only request made to check
+        items that the journal records as done.
+        """
+        remote_files = utils.get_all_list_data(self.request_context, files.list_files_folders, folder_id)
+        return dict((remote_file['id'], remote_file) for remote_file in remote_files)
+
+    def _run(self, function, items, skipped):
+        result = TransferResult([], skipped, [])
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [(item, executor.submit(function, *arguments)) for item, arguments in items]
+            for item, future in futures:
+                error = future.exception()
+                if error is None:
+                    result.transferred.append(item)
+                else:
+                    log.warning('Transfer of %s failed: %s', item, error)
+                    result.failed.append((item, error))
+        finally:
+            executor.shutdown(wait=True)
+        return result
+
+    @staticmethod
+    def get_upload_key(path, folder_id):
+        return 'upload:%s:%s' % (folder_id, os.path.abspath(path))
+
+    def upload_files(self, paths, folder_id, on_duplicate='overwrite'):
+        """
+        Upload local files to a remote folder, skipping those the journal records as uploaded, unless the local
+        file has changed since or the uploaded file is no longer in the folder.
+
+        :param paths: Paths of the local files
+        :param folder_id: The folder to upload to
+        :param str on_duplicate: (optional) 'overwrite' (the default) or 'rename' a file of the same name
+        :rtype: TransferResult
+        """
+        remote_files = None
+        uploads = []
+        skipped = []
+        for path in paths:
+            key = self.get_upload_key(path, folder_id)
+            entry = self.journal.get(key)
+            if entry is not None and entry.get('state') == 'done':
+                if remote_files is None:
+                    remote_files = self.list_folder(folder_id)
+                stat = os.stat(path)
+                if (entry['file_id'] in remote_files and entry['size'] == stat.st_size and
+                        entry['mtime'] == stat.st_mtime):
+                    skipped.append(path)
+                    continue
+            uploads.append((path, (path, folder_id, on_duplicate)))
+        return self._run(self.upload_file, uploads, skipped)
+
+    def upload_file(self, path, folder_id, on_duplicate='overwrite'):
+        """
+        Upload a local file to a remote folder and record it in the journal.  Returns the uploaded file's json.
+        """
+        stat = os.stat(path)
+        response = upload_file_stream(self.request_context, files.upload_file, path, folder_id,
+                                      on_duplicate=on_duplicate, chunk_size=self.chunk_size)
+        remote_file = response.json()
+        self.journal.record(self.get_upload_key(path, folder_id), state='done', file_id=remote_file['id'],
+                            size=stat.st_size, mtime=stat.st_mtime)
+        return remote_file
+
+    @staticmethod
+    def get_download_key(remote_file):
+        return 'download:%s' % remote_file['id']
+
+    def download_folder(self, folder_id, directory):
+        """
+        Download the files of a remote folder into a local directory, skipping those the journal records as
+        downloaded, unless the remote file has changed since or the local copy is gone, and resuming partial
+        downloads.
+
+        :param folder_id: The folder to download
+        :param str directory: The local directory to download to, created if it doesn't exist
+        :rtype: TransferResult
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        downloads = []
+        skipped = []
+        for file_id, remote_file in sorted(self.list_folder(folder_id).iteritems()):
+            destination = os.path.join(directory, _safe_name(remote_file['display_name']))
+            entry = self.journal.get(self.get_download_key(remote_file))
+            if (entry is not None and entry.get('state') == 'done' and
+                    entry['updated_at'] == remote_file.get('updated_at') and
+                    os.path.exists(destination) and os.path.getsize(destination) == remote_file['size']):
+                skipped.append(file_id)
+                continue
+            downloads.append((file_id, (remote_file, destination)))
+        return self._run(self.download_file, downloads, skipped)
+
+    def download_file(self, remote_file, destination):
+        """
+        Download a remote file (its json, as listed or returned by :py:func:`canvas_sdk.methods.files.get_file`)
+        to a local path, resuming a partial download of the same version of the file.  Returns the destination.
+
+        :raises CanvasAPIError: if the download is refused
+        :raises IOError: if the download ends before the whole file is received
+        """
+        key = self.get_download_key(remote_file)
+        size = remote_file['size']
+        updated_at = remote_file.get('updated_at')
+        part_path = destination + '.part'
+        entry = self.journal.get(key)
+        offset = 0
+        if entry is not None and entry.get('updated_at') == updated_at and os.path.exists(part_path):
+            offset = min(os.path.getsize(part_path), size)
+        context = self.request_context
+        # the file's url carries its own verifier (and redirects off the Canvas host), so it's fetched without auth
+        response = requests.get(remote_file['url'], headers={'Range': 'bytes=%d-' % offset} if offset else None,
+                                stream=True, timeout=context.timeout, proxies=context.proxies,
+                                verify=context.verify, cert=context.cert)
+        try:
+            if response.status_code == 416 and offset == size:
+                pass  # the part file is complete
+            elif response.status_code >= 400:
+                raise CanvasAPIError(status_code=response.status_code, msg=response.text.strip())
+            else:
+                if response.status_code != 206:
+                    offset = 0  # the range was ignored, so start over
+                self._write_download(response, part_path, offset, key, size, updated_at)
+        finally:
+            response.close()
+        if os.path.getsize(part_path) != size:
+            raise IOError('Download of %s ended after %d of %d bytes' % (
+                remote_file['url'], os.path.getsize(part_path), size))
+        _replace(part_path, destination)
+        self.journal.record(key, state='done', size=size, updated_at=updated_at, path=destination)
+        return destination
+
+    def _write_download(self, response, part_path, offset, key, size, updated_at):
+        with open(part_path, 'r+b' if offset else 'wb') as part_file:
+            part_file.seek(offset)
+            part_file.truncate()
+            # record which version of the file the part file holds, so that it can be resumed from its size
+            self.journal.record(key, state='partial', offset=offset, size=size, updated_at=updated_at)
+            checkpoint = offset
+            for chunk in response.iter_content(self.chunk_size):
+                part_file.write(chunk)
+                offset += len(chunk)
+                if offset - checkpoint >= self.checkpoint_bytes:
+                    part_file.flush()
+                    self.journal.record(key, state='partial', offset=offset, size=size, updated_at=updated_at)
+                    checkpoint = offset
@@ -0,0 +1,363 @@
+"""
+Streaming file uploads.  Uploading a file to Canvas takes three requests (see
+https://canvas.instructure.com/doc/api/file.file_uploads.html): the upload_file method of the context the file
+goes to (e.g. :py:func:`canvas_sdk.methods.files.upload_file`) tells Canvas about the file and returns an upload
+url, the file is posted to that url as multipart/form-data, and the upload is confirmed by following the redirect
+that comes back.  :py:func:`upload_file_stream` runs all three, sending the file in chunks straight from disk with
+a :class:`MultipartEncoder`, so uploads take constant memory whatever the size of the file:
+
+    response = upload_file_stream(request_context, files.upload_file, '/path/to/lecture.mp4', folder_id,
+                                  progress=lambda sent, total: log.info('%d of %d bytes', sent, total))
+    file_id = response.json()['id']
+
+Whole directory trees are mirrored into a course's files with :class:`FolderUploader`.
+"""
+import logging
+import mimetypes
+import os
+import sys
+import urllib
+import uuid
+from collections import namedtuple
+
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+from canvas_sdk import client, utils
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import files
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Parameters of the first step that upload_file_stream takes as keyword arguments
+UPLOAD_PARAMETERS = ('parent_folder_id', 'parent_folder_path', 'on_duplicate')
+
+
+def _encode(value):
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return str(value)
+
+
+def _quote(value):
+    """
+    Quote a form field or file name for a Content-Disposition header.
+    """
+    return _encode(value).replace('\r', '').replace('\n', '').replace('"', '%22')
+
+
+class MultipartEncoder(object):
+
+    """
+    A multipart/form-data request body that is read in chunks: the form fields, then a single file part whose
+    content is read from a file object as the body is read, then the closing boundary.  Its length is known up
+    front, so requests sends it with a Content-Length header (which S3 upload urls require) instead of chunked
+    transfer encoding.
+
+    :param fields: (name, value) pairs of the form fields sent before the file, in order
+    :param str file_field: Name of the file's form field
+    :param str filename: Name of the file
+    :param fileobj: A file object opened in binary mode, positioned at the start of the content
+    :param int size: Number of bytes of content to read from fileobj
+    :param str content_type: (optional) Content type of the file.  Defaults to 'application/octet-stream'.
+    :param int chunk_size: (optional) Number of bytes of the file read at a time
+    :param function progress: (optional) Called with (bytes of the file read, size) after each chunk
+    """
+
+    def __init__(self, fields, file_field, filename, fileobj, size, content_type=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        head = []
+        for name, value in fields:
+            head.append('--%s\r\nContent-Disposition: form-data; name="%s"\r\n\r\n%s\r\n' % (
+                self.boundary, _quote(name), _encode(value)))
+        head.append('--%s\r\nContent-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                    'Content-Type: %s\r\n\r\n' % (self.boundary, _quote(file_field), _quote(filename),
+                                                  content_type or 'application/octet-stream'))
+        self.head = ''.join(head)
+        self.tail = '\r\n--%s--\r\n' % self.boundary
+        self.fileobj = fileobj
+        self.size = size
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.bytes_read = 0
+        self._parts = self._iter_parts()
+        self._buffer = ''
+
+    def __len__(self):
+        return len(self.head) + self.size + len(self.tail)
+
+    def _iter_parts(self):
+        yield self.head
+        while self.bytes_read < self.size:
+            chunk = self.fileobj.read(min(self.chunk_size, self.size - self.bytes_read))
+            if not chunk:
+                raise IOError('File ended after %d of %d bytes' % (self.bytes_read, self.size))
+            self.bytes_read += len(chunk)
+            if self.progress:
+                self.progress(self.bytes_read, self.size)
+            yield chunk
+        yield self.tail
+
+    def read(self, size=-1):
+        """
+        Read up to size bytes of the body, or the rest of it if size is negative.  Returns '' at the end.
+        """
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            chunk = next(self._parts, None)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            length += len(chunk)
+        data = ''.join(chunks)
+        if 0 <= size < len(data):
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ''
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def get_file_size(fileobj):
+    """
+    Return the number of bytes from a file object's current position to its end, or None if it can't be told.
+    """
+    try:
+        return os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+    except (AttributeError, IOError, OSError):
+        pass
+    try:
+        position = fileobj.tell()
+        fileobj.seek(0, os.SEEK_END)
+        size = fileobj.tell() - position
+        fileobj.seek(position)
+        return size
+    except (AttributeError, IOError, OSError):
+        return None
+
+
+def _raise_for_upload_status(response):
+    if response.status_code >= 400:
+        raise CanvasAPIError(status_code=response.status_code, msg=response.text.strip())
+
+
+def upload_file_stream(request_context, function, file, *args, **kwargs):
+    """
+    Upload a file with all three steps of the Canvas file upload flow, streaming it from disk.  The function is
+    called with args and kwargs, plus the file's name, size and content type (and the keyword arguments in
+    UPLOAD_PARAMETERS), to get the upload url.  The file is then posted there in chunks with a
+    :class:`MultipartEncoder`, without the Canvas auth token, and the upload is confirmed with a GET of the
+    redirect location.
+
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The upload_file API function of the file's destination, e.g.
+            :py:func:`canvas_sdk.methods.files.upload_file` or
+            :py:func:`canvas_sdk.methods.submissions.upload_file_courses`
+        :param file: A path, or a file object opened in binary mode (which is read from its current position
+            and left open)
+        :param str name: (optional) Name of the file in Canvas.  Defaults to the base name of the file.
+        :param int size: (optional) Size of the file in bytes; required for file objects whose size can't be told
+        :param str content_type: (optional) Defaults to the type guessed from the name
+        :param str parent_folder_id: (optional) Folder to upload to, for uploads to a user, group or course
+        :param str parent_folder_path: (optional) Path of the folder to upload to, created if it doesn't exist
+        :param str on_duplicate: (optional) 'overwrite' or 'rename' a file of the same name in the folder
+        :param function progress: (optional) Called with (bytes sent, size) as the file is uploaded
+        :param int chunk_size: (optional) Number of bytes read from the file at a time
+        :return: The response of the confirmation request, whose json is the uploaded file
+        :rtype: requests.Response
+        :raises CanvasAPIError: if the upload is rejected
+        :raises ValueError: if the file's name or size can't be determined
+    """
+    name = kwargs.pop('name', None)
+    size = kwargs.pop('size', None)
+    content_type = kwargs.pop('content_type', None)
+    progress = kwargs.pop('progress', None)
+    chunk_size = kwargs.pop('chunk_size', DEFAULT_CHUNK_SIZE)
+    data = dict(kwargs.pop('data', None) or {})
+    for parameter in UPLOAD_PARAMETERS:
+        if parameter in kwargs:
+            data[parameter] = kwargs.pop(parameter)
+
+    if isinstance(file, basestring):
+        fileobj = open(file, 'rb')
+        name = name or os.path.basename(file)
+    else:
+        fileobj = file
+        if not name and isinstance(getattr(fileobj, 'name', None), basestring):
+            name = os.path.basename(fileobj.name)
+    try:
+        if not name:
+            raise ValueError('A name is required to upload a file object without one')
+        if size is None:
+            size = get_file_size(fileobj)
+            if size is None:
+                raise ValueError('A size is required to upload a file object whose size can\'t be told')
+        content_type = content_type or mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        data.update(name=name, size=size, content_type=content_type)
+
+        # Step 1: tell Canvas about the file
+        upload = function(request_context, *args, data=data, **kwargs).json()
+
+        # Step 2: post the file to the upload url, which may not be on the Canvas host, so without its auth token
+        encoder = MultipartEncoder(
+            sorted(upload.get('upload_params', {}).iteritems()), 'file', name, fileobj, size, content_type,
+            chunk_size=chunk_size, progress=progress)
+        response = requests.post(
+            upload['upload_url'], data=encoder, headers={'Content-Type': encoder.content_type},
+            allow_redirects=False, timeout=request_context.timeout, proxies=request_context.proxies,
+            verify=request_context.verify, cert=request_context.cert)
+    finally:
+        if fileobj is not file:
+            fileobj.close()
+    _raise_for_upload_status(response)
+
+    # Step 3: confirm the upload.  A redirect must be followed for the file to be made available; a 201 Created
+    # may come with the file's json, or just the location to get it from.
+    location = response.headers.get('Location')
+    if location and (300 <= response.status_code < 400 or not response.content):
+        return client.get(request_context, location)
+    return response
+
+
+class SyncResult(namedtuple('SyncResult', ('uploaded', 'skipped', 'failed'))):
+
+    """
+    The outcome of :py:meth:`FolderUploader.sync`: lists of the local paths uploaded and skipped, and of (local
+    path, exception) pairs for the uploads that failed.
+    """
+
+    __slots__ = ()
+
+
+class FolderUploader(object):
+
+    """
+    Mirrors local directory trees into the files of a course.  Remote folders are looked up with
+    :py:func:`canvas_sdk.methods.files.resolve_path_courses_full_path` (and created with
+    :py:func:`canvas_sdk.methods.files.create_folder_courses` if they don't exist) once each, and their ids are
+    cached for the life of the uploader.  Files whose name and size match a file already in the remote folder
+    are skipped, and the rest are uploaded with :py:func:`upload_file_stream` on a pool of worker threads.
+    Folders are resolved and listed on the calling thread, in top-down order, while the workers upload.
+
+    Since the workers share the request context, create it with ``thread_local_sessions=True`` and a
+    ``pool_maxsize`` of at least the number of workers.
+
+    :param RequestContext request_context: The context required to make an API call
+    :param course_id: The course to upload to
+    :param int workers: (optional) Number of files uploaded concurrently.  Defaults to DEFAULT_UPLOAD_WORKERS.
+    :param str on_duplicate: (optional) What Canvas does when a file of the same name but a different size is
+        uploaded: 'overwrite' (the default) or 'rename'
+    :param function progress: (optional) Called with (local path, bytes sent, size) as each file is uploaded
+    """
+
+    def __init__(self, request_context, course_id, workers=DEFAULT_UPLOAD_WORKERS, on_duplicate='overwrite',
+                 progress=None):
+        self.request_context = request_context
+        self.course_id = course_id
+        self.workers = workers
+        self.on_duplicate = on_duplicate
+        self.progress = progress
+        # remote folder path (relative to the course's root folder, '' for the root) -> folder id
+        self.folder_ids = {}
+
+    def get_folder_id(self, path):
+        """
+        Return the id of the remote folder at a path relative to the course's root folder, creating the folder
+        (and its parents) if it doesn't exist.
+        """
+        path = path.strip('/')
+        folder_id = self.folder_ids.get(path)
+        if folder_id is not None:
+            return folder_id
+        try:
+            if path:
+                response = files.resolve_path_courses_full_path(
+                    self.request_context, self.course_id, urllib.quote(path.encode('utf-8'), safe='/'))
+            else:
+                response = files.resolve_path_courses(self.request_context, self.course_id)
+        except CanvasAPIError as error:
+            if error.status_code != 404:
+                raise
+            parent, _, name = path.rpartition('/')
+            folder = files.create_folder_courses(
+                self.request_context, self.course_id, name, self.get_folder_id(parent), None,
+                None, None, None, None, None).json()
+            self.folder_ids[path] = folder['id']
+        else:
+            # the response lists every folder from the root down, so cache the ancestors as well
+            parts = path.split('/') if path else []
+            for depth, folder in enumerate(response.json()):
+                self.folder_ids.setdefault('/'.join(parts[:depth]), folder['id'])
+        return self.folder_ids[path]
+
+    def get_remote_sizes(self, folder_id):
+        """
+        Return a dictionary of the names and sizes of the files in a remote folder.
+        """
+        remote_files = utils.get_all_list_data(self.request_context, files.list_files_folders, folder_id)
+        return dict((remote_file['display_name'], remote_file['size']) for remote_file in remote_files)
+
+    def upload(self, path, folder_id):
+        """
+        Upload a local file to a remote folder.
+        """
+        progress = None
+        if self.progress:
+            progress = lambda sent, total: self.progress(path, sent, total)
+        return upload_file_stream(self.request_context, files.upload_file, path, folder_id,
+                                  on_duplicate=self.on_duplicate, progress=progress)
+
+    def sync(self, local_root, remote_root=''):
+        """
+        Upload the files of a local directory tree that aren't in the remote folder tree already, and wait for
+        the uploads to finish.  Failed uploads are logged and returned, so a sync can simply be run again.
+
+        :param str local_root: The local directory to upload
+        :param str remote_root: (optional) The remote folder path the directory is mirrored to, relative to the
+            course's root folder.  Defaults to the root folder.
+        :rtype: SyncResult
+        """
+        if isinstance(local_root, str):
+            local_root = local_root.decode(sys.getfilesystemencoding() or 'utf-8')
+        result = SyncResult([], [], [])
+        uploads = []
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for directory, subdirectories, names in os.walk(local_root):
+                subdirectories.sort()
+                relative_directory = os.path.relpath(directory, local_root)
+                remote_path = remote_root.strip('/')
+                if relative_directory != os.curdir:
+                    remote_path = '/'.join(
+                        part for part in [remote_path] + relative_directory.split(os.sep) if part)
+                folder_id = self.get_folder_id(remote_path)
+                remote_sizes = self.get_remote_sizes(folder_id) if names else {}
+                for name in sorted(names):
+                    path = os.path.join(directory, name)
+                    if remote_sizes.get(name) == os.path.getsize(path):
+                        result.skipped.append(path)
+                        continue
+                    uploads.append((path, executor.submit(self.upload, path, folder_id)))
+            for path, upload in uploads:
+                error = upload.exception()
+                if error is None:
+                    result.uploaded.append(path)
+                else:
+                    log.warning('Upload of %s failed: %s', path, error)
+                    result.failed.append((path, error))
+        finally:
+            executor.shutdown(wait=True)
+        return result
@@ -1,4 +1,13 @@
+import Queue
+import threading
+import urllib
+import urlparse
+from itertools import repeat
+
+from concurrent.futures import ThreadPoolExecutor
+
 from canvas_sdk import client
+from canvas_sdk.records import get_record_converter
 from collections import defaultdict
 
 """
@@ -10,7 +19,8 @@ def validate_attr_is_acceptable(value, acceptable_values=[], allow_none=True):
     """
     Test an input value against a list of acceptable values.  A value of None may or may
     not be considered valid.  If the input is not valid, an Attribute error is raised, otherwise
-    nothing is returned.
+    nothing is returned.  Pass the acceptable values as a frozenset to make the check a hash
+    lookup; the generated methods do.
     """
     if type(value) not in (list, tuple):
         value = [value]
@@ -20,6 +30,8 @@ def validate_attr_is_acceptable(value, acceptable_values=[], allow_none=True):
             # that the value is not None and that None is not an allowable value before raising
             # an exception
             if v is not None or not allow_none:
+                if isinstance(acceptable_values, (set, frozenset)):
+                    acceptable_values = tuple(sorted(acceptable_values))
                 raise AttributeError("%s must be one of %s" % (v, acceptable_values))
 
 
@@ -37,17 +49,133 @@ def validate_any(param_choices, *args, **kwargs):
 
 def get_next(request_context, response):
     """
-    Generator function that will iterate over a given response's "next" header links.
+    Iterate over a given response's "next" header links.  If the request context has a prefetch_depth, the
+    "next" pages are fetched on a background thread as soon as this is called, keeping up to prefetch_depth
+    responses queued ahead of the caller; otherwise each page is requested when the iterator is advanced.
 
         :param :class:RequestContext request_context: The context required to make a "get" request
         :return: next response object retrieved by client
         :rtype: iterator
     """
+    if request_context.prefetch_depth:
+        return _PrefetchIterator(request_context, response, request_context.prefetch_depth)
+    return _iter_next(request_context, response)
+
+
+def _iter_next(request_context, response):
+    """
+    Generator function that will iterate over a given response's "next" header links.
+    """
     while 'next' in response.links:
         response = client.get(request_context, response.links["next"]["url"])
         yield response
 
 
+def _prefetch_pages(request_context, response, pages, stop):
+    """
+    Background thread target that puts each "next" response (or the exception raised while fetching it) on
+    the pages queue, followed by a (None, None) end marker.  Returns early once the stop event is set.
+    """
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
+
+    try:
+        for next_response in _iter_next(request_context, response):
+            if not put((next_response, None)):
+                return
+    except Exception as error:
+        put((None, error))
+        return
+    put((None, None))
+
+
+class _PrefetchIterator(object):
+
+    """
+    Iterator over "next" responses that are fetched on a background thread into a bounded queue.  The thread
+    stops once the iterator is exhausted, closed, or garbage collected.
+    """
+
+    def __init__(self, request_context, response, depth):
+        self._pages = Queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._done = False
+        thread = threading.Thread(
+            target=_prefetch_pages, args=(request_context, response, self._pages, self._stop))
+        thread.daemon = True
+        thread.start()
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._done:
+            raise StopIteration
+        next_response, error = self._pages.get()
+        if error is not None:
+            self.close()
+            raise error
+        if next_response is None:
+            self.close()
+            raise StopIteration
+        return next_response
+
+    __next__ = next
+
+    def close(self):
+        self._done = True
+        self._stop.set()
+
+    def __del__(self):
+        self._stop.set()
+
+
+def get_link_page(response, rel):
+    """
+    Return the numeric "page" query parameter of one of a response's header links, or None if the link
+    is missing or uses bookmark-style (non-numeric) pagination.
+
+        :param response: A requests.Response returned by a paged API call
+        :param str rel: The link relation, e.g. "next" or "last"
+        :rtype: int or None
+    """
+    return _get_link_int_param(response, rel, 'page')
+
+
+def _get_link_int_param(response, rel, name):
+    """
+    Return the numeric value of a query parameter of one of a response's header links, or None.
+    """
+    link = response.links.get(rel)
+    if not link:
+        return None
+    query = urlparse.parse_qs(urlparse.urlsplit(link['url']).query)
+    try:
+        return int(query[name][0])
+    except (KeyError, ValueError):
+        return None
+
+
+def build_page_url(url, page):
+    """
+    Return the given paged url with its "page" query parameter replaced by page.
+    """
+    scheme, netloc, path, query, fragment = urlparse.urlsplit(url)
+    params = [(k, str(page) if k == 'page' else v)
+              for k, v in urlparse.parse_qsl(query, keep_blank_values=True)]
+    return urlparse.urlunsplit((scheme, netloc, path, urllib.urlencode(params), fragment))
+
+
+def _get_page_json(request_context, url):
+    return client.get(request_context, url).json()
+
+
 def get_all_list_data(request_context, function, *args, **kwargs):
     """
     Make a function request with args and kwargs and iterate over the "next" responses until exhausted.
@@ -57,20 +185,105 @@ def get_all_list_data(request_context, function, *args, **kwargs):
     that exception will be bubbled back to the caller and any intermediary results will be lost.  Worst case
     complexity O(n).
 
+    If a "parallel" keyword argument is given (it is not passed through to the function) and the initial
+    response has numbered "next" and "last" links, the remaining pages are requested directly by page number
+    using up to that many concurrent requests over the context's session, and their data is concatenated in
+    page order.  Bookmark-style pagination falls back to following "next" links one at a time.
+
+    If a "record_type" or "fields" keyword argument is given, each page's json objects are converted to compact
+    records (see :py:mod:`canvas_sdk.records`) as the page arrives, keeping only the given fields.
+
 
         :param RequestContext request_context: The context required to make an API call
         :param function function: The API function to call
+        :param int parallel: (optional) Maximum number of pages to request concurrently
+        :param record_type: (optional) A :class:`Record <canvas_sdk.records.Record>` type to convert json objects to
+        :param fields: (optional) The json keys to keep, projecting record_type (or a new record type) to them
         :return: A list of all json data retrieved while iterating over response links, or the initial json
             function response if there are no paged results
         :rtype: list of json data or json
     """
+    parallel = kwargs.pop('parallel', None)
+    to_record = get_record_converter(kwargs.pop('record_type', None), kwargs.pop('fields', None))
     response = function(request_context, *args, **kwargs)
     data = response.json()
-    for next_response in get_next(request_context, response):
-        data.extend(next_response.json())
+    if to_record:
+        data = _convert_records(data, to_record)
+    elif isinstance(data, list):
+        # copy the first page, since the response's decoded json may be memoized and shared
+        data = list(data)
+    next_page = parallel and get_link_page(response, 'next')
+    last_page = next_page and get_link_page(response, 'last')
+    if last_page:
+        next_url = response.links['next']['url']
+        page_urls = [build_page_url(next_url, page) for page in range(next_page, last_page + 1)]
+        executor = ThreadPoolExecutor(max_workers=parallel)
+        try:
+            for page_data in executor.map(_get_page_json, repeat(request_context), page_urls):
+                data.extend(_convert_records(page_data, to_record))
+        finally:
+            executor.shutdown(wait=True)
+    else:
+        for next_response in get_next(request_context, response):
+            data.extend(_convert_records(next_response.json(), to_record))
     return data
 
 
+def _convert_records(json_data, to_record):
+    """
+    Convert a page of json objects (or a single one) with to_record, if given.
+    """
+    if to_record is None:
+        return json_data
+    if isinstance(json_data, list):
+        return [to_record(item) for item in json_data]
+    return to_record(json_data)
+
+
+def iter_list_data(request_context, function, *args, **kwargs):
+    """
+    Make a function request with args and kwargs and lazily iterate over the records of the initial response
+    and each of its "next" responses.  Unlike get_all_list_data, pages are only requested as records are
+    consumed and each page is released once its records have been yielded, so memory use stays flat regardless
+    of the size of the result set.  A response whose json data is not a list is yielded as a single record.
+    The following keyword arguments are consumed here and not passed through to the function:
+
+        :param RequestContext request_context: The context required to make an API call
+        :param function function: The API function to call
+        :param int max_items: (optional) Stop after this many records have been yielded
+        :param function stop_when: (optional) Callable that is passed each record; iteration stops (without
+            yielding that record) as soon as it returns a truthy value
+        :param record_type: (optional) A :class:`Record <canvas_sdk.records.Record>` type to convert json objects to
+        :param fields: (optional) The json keys to keep, projecting record_type (or a new record type) to them
+        :return: json records (or records of record_type) retrieved while iterating over response links
+        :rtype: iterator
+    """
+    max_items = kwargs.pop('max_items', None)
+    stop_when = kwargs.pop('stop_when', None)
+    to_record = get_record_converter(kwargs.pop('record_type', None), kwargs.pop('fields', None))
+    if max_items is not None and max_items <= 0:
+        return
+    response = function(request_context, *args, **kwargs)
+    next_responses = get_next(request_context, response)
+    count = 0
+    while response is not None:
+        page = response.json()
+        if not isinstance(page, list):
+            page = [page]
+        if to_record:
+            page = [to_record(item) for item in page]
+        for record in page:
+            if stop_when is not None and stop_when(record):
+                return
+            yield record
+            count += 1
+            if max_items is not None and count >= max_items:
+                return
+        # Drop our references to the consumed page before requesting the next one
+        page = response = None
+        response = next(next_responses, None)
+
+
 def masquerade(request_context, function, as_user_id, *args, **kwargs):
     """
     Make a function request on behalf of another user.  In order to masquerade, the calling user must
@@ -90,12 +303,36 @@ def masquerade(request_context, function, as_user_id, *args, **kwargs):
 
 def get_count(request_context, function, *args, **kwargs):
     """
-    Make a function request with args and kwargs and return the total result count.  Worst case complexity
-    is O(n).
+    Make a function request with args and kwargs and return the total result count.  When the initial response
+    has a numbered "last" link and the page size is known (from the per_page parameter of the link, or from the
+    size of the first page when there is a "next" page), only the last page is requested and the count is
+    computed from the page numbers.  Otherwise, every "next" page is requested and its records counted.  Best
+    case complexity is O(1) pages, worst case O(n).
 
         :param RequestContext request_context: The context required to make an API call
         :param function function: The API function to call
         :return: Total result count
         :rtype: int
     """
-    return len(get_all_list_data(request_context, function, *args, **kwargs))
+    response = function(request_context, *args, **kwargs)
+    count = _count_records(response.json())
+    last_page = get_link_page(response, 'last')
+    if last_page == 1:
+        return count
+    if last_page:
+        per_page = _get_link_int_param(response, 'last', 'per_page')
+        if per_page is None and 'next' in response.links:
+            per_page = count  # Every page but the last is full
+        if per_page:
+            last_response = client.get(request_context, response.links['last']['url'])
+            return (last_page - 1) * per_page + _count_records(last_response.json())
+    for next_response in get_next(request_context, response):
+        count += _count_records(next_response.json())
+    return count
+
+
+def _count_records(json_data):
+    """
+    Return the number of records in a page of json data; data that isn't a list is a single record.
+    """
+    return len(json_data) if isinstance(json_data, list) else 1
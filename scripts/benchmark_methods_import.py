@@ -0,0 +1,54 @@
+"""
+Compare the cost of importing canvas_sdk.methods lazily with importing every
+method module up front.  Each measurement runs in a fresh interpreter so
+that nothing is already in sys.modules.  The client and its dependencies
+(requests) are imported before the clock starts, so that only the method
+modules are measured.
+
+    python benchmark_methods_import.py [--runs N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMED_IMPORT = """
+import time
+import canvas_sdk.client
+import canvas_sdk.utils
+start = time.time()
+%s
+print(time.time() - start)
+"""
+
+# The eager case imports every module by its full name, which imports it whether or not the package is lazy, so it
+# is the cost that lazy imports avoid
+CASES = [
+    ('package import', 'import canvas_sdk.methods'),
+    ('star import (lazy)', 'from canvas_sdk.methods import *'),
+    ('one module', 'from canvas_sdk.methods import courses; courses.list_your_courses'),
+    ('all modules (eager)', 'import importlib, pkgutil\nimport canvas_sdk.methods as m\n'
+                            'for _, name, _ in pkgutil.iter_modules(m.__path__):\n'
+                            '    importlib.import_module("canvas_sdk.methods." + name)'),
+]
+
+
+def time_import(statement):
+    output = subprocess.check_output([sys.executable, '-c', TIMED_IMPORT % statement], cwd=BASE_DIR)
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark imports of canvas_sdk.methods')
+    parser.add_argument('--runs', type=int, default=10, help='number of interpreters to time each case in')
+    args = parser.parse_args()
+    for label, statement in CASES:
+        timings = sorted(time_import(statement) for _ in range(args.runs))
+        print '%-20s best %.1f ms, median %.1f ms' % (
+            label, timings[0] * 1000, timings[len(timings) // 2] * 1000)
+
+
+if __name__ == '__main__':
+    main()
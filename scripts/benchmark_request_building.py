@@ -0,0 +1,73 @@
+"""
+Measure the per-call overhead of building a request in a generated method,
+with the client call itself replaced by a no-op.  "inline" is the shape the
+generated methods had before the endpoint table: enum tuples built on every
+call, a linear validation scan and str.format on the path template.
+"endpoint" is the current code path through canvas_sdk.endpoints.  The cases
+are timed in turn over many short repeats and the best of each is reported,
+so that a busy machine slows them alike.
+
+    python benchmark_request_building.py [--number N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from canvas_sdk import client, utils
+from canvas_sdk.client import RequestContext
+from canvas_sdk.methods import sections
+
+
+def inline_list_course_sections(request_ctx, course_id, include=None, per_page=None, **request_kwargs):
+    if per_page is None:
+        per_page = request_ctx.per_page
+    include_types = ('students', 'avatar_url')
+    utils.validate_attr_is_acceptable(include, include_types)
+    path = '/v1/courses/{course_id}/sections'
+    payload = {
+        'include[]' : include,
+        'per_page' : per_page,
+    }
+    url = request_ctx.base_api_url + path.format(course_id=course_id)
+    response = client.get(request_ctx, url, payload=payload, **request_kwargs)
+
+    return response
+
+
+def no_op(request_ctx, url, **kwargs):
+    return url
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark request building in generated methods')
+    parser.add_argument('--number', type=int, default=20000, help='number of calls in each repeat of a case')
+    parser.add_argument('--repeat', type=int, default=50, help='number of repeats of each case')
+    args = parser.parse_args()
+    request_ctx = RequestContext('token', 'https://canvas.example.edu/api', per_page=50)
+    client.get = no_op
+    cases = [
+        ('inline', inline_list_course_sections),
+        ('endpoint', sections.list_course_sections),
+    ]
+    timers = [(label, timeit.Timer(lambda function=function: function(request_ctx, 1234, 'avatar_url')))
+              for label, function in cases]
+    best = dict((label, float('inf')) for label, _ in cases)
+    for _ in xrange(args.repeat):
+        for label, timer in timers:
+            best[label] = min(best[label], timer.timeit(number=args.number))
+    for label, _ in cases:
+        print '%-10s %.2f us per call' % (label, best[label] / args.number * 1e6)
+    for label, acceptable_values in [('tuple', ('needs_grading_count', 'syllabus_body', 'total_scores', 'term',
+                                                'course_progress', 'sections')),
+                                     ('frozenset', frozenset(('needs_grading_count', 'syllabus_body', 'total_scores',
+                                                              'term', 'course_progress', 'sections')))]:
+        timer = timeit.Timer(lambda: utils.validate_attr_is_acceptable('sections', acceptable_values))
+        best = min(timer.repeat(repeat=args.repeat, number=args.number))
+        print 'validate against %-10s %.2f us per call' % (label, best / args.number * 1e6)
+
+
+if __name__ == '__main__':
+    main()
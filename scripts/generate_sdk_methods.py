@@ -34,6 +34,17 @@ The script will create a new directory relative to the CWD called
 """
 METHODS_DIR = BASE_DIR+'/canvas_sdk/methods'
 
+"""
+The record types built from the models in the Canvas meta api are written
+to this module
+"""
+RECORD_TYPES_FILE = BASE_DIR+'/canvas_sdk/record_types.py'
+
+"""
+Model properties that can be record fields
+"""
+FIELD_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
 """
 parameters to replace the pre_attachment[*] parameter in the Canvas meta api
 """
@@ -129,23 +140,30 @@ def is_array_param(param):
     return param.get('tags') and param['tags']['type'] == 'array'
 
  
-def build_payload(parameters):
+def get_endpoint_arguments(parameters):
     """
-    build_payload creates a list of parameters to be used in the payload of
-    the api call
+    get_endpoint_arguments lists the parameters of the method call, in the
+    order of the parameter list, for its row of the ENDPOINTS table. Path
+    parameters and parameters sent under their own name are listed by name,
+    others as a (payload key, name) pair
     """
-    payload = []
+    arg_list = []
+    opt_list = []
     for param in parameters:
-        """
-        Do not include path parameters in the payload
-        """
-        if param['paramType'] != 'path':
+        param_name = check_param(flatten_param(param['name']))
+        if param['paramType'] == 'path':
+            argument = param['name']
+        else:
             field_name = clean_param(param['name'])
-            field = flatten_param(field_name)
             if is_array_param(param):
                 field_name += '[]'
-            payload.append("'{0}': {1},".format(field_name, check_param(field)))
-    return payload
+            argument = param_name if field_name == param_name else (field_name, param_name)
+        if param['required']:
+            arg_list.append(argument)
+        else:
+            opt_list.append(argument)
+
+    return arg_list + opt_list
 
 
 def format_parameter(param, required):
@@ -202,44 +220,64 @@ def get_parameter_descriptions(parameters):
     return lines + opt_lines
 
 
-def get_path_parameters(parameters):
+def get_enums(parameters):
     """
-    get paramters creates the parameter list for the method call
+    Check for the existance of enums in the parameter list. Returns a list of
+    (parameter name, enum names) pairs for the ENDPOINTS table, which the
+    method validates its arguments against.
+
+    Enum params are just flat strings so there is not need to flatten them.
     """
-    
-    param_list = []
+    enums = []
     for param in parameters:
-        if param['paramType'] == 'path':
-            param_name = param['name']
-            param_list.append('{0}={1}'.format(param_name, param_name))
-    return param_list
+        if 'enum' in param:
+            param_name = check_param(flatten_param(param['name']))
+            enums.append((param_name, tuple(param['enum'])))
+    return enums
 
 
-def check_for_enums(parameters):
+def to_str(value):
+    """
+    Convert the unicode strings in the meta api data to str, so that they
+    are written out without a u prefix
     """
-    Check for the existance of enums in the parameter list. 
-    If an enum exists, we need to build a tuple of the emum names
-    as well as the code that will validate the the enum. We create
-    two lists one that contains the enums as tuples and another that contains
-    the valdiate code. The method returns a list that consistes of these
-    two lists joined with the enums followed by the validate code.
+    if isinstance(value, tuple):
+        return tuple(to_str(v) for v in value)
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
 
-    Enum params are just flat strings so there is not need to flatten them.
+
+def format_endpoint_row(method_name, http_method, api_path, arguments, enums):
     """
-    
-    enum_line = ''
-    enum_lines = []
-    validate_enums = []
-    for param in parameters:
-        if 'enum' in param:
-            param_name = check_param(flatten_param(param['name']))
-            param_enum = param['enum']
-            enum_line = param_name + '_types = ('
-            enums = ", ".join("'{0}'".format(p) for p in param_enum)
-            enum_line += enums + ')'
-            enum_lines.append(enum_line)
-            validate_enums.append('utils.validate_attr_is_acceptable('+param_name+', ' +param_name+'_types)')
-    return enum_lines + validate_enums
+    format_endpoint_row builds the row of the ENDPOINTS table for a method
+    """
+    row = (method_name, http_method, api_path, tuple(arguments))
+    if enums:
+        row += (tuple(enums),)
+    return line_format(repr(to_str(row)) + ',', FOUR)
+
+
+def format_wrapper_call(method_name, api_path, arguments, call_args):
+    """
+    format_wrapper_call builds the body of a method, which passes its
+    endpoint the tuple of values filling the path template, in path order,
+    and the payload dictionary (None when there are no payload arguments),
+    both written out as literals
+    """
+    path_names = re.findall(r'\{([^}]+)\}', api_path)
+    path_values = [call_args[arguments.index(name)] for name in path_names]
+    payload_values = []
+    for argument, call_arg in zip(arguments, call_args):
+        if not isinstance(argument, tuple):
+            if argument in path_names:
+                continue
+            argument = (argument, call_arg)
+        payload_values.append(repr(to_str(argument[0])) + ': ' + call_arg)
+    path = '(' + ', '.join(path_values) + (',)' if len(path_values) == 1 else ')')
+    payload = '{' + ', '.join(payload_values) + '}' if payload_values else 'None'
+    return line_format("return ENDPOINTS['" + method_name + "'].request(" + ', '.join(
+        ['request_ctx', 'request_kwargs', path, payload]) + ')', FOUR)
 
 
 def convert(name):
@@ -283,13 +321,14 @@ def check_for_pre_attachment_param(parameters):
 def build_method(method_name, description, parameters, api_path, http_method, summary, return_type):
     """
     build method is used build the methods of the class we are processing.
+    It returns the method's row of the ENDPOINTS table and the source of the
+    method, a thin wrapper around the endpoint.
     """
-    allow_per_page = False
     parameters = check_for_pre_attachment_param(parameters)
     arg_list = get_parameters(parameters)
     param_descriptions = get_parameter_descriptions(parameters)
-    payload = build_payload(parameters)
-    enums = check_for_enums(parameters)
+    arguments = get_endpoint_arguments(parameters)
+    enums = get_enums(parameters)
 
     """
     If the method returns an array, allow the per_page parameter for paging
@@ -298,9 +337,9 @@ def build_method(method_name, description, parameters, api_path, http_method, su
         arg_list.append('per_page=None')
         param_descriptions.append(':param per_page: (optional) Set how many results canvas should return, defaults to config.LIMIT_PER_PAGE')
         param_descriptions.append(':type per_page: integer or None')
-        payload.append('\'per_page\': per_page,')
-        allow_per_page = True
-        
+        arguments.append('per_page')
+
+    call_args = [arg.replace('=None', '') for arg in arg_list]
     arg_list.append('**request_kwargs')
     
     """
@@ -332,59 +371,28 @@ def build_method(method_name, description, parameters, api_path, http_method, su
     content += line_format('"""', FOUR)
     content += line_format('', NONE)
     
-    """
-    Add the per_page check
-    """
-    if allow_per_page:
-        content += line_format('if per_page is None:', FOUR)
-        content += line_format('per_page = request_ctx.per_page', EIGHT)
-
-    """
-    Add any enums if they exist.
-    """
-    for enum in enums:
-        content += line_format(enum, FOUR)
-    
-    """
-    Add the api path
-    """
-    path_formatted = 'path = \'' + api_path + '\''
-    content += line_format(path_formatted, FOUR)
-    
-    """
-    Add a payload if one exists
-    """
-    payload_string = ''
-    if payload:
-        content += line_format('payload = {', FOUR)
-        for item in payload:
-            content += line_format(item, EIGHT)
-        content += line_format('}', FOUR)
-        payload_string = ', payload=payload'
-
-    content += line_format('url = request_ctx.base_api_url + path.format(' + ', '.join(get_path_parameters(parameters)) + ')', FOUR)
-    content += line_format(
-        'response = client.'+http_method.lower()+'(request_ctx, url' + payload_string + ', **request_kwargs)', FOUR)
-    
-    content += line_format('', NONE)
-    content += line_format('return response', FOUR)
+    content += format_wrapper_call(method_name, api_path, arguments, call_args)
     content += line_format('', NONE)
     content += line_format('', NONE)
-    return content
+    row = format_endpoint_row(method_name, http_method, api_path, arguments, enums)
+    return row, content
 
 
-def build_module(json_api_url):
+def build_module(json_api_url, models=None):
     """
     build class reads in the api call for a class and contructs a class object 
-    to be written to a file.
+    to be written to a file. The models described in the api call are added
+    to the models dictionary, if one is given.
     """
     resp = urllib2.urlopen(json_api_url)
     json_resp = json.load(resp)
     apis = json_resp['apis']
+    if models is not None:
+        models.update(json_resp.get('models') or {})
+
+    rows = ''
+    methods = ''
 
-    content = line_format('from canvas_sdk import client, utils', NONE)
-    content += '\n\n'
-    
     """
     Extract the data needed to build the method from the json source
     """
@@ -397,11 +405,54 @@ def build_module(json_api_url):
         parameters = operations['parameters']
         summary = operations['summary']
         return_type = operations['type']
-        content += build_method(
-            method_name, description, parameters, api_path, http_method, 
+        row, method = build_method(
+            method_name, description, parameters, api_path, http_method,
             summary, return_type)
+        rows += row
+        methods += method
+
+    return build_module_content(rows, methods)
+
+
+def build_module_content(rows, methods):
+    """
+    build_module_content puts together a module from its ENDPOINTS table rows
+    and its methods. client and utils are still imported so that code that
+    patches them through the method modules keeps working
+    """
+    content = line_format('from canvas_sdk import client, utils', NONE)
+    content += line_format('from canvas_sdk.endpoints import Endpoint', NONE)
+    content += '\n'
+    content += line_format('ENDPOINTS = Endpoint.table([', NONE)
+    content += rows
+    content += line_format('])', NONE)
+    content += '\n\n'
+    content += methods
     return content
 
+def build_record_types(models):
+    """
+    build_record_types creates the record_types module, with a compact
+    record type (see canvas_sdk/records.py) for each model in the meta api.
+    Properties whose names can't be attribute names are left out.
+    """
+    content = line_format('"""', NONE)
+    content += line_format('Record types for the models of the Canvas api, generated by scripts/generate_sdk_methods.py.', NONE)
+    content += line_format('"""', NONE)
+    content += line_format('from canvas_sdk.records import record_type', NONE)
+    for model_name in sorted(models):
+        class_name = to_str(re.sub(r'\W', '', model_name))
+        if not class_name or not FIELD_NAME_PATTERN.match(class_name):
+            continue
+        fields = tuple(to_str(name) for name in sorted(models[model_name].get('properties') or {})
+                       if FIELD_NAME_PATTERN.match(name) and not keyword.iskeyword(name))
+        if not fields:
+            continue
+        content += '\n'
+        content += line_format(class_name + ' = record_type(' + repr(class_name) + ', ' + repr(fields) + ', __name__)', NONE)
+    return content
+
+
 def create_sdk_directories():
     """
     Create the canvas_sdk/methods directory if it doesn't already exist
@@ -469,6 +520,7 @@ def main(argv=None):
     modules
     """
 
+    models = {}
     for api in apis:
         path = api['path']
         url = base_api_url + path
@@ -476,10 +528,14 @@ def main(argv=None):
         python_file_name = METHODS_DIR + file_name + '.py'
         with open(python_file_name, 'w') as python_file:
             print 'Creating '+ python_file_name + '...'
-            python_file_content = build_module(url)
+            python_file_content = build_module(url, models)
             python_file.write(python_file_content)
         python_file.close()
 
+    with open(RECORD_TYPES_FILE, 'w') as record_types_file:
+        print 'Creating ' + RECORD_TYPES_FILE + '...'
+        record_types_file.write(build_record_types(models))
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -31,9 +31,12 @@ setup(
     zip_safe=False,
     install_requires=[
         'requests',
+        'futures',
     ],
     extras_require={
         'docs': ['sphinx>=1.2.0'],
+        'fast_json': ['ujson'],
+        'parquet': ['pyarrow'],
     },
     test_suite='tests',
     tests_require=[
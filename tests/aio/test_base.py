@@ -0,0 +1,83 @@
+import unittest
+
+from mock import patch
+from concurrent.futures import Future
+
+from canvas_sdk import aio
+from canvas_sdk.aio import base
+from canvas_sdk.aio import AsyncRequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+
+
+class TestAsyncBase(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.url = "https://path/to/canvas/api/fake/path/to/method"
+        self.req_ctx = AsyncRequestContext('my-auth-token', 'https://path/to/canvas/api', max_workers=2)
+        self.addCleanup(self.req_ctx.shutdown)
+        self.payload = {'foo': 'bar'}
+        self.request_kwargs = {'headers': {'my': 'header'}, 'timeout': 30}
+
+    @patch('canvas_sdk.aio.base.base.get')
+    def test_get_returns_future_resolving_to_client_get(self, get_mock):
+        """
+        Test that the call to get returns a future whose result is the result of client get
+        """
+        result = aio.get(self.req_ctx, self.url)
+        self.assertIsInstance(result, Future, "Call to 'get' should return a future")
+        self.assertEqual(result.result(), get_mock.return_value,
+                         "Future should resolve to the result of the blocking 'get' method")
+
+    @patch('canvas_sdk.aio.base.base.get')
+    def test_get_passes_payload_and_request_kwargs(self, get_mock):
+        """
+        Test that the call to get passes context, url, payload and request kwargs through to client get
+        """
+        aio.get(self.req_ctx, self.url, self.payload, **self.request_kwargs).result()
+        get_mock.assert_called_once_with(self.req_ctx, self.url, self.payload, **self.request_kwargs)
+
+    @patch('canvas_sdk.aio.base.base.put')
+    def test_put_passes_payload_and_request_kwargs(self, put_mock):
+        """
+        Test that the call to put passes context, url, payload and request kwargs through to client put
+        """
+        result = aio.put(self.req_ctx, self.url, self.payload, **self.request_kwargs).result()
+        put_mock.assert_called_once_with(self.req_ctx, self.url, self.payload, **self.request_kwargs)
+        self.assertEqual(result, put_mock.return_value)
+
+    @patch('canvas_sdk.aio.base.base.post')
+    def test_post_passes_payload_and_request_kwargs(self, post_mock):
+        """
+        Test that the call to post passes context, url, payload and request kwargs through to client post
+        """
+        result = aio.post(self.req_ctx, self.url, self.payload, **self.request_kwargs).result()
+        post_mock.assert_called_once_with(self.req_ctx, self.url, self.payload, **self.request_kwargs)
+        self.assertEqual(result, post_mock.return_value)
+
+    @patch('canvas_sdk.aio.base.base.delete')
+    def test_delete_passes_payload_and_request_kwargs(self, delete_mock):
+        """
+        Test that the call to delete passes context, url, payload and request kwargs through to client delete
+        """
+        result = aio.delete(self.req_ctx, self.url, self.payload, **self.request_kwargs).result()
+        delete_mock.assert_called_once_with(self.req_ctx, self.url, self.payload, **self.request_kwargs)
+        self.assertEqual(result, delete_mock.return_value)
+
+    @patch('canvas_sdk.aio.base.base.call')
+    def test_call_passes_action_url_and_context(self, call_mock):
+        """
+        Test that the call method passes its arguments through to client call
+        """
+        base.call("GET", self.url, self.req_ctx, max_retries=3).result()
+        call_mock.assert_called_once_with("GET", self.url, self.req_ctx, max_retries=3)
+
+    @patch('canvas_sdk.aio.base.base.get')
+    def test_get_future_raises_canvas_api_error(self, get_mock):
+        """
+        Test that an error raised by the blocking request is raised when reading the future's result
+        """
+        get_mock.side_effect = CanvasAPIError(status_code=404)
+        future = aio.get(self.req_ctx, self.url)
+        with self.assertRaises(CanvasAPIError):
+            future.result()
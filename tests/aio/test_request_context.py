@@ -0,0 +1,77 @@
+import unittest
+
+import mock
+from mock import patch
+
+from canvas_sdk.aio import AsyncRequestContext
+
+
+class TestAsyncRequestContext(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.auth_token = 'my-auth-token'
+        self.base_api_url = 'http://fake/canvas/instance/api'
+
+    def test_initialize_max_workers_defaults_to_ten(self):
+        """
+        Test that if max_workers is not passed in, the value defaults to ten
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url)
+        self.assertEqual(10, context.max_workers, "max_workers should default to ten on creation")
+
+    def test_initialize_passes_request_context_settings(self):
+        """
+        Test that RequestContext settings are accepted and set on the async context
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url, max_retries=3, per_page=50)
+        self.assertEqual(3, context.max_retries)
+        self.assertEqual(50, context.per_page)
+
+    def test_sessions_are_thread_local_by_default(self):
+        """
+        Test that the worker threads get sessions of their own unless thread_local_sessions is turned off
+        """
+        self.assertTrue(AsyncRequestContext(self.auth_token, self.base_api_url).thread_local_sessions)
+        context = AsyncRequestContext(self.auth_token, self.base_api_url, thread_local_sessions=False)
+        self.assertFalse(context.thread_local_sessions)
+
+    def test_session_mounts_adapter_sized_to_max_workers(self):
+        """
+        Test that the created session has an adapter whose pool can hold max_workers connections
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url, max_workers=25)
+        adapter = context.session.get_adapter('https://fake/canvas/instance/api')
+        self.assertEqual(25, adapter._pool_maxsize, "Connection pool should be sized to max_workers")
+
+    @patch('canvas_sdk.aio.request_context.ThreadPoolExecutor')
+    def test_executor_created_once_with_max_workers(self, mock_executor):
+        """
+        Test that accessing the executor property lazily creates a single executor sized to max_workers
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url, max_workers=7)
+        context.executor
+        context.executor
+        mock_executor.assert_called_once_with(max_workers=7)
+
+    def test_submit_calls_function_with_context(self):
+        """
+        Test that submit runs the function with the context as its first argument
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url)
+        context.executor = mock.MagicMock(name='executor')
+        function = mock.Mock(name='sdk-method')
+        context.submit(function, 'arg', kwarg='val')
+        context.executor.submit.assert_called_once_with(function, context, 'arg', kwarg='val')
+
+    def test_shutdown_shuts_down_executor_and_expires_session(self):
+        """
+        Test that shutdown stops the executor and clears out the stored session
+        """
+        context = AsyncRequestContext(self.auth_token, self.base_api_url)
+        executor = mock.MagicMock(name='executor')
+        context.executor = executor
+        context.session = mock.Mock(name='session')
+        context.shutdown()
+        executor.shutdown.assert_called_once_with(wait=True)
+        self.assertIsNone(context._session, "Session should be expired after shutdown")
@@ -1,11 +1,14 @@
+import threading
 import unittest
 
 import mock
 from mock import patch
-from requests.exceptions import HTTPError
+import requests
+from requests.exceptions import ConnectionError, HTTPError, Timeout
 
 from canvas_sdk import client
 from canvas_sdk.client import base
+from canvas_sdk.client.cache import MemoryCache
 from canvas_sdk.exceptions import (
     SDKException, CanvasAPIError, InvalidOAuthTokenError)
 
@@ -34,11 +37,18 @@ class TestBase(unittest.TestCase):
         self.req_ctx.base_api_url = self.base_api_url
         self.req_ctx.session = self.session
         self.req_ctx.max_retries = 0
+        self.req_ctx.retry_policy = None
+        self.req_ctx.throttle = None
+        self.req_ctx.rate_limiter = None
+        self.req_ctx.cache = None
+        self.req_ctx.coalesce_gets = False
+        self.req_ctx.json_backend = None
         self.payload = {'foo': 'bar'}
         self.request_kwargs = {'headers': {'my': 'header'}, 'timeout': 30}
 
     def make_retry_call_with_error_code(self, http_error_code, max_retries=None,
-                                        error_json=None, response_headers=None):
+                                        error_json=None, response_headers=None,
+                                        response_text=''):
         """
         Makes a call that will raise an http error in order to potentially
         trigger the request being retried up to "max_retries" times.  Otherwise,
@@ -50,6 +60,7 @@ class TestBase(unittest.TestCase):
         self.session.request.return_value.json.return_value = error_json or {}
         # Response headers
         self.session.request.return_value.headers = response_headers or {}
+        self.session.request.return_value.text = response_text
 
         with self.assertRaises(SDKException) as canvas_error:
             base.call("GET", self.url, self.req_ctx, max_retries=max_retries)
@@ -97,6 +108,53 @@ class TestBase(unittest.TestCase):
             dictionary, {'foo': {'key1': 'val1', 'new': 'value'}},
             "The value should have been merged into the existing key on the dictionary")
 
+    def test_normalize_payload_drops_none_values(self):
+        """
+        Test that keys with a value of None are not sent
+        """
+        self.assertEqual(base.normalize_payload({'foo': 'bar', 'search_term': None}), [('foo', 'bar')])
+
+    def test_normalize_payload_expands_lists(self):
+        """
+        Test that list values are sent as one pair per item, skipping None items
+        """
+        self.assertEqual(base.normalize_payload([('include[]', ['a', None, 'b'])]),
+                         [('include[]', 'a'), ('include[]', 'b')])
+
+    def test_normalize_payload_encodes_booleans(self):
+        """
+        Test that booleans are sent as 'true' and 'false', including in lists
+        """
+        self.assertEqual(base.normalize_payload([('hidden', True), ('published', False), ('flags[]', [True])]),
+                         [('hidden', 'true'), ('published', 'false'), ('flags[]', 'true')])
+
+    def test_normalize_payload_keeps_other_values(self):
+        """
+        Test that numbers and zero are not dropped or encoded, and that string bodies are passed through
+        """
+        self.assertEqual(base.normalize_payload([('position', 0), ('points', 1.5)]), [('position', 0), ('points', 1.5)])
+        self.assertEqual(base.normalize_payload('raw body'), 'raw body')
+        self.assertIsNone(base.normalize_payload(None))
+
+    @patch('canvas_sdk.client.base.call')
+    def test_get_makes_call_with_normalized_params(self, call_mock):
+        """
+        Test that get merges the payload into the params and normalizes them before making the call
+        """
+        client.get(self.req_ctx, self.url, {'include[]': ['a', 'b'], 'search_term': None},
+                   params={'as_user_id': 1})
+        call_mock.assert_called_once_with("GET", self.url, self.req_ctx, params=mock.ANY)
+        self.assertItemsEqual(call_mock.call_args[1]['params'],
+                              [('include[]', 'a'), ('include[]', 'b'), ('as_user_id', 1)])
+
+    @patch('canvas_sdk.client.base.call')
+    def test_post_makes_call_with_normalized_data(self, call_mock):
+        """
+        Test that post normalizes its data before making the call
+        """
+        client.post(self.req_ctx, self.url, {'module[published]': True, 'module[name]': None})
+        call_mock.assert_called_once_with("POST", self.url, self.req_ctx, data=[('module[published]', 'true')])
+
     @patch('canvas_sdk.client.base.merge_or_create_key_value_for_dictionary')
     @patch('canvas_sdk.client.base.call')
     def test_get_returns_call(self, call_mock, merge_mock):
@@ -561,3 +619,298 @@ class TestBase(unittest.TestCase):
             error_code, max_retries=1, response_headers=resp_headers)
 
         self.assertIs(type(canvas_error), CanvasAPIError)
+
+    def test_call_retries_connection_errors_up_to_max_retries(self):
+        """
+        Test that a request that fails to connect is retried up to max_retries
+        times before the connection error is raised back to the caller.
+        """
+        max_retries = 2
+        self.session.request.side_effect = ConnectionError()
+        with self.assertRaises(ConnectionError):
+            base.call("GET", self.url, self.req_ctx, max_retries=max_retries)
+        self.assertEqual(max_retries + 1, self.session.request.call_count,
+                         "Call should have been made 'max_retries' + 1 times")
+
+    def test_call_returns_response_after_retried_timeout(self):
+        """
+        Test that a request that times out and then succeeds returns the
+        successful response.
+        """
+        response = mock.MagicMock(name='response')
+        self.session.request.side_effect = [Timeout(), response]
+        result = base.call("GET", self.url, self.req_ctx, max_retries=1)
+        self.assertEqual(result, response)
+
+    @patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_waits_on_retry_policy_between_attempts(self):
+        """
+        Test that the context's retry policy is asked to wait before each retry
+        with the retry count and the failed response.
+        """
+        self.req_ctx.retry_policy = mock.MagicMock(name='retry-policy')
+        self.make_retry_call_with_error_code(503, max_retries=2)
+        self.assertEqual(
+            self.req_ctx.retry_policy.wait.call_args_list,
+            [mock.call(0, self.session.request.return_value),
+             mock.call(1, self.session.request.return_value)])
+
+    def test_call_waits_on_retry_policy_without_response_after_connection_error(self):
+        """
+        Test that the retry policy is passed no response when the request
+        failed to connect.
+        """
+        self.req_ctx.retry_policy = mock.MagicMock(name='retry-policy')
+        self.session.request.side_effect = [ConnectionError(), mock.MagicMock()]
+        base.call("GET", self.url, self.req_ctx, max_retries=1)
+        self.req_ctx.retry_policy.wait.assert_called_once_with(0, None)
+
+    def test_call_retries_rate_limit_exceeded_403(self):
+        """
+        Test that a 403 "Rate Limit Exceeded" response is retried up to
+        max_retries times.
+        """
+        max_retries = 2
+        canvas_error = self.make_retry_call_with_error_code(
+            403, max_retries=max_retries,
+            response_text='403 Forbidden (Rate Limit Exceeded)')
+        self.assertEqual(max_retries + 1, self.session.request.call_count,
+                         "Call should have been made 'max_retries' + 1 times")
+        self.assertIs(type(canvas_error), CanvasAPIError)
+
+    def test_call_does_not_retry_other_403(self):
+        """
+        Test that a 403 response that isn't a rate limit error is not retried.
+        """
+        self.make_retry_call_with_error_code(
+            403, max_retries=2, response_text='user not authorized to perform that action')
+        self.assertEqual(1, self.session.request.call_count,
+                         "Request call should have been made only once")
+
+    def test_call_waits_on_throttle_and_updates_it_with_response(self):
+        """
+        Test that the context's throttle is consulted before the request is
+        sent and updated with the response.
+        """
+        throttle = mock.MagicMock(name='throttle')
+        throttle.wait.side_effect = lambda: self.assertFalse(self.session.request.called)
+        self.req_ctx.throttle = throttle
+        base.call("GET", self.url, self.req_ctx)
+        throttle.wait.assert_called_once_with()
+        throttle.update.assert_called_once_with(self.session.request.return_value)
+
+    @patch('canvas_sdk.client.base.RETRY_ERROR_CODES', (503,))
+    def test_call_acquires_rate_limiter_token_for_each_attempt(self):
+        """
+        Test that a token is acquired from the context's rate limiter before
+        the initial request and each retry.
+        """
+        self.req_ctx.rate_limiter = mock.MagicMock(name='rate-limiter')
+        self.make_retry_call_with_error_code(503, max_retries=2)
+        self.assertEqual(3, self.req_ctx.rate_limiter.acquire.call_count)
+
+    def test_call_installs_json_backend_on_response(self):
+        """
+        Test that the returned response decodes its json with the context's json backend, once
+        """
+        self.req_ctx.json_backend = mock.Mock(name='json-backend')
+        self.session.request.return_value = requests.Response()
+        self.session.request.return_value._content = '[]'
+        self.session.request.return_value.status_code = 200
+        response = base.call("GET", self.url, self.req_ctx)
+        self.assertIs(response.json(), self.req_ctx.json_backend.loads.return_value)
+        response.json()
+        self.req_ctx.json_backend.loads.assert_called_once_with('[]')
+
+    def test_call_get_with_cached_response_sends_conditional_request(self):
+        """
+        Test that a GET for which a response is cached is made conditional and
+        that a 304 reply returns the cached response.
+        """
+        cached_response = mock.MagicMock(name='cached-response', headers={'ETag': '"abc"'})
+        self.req_ctx.auth_token = 'my-token'
+        self.req_ctx.cache = MemoryCache()
+        key = self.req_ctx.cache.build_key(self.url, {'foo': 'bar'}, 'my-token')
+        self.req_ctx.cache.set(key, cached_response)
+        self.session.request.return_value.status_code = 304
+
+        result = base.call("GET", self.url, self.req_ctx, params={'foo': 'bar'},
+                           headers={'my': 'header'})
+        self.assertIs(result, cached_response)
+        self.assertEqual(self.session.request.call_args[1]['headers'],
+                         {'my': 'header', 'If-None-Match': '"abc"'})
+
+    def test_call_get_stores_response_with_etag(self):
+        """
+        Test that a successful GET response carrying an ETag is cached.
+        """
+        self.req_ctx.auth_token = 'my-token'
+        self.req_ctx.cache = MemoryCache()
+        self.session.request.return_value.status_code = 200
+        self.session.request.return_value.headers = {'ETag': '"abc"'}
+
+        result = base.call("GET", self.url, self.req_ctx)
+        key = self.req_ctx.cache.build_key(self.url, None, 'my-token')
+        self.assertIs(self.req_ctx.cache.get(key), result)
+
+    def test_get_caches_response_for_non_ascii_unicode_params(self):
+        """
+        Test that a GET with non-ASCII unicode params is cached under a key
+        built from their UTF-8 encoding.
+        """
+        self.req_ctx.auth_token = 'my-token'
+        self.req_ctx.cache = MemoryCache()
+        self.session.request.return_value.status_code = 200
+        self.session.request.return_value.headers = {'ETag': '"abc"'}
+
+        result = base.get(self.req_ctx, self.url, {'search_term': u'caf\xe9'})
+        key = self.req_ctx.cache.build_key(self.url, {'search_term': 'caf\xc3\xa9'}, 'my-token')
+        self.assertIs(self.req_ctx.cache.get(key), result)
+
+    def test_call_invalidates_cache_after_non_get_requests(self):
+        """
+        Test that requests other than GET don't look up the cache, but
+        invalidate the cached responses for the url once they succeed.
+        """
+        self.req_ctx.cache = mock.MagicMock(name='cache')
+        base.call("PUT", self.url, self.req_ctx)
+        self.assertEqual(self.req_ctx.cache.mock_calls, [mock.call.invalidate(self.url)])
+
+    def test_call_get_returns_fresh_cached_response_without_request(self):
+        """
+        Test that a cached response the cache policy considers fresh is
+        returned without making a request.
+        """
+        cached_response = mock.MagicMock(name='cached-response')
+        self.req_ctx.cache = mock.MagicMock(name='cache')
+        self.req_ctx.cache.lookup.return_value = (cached_response, True)
+        result = base.call("GET", self.url, self.req_ctx)
+        self.assertIs(result, cached_response)
+        self.assertFalse(self.session.request.called)
+
+    def run_concurrent_single_flights(self, function, key_1, key_2):
+        """
+        Run single_flight for key_1 on one thread, blocking it inside function
+        until single_flight for key_2 has been called on a second thread (and,
+        if the keys match, is waiting on the first).  Returns the results or
+        exceptions of both calls.
+        """
+        entered, release, follower_waiting = threading.Semaphore(0), threading.Event(), threading.Event()
+        results = {}
+
+        class WaitingEvent(threading._Event):
+            def wait(self, timeout=None):
+                follower_waiting.set()
+                return super(WaitingEvent, self).wait(timeout)
+
+        def blocking_function():
+            entered.release()
+            release.wait(5)
+            return function()
+
+        def run(name, key):
+            try:
+                results[name] = base.single_flight(key, blocking_function)
+            except BaseException as error:
+                results[name] = error
+
+        with patch('canvas_sdk.client.base.threading.Event', WaitingEvent):
+            leader = threading.Thread(target=run, args=('leader', key_1))
+            leader.start()
+            entered.acquire()
+            follower = threading.Thread(target=run, args=('follower', key_2))
+            follower.start()
+            if key_1 == key_2:
+                follower_waiting.wait(5)
+            else:
+                entered.acquire()
+            release.set()
+            leader.join(5)
+            follower.join(5)
+        return results
+
+    def test_single_flight_shares_result_of_concurrent_call_with_same_key(self):
+        """
+        Test that a call made while an identical one is in flight waits for
+        and returns the result of the first call.
+        """
+        function = mock.Mock(name='function')
+        results = self.run_concurrent_single_flights(function, 'key', 'key')
+        self.assertEqual(function.call_count, 1)
+        self.assertIs(results['leader'], function.return_value)
+        self.assertIs(results['follower'], function.return_value)
+        self.assertEqual(base._in_flight, {})
+
+    def test_single_flight_raises_error_of_shared_call(self):
+        """
+        Test that an exception raised by the in-flight call is raised by the
+        calls waiting on it.
+        """
+        error = CanvasAPIError(status_code=500)
+        function = mock.Mock(name='function', side_effect=error)
+        results = self.run_concurrent_single_flights(function, 'key', 'key')
+        self.assertEqual(function.call_count, 1)
+        self.assertIs(results['leader'], error)
+        self.assertIs(results['follower'], error)
+
+    def test_single_flight_raises_base_exception_of_shared_call(self):
+        """
+        Test that an exception that isn't an Exception (e.g. KeyboardInterrupt)
+        raised by the in-flight call is raised by the calls waiting on it
+        rather than them returning None.
+        """
+        class Abort(BaseException):
+            pass
+
+        error = Abort()
+        function = mock.Mock(name='function', side_effect=error)
+        results = self.run_concurrent_single_flights(function, 'key', 'key')
+        self.assertEqual(function.call_count, 1)
+        self.assertIs(results['leader'], error)
+        self.assertIs(results['follower'], error)
+        self.assertEqual(base._in_flight, {})
+
+    def test_single_flight_does_not_share_calls_with_different_keys(self):
+        """
+        Test that concurrent calls with different keys are each made.
+        """
+        function = mock.Mock(name='function')
+        self.run_concurrent_single_flights(function, 'key-1', 'key-2')
+        self.assertEqual(function.call_count, 2)
+
+    @patch('canvas_sdk.client.base.single_flight')
+    def test_get_with_coalesce_gets_uses_single_flight(self, single_flight_mock):
+        """
+        Test that get with coalesce_gets enabled makes the call through
+        single_flight with a key identifying url, params, token and options.
+        """
+        self.req_ctx.coalesce_gets = True
+        self.req_ctx.auth_token = 'my-token'
+        result = client.get(self.req_ctx, self.url, self.payload, timeout=30)
+        self.assertIs(result, single_flight_mock.return_value)
+        single_flight_mock.assert_called_once_with(
+            mock.ANY, base.call, "GET", self.url, self.req_ctx, params=[('foo', 'bar')], timeout=30)
+        key = single_flight_mock.call_args[0][0]
+        client.get(self.req_ctx, self.url, {'foo': 'baz'}, timeout=30)
+        client.get(self.req_ctx, self.url, self.payload, timeout=60)
+        client.get(self.req_ctx, self.url, self.payload, timeout=30)
+        keys = [c[0][0] for c in single_flight_mock.call_args_list]
+        self.assertNotEqual(keys[1], key)
+        self.assertNotEqual(keys[2], key)
+        self.assertEqual(keys[3], key)
+
+    def test_get_with_coalesce_gets_and_non_ascii_unicode_params(self):
+        """
+        Test that get with coalesce_gets enabled builds the single_flight key
+        of non-ASCII unicode params from their UTF-8 encoding and makes the
+        request.
+        """
+        self.req_ctx.coalesce_gets = True
+        self.req_ctx.auth_token = 'my-token'
+        with patch('canvas_sdk.client.base.single_flight', wraps=base.single_flight) as single_flight_mock:
+            result = client.get(self.req_ctx, self.url, {'search_term': u'caf\xe9'})
+            client.get(self.req_ctx, self.url, {'search_term': 'caf\xc3\xa9'})
+        self.assertIs(result, self.session.request.return_value)
+        self.assertEqual(self.session.request.call_count, 2)
+        keys = [c[0][0] for c in single_flight_mock.call_args_list]
+        self.assertEqual(keys[0], keys[1])
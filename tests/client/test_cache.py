@@ -0,0 +1,233 @@
+import shutil
+import tempfile
+import unittest
+
+import mock
+import requests
+
+from canvas_sdk.client.cache import FileCache, MemoryCache, ResponseCache
+from canvas_sdk.client.cache_policy import CachePolicy
+
+
+class TestResponseCache(unittest.TestCase):
+    longMessage = True
+
+    def build_response_mock(self, status_code=200, headers=None):
+        return mock.MagicMock(name='response', status_code=status_code, headers=headers or {})
+
+    def test_build_key_ignores_param_order_and_none_values(self):
+        """
+        Test that equivalent params produce the same key regardless of order or None values
+        """
+        self.assertEqual(
+            ResponseCache.build_key('http://u', {'a': 1, 'b': ['x', 'y'], 'c': None}, 'token'),
+            ResponseCache.build_key('http://u', {'b': ['x', 'y'], 'a': 1}, 'token'))
+
+    def test_build_key_differs_by_token_and_does_not_contain_it(self):
+        """
+        Test that keys for different tokens differ and that the token itself is not part of the key
+        """
+        key = ResponseCache.build_key('http://u', None, 'secret-token')
+        self.assertNotEqual(key, ResponseCache.build_key('http://u', None, 'other-token'))
+        self.assertNotIn('secret-token', key)
+
+    def test_build_key_encodes_unicode_params_and_token(self):
+        """
+        Test that non-ASCII unicode params and tokens are encoded as UTF-8 rather than failing to encode
+        """
+        key = ResponseCache.build_key(u'http://u', {u'search_term': u'caf\xe9', 'include[]': [u'\xfc']}, u't\xf6ken')
+        self.assertIn('include%5B%5D=%C3%BC&search_term=caf%C3%A9', key)
+        self.assertEqual(key, ResponseCache.build_key('http://u', {'search_term': 'caf\xc3\xa9',
+                                                                   'include[]': ['\xc3\xbc']}, 't\xc3\xb6ken'))
+
+    def test_get_conditional_headers_adds_validators(self):
+        """
+        Test that the cached response's ETag and Last-Modified become conditional request headers
+        """
+        cached = self.build_response_mock(headers={'ETag': '"v1"', 'Last-Modified': 'Tue, 01 Jan 2019 00:00:00 GMT'})
+        headers = {'my': 'header'}
+        result = ResponseCache.get_conditional_headers(cached, headers)
+        self.assertEqual(result, {'my': 'header', 'If-None-Match': '"v1"',
+                                  'If-Modified-Since': 'Tue, 01 Jan 2019 00:00:00 GMT'})
+        self.assertEqual(headers, {'my': 'header'}, "Caller's headers should not be modified")
+
+    def test_update_returns_cached_response_for_not_modified(self):
+        """
+        Test that a 304 reply is answered with the cached response
+        """
+        cache = MemoryCache()
+        cached = self.build_response_mock(headers={'ETag': '"v1"'})
+        self.assertIs(cache.update('key', 'http://u', self.build_response_mock(304), cached), cached)
+        self.assertIs(cache.get('key'), cached)
+
+    def test_update_stores_only_responses_with_validators(self):
+        """
+        Test that responses are stored only when they carry an ETag or Last-Modified header
+        """
+        cache = MemoryCache()
+        cache.update('no-validator', 'http://u', self.build_response_mock())
+        response = self.build_response_mock(headers={'ETag': '"v2"'})
+        self.assertIs(cache.update('validator', 'http://u', response), response)
+        self.assertIsNone(cache.get('no-validator'))
+        self.assertIs(cache.get('validator'), response)
+
+    def test_get_discards_entries_older_than_ttl(self):
+        """
+        Test that an entry that has outlived the ttl is not returned
+        """
+        cache = MemoryCache(ttl=60)
+        response = self.build_response_mock()
+        cache.set('key', response, now=1000)
+        self.assertIs(cache.get('key', now=1059), response)
+        self.assertIsNone(cache.get('key', now=1061))
+        self.assertEqual(len(cache), 0)
+
+    def test_lookup_reports_fresh_while_younger_than_policy_ttl(self):
+        """
+        Test that a response is fresh while its age is within the policy's ttl for the url
+        """
+        cache = MemoryCache(policy=CachePolicy([('/v1/accounts/{id}', 3600)]))
+        url = 'http://canvas/api/v1/accounts/1'
+        cache.set('key', 'response', now=1000)
+        self.assertEqual(cache.lookup('key', url, now=4600), ('response', True))
+        self.assertEqual(cache.lookup('key', url, now=4601), ('response', False))
+        self.assertEqual(cache.lookup('key', 'http://canvas/api/v1/courses/1', now=1001), ('response', False))
+
+    def test_update_stores_response_without_validator_when_policy_has_ttl(self):
+        """
+        Test that a response without validators is stored when the policy has a ttl for the url
+        """
+        cache = MemoryCache(policy=CachePolicy([('/v1/accounts/{id}', 3600)]))
+        response = self.build_response_mock()
+        cache.update('key', 'http://canvas/api/v1/accounts/1', response)
+        self.assertIs(cache.get('key'), response)
+
+    def test_invalidate_removes_resource_sub_resources_and_collection(self):
+        """
+        Test that invalidating a url deletes entries for it, paths below it, and its parent collection, for
+        every token
+        """
+        cache = MemoryCache()
+        base = 'http://canvas/api/v1/courses'
+        keys = {
+            'resource': cache.build_key(base + '/1', None, 'token-1'),
+            'resource-other-token': cache.build_key(base + '/1', {'include': ['term']}, 'token-2'),
+            'sub-resource': cache.build_key(base + '/1/settings', None, 'token-1'),
+            'collection': cache.build_key(base, {'per_page': 10}, 'token-1'),
+            'other-resource': cache.build_key(base + '/12', None, 'token-1'),
+            'other-sub-resource': cache.build_key(base + '/2/settings', None, 'token-1'),
+        }
+        for key in keys.values():
+            cache.set(key, 'response')
+        cache.invalidate(base + '/1')
+        self.assertEqual(sorted(cache.keys()), sorted([keys['other-resource'], keys['other-sub-resource']]))
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """
+        Test that the memory cache keeps at most max_entries, evicting the least recently used
+        """
+        cache = MemoryCache(max_entries=2)
+        cache.set('a', 'response-a')
+        cache.set('b', 'response-b')
+        cache.get('a')
+        cache.set('c', 'response-c')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'response-a')
+        self.assertEqual(cache.get('c'), 'response-c')
+
+
+class TestFileCache(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = FileCache(self.directory)
+
+    def build_response(self):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'[{"id": 1}]'
+        response.headers['ETag'] = '"v1"'
+        response.request = requests.Request(
+            'GET', 'http://u', headers={'Authorization': 'Bearer secret'}).prepare()
+        return response
+
+    def test_set_and_get_round_trip_response(self):
+        """
+        Test that a stored response can be read back with its headers and body
+        """
+        self.cache.set('key', self.build_response())
+        result = self.cache.get('key')
+        self.assertEqual(result.json(), [{'id': 1}])
+        self.assertEqual(result.headers['ETag'], '"v1"')
+
+    def test_set_does_not_store_request_headers(self):
+        """
+        Test that the request (and its authorization header) is not written to disk
+        """
+        self.cache.set('key', self.build_response())
+        self.assertIsNone(self.cache.get('key').request)
+
+    def test_get_missing_key_returns_none(self):
+        """
+        Test that a key that was never stored returns None
+        """
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_keys_lists_stored_keys(self):
+        """
+        Test that keys returns the keys of the stored entries
+        """
+        self.cache.set('http://u/a', self.build_response())
+        self.cache.set('http://u/b', self.build_response())
+        self.assertEqual(sorted(self.cache.keys()), ['http://u/a', 'http://u/b'])
+
+    def test_set_and_get_with_unicode_key(self):
+        """
+        Test that a key with non-ASCII unicode characters can be stored and read back
+        """
+        self.cache.set(u'http://u/caf\xe9', self.build_response())
+        self.assertEqual(self.cache.get(u'http://u/caf\xe9').json(), [{'id': 1}])
+
+    def test_invalidate_removes_resource_sub_resources_and_collection(self):
+        """
+        Test that invalidating a url deletes entries for it, paths below it, and its parent collection, for
+        every token, and leaves the others
+        """
+        base = 'http://canvas/api/v1/courses'
+        keys = {
+            'resource': self.cache.build_key(base + '/1', None, 'token-1'),
+            'resource-other-token': self.cache.build_key(base + '/1/', {'include': ['term']}, 'token-2'),
+            'sub-resource': self.cache.build_key(base + '/1/settings', None, 'token-1'),
+            'collection': self.cache.build_key(base, {'per_page': 10}, 'token-1'),
+            'other-resource': self.cache.build_key(base + '/12', None, 'token-1'),
+            'other-sub-resource': self.cache.build_key(base + '/2/settings', None, 'token-1'),
+            'dotted': self.cache.build_key(base + '/../1', None, 'token-1'),
+        }
+        for key in keys.values():
+            self.cache.set(key, self.build_response())
+        self.cache.invalidate(base + '/1')
+        self.assertEqual(sorted(self.cache.keys()),
+                         sorted([keys['other-resource'], keys['other-sub-resource'], keys['dotted']]))
+
+    def test_invalidate_does_not_read_entries(self):
+        """
+        Test that invalidation finds the entries to delete by their path, without loading any entry
+        """
+        self.cache.set(self.cache.build_key('http://canvas/api/v1/courses/1', None, 'token'), self.build_response())
+        with mock.patch.object(FileCache, '_load') as mock_load:
+            self.cache.invalidate('http://canvas/api/v1/courses/1')
+        self.assertFalse(mock_load.called)
+        self.assertEqual(self.cache.keys(), [])
+
+    def test_delete_and_clear_remove_entries(self):
+        """
+        Test that delete removes one entry and clear removes all of them
+        """
+        self.cache.set('a', self.build_response())
+        self.cache.set('b', self.build_response())
+        self.cache.delete('a')
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.clear()
+        self.assertIsNone(self.cache.get('b'))
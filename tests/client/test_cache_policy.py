@@ -0,0 +1,65 @@
+import unittest
+
+from canvas_sdk.client.cache_policy import (
+    CachePolicy, compile_path_template, get_method_paths, is_get_method)
+from canvas_sdk.methods import account_reports, accounts, enrollment_terms
+
+
+class TestCachePolicy(unittest.TestCase):
+    longMessage = True
+
+    def test_compile_path_template_matches_formatted_urls(self):
+        """
+        Test that a compiled template matches the path of urls built from it and nothing longer
+        """
+        pattern = compile_path_template('/v1/courses/{course_id}/assignments/{id}')
+        self.assertTrue(pattern.search('/api/v1/courses/1/assignments/sis_assignment_id:A'))
+        self.assertTrue(pattern.search('/api/v1/courses/1/assignments/2/'))
+        self.assertFalse(pattern.search('/api/v1/courses/1/assignments/2/submissions'))
+        self.assertFalse(pattern.search('/api/v1/courses/1/assignments'))
+
+    def test_get_method_paths_returns_generated_method_path(self):
+        """
+        Test that the path template of a generated method is found
+        """
+        self.assertEqual(get_method_paths(accounts.get_single_account), ['/v1/accounts/{id}'])
+
+    def test_is_get_method(self):
+        """
+        Test that GET methods are told apart from methods using other verbs
+        """
+        self.assertTrue(is_get_method(accounts.get_single_account))
+        self.assertFalse(is_get_method(accounts.update_account))
+
+    def test_hand_written_method_has_no_paths(self):
+        """
+        Test that a method that builds its request itself, and so isn't in the endpoint table, has no paths and
+        isn't taken for a GET method
+        """
+        self.assertEqual(get_method_paths(account_reports.start_report), [])
+        self.assertFalse(is_get_method(account_reports.start_report))
+        with self.assertRaises(ValueError):
+            CachePolicy([(account_reports.start_report, 3600)])
+
+    def test_get_ttl_uses_first_matching_rule_or_default(self):
+        """
+        Test that get_ttl returns the ttl of the first matching rule, falling back to default_ttl
+        """
+        policy = CachePolicy([('/v1/accounts/{id}', 3600), ('/v1/accounts/{id}', 5)], default_ttl=1)
+        self.assertEqual(policy.get_ttl('https://canvas/api/v1/accounts/1?include[]=x'), 3600)
+        self.assertEqual(policy.get_ttl('https://canvas/api/v1/courses/1'), 1)
+
+    def test_add_rule_for_method(self):
+        """
+        Test that a rule can be added for a generated method
+        """
+        policy = CachePolicy([(accounts.get_single_account, 3600)])
+        self.assertEqual(policy.get_ttl('https://canvas/api/v1/accounts/1'), 3600)
+        self.assertIsNone(policy.get_ttl('https://canvas/api/v1/accounts/1/courses'))
+
+    def test_add_rule_for_module_covers_its_get_methods(self):
+        """
+        Test that a rule for a module applies to the paths of all its GET methods
+        """
+        policy = CachePolicy([(enrollment_terms, 86400)])
+        self.assertEqual(policy.get_ttl('https://canvas/api/v1/accounts/1/terms'), 86400)
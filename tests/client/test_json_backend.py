@@ -0,0 +1,157 @@
+import gc
+import json
+import pickle
+import unittest
+import weakref
+
+import mock
+import requests
+from mock import patch
+
+from canvas_sdk import client
+from canvas_sdk.client import RequestContext
+from canvas_sdk.client.json_backend import JsonResponse, get_json_backend, install_json_decoder
+
+
+def build_response(content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    return response
+
+
+class TestGetJsonBackend(unittest.TestCase):
+    longMessage = True
+
+    @patch('canvas_sdk.client.json_backend.importlib.import_module')
+    def test_default_is_first_importable_backend(self, mock_import):
+        """
+        Test that the first backend in order of preference that can be imported is used by default
+        """
+        ujson = mock.Mock(name='ujson')
+        mock_import.side_effect = [ImportError('no orjson'), ujson]
+        self.assertIs(get_json_backend(), ujson)
+        self.assertEqual([c[0][0] for c in mock_import.call_args_list], ['orjson', 'ujson'])
+
+    @patch('canvas_sdk.client.json_backend.importlib.import_module')
+    def test_default_falls_back_to_stdlib(self, mock_import):
+        """
+        Test that the stdlib json module is used when no faster backend is installed
+        """
+        mock_import.side_effect = lambda name: json if name == 'json' else self.fail_import(name)
+        self.assertIs(get_json_backend(), json)
+
+    def fail_import(self, name):
+        raise ImportError(name)
+
+    def test_backend_by_name(self):
+        """
+        Test that a backend can be chosen by module name
+        """
+        self.assertIs(get_json_backend('json'), json)
+
+    def test_backend_object_is_used_as_is(self):
+        """
+        Test that an object with a loads function is used as the backend
+        """
+        backend = mock.Mock(name='backend')
+        self.assertIs(get_json_backend(backend), backend)
+
+
+class TestJsonResponse(unittest.TestCase):
+    longMessage = True
+
+    def test_decodes_content_with_backend_once(self):
+        """
+        Test that the body is decoded with the backend's loads on first use and the result reused
+        """
+        backend = mock.Mock(name='backend')
+        response = install_json_decoder(build_response('[1, 2]'), backend)
+        self.assertIs(response.json(), backend.loads.return_value)
+        self.assertIs(response.json(), backend.loads.return_value)
+        backend.loads.assert_called_once_with('[1, 2]')
+
+    def test_body_is_not_decoded_until_read(self):
+        """
+        Test that installing the decoder doesn't decode the body
+        """
+        backend = mock.Mock(name='backend')
+        response = install_json_decoder(build_response('[1, 2]'), backend)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(backend.loads.called)
+
+    def test_stdlib_backend_decodes_through_requests(self):
+        """
+        Test that the stdlib backend decodes the body the way requests does, once
+        """
+        response = install_json_decoder(build_response('{"id": 1}'), json)
+        with patch.object(requests.Response, 'json', autospec=True, return_value={'id': 1}) as mock_json:
+            self.assertEqual(response.json(), {'id': 1})
+            response.json()
+        mock_json.assert_called_once_with(response)
+
+    def test_keyword_arguments_go_to_requests_uncached(self):
+        """
+        Test that calls with keyword arguments are decoded by requests each time
+        """
+        backend = mock.Mock(name='backend')
+        response = install_json_decoder(build_response('{"id": 1}'), backend)
+        self.assertEqual(response.json(object_hook=lambda d: d.keys()), ['id'])
+        self.assertFalse(backend.loads.called)
+
+    def test_decode_errors_are_raised(self):
+        """
+        Test that a body that isn't json raises a ValueError, like requests does
+        """
+        response = install_json_decoder(build_response('not json'), json)
+        with self.assertRaises(ValueError):
+            response.json()
+
+    def test_install_is_idempotent(self):
+        """
+        Test that installing the decoder on a response that has one keeps the existing backend and its result
+        """
+        response = install_json_decoder(build_response('[]'), json)
+        self.assertEqual(response.json(), [])
+        install_json_decoder(response, mock.Mock(name='other-backend'))
+        self.assertIsInstance(response, JsonResponse)
+        self.assertIs(response._json_backend, json)
+        self.assertEqual(response.json(), [])
+
+    def test_other_objects_are_left_as_they_are(self):
+        """
+        Test that objects that aren't plain requests.Responses keep their own json method
+        """
+        response = mock.MagicMock(name='response', spec=requests.Response)
+        self.assertIs(install_json_decoder(response, json), response)
+        self.assertIs(response.json(), response.json.return_value)
+
+    def test_pickled_response_keeps_decoding(self):
+        """
+        Test that a response unpickled without its backend decodes with the stdlib backend
+        """
+        response = install_json_decoder(build_response('[1, 2]'), mock.Mock(name='backend'))
+        self.assertEqual(pickle.loads(pickle.dumps(response)).json(), [1, 2])
+
+    def test_response_is_freed_without_garbage_collection(self):
+        """
+        Test that a decoded response isn't part of a reference cycle, so that it is freed as soon as it is deleted
+        """
+        gc.disable()
+        self.addCleanup(gc.enable)
+        response = install_json_decoder(build_response('[1, 2]'), json)
+        self.assertEqual(response.json(), [1, 2])
+        response_ref = weakref.ref(response)
+        del response
+        self.assertIsNone(response_ref())
+
+    def test_json_of_response_that_is_not_kept(self):
+        """
+        Test that json() can be called on a response returned by a client function without keeping the response
+        """
+        for backend in ('json', mock.Mock(name='backend', loads=json.loads)):
+            context = RequestContext('my-auth-token', 'https://path/to/canvas/api', json_backend=backend)
+            context.session = mock.MagicMock(name='session')
+            # a new response for each request, so that nothing but the caller refers to it
+            context.session.request.side_effect = lambda *args, **kwargs: build_response('[1, 2]')
+            self.assertEqual(client.get(context, 'https://path/to/canvas/api/v1/courses').json(), [1, 2])
@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+from mock import patch
+
+from canvas_sdk.client.rate_limit import (
+    consume_tokens, FileBucketStore, MemoryBucketStore, RateLimiter)
+
+
+class TestRateLimit(unittest.TestCase):
+    longMessage = True
+
+    def test_consume_tokens_starts_with_full_bucket(self):
+        """
+        Test that a new bucket starts at capacity and tokens are taken immediately
+        """
+        state, wait = consume_tokens(None, 1, rate=10, capacity=5, now=100)
+        self.assertEqual(state, (4, 100))
+        self.assertEqual(wait, 0)
+
+    def test_consume_tokens_returns_wait_when_bucket_empty(self):
+        """
+        Test that the wait for an empty bucket is the time needed to refill the missing tokens
+        """
+        state, wait = consume_tokens((0.5, 100), 1, rate=10, capacity=5, now=100)
+        self.assertEqual(state, (0.5, 100))
+        self.assertAlmostEqual(wait, 0.05)
+
+    def test_consume_tokens_refills_up_to_capacity(self):
+        """
+        Test that a bucket refills at rate tokens per second but never beyond capacity
+        """
+        state, wait = consume_tokens((0, 100), 1, rate=10, capacity=5, now=200)
+        self.assertEqual(state, (4, 200))
+
+    def test_memory_store_tracks_buckets_by_key(self):
+        """
+        Test that the memory store keeps separate state per bucket key
+        """
+        store = MemoryBucketStore()
+        self.assertEqual(store.consume('a', 1, 1, 1, now=100), 0)
+        self.assertEqual(store.consume('a', 1, 1, 1, now=100), 1)
+        self.assertEqual(store.consume('b', 1, 1, 1, now=100), 0)
+
+    def test_file_store_shares_budget_between_instances(self):
+        """
+        Test that two file stores using the same path (as separate processes would) share a bucket
+        """
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'bucket.json')
+        first, second = FileBucketStore(path), FileBucketStore(path)
+        self.assertEqual(first.consume('token', 1, 1, 2, now=100), 0)
+        self.assertEqual(second.consume('token', 1, 1, 2, now=100), 0)
+        self.assertEqual(first.consume('token', 1, 1, 2, now=100), 1)
+
+    @patch('canvas_sdk.client.rate_limit.time.sleep')
+    @patch('canvas_sdk.client.rate_limit.time.time')
+    def test_acquire_sleeps_until_token_available(self, mock_time, mock_sleep):
+        """
+        Test that acquire sleeps for the wait returned by the store and then tries again
+        """
+        mock_time.return_value = 100
+        store = mock.MagicMock(name='store')
+        store.consume.side_effect = [0.25, 0]
+        limiter = RateLimiter(rate=4, capacity=8, store=store, key='my-token')
+        limiter.acquire()
+        mock_sleep.assert_called_once_with(0.25)
+        self.assertEqual(store.consume.call_args_list, [mock.call('my-token', 1, 4, 8, 100)] * 2)
+
+    def test_capacity_defaults_to_rate(self):
+        """
+        Test that the burst capacity defaults to the rate
+        """
+        self.assertEqual(RateLimiter(rate=3).capacity, 3)
+
+    def test_capacity_defaults_to_one_token_for_rates_below_one(self):
+        """
+        Test that the burst capacity defaults to a whole token when the rate is below one request per second
+        """
+        self.assertEqual(RateLimiter(rate=0.5).capacity, 1)
+
+    @patch('canvas_sdk.client.rate_limit.time.sleep')
+    @patch('canvas_sdk.client.rate_limit.time.time')
+    def test_acquire_with_rate_below_one_waits_for_a_whole_token(self, mock_time, mock_sleep):
+        """
+        Test that a limiter with a rate below one request per second waits for a token instead of looping forever
+        """
+        mock_time.side_effect = [100, 100, 102]
+        limiter = RateLimiter(rate=0.5)
+        limiter.acquire()
+        limiter.acquire()
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_acquire_raises_for_more_tokens_than_capacity(self):
+        """
+        Test that acquiring more tokens than the bucket can hold raises instead of blocking forever
+        """
+        limiter = RateLimiter(rate=4, capacity=2)
+        with self.assertRaises(ValueError):
+            limiter.acquire(3)
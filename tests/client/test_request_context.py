@@ -1,7 +1,8 @@
+import threading
 import unittest
 import mock
 from mock import patch
-from canvas_sdk.client import RequestContext
+from canvas_sdk.client import RequestContext, RetryPolicy
 
 
 class TestRequestContext(unittest.TestCase):
@@ -56,6 +57,15 @@ class TestRequestContext(unittest.TestCase):
         self.assertEqual(self.base_api_url, context.base_api_url,
                          "RequestContext should have a base_api_url instance attribute")
 
+    @patch('canvas_sdk.client.request_context.get_json_backend')
+    def test_initialize_json_backend_uses_get_json_backend(self, mock_get_json_backend):
+        """
+        Test that the json_backend passed in (None by default) is resolved with get_json_backend
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, json_backend='ujson')
+        mock_get_json_backend.assert_called_once_with('ujson')
+        self.assertEqual(context.json_backend, mock_get_json_backend.return_value)
+
     def test_initialize_max_retries_defaults_to_zero(self):
         """
         Test that if max_retries is not passed in, the value defaults to zero
@@ -124,6 +134,20 @@ class TestRequestContext(unittest.TestCase):
         context = RequestContext(self.auth_token, self.base_api_url)
         self.assertEqual(None, context.per_page, "per_page should default to None on creation")
 
+    def test_initialize_prefetch_depth_defaults_to_zero(self):
+        """
+        Test that if prefetch_depth is not passed in, the value defaults to zero (no prefetching)
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertEqual(0, context.prefetch_depth, "prefetch_depth should default to zero on creation")
+
+    def test_initialize_retry_policy_defaults_to_backoff_policy(self):
+        """
+        Test that if retry_policy is not passed in, a default RetryPolicy is used
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        self.assertIsInstance(context.retry_policy, RetryPolicy)
+
     def test_initialize_from_dictionary(self):
         """
         Test that RequestContext can be initialized from a dictionary of settings
@@ -138,7 +162,9 @@ class TestRequestContext(unittest.TestCase):
             'cookies': {'oreo': 'cookie'},
             'proxies': {'my': 'proxy'},
             'verify': False,
-            'cert': 'my-cert'
+            'cert': 'my-cert',
+            'prefetch_depth': 3,
+            'retry_policy': RetryPolicy(base_delay=1),
         }
         self.mock_default_headers.return_value = {}  # Need to merge into a dictionary
         context = RequestContext(**dict_settings)
@@ -296,6 +322,57 @@ class TestRequestContext(unittest.TestCase):
         self.assertEqual(context_cookies, result.cookies,
                          "Cookies attribute should be set to context value")
 
+    @patch('canvas_sdk.client.request_context.HTTPAdapter')
+    @patch('canvas_sdk.client.request_context.requests.Session')
+    @patch.object(RequestContext, 'auth', new_callable=mock.PropertyMock)
+    def test_session_creation_does_not_mount_adapter_without_pool_sizes(self, mock_auth, mock_requests_session,
+                                                                        mock_adapter):
+        """
+        Test that the requests default adapters are kept when no pool sizes are set on the context
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        result = context.session
+        self.assertFalse(mock_adapter.called)
+        self.assertFalse(result.mount.called)
+
+    @patch('canvas_sdk.client.request_context.HTTPAdapter')
+    @patch('canvas_sdk.client.request_context.requests.Session')
+    @patch.object(RequestContext, 'auth', new_callable=mock.PropertyMock)
+    def test_session_creation_mounts_adapter_sized_from_pool_settings(self, mock_auth, mock_requests_session,
+                                                                      mock_adapter):
+        """
+        Test that Session object gets an adapter sized from pool_connections and pool_maxsize for http and https
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, pool_connections=4, pool_maxsize=32)
+        result = context.session
+        mock_adapter.assert_called_once_with(pool_connections=4, pool_maxsize=32)
+        self.assertEqual(result.mount.call_args_list, [mock.call('http://', mock_adapter.return_value),
+                                                       mock.call('https://', mock_adapter.return_value)])
+
+    def test_session_with_thread_local_sessions_differs_per_thread(self):
+        """
+        Test that each thread gets (and keeps) its own session when thread_local_sessions is enabled
+        """
+        context = RequestContext(self.auth_token, self.base_api_url, thread_local_sessions=True)
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.extend([context.session, context.session]))
+        thread.start()
+        thread.join()
+        self.assertIs(sessions[0], sessions[1], "A thread should reuse its session")
+        self.assertIsNot(context.session, sessions[0], "Threads should not share a session")
+        self.assertIs(context.session, context.session)
+
+    def test_session_without_thread_local_sessions_is_shared_across_threads(self):
+        """
+        Test that a single session is shared by all threads by default
+        """
+        context = RequestContext(self.auth_token, self.base_api_url)
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(context.session))
+        thread.start()
+        thread.join()
+        self.assertIs(context.session, sessions[0])
+
     def test_session_returns_stored_value_after_initial_creation(self):
         """
         Test that a previously created session is stored/returned when session property is called
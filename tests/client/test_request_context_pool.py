@@ -0,0 +1,102 @@
+import unittest
+
+import mock
+from mock import patch
+
+from canvas_sdk.client import RequestContextPool
+from canvas_sdk.client.request_context_pool import PooledRequestContext
+
+
+class TestRequestContextPool(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.base_api_url = 'https://canvas.example.edu/api'
+        self.pool = RequestContextPool(max_size=2, idle_timeout=60)
+
+    def test_get_returns_pooled_context_for_token_and_url(self):
+        """
+        Test that get creates a context with the given token and base url
+        """
+        context = self.pool.get('token-1', self.base_api_url)
+        self.assertIsInstance(context, PooledRequestContext)
+        self.assertEqual(context.auth_token, 'token-1')
+        self.assertEqual(context.base_api_url, self.base_api_url)
+
+    def test_get_passes_context_kwargs(self):
+        """
+        Test that extra keyword arguments to the pool are used for every context
+        """
+        pool = RequestContextPool(per_page=100, max_retries=3)
+        context = pool.get('token-1', self.base_api_url)
+        self.assertEqual(context.per_page, 100)
+        self.assertEqual(context.max_retries, 3)
+
+    def test_get_returns_cached_context(self):
+        """
+        Test that the same context is returned for the same token and url
+        """
+        self.assertIs(self.pool.get('token-1', self.base_api_url), self.pool.get('token-1', self.base_api_url))
+        self.assertEqual(len(self.pool), 1)
+
+    def test_contexts_for_same_host_share_adapter_but_not_auth(self):
+        """
+        Test that contexts for different tokens on one host use the same adapter with separate auth
+        """
+        session_1 = self.pool.get('token-1', self.base_api_url).session
+        session_2 = self.pool.get('token-2', self.base_api_url).session
+        url = self.base_api_url + '/v1/courses'
+        self.assertIs(session_1.get_adapter(url), session_2.get_adapter(url))
+        self.assertEqual(session_1.auth.oauth2_token, 'token-1')
+        self.assertEqual(session_2.auth.oauth2_token, 'token-2')
+
+    def test_contexts_for_different_hosts_use_different_adapters(self):
+        """
+        Test that each Canvas host has its own adapter
+        """
+        session_1 = self.pool.get('token-1', self.base_api_url).session
+        session_2 = self.pool.get('token-1', 'https://other.example.edu/api').session
+        self.assertIsNot(session_1.get_adapter(self.base_api_url + '/v1'),
+                         session_2.get_adapter('https://other.example.edu/api/v1'))
+
+    def test_get_evicts_least_recently_used_context(self):
+        """
+        Test that the least recently used context is evicted when max_size is exceeded
+        """
+        first = self.pool.get('token-1', self.base_api_url)
+        self.pool.get('token-2', self.base_api_url)
+        self.pool.get('token-1', self.base_api_url)  # token-2 is now least recently used
+        self.pool.get('token-3', self.base_api_url)
+        self.assertEqual(len(self.pool), 2)
+        self.assertIs(self.pool.get('token-1', self.base_api_url), first)
+        self.assertEqual(len(self.pool), 2)
+        self.assertNotIn((self.base_api_url, 'token-2'), self.pool._contexts)
+
+    @patch('canvas_sdk.client.request_context_pool.time.time')
+    def test_get_expires_idle_contexts(self, mock_time):
+        """
+        Test that contexts unused for idle_timeout seconds are replaced
+        """
+        mock_time.return_value = 1000
+        first = self.pool.get('token-1', self.base_api_url)
+        mock_time.return_value = 1061
+        self.assertIsNot(self.pool.get('token-1', self.base_api_url), first)
+
+    def test_remove_discards_context(self):
+        """
+        Test that remove drops the cached context
+        """
+        self.pool.get('token-1', self.base_api_url)
+        self.pool.remove('token-1', self.base_api_url)
+        self.assertEqual(len(self.pool), 0)
+
+    def test_clear_removes_contexts_and_closes_adapters(self):
+        """
+        Test that clear drops all contexts and closes the shared adapters
+        """
+        context = self.pool.get('token-1', self.base_api_url)
+        context.adapter = mock.MagicMock(name='adapter')
+        self.pool._adapters['https://canvas.example.edu/'] = context.adapter
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        context.adapter.close.assert_called_once_with()
@@ -0,0 +1,92 @@
+import unittest
+
+import mock
+from mock import patch
+
+from canvas_sdk.client.retry import RetryPolicy, get_retry_after
+
+
+class TestRetryPolicy(unittest.TestCase):
+    longMessage = True
+
+    def build_response_mock(self, headers=None):
+        return mock.MagicMock(name='response', headers=headers or {})
+
+    def test_get_delay_grows_exponentially_without_jitter(self):
+        """
+        Test that the delay is base_delay * multiplier ** retry when jitter is disabled
+        """
+        policy = RetryPolicy(base_delay=1, multiplier=3, max_delay=100, jitter=False)
+        self.assertEqual([policy.get_delay(r) for r in range(4)], [1, 3, 9, 27])
+
+    def test_get_delay_is_capped_at_max_delay(self):
+        """
+        Test that the computed delay never exceeds max_delay
+        """
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=5, jitter=False)
+        self.assertEqual(policy.get_delay(10), 5)
+
+    @patch('canvas_sdk.client.retry.random.uniform')
+    def test_get_delay_with_jitter_picks_random_delay_up_to_backoff(self, mock_uniform):
+        """
+        Test that full jitter picks a uniformly random delay between zero and the backoff delay
+        """
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=30, jitter=True)
+        result = policy.get_delay(2)
+        mock_uniform.assert_called_once_with(0, 4)
+        self.assertEqual(result, mock_uniform.return_value)
+
+    def test_get_delay_honors_longer_retry_after_header(self):
+        """
+        Test that a Retry-After header asking for a longer wait than the backoff delay is honored
+        """
+        policy = RetryPolicy(base_delay=1, jitter=False)
+        response = self.build_response_mock({'Retry-After': '12'})
+        self.assertEqual(policy.get_delay(0, response), 12)
+
+    def test_get_delay_caps_retry_after_header_at_max_delay(self):
+        """
+        Test that a Retry-After header asking for a wait longer than max_delay waits max_delay only
+        """
+        policy = RetryPolicy(base_delay=1, max_delay=30, jitter=False)
+        response = self.build_response_mock({'Retry-After': '86400'})
+        self.assertEqual(policy.get_delay(0, response), 30)
+
+    def test_get_delay_ignores_retry_after_when_disabled(self):
+        """
+        Test that the Retry-After header is ignored when respect_retry_after is False
+        """
+        policy = RetryPolicy(base_delay=1, jitter=False, respect_retry_after=False)
+        response = self.build_response_mock({'Retry-After': '12'})
+        self.assertEqual(policy.get_delay(0, response), 1)
+
+    @patch('canvas_sdk.client.retry.time.sleep')
+    def test_wait_sleeps_for_delay(self, mock_sleep):
+        """
+        Test that wait sleeps for the result of get_delay
+        """
+        policy = RetryPolicy(base_delay=2, jitter=False)
+        policy.wait(1)
+        mock_sleep.assert_called_once_with(4)
+
+    def test_get_retry_after_parses_seconds(self):
+        """
+        Test that a Retry-After header in seconds is returned as a float
+        """
+        self.assertEqual(get_retry_after(self.build_response_mock({'Retry-After': '3'})), 3.0)
+
+    @patch('canvas_sdk.client.retry.time.time')
+    def test_get_retry_after_parses_http_date(self, mock_time):
+        """
+        Test that a Retry-After header given as an HTTP date is converted to seconds from now
+        """
+        mock_time.return_value = 784111767  # Sun, 06 Nov 1994 08:49:27 GMT
+        response = self.build_response_mock({'Retry-After': 'Sun, 06 Nov 1994 08:49:37 GMT'})
+        self.assertEqual(get_retry_after(response), 10)
+
+    def test_get_retry_after_returns_none_for_missing_or_malformed_header(self):
+        """
+        Test that None is returned when there is no usable Retry-After header
+        """
+        self.assertIsNone(get_retry_after(self.build_response_mock()))
+        self.assertIsNone(get_retry_after(self.build_response_mock({'Retry-After': 'soon'})))
@@ -0,0 +1,83 @@
+import unittest
+
+import mock
+from mock import patch
+
+from canvas_sdk.client.throttle import RateLimitThrottle, is_rate_limit_error
+
+
+class TestThrottle(unittest.TestCase):
+    longMessage = True
+
+    def build_response_mock(self, status_code=200, headers=None, text=''):
+        return mock.MagicMock(name='response', status_code=status_code, headers=headers or {}, text=text)
+
+    def test_is_rate_limit_error_for_rate_limit_exceeded_403(self):
+        """
+        Test that a 403 with the rate limit exceeded message is a rate limit error
+        """
+        response = self.build_response_mock(403, text='403 Forbidden (Rate Limit Exceeded)\n')
+        self.assertTrue(is_rate_limit_error(response))
+
+    def test_is_rate_limit_error_false_for_other_responses(self):
+        """
+        Test that other 403s and other status codes are not rate limit errors
+        """
+        self.assertFalse(is_rate_limit_error(self.build_response_mock(403, text='unauthorized')))
+        self.assertFalse(is_rate_limit_error(self.build_response_mock(500, text='Rate Limit Exceeded')))
+
+    def test_get_delay_is_zero_before_any_response(self):
+        """
+        Test that no delay is applied until a quota has been reported
+        """
+        self.assertEqual(RateLimitThrottle().get_delay(), 0)
+
+    def test_update_records_remaining_quota_and_cost(self):
+        """
+        Test that update records the rate limit headers of the response
+        """
+        throttle = RateLimitThrottle()
+        throttle.update(self.build_response_mock(
+            headers={'X-Rate-Limit-Remaining': '612.5', 'X-Request-Cost': '1.25'}))
+        self.assertEqual(throttle.remaining, 612.5)
+        self.assertEqual(throttle.request_cost, 1.25)
+
+    def test_update_treats_rate_limit_error_as_exhausted_quota(self):
+        """
+        Test that a rate limit error sets the remaining quota to zero
+        """
+        throttle = RateLimitThrottle()
+        throttle.update(self.build_response_mock(403, text='403 Forbidden (Rate Limit Exceeded)'))
+        self.assertEqual(throttle.remaining, 0)
+
+    def test_update_keeps_previous_quota_when_headers_missing(self):
+        """
+        Test that a response without rate limit headers doesn't clear the recorded quota
+        """
+        throttle = RateLimitThrottle()
+        throttle.remaining = 100.0
+        throttle.update(self.build_response_mock())
+        self.assertEqual(throttle.remaining, 100.0)
+
+    def test_get_delay_scales_as_quota_drains(self):
+        """
+        Test that the delay is zero above the threshold and grows linearly to max_delay below it
+        """
+        throttle = RateLimitThrottle(threshold=200, max_delay=2)
+        delays = []
+        for remaining in (500, 200, 100, 0, -5):
+            throttle.remaining = remaining
+            delays.append(throttle.get_delay())
+        self.assertEqual(delays, [0, 0, 1, 2, 2])
+
+    @patch('canvas_sdk.client.throttle.time.sleep')
+    def test_wait_sleeps_only_when_delay_needed(self, mock_sleep):
+        """
+        Test that wait sleeps for the computed delay and doesn't sleep when there is none
+        """
+        throttle = RateLimitThrottle(threshold=200, max_delay=2)
+        throttle.wait()
+        self.assertFalse(mock_sleep.called)
+        throttle.remaining = 50
+        throttle.wait()
+        mock_sleep.assert_called_once_with(1.5)
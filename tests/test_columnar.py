@@ -0,0 +1,183 @@
+import sys
+import unittest
+from StringIO import StringIO
+import mock
+import requests
+from mock import patch
+from canvas_sdk.client import RequestContext
+from canvas_sdk.columnar import (Column, ColumnarBatch, CsvWriter, DictionaryColumnBuffer, ParquetWriter,
+                                 export_list_data, format_timestamp, parse_timestamp)
+
+
+class TestColumnar(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.prefetch_depth = 0
+        self.columns = [Column('id', 'int'), Column('score', 'float'), Column('submitted_at', 'timestamp'),
+                        Column('workflow_state', 'category'), Column('late', 'bool'),
+                        Column('current_score', 'float', key='grades.current_score')]
+
+    def build_response_mock(self, json_data, links=None):
+        response = mock.MagicMock(spec=requests.Response)
+        response.links = links or {}
+        response.json.return_value = json_data
+        return response
+
+    def test_parse_timestamp(self):
+        """
+        Test that ISO 8601 timestamps with and without offsets are parsed to UTC epoch seconds
+        """
+        self.assertEqual(parse_timestamp('2014-01-01T00:00:00Z'), 1388534400)
+        self.assertEqual(parse_timestamp('2014-01-01T00:00:00.250Z'), 1388534400)
+        self.assertEqual(parse_timestamp('2013-12-31T18:00:00-06:00'), 1388534400)
+        self.assertEqual(parse_timestamp('2014-01-01T01:00:00+01:00'), 1388534400)
+        self.assertEqual(parse_timestamp('2014-01-01T00:00:00'), 1388534400)
+        self.assertEqual(parse_timestamp(1388534400), 1388534400)
+        self.assertEqual(format_timestamp(1388534400), '2014-01-01T00:00:00Z')
+        with self.assertRaises(ValueError):
+            parse_timestamp('yesterday')
+
+    def test_column_rejects_unknown_kind(self):
+        """
+        Test that a column of an unknown kind raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            Column('id', 'integer')
+
+    def test_batch_stores_typed_and_dictionary_encoded_columns(self):
+        """
+        Test that numbers go into typed arrays with missing values masked, and categories are dictionary encoded
+        """
+        batch = ColumnarBatch(self.columns)
+        batch.append({'id': 1, 'score': 9.5, 'submitted_at': '2014-01-01T00:00:00Z', 'workflow_state': 'graded',
+                      'late': False, 'grades': {'current_score': 90}})
+        batch.append({'id': 2, 'workflow_state': 'submitted', 'late': True})
+        batch.append({'id': 3, 'score': 7, 'workflow_state': 'graded', 'grades': None})
+        self.assertEqual(len(batch), 3)
+        ids, scores, submitted_at, states = batch.buffers[:4]
+        self.assertEqual(ids.values.typecode, 'l')
+        self.assertEqual(list(ids.values), [1, 2, 3])
+        self.assertEqual(scores.values.typecode, 'd')
+        self.assertEqual(scores.to_list(), [9.5, None, 7.0])
+        self.assertEqual(submitted_at.to_list(), [1388534400, None, None])
+        self.assertIsInstance(states, DictionaryColumnBuffer)
+        self.assertEqual(states.dictionary, ['graded', 'submitted'])
+        self.assertEqual(list(states.codes), [0, 1, 0])
+        self.assertEqual(list(batch.rows())[0], (1, 9.5, 1388534400, 'graded', False, 90.0))
+
+    def test_batch_keeps_large_ids_and_timestamps(self):
+        """
+        Test that ids above 2**31, even ones that don't fit a C long, and timestamps after 2038 are kept exactly
+        """
+        batch = ColumnarBatch([Column('id', 'int'), Column('submitted_at', 'timestamp')])
+        batch.append({'id': 10000000000123, 'submitted_at': '2040-01-01T00:00:00Z'})
+        batch.append({'id': 2 ** 70})
+        batch.append({})
+        ids, submitted_at = batch.buffers
+        self.assertEqual(ids.to_list(), [10000000000123, 2 ** 70, None])
+        self.assertEqual(submitted_at.to_list(), [2208988800, None, None])
+        self.assertIsInstance(submitted_at.to_list()[0], (int, long))
+        output = StringIO()
+        writer = CsvWriter(output, [Column('id', 'int'), Column('submitted_at', 'timestamp')])
+        writer.write_batch(batch)
+        self.assertIn('10000000000123,2040-01-01T00:00:00Z', output.getvalue())
+        batch.clear()
+        batch.append({'id': 1})
+        self.assertEqual(ids.to_list(), [1])
+
+    def test_dictionary_is_kept_across_batches(self):
+        """
+        Test that clearing a batch keeps the dictionary so codes are stable from batch to batch
+        """
+        batch = ColumnarBatch([Column('workflow_state', 'category')])
+        batch.append({'workflow_state': 'graded'})
+        batch.clear()
+        batch.append({'workflow_state': 'submitted'})
+        batch.append({'workflow_state': 'graded'})
+        batch.append({})
+        self.assertEqual(list(batch.buffers[0].codes), [1, 0, -1])
+        self.assertEqual(list(batch.rows()), [('submitted',), ('graded',), (None,)])
+
+    def test_csv_writer_formats_values(self):
+        """
+        Test that the CSV writer writes a header row, empty fields for missing values, ISO timestamps and
+        lower case booleans
+        """
+        output = StringIO()
+        writer = CsvWriter(output, self.columns)
+        batch = ColumnarBatch(self.columns)
+        batch.append({'id': 1, 'score': 9.5, 'submitted_at': '2014-01-01T00:00:00Z', 'workflow_state': u'gr\xe4ded',
+                      'late': False})
+        batch.append({'id': 2})
+        writer.write_batch(batch)
+        self.assertEqual(output.getvalue().splitlines(), [
+            'id,score,submitted_at,workflow_state,late,current_score',
+            '1,9.5,2014-01-01T00:00:00Z,gr\xc3\xa4ded,false,',
+            '2,,,,,',
+        ])
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_export_list_data_writes_full_batches(self, mock_next):
+        """
+        Test that records from every page are written in batches of batch_size, followed by the remainder, and
+        that the writer is closed
+        """
+        mock_next.return_value = iter([self.build_response_mock([{'id': 3}, {'id': 4}, {'id': 5}])])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock([{'id': 1}, {'id': 2}])
+        written = []
+        writer = mock.Mock(name='writer', columns=[Column('id', 'int')])
+        writer.write_batch.side_effect = lambda batch: written.append(list(batch.buffers[0].values))
+
+        count = export_list_data(writer, self.req_ctx, mock_function, 'arg1', batch_size=2, per_page=100)
+        self.assertEqual(count, 5)
+        self.assertEqual(written, [[1, 2], [3, 4], [5]])
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1', per_page=100)
+        writer.close.assert_called_once_with()
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_export_list_data_closes_writer_on_error(self, mock_next):
+        """
+        Test that the writer is closed when a page request fails
+        """
+        def next_pages():
+            raise requests.exceptions.ConnectionError()
+            yield
+
+        mock_next.return_value = next_pages()
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock([{'id': 1}])
+        writer = mock.Mock(name='writer', columns=[Column('id', 'int')])
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            export_list_data(writer, self.req_ctx, mock_function)
+        writer.close.assert_called_once_with()
+
+    def test_parquet_writer_requires_pyarrow(self):
+        """
+        Test that creating a Parquet writer without pyarrow installed raises an ImportError
+        """
+        with patch.dict(sys.modules, {'pyarrow': None, 'pyarrow.parquet': None}):
+            with self.assertRaises(ImportError):
+                ParquetWriter('submissions.parquet', self.columns)
+
+    def test_parquet_writer_writes_a_row_group_per_batch(self):
+        """
+        Test that each batch is written as a table, with dictionary arrays for category columns
+        """
+        pyarrow = mock.MagicMock(name='pyarrow')
+        with patch.dict(sys.modules, {'pyarrow': pyarrow, 'pyarrow.parquet': pyarrow.parquet}):
+            writer = ParquetWriter('submissions.parquet', [Column('id', 'int'), Column('state', 'category')])
+        batch = ColumnarBatch(writer.columns)
+        batch.append({'id': 1, 'state': 'graded'})
+        batch.append({'state': None})
+        writer.write_batch(batch)
+        writer.close()
+        pyarrow.parquet.ParquetWriter.assert_called_once_with('submissions.parquet', pyarrow.schema.return_value)
+        pyarrow.array.assert_any_call([1, None], type=pyarrow.int64.return_value)
+        pyarrow.array.assert_any_call([0, None], type=pyarrow.int32.return_value)
+        pyarrow.array.assert_any_call(['graded'], type=pyarrow.string.return_value)
+        pyarrow.parquet.ParquetWriter.return_value.write_table.assert_called_once_with(
+            pyarrow.Table.from_arrays.return_value)
+        pyarrow.parquet.ParquetWriter.return_value.close.assert_called_once_with()
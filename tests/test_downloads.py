@@ -0,0 +1,160 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+import zlib
+from StringIO import StringIO
+import mock
+from canvas_sdk.client import RequestContext
+from canvas_sdk.downloads import download, get_artifact_url, iter_csv_rows, iter_download, iter_zip_entries
+from canvas_sdk.exceptions import CanvasAPIError
+
+
+def split_chunks(data, size):
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+def build_zip(entries, compression=zipfile.ZIP_DEFLATED):
+    archive = StringIO()
+    zip_file = zipfile.ZipFile(archive, 'w', compression)
+    for name, content in entries:
+        zip_file.writestr(name, content)
+    zip_file.close()
+    return archive.getvalue()
+
+
+def build_streamed_zip_entry(name, content):
+    """
+    Build a deflated local file entry whose crc and sizes follow its content in a data descriptor, the way zip
+    files written to a stream are
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(content) + compressor.flush()
+    header = struct.pack('<4sHHHHHIIIHH', 'PK\x03\x04', 20, 0x8, zipfile.ZIP_DEFLATED, 0, 0, 0, 0, 0, len(name), 0)
+    descriptor = struct.pack('<4sIII', 'PK\x07\x08', zlib.crc32(content) & 0xffffffff, len(compressed), len(content))
+    return header + name + compressed + descriptor
+
+
+class TestDownloads(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.timeout = 30
+        self.response = mock.Mock(name='response', status_code=200, text='')
+        self.response.iter_content.return_value = ['abc', '', 'def']
+        self.req_ctx.session.get.return_value = self.response
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_get_artifact_url(self):
+        """
+        Test that the url is taken from a job's attachment or file_url, and that a job without one raises
+        """
+        self.assertEqual(get_artifact_url({'attachment': {'url': 'http://export'}}), 'http://export')
+        self.assertEqual(get_artifact_url({'file_url': 'http://report', 'attachment': None}), 'http://report')
+        self.assertEqual(get_artifact_url('http://file'), 'http://file')
+        with self.assertRaises(ValueError):
+            get_artifact_url({'id': 1, 'status': 'running'})
+
+    def test_iter_download_streams_chunks_and_closes_response(self):
+        """
+        Test that the file is requested as a stream with the context's session and read in chunks
+        """
+        chunks = list(iter_download(self.req_ctx, {'file_url': 'http://report'}, chunk_size=3))
+        self.assertEqual(chunks, ['abc', 'def'])
+        self.req_ctx.session.get.assert_called_once_with('http://report', stream=True, timeout=30)
+        self.response.iter_content.assert_called_once_with(3)
+        self.response.close.assert_called_once_with()
+
+    def test_iter_download_raises_for_error_status(self):
+        """
+        Test that a refused download raises a CanvasAPIError
+        """
+        self.response.status_code = 404
+        with self.assertRaises(CanvasAPIError):
+            list(iter_download(self.req_ctx, 'http://file'))
+        self.response.close.assert_called_once_with()
+
+    def test_download_to_path_callback_and_file_object(self):
+        """
+        Test that a download can be written to a path, passed to a callback, or written to a file object
+        """
+        path = os.path.join(self.directory, 'report.csv')
+        self.assertEqual(download(self.req_ctx, 'http://file', path), 6)
+        with open(path, 'rb') as downloaded:
+            self.assertEqual(downloaded.read(), 'abcdef')
+        self.assertFalse(os.path.exists(path + '.part'))
+        callback = mock.Mock(name='callback')
+        download(self.req_ctx, 'http://file', callback)
+        self.assertEqual(callback.call_args_list, [mock.call('abc'), mock.call('def')])
+        output = StringIO()
+        download(self.req_ctx, 'http://file', output)
+        self.assertEqual(output.getvalue(), 'abcdef')
+
+    def test_failed_download_to_path_leaves_no_file(self):
+        """
+        Test that a download to a path that fails midway leaves neither the path nor a part file
+        """
+        def chunks(chunk_size):
+            yield 'abc'
+            raise IOError('connection reset')
+
+        self.response.iter_content.side_effect = chunks
+        path = os.path.join(self.directory, 'report.csv')
+        with self.assertRaises(IOError):
+            download(self.req_ctx, 'http://file', path)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_iter_zip_entries_reads_deflated_and_stored_entries(self):
+        """
+        Test that zip entries are read from small chunks, in order, whether deflated or stored
+        """
+        entries = [('course_settings/syllabus.html', '<p>syllabus</p>' * 100), ('imsmanifest.xml', '<manifest/>')]
+        for compression in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+            chunks = split_chunks(build_zip(entries, compression), 7)
+            read = [(entry.name, ''.join(entry)) for entry in iter_zip_entries(chunks, chunk_size=5)]
+            self.assertEqual(read, entries, 'compression %d' % compression)
+
+    def test_unread_entries_are_skipped(self):
+        """
+        Test that moving on to the next entry skips the rest of the current one
+        """
+        chunks = split_chunks(build_zip([('a.csv', 'a' * 1000), ('b.csv', 'b,c\n')]), 100)
+        names = [entry.name for entry in iter_zip_entries(chunks)]
+        self.assertEqual(names, ['a.csv', 'b.csv'])
+
+    def test_iter_zip_entries_reads_entries_with_data_descriptors(self):
+        """
+        Test that entries whose sizes follow their content are read to the end of their deflate stream
+        """
+        archive = build_streamed_zip_entry('a.csv', 'x' * 500) + build_streamed_zip_entry('b.csv', 'y,z\n')
+        for chunk_size in (1, 16, len(archive)):
+            read = [(entry.name, ''.join(entry)) for entry in iter_zip_entries(split_chunks(archive, chunk_size))]
+            self.assertEqual(read, [('a.csv', 'x' * 500), ('b.csv', 'y,z\n')], 'chunk size %d' % chunk_size)
+
+    def test_corrupt_entry_raises_bad_zip_file(self):
+        """
+        Test that an entry whose content doesn't match its crc raises a BadZipfile
+        """
+        archive = build_zip([('a.txt', 'hello')], zipfile.ZIP_STORED).replace('hello', 'jello')
+        entry = next(iter_zip_entries([archive]))
+        with self.assertRaises(zipfile.BadZipfile):
+            ''.join(entry)
+
+    def test_iter_csv_rows(self):
+        """
+        Test that CSV rows are parsed across chunk boundaries, including quoted newlines, with values decoded and
+        a byte order mark skipped
+        """
+        content = '\xef\xbb\xbfuser_id,name\r\n1,"Ren\xc3\xa9e\r\nSmith"\r\n2,Bo\r\n'
+        chunks = split_chunks(content, 4)
+        self.assertEqual(list(iter_csv_rows(chunks)),
+                         [[u'user_id', u'name'], [u'1', u'Ren\xe9e\r\nSmith'], [u'2', u'Bo']])
+        self.assertEqual(list(iter_csv_rows(chunks, as_dicts=True)),
+                         [{u'user_id': u'1', u'name': u'Ren\xe9e\r\nSmith'}, {u'user_id': u'2', u'name': u'Bo'}])
+        self.assertEqual(list(iter_csv_rows([])), [])
@@ -0,0 +1,153 @@
+import unittest
+import mock
+from mock import patch
+from canvas_sdk.client import RequestContext
+from canvas_sdk.endpoints import Endpoint, get_endpoint
+from canvas_sdk.methods import account_reports, sections
+
+
+class TestEndpoint(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.base_api_url = 'http://base/url/api'
+        self.req_ctx.per_page = 10
+        self.endpoint = Endpoint(
+            'list_things', 'GET', '/v1/courses/{course_id}/things',
+            ('course_id', ('include[]', 'include'), 'search_term', 'per_page'),
+            (('include', ('a', 'b')),))
+
+    def test_arguments_are_split_into_path_arguments_and_payload_keys(self):
+        """
+        Test that arguments named in the path template are path arguments and the rest are payload keys
+        """
+        self.assertEqual(self.endpoint.argument_names, ('course_id', 'include', 'search_term', 'per_page'))
+        self.assertEqual(self.endpoint.path_arguments, ('course_id',))
+        self.assertEqual(self.endpoint.payload_keys,
+                         (('include[]', 'include'), ('search_term', 'search_term'), ('per_page', 'per_page')))
+        self.assertEqual(self.endpoint.per_page_index, 3)
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_formats_url_and_payload(self, mock_client_get):
+        """
+        Test that calling an endpoint makes the request with the formatted url, payload and request kwargs
+        """
+        result = self.endpoint(self.req_ctx, {'timeout': 5}, 1234, 'a', None, 50)
+        mock_client_get.assert_called_once_with(
+            self.req_ctx, 'http://base/url/api/v1/courses/1234/things',
+            payload={'include[]': 'a', 'search_term': None, 'per_page': 50}, timeout=5)
+        self.assertEqual(result, mock_client_get.return_value)
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_defaults_per_page_to_request_context(self, mock_client_get):
+        """
+        Test that a per_page of None is replaced by the request context's per_page
+        """
+        self.endpoint(self.req_ctx, {}, 1234, None, None, None)
+        self.assertEqual(mock_client_get.call_args[1]['payload']['per_page'], 10)
+
+    @patch('canvas_sdk.endpoints.utils.validate_attr_is_acceptable')
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_validates_enums(self, mock_client_get, mock_validate):
+        """
+        Test that enum arguments that aren't a single acceptable value go through the full validation
+        """
+        self.endpoint(self.req_ctx, {}, 1234, ['b', 'c'], None, None)
+        mock_validate.assert_called_once_with(['b', 'c'], frozenset(['a', 'b']))
+
+    @patch('canvas_sdk.endpoints.utils.validate_attr_is_acceptable')
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_accepts_single_acceptable_enum_value_or_none(self, mock_client_get, mock_validate):
+        """
+        Test that a single acceptable enum value, or None, is accepted with a lookup only
+        """
+        self.endpoint(self.req_ctx, {}, 1234, 'b', None, None)
+        self.endpoint(self.req_ctx, {}, 1234, None, None, None)
+        self.assertFalse(mock_validate.called)
+        self.assertEqual(mock_client_get.call_count, 2)
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_accepts_list_of_acceptable_enum_values(self, mock_client_get):
+        """
+        Test that a list of acceptable enum values passes validation
+        """
+        self.endpoint(self.req_ctx, {}, 1234, ['a', 'b'], None, None)
+        self.assertEqual(mock_client_get.call_args[1]['payload']['include[]'], ['a', 'b'])
+
+    def test_call_raises_for_unacceptable_enum_value(self):
+        """
+        Test that no request is made for an unacceptable enum value
+        """
+        with self.assertRaises(AttributeError):
+            self.endpoint(self.req_ctx, {}, 1234, 'c', None, None)
+
+    def test_single_enum_value_given_as_string_is_not_split_into_characters(self):
+        """
+        Test that an enum given as a plain string accepts that value only, not its substrings
+        """
+        endpoint = Endpoint('list_things', 'GET', '/v1/things', ('include',), (('include', 'user'),))
+        self.assertEqual(endpoint.enums, (('include', frozenset(['user'])),))
+        with self.assertRaises(AttributeError):
+            endpoint(self.req_ctx, {}, 'u')
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_fills_path_template_in_order(self, mock_client_get):
+        """
+        Test that the precompiled url template is filled in path order, whatever the signature order
+        """
+        endpoint = Endpoint('get_thing', 'GET', '/v1/courses/{course_id}/things/{id}', ('id', 'course_id'))
+        self.assertEqual(endpoint.path_arguments, ('course_id', 'id'))
+        endpoint(self.req_ctx, {}, 2, 1)
+        mock_client_get.assert_called_once_with(self.req_ctx, 'http://base/url/api/v1/courses/1/things/2')
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_call_keeps_percent_signs_in_path(self, mock_client_get):
+        """
+        Test that a literal % in a path template is not treated as a format specifier
+        """
+        endpoint = Endpoint('get_thing', 'GET', '/v1/things%20/{id}', ('id',))
+        endpoint(self.req_ctx, {}, 1)
+        mock_client_get.assert_called_once_with(self.req_ctx, 'http://base/url/api/v1/things%20/1')
+
+    @patch('canvas_sdk.endpoints.client.get')
+    def test_request_takes_path_values_and_payload(self, mock_client_get):
+        """
+        Test that the request function the generated methods call fills the path template with the path values and
+        sends the payload
+        """
+        endpoint = Endpoint(
+            'list_things', 'GET', '/v1/courses/{course_id}/things/{id}', ('id', 'course_id', 'per_page'))
+        endpoint.request(self.req_ctx, {'timeout': 5}, (1, 2), {'per_page': None})
+        mock_client_get.assert_called_once_with(
+            self.req_ctx, 'http://base/url/api/v1/courses/1/things/2', payload={'per_page': 10}, timeout=5)
+
+    @patch('canvas_sdk.endpoints.client.delete')
+    def test_call_without_payload_arguments_sends_no_payload(self, mock_client_delete):
+        """
+        Test that an endpoint with only path arguments doesn't pass a payload to the client
+        """
+        endpoint = Endpoint('delete_thing', 'DELETE', '/v1/things/{id}', ('id',))
+        endpoint(self.req_ctx, {}, 1)
+        mock_client_delete.assert_called_once_with(self.req_ctx, 'http://base/url/api/v1/things/1')
+
+    def test_table_is_keyed_by_name(self):
+        """
+        Test that Endpoint.table builds a dictionary of endpoints keyed by function name
+        """
+        table = Endpoint.table([('delete_thing', 'DELETE', '/v1/things/{id}', ('id',))])
+        self.assertEqual(table.keys(), ['delete_thing'])
+        self.assertEqual(table['delete_thing'].method, 'DELETE')
+
+    def test_get_endpoint_of_generated_method(self):
+        """
+        Test that get_endpoint finds the endpoint wrapped by a generated method
+        """
+        self.assertIs(get_endpoint(sections.list_course_sections),
+                      sections.ENDPOINTS['list_course_sections'])
+
+    def test_get_endpoint_of_hand_written_method_is_none(self):
+        """
+        Test that get_endpoint returns None for methods that build their request themselves
+        """
+        self.assertIsNone(get_endpoint(account_reports.start_report))
@@ -0,0 +1,184 @@
+import unittest
+import mock
+from concurrent.futures import wait
+from mock import patch
+from requests.exceptions import ConnectionError
+from canvas_sdk.client import RequestContext
+from canvas_sdk.exceptions import CanvasAPIError, JobFailedError
+from canvas_sdk.jobs import JobPoller, get_job_completion, get_job_state
+
+
+class TestJobPoller(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.poller = JobPoller(self.req_ctx, initial_interval=1.0, max_interval=60.0, multiplier=2.0)
+        self.clock = patch('canvas_sdk.jobs.time.time', return_value=1000.0)
+        self.mock_time = self.clock.start()
+        self.addCleanup(self.clock.stop)
+        # Keep the background thread out of the synchronous tests
+        self.thread = patch('canvas_sdk.jobs.threading.Thread')
+        self.thread.start()
+        self.addCleanup(self.thread.stop)
+
+    def build_status_function(self, *jobs):
+        function = mock.Mock(name='status-function', __name__='status_function')
+        responses = []
+        for job in jobs:
+            response = mock.Mock(name='response')
+            response.json.return_value = job
+            responses.append(response)
+        function.side_effect = responses
+        return function
+
+    def advance(self, seconds):
+        self.mock_time.return_value += seconds
+        self.poller.poll_due_jobs()
+
+    def test_job_state_and_completion(self):
+        """
+        Test that the state and completion of every kind of job are found
+        """
+        self.assertEqual(get_job_state({'workflow_state': 'running', 'completion': 50}), 'running')
+        self.assertEqual(get_job_state({'status': 'compiling', 'progress': 10}), 'compiling')
+        self.assertEqual(get_job_completion({'completion': 50}), 50.0)
+        self.assertEqual(get_job_completion({'progress': 10}), 10.0)
+        self.assertIsNone(get_job_completion({'workflow_state': 'exporting'}))
+
+    def test_job_is_polled_until_it_succeeds(self):
+        """
+        Test that a job is first polled after the initial interval and its future resolves to its final json
+        """
+        function = self.build_status_function({'workflow_state': 'running'}, {'workflow_state': 'completed'})
+        future = self.poller.submit(function, 'progress-id', timeout=5)
+        self.advance(0.5)
+        self.assertFalse(function.called, "The job should not be polled before the initial interval")
+        self.advance(0.5)
+        self.advance(2.0)
+        self.assertEqual(future.result(0), {'workflow_state': 'completed'})
+        function.assert_called_with(self.req_ctx, 'progress-id', timeout=5)
+        self.assertEqual(len(self.poller), 0)
+
+    def test_interval_backs_off_while_job_runs(self):
+        """
+        Test that the interval between polls grows by the multiplier up to max_interval
+        """
+        function = self.build_status_function(*[{'workflow_state': 'running'}] * 10)
+        self.poller.submit(function)
+        poll_times = []
+        function.side_effect = lambda *args: (poll_times.append(self.mock_time.return_value),
+                                              mock.Mock(json=mock.Mock(return_value={'status': 'running'})))[1]
+        for _ in range(200):
+            self.advance(1.0)
+        self.assertEqual([b - a for a, b in zip(poll_times, poll_times[1:])], [2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0])
+
+    def test_interval_is_capped_by_estimated_time_left(self):
+        """
+        Test that a job reporting steady progress is polled again when it should be finishing
+        """
+        job = mock.Mock(interval=8.0, completion=40.0, polled_at=990.0)
+        self.assertEqual(self.poller.get_next_interval(job, 80.0, 1000.0), 5.0)
+        self.assertEqual(self.poller.get_next_interval(job, 99.9, 1000.0), 1.0)
+        self.assertEqual(self.poller.get_next_interval(job, 40.0, 1000.0), 16.0)
+
+    def test_failed_job_raises_job_failed_error(self):
+        """
+        Test that the future of a job that fails raises a JobFailedError carrying the job's json
+        """
+        job = {'id': 3, 'workflow_state': 'failed_with_messages', 'message': 'bad csv'}
+        future = self.poller.submit(self.build_status_function(job), 3)
+        self.advance(1.0)
+        with self.assertRaises(JobFailedError) as context:
+            future.result(0)
+        self.assertEqual(context.exception.job, job)
+        self.assertEqual(str(context.exception), 'Job 3 failed_with_messages: bad csv')
+
+    def test_polling_error_is_set_on_future(self):
+        """
+        Test that an error raised while polling a job is raised by its future
+        """
+        function = self.build_status_function()
+        function.side_effect = CanvasAPIError(status_code=404)
+        future = self.poller.submit(function, 3)
+        self.advance(1.0)
+        with self.assertRaises(CanvasAPIError):
+            future.result(0)
+
+    def test_transient_polling_error_is_retried(self):
+        """
+        Test that a poll failing with a transient error is retried after the backed off interval, and that the
+        job's future resolves once a later poll succeeds
+        """
+        function = self.build_status_function()
+        response = mock.Mock(name='response')
+        response.json.return_value = {'workflow_state': 'completed'}
+        function.side_effect = [CanvasAPIError(status_code=503), response]
+        future = self.poller.submit(function, 3)
+        self.advance(1.0)
+        self.assertFalse(future.done(), "A transient error should not fail the job's future")
+        self.advance(1.0)
+        self.assertEqual(function.call_count, 1, "The retry should wait for the backed off interval")
+        self.advance(1.0)
+        self.assertEqual(future.result(0), {'workflow_state': 'completed'})
+        self.assertEqual(function.call_count, 2)
+
+    def test_consecutive_transient_polling_errors_fail_future(self):
+        """
+        Test that the future of a job fails with the last error once polling it fails max_errors times in a row
+        """
+        poller = JobPoller(self.req_ctx, initial_interval=1.0, max_interval=1.0, max_errors=3)
+        function = self.build_status_function()
+        errors = [ConnectionError('reset'), CanvasAPIError(status_code=502), ConnectionError('refused')]
+        function.side_effect = errors
+        future = poller.submit(function, 3)
+        for _ in range(3):
+            self.mock_time.return_value += 1.0
+            poller.poll_due_jobs()
+        self.assertIs(future.exception(0), errors[-1])
+        self.assertEqual(len(poller), 0)
+
+    def test_cancelled_job_is_dropped(self):
+        """
+        Test that a job whose future is cancelled is no longer polled
+        """
+        function = self.build_status_function({'workflow_state': 'running'})
+        future = self.poller.submit(function, 3)
+        self.assertTrue(future.cancel())
+        self.advance(1.0)
+        self.assertFalse(function.called)
+        self.assertEqual(len(self.poller), 0)
+
+    def test_shutdown_cancels_outstanding_jobs(self):
+        """
+        Test that shutting down cancels the futures of unfinished jobs and refuses new ones
+        """
+        future = self.poller.submit(self.build_status_function(), 3)
+        self.poller.shutdown(wait=False)
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            self.poller.submit(self.build_status_function(), 4)
+
+
+class TestJobPollerThread(unittest.TestCase):
+    longMessage = True
+
+    def test_one_thread_resolves_many_jobs(self):
+        """
+        Test that the background thread polls many jobs at once and resolves them as they finish
+        """
+        req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        poller = JobPoller(req_ctx, initial_interval=0.01, max_interval=0.02)
+        polls = {}
+
+        def status(request_ctx, job_id):
+            polls[job_id] = polls.get(job_id, 0) + 1
+            state = 'exported' if polls[job_id] > job_id % 3 else 'exporting'
+            return mock.Mock(json=mock.Mock(return_value={'id': job_id, 'workflow_state': state}))
+
+        futures = [poller.submit(status, job_id) for job_id in range(50)]
+        done, not_done = wait(futures, timeout=10)
+        poller.shutdown()
+        self.assertEqual(not_done, set())
+        self.assertEqual([future.result()['id'] for future in futures], range(50))
+        self.assertFalse(poller._thread.is_alive())
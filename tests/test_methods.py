@@ -0,0 +1,140 @@
+import importlib
+import inspect
+import pkgutil
+import subprocess
+import sys
+import types
+import unittest
+
+import mock
+from mock import patch
+
+import canvas_sdk.methods
+from canvas_sdk.client import RequestContext
+from canvas_sdk.methods import LazyModule
+
+
+def run_in_new_interpreter(code):
+    """
+    Run code in a fresh interpreter, so that no SDK method modules have been imported yet, and return its output
+    """
+    return subprocess.check_output([sys.executable, '-c', code]).strip()
+
+
+class TestMethodsPackage(unittest.TestCase):
+    longMessage = True
+
+    def test_all_lists_generated_modules(self):
+        """
+        Test that __all__ lists the generated method modules
+        """
+        self.assertIn('courses', canvas_sdk.methods.__all__)
+        self.assertIn('discussion_topics', canvas_sdk.methods.__all__)
+        self.assertNotIn('__init__', canvas_sdk.methods.__all__)
+
+    def test_all_matches_modules_found_by_pkgutil(self):
+        """
+        Test that listing the package directory finds the same modules as pkgutil
+        """
+        self.assertEqual(canvas_sdk.methods.__all__, sorted(
+            name for _, name, is_package in pkgutil.iter_modules(canvas_sdk.methods.__path__) if not is_package))
+
+    @patch('canvas_sdk.methods.pkgutil.iter_modules')
+    def test_modules_of_package_that_is_not_a_directory_are_listed_by_pkgutil(self, mock_iter_modules):
+        """
+        Test that pkgutil lists the modules when the package path can't be listed, e.g. in a zipped egg
+        """
+        mock_iter_modules.return_value = [(None, 'tabs', False), (None, 'courses', False), (None, 'package', True)]
+        self.assertEqual(canvas_sdk.methods._list_modules(['/path/to/sdk.egg/canvas_sdk/methods']),
+                         ['courses', 'tabs'])
+
+    def test_star_import_does_not_import_method_modules(self):
+        """
+        Test that "from canvas_sdk.methods import *" binds every module without importing any of them
+        """
+        output = run_in_new_interpreter(
+            "import sys\n"
+            "from canvas_sdk.methods import *\n"
+            "print(len([m for m in sys.modules if m.startswith('canvas_sdk.methods.') and sys.modules[m]]))\n"
+            "print(type(courses).__name__)")
+        self.assertEqual(output.split(), ['0', 'LazyModule'])
+
+    def test_lazy_module_imports_module_on_attribute_access(self):
+        """
+        Test that using an attribute of a lazy module imports the real module and returns its attribute
+        """
+        output = run_in_new_interpreter(
+            "import sys\n"
+            "from canvas_sdk.methods import tabs\n"
+            "print('canvas_sdk.methods.tabs' in sys.modules)\n"
+            "print(tabs.list_available_tabs_for_course_or_group_courses is "
+            "sys.modules['canvas_sdk.methods.tabs'].list_available_tabs_for_course_or_group_courses)")
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_imported_module_replaces_lazy_module_on_package(self):
+        """
+        Test that once a module has been imported, the package attribute is the real module
+        """
+        import canvas_sdk.methods.sections
+        self.assertIsInstance(canvas_sdk.methods.sections, types.ModuleType)
+        self.assertNotIsInstance(canvas_sdk.methods.sections, LazyModule)
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """
+        Test that names that aren't method modules raise an AttributeError
+        """
+        with self.assertRaises(AttributeError):
+            canvas_sdk.methods.not_a_module
+
+    def test_setattr_on_lazy_module_sets_attribute_on_real_module(self):
+        """
+        Test that setting an attribute on a lazy module sets it on the real module
+        """
+        lazy_module = LazyModule('canvas_sdk.methods.services')
+        lazy_module.test_attribute = 'value'
+        self.addCleanup(delattr, lazy_module, 'test_attribute')
+        self.assertEqual(sys.modules['canvas_sdk.methods.services'].test_attribute, 'value')
+
+
+class TestMethodPayloads(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = RequestContext('token', 'https://canvas/api', per_page=10)
+        self.req_ctx.session = mock.MagicMock(name='canvas-session')
+
+    def call_method(self, function, optional_value):
+        """
+        Call a method with 'value' for its required arguments and optional_value for the optional ones, and
+        return the keyword arguments of the request sent for it
+        """
+        spec = inspect.getargspec(function)
+        names = spec.args[1:]
+        required = len(names) - len(spec.defaults or ())
+        values = ['value' if index < required else optional_value for index in range(len(names))]
+        # hand-written methods that expand a dictionary argument into the payload
+        for index, name in enumerate(names):
+            if name == 'parameters' or (name.endswith('_attributes') and optional_value is not None):
+                values[index] = {'key': optional_value}
+        self.req_ctx.session.request.reset_mock()
+        function(self.req_ctx, *values)
+        return self.req_ctx.session.request.call_args[1]
+
+    @patch('canvas_sdk.utils.validate_any')
+    @patch('canvas_sdk.utils.validate_attr_is_acceptable')
+    def test_every_method_sends_normalized_payload(self, mock_validate, mock_validate_any):
+        """
+        Test that no method in any method module sends None values or Python-encoded booleans
+        """
+        for module_name in canvas_sdk.methods.__all__:
+            module = importlib.import_module('canvas_sdk.methods.' + module_name)
+            for name, function in vars(module).items():
+                if not isinstance(function, types.FunctionType) or function.__module__ != module.__name__:
+                    continue
+                for optional_value in (None, False, True):
+                    request_kwargs = self.call_method(function, optional_value)
+                    for payload in (request_kwargs['params'], request_kwargs['data']):
+                        for key, value in payload or ():
+                            self.assertIsNotNone(value, '%s.%s sent %s=None' % (module_name, name, key))
+                            self.assertNotIsInstance(value, bool, '%s.%s sent a bool for %s' % (
+                                module_name, name, key))
@@ -0,0 +1,85 @@
+import pickle
+import unittest
+
+from canvas_sdk.records import Record, get_record_converter, record_type
+
+# Module-level so that its records can be pickled
+Enrollment = record_type('Enrollment', ('id', 'user_id', 'type'), __name__)
+
+
+class TestRecords(unittest.TestCase):
+    longMessage = True
+
+    def test_record_type_stores_fields_in_slots(self):
+        """
+        Test that record types are Record subclasses with their fields as slots and no instance dictionary
+        """
+        record = Enrollment(1, 2, 'StudentEnrollment')
+        self.assertTrue(issubclass(Enrollment, Record))
+        self.assertEqual((record.id, record.user_id, record.type), (1, 2, 'StudentEnrollment'))
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.other = 'value'
+
+    def test_missing_values_are_none(self):
+        """
+        Test that fields without a value are None
+        """
+        self.assertIsNone(Enrollment(1).type)
+
+    def test_too_many_values_raises_type_error(self):
+        """
+        Test that giving more values than fields raises a TypeError
+        """
+        with self.assertRaises(TypeError):
+            Enrollment(1, 2, 3, 4)
+
+    def test_from_json_drops_other_keys(self):
+        """
+        Test that a record built from a json object keeps only its fields
+        """
+        record = Enrollment.from_json({'id': 1, 'type': 'TaEnrollment', 'grades': {'current_score': 90}})
+        self.assertEqual(record.as_dict(), {'id': 1, 'user_id': None, 'type': 'TaEnrollment'})
+
+    def test_records_compare_and_pickle_by_value(self):
+        """
+        Test that records are equal when their type and values are, and survive pickling
+        """
+        record = Enrollment(1, 2, 'StudentEnrollment')
+        self.assertEqual(record, Enrollment(1, 2, 'StudentEnrollment'))
+        self.assertNotEqual(record, Enrollment(1, 3, 'StudentEnrollment'))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(record, protocol)), record)
+
+    def test_repr_lists_fields(self):
+        """
+        Test the repr of a record
+        """
+        self.assertEqual(repr(Enrollment(1, 2)), "Enrollment(id=1, user_id=2, type=None)")
+
+    def test_record_type_rejects_invalid_field_names(self):
+        """
+        Test that json keys that can't be attribute names are rejected
+        """
+        with self.assertRaises(ValueError):
+            record_type('Bad', ('id', 'not-a-name'))
+        with self.assertRaises(ValueError):
+            record_type('Bad', ('class',))
+
+    def test_get_record_converter(self):
+        """
+        Test that the converter uses the record type, projects it to the given fields, or builds one from them
+        """
+        self.assertIsNone(get_record_converter())
+        self.assertIsInstance(get_record_converter(Enrollment)({'id': 1}), Enrollment)
+        projected = get_record_converter(Enrollment, ('id',))({'id': 1, 'user_id': 2})
+        self.assertEqual(projected.as_dict(), {'id': 1})
+        self.assertEqual(type(projected).__name__, 'Enrollment')
+        self.assertEqual(get_record_converter(fields=('user_id',))({'id': 1, 'user_id': 2}).as_dict(), {'user_id': 2})
+
+    def test_get_record_converter_rejects_fields_outside_record_type(self):
+        """
+        Test that projecting a record type to fields it doesn't have raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            get_record_converter(Enrollment, ('id', 'grades'))
@@ -41,11 +41,20 @@ class TestSections(unittest.TestCase):
     @patch('canvas_sdk.methods.sections.client.get')
     def test_list_course_sections_calls_validate_attributes(self, mock_client_get, mock_validate):
         """
-        Assert that validate_attr_is_acceptable called for include
+        Assert that validate_attr_is_acceptable called for an include that isn't one of the acceptable values
         """
-        include = 'students'
+        include = ['students', 'enrollments']
         sections.list_course_sections(self.req_ctx, self.course_id, include)
-        mock_validate.assert_called_once_with(include, ('students', 'avatar_url'))
+        mock_validate.assert_called_once_with(include, frozenset(['students', 'avatar_url']))
+
+    @patch('canvas_sdk.methods.sections.client.get')
+    def test_list_course_sections_raises_for_unacceptable_include(self, mock_client_get):
+        """
+        Assert that no request is made for an include that isn't one of the acceptable values
+        """
+        with self.assertRaises(AttributeError):
+            sections.list_course_sections(self.req_ctx, self.course_id, 'enrollments')
+        self.assertFalse(mock_client_get.called)
 
     @patch('canvas_sdk.methods.sections.utils.validate_attr_is_acceptable')
     @patch('canvas_sdk.methods.sections.client.get')
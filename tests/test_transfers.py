@@ -0,0 +1,207 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+from mock import patch
+from canvas_sdk.client import RequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import files
+from canvas_sdk.transfers import TransferJournal, TransferManager
+
+
+class TestTransferJournal(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'transfers.journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_entries_survive_reopening(self):
+        """
+        Test that the last entry recorded for each key is read back when the journal is reopened
+        """
+        journal = TransferJournal(self.path)
+        journal.record('download:1', state='partial', offset=10)
+        journal.record('download:1', state='done', size=20)
+        journal.record('download:2', state='partial', offset=5)
+        journal.close()
+        journal = TransferJournal(self.path)
+        self.assertEqual(journal.get('download:1'), {'state': 'done', 'size': 20})
+        self.assertTrue(journal.is_done('download:1'))
+        self.assertFalse(journal.is_done('download:2'))
+        self.assertIsNone(journal.get('download:3'))
+        journal.close()
+
+    def test_opening_compacts_and_ignores_incomplete_lines(self):
+        """
+        Test that a line cut short by a crash is ignored and the journal is rewritten with one line per key
+        """
+        with open(self.path, 'wb') as journal_file:
+            journal_file.write('{"key": "download:1", "offset": 10, "state": "partial"}\n')
+            journal_file.write('{"key": "download:1", "size": 20, "state": "done"}\n')
+            journal_file.write('{"key": "download:2", "off')
+        journal = TransferJournal(self.path)
+        journal.close()
+        with open(self.path, 'rb') as journal_file:
+            lines = [json.loads(line) for line in journal_file]
+        self.assertEqual(lines, [{'key': 'download:1', 'size': 20, 'state': 'done'}])
+
+
+class TestTransferManager(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.timeout = 30
+        self.req_ctx.proxies = None
+        self.req_ctx.verify = True
+        self.req_ctx.cert = None
+        self.directory = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.directory, 'transfers.journal')
+        self.journal = TransferJournal(self.journal_path)
+        self.manager = TransferManager(self.req_ctx, self.journal, workers=2, chunk_size=4, checkpoint_bytes=4)
+        self.remote_file = {'id': 7, 'display_name': 'notes.txt', 'size': 10, 'updated_at': '2014-01-01T00:00:00Z',
+                            'url': 'https://canvas/files/7/download?verifier=abc'}
+        self.destination = os.path.join(self.directory, 'notes.txt')
+        patchers = {
+            'list_files': patch('canvas_sdk.transfers.utils.get_all_list_data'),
+            'upload': patch('canvas_sdk.transfers.upload_file_stream'),
+            'get': patch('canvas_sdk.transfers.requests.get'),
+        }
+        self.mocks = dict((name, patcher.start()) for name, patcher in patchers.items())
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+        self.mocks['list_files'].return_value = [self.remote_file]
+        self.mocks['upload'].return_value.json.return_value = {'id': 7}
+
+    def tearDown(self):
+        self.journal.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self):
+        """
+        Start over with a new manager and the journal read back from disk, as after a restart
+        """
+        self.journal.close()
+        self.journal = TransferJournal(self.journal_path)
+        self.manager = TransferManager(self.req_ctx, self.journal, workers=2, chunk_size=4, checkpoint_bytes=4)
+
+    def build_download_response(self, status_code, content):
+        response = mock.Mock(name='download-response', status_code=status_code, text='')
+        response.iter_content.side_effect = lambda chunk_size: [
+            content[index:index + chunk_size] for index in range(0, len(content), chunk_size)]
+        return response
+
+    def write_local_file(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as local_file:
+            local_file.write(content)
+        return path
+
+    def test_uploaded_files_are_skipped_after_restart(self):
+        """
+        Test that files recorded as uploaded are skipped after a restart, checked with a single folder listing
+        """
+        path = self.write_local_file('notes.txt', '0123456789')
+        result = self.manager.upload_files([path], 42)
+        self.assertEqual(result.transferred, [path])
+        self.mocks['upload'].assert_called_once_with(
+            self.req_ctx, files.upload_file, path, 42, on_duplicate='overwrite', chunk_size=4)
+        self.assertFalse(self.mocks['list_files'].called, "Nothing is done yet, so there is nothing to check")
+
+        self.reopen()
+        result = self.manager.upload_files([path, path], 42)
+        self.assertEqual(result.skipped, [path, path])
+        self.assertEqual(result.transferred, [])
+        self.assertEqual(self.mocks['upload'].call_count, 1)
+        self.mocks['list_files'].assert_called_once_with(self.req_ctx, files.list_files_folders, 42)
+
+    def test_changed_or_missing_uploads_are_uploaded_again(self):
+        """
+        Test that a file recorded as uploaded is uploaded again if it changed locally or is gone remotely
+        """
+        path = self.write_local_file('notes.txt', '0123456789')
+        self.manager.upload_files([path], 42)
+        self.write_local_file('notes.txt', '01234567890')
+        self.assertEqual(self.manager.upload_files([path], 42).transferred, [path])
+        self.mocks['list_files'].return_value = []
+        self.assertEqual(self.manager.upload_files([path], 42).transferred, [path])
+        self.assertEqual(self.mocks['upload'].call_count, 3)
+
+    def test_download_writes_file_and_records_it(self):
+        """
+        Test that a download is written to the destination through a part file and recorded as done
+        """
+        self.mocks['get'].return_value = self.build_download_response(200, '0123456789')
+        self.manager.download_file(self.remote_file, self.destination)
+        with open(self.destination, 'rb') as local_file:
+            self.assertEqual(local_file.read(), '0123456789')
+        self.assertFalse(os.path.exists(self.destination + '.part'))
+        self.assertEqual(self.mocks['get'].call_args[1]['headers'], None)
+        self.assertEqual(self.journal.get('download:7')['state'], 'done')
+
+    def test_partial_download_is_resumed_with_range(self):
+        """
+        Test that a partial download of the same version of a file is resumed from the size of its part file
+        """
+        self.journal.record('download:7', state='partial', offset=4, size=10, updated_at='2014-01-01T00:00:00Z')
+        self.write_local_file('notes.txt.part', '012345')
+        self.mocks['get'].return_value = self.build_download_response(206, '6789')
+        self.manager.download_file(self.remote_file, self.destination)
+        self.assertEqual(self.mocks['get'].call_args[1]['headers'], {'Range': 'bytes=6-'})
+        with open(self.destination, 'rb') as local_file:
+            self.assertEqual(local_file.read(), '0123456789')
+
+    def test_download_starts_over_when_range_is_ignored_or_file_changed(self):
+        """
+        Test that the part file is overwritten when the server ignores the range, and that no range is asked for
+        when the remote file changed since the part file was written
+        """
+        self.journal.record('download:7', state='partial', offset=4, size=10, updated_at='2014-01-01T00:00:00Z')
+        self.write_local_file('notes.txt.part', 'xxxxxx')
+        self.mocks['get'].return_value = self.build_download_response(200, '0123456789')
+        self.manager.download_file(self.remote_file, self.destination)
+        with open(self.destination, 'rb') as local_file:
+            self.assertEqual(local_file.read(), '0123456789')
+
+        self.journal.record('download:7', state='partial', offset=4, size=10, updated_at='2013-01-01T00:00:00Z')
+        self.write_local_file('notes.txt.part', 'xxxxxx')
+        self.manager.download_file(self.remote_file, self.destination)
+        self.assertEqual(self.mocks['get'].call_args[1]['headers'], None)
+
+    def test_short_download_raises_io_error_and_keeps_part_file(self):
+        """
+        Test that a download that ends early raises an IOError and leaves its part file to be resumed
+        """
+        self.mocks['get'].return_value = self.build_download_response(200, '01234')
+        with self.assertRaises(IOError):
+            self.manager.download_file(self.remote_file, self.destination)
+        self.assertEqual(os.path.getsize(self.destination + '.part'), 5)
+        self.assertEqual(self.journal.get('download:7')['state'], 'partial')
+
+    def test_refused_download_raises_canvas_api_error(self):
+        """
+        Test that an error status from the file's url raises a CanvasAPIError
+        """
+        self.mocks['get'].return_value = self.build_download_response(403, '')
+        with self.assertRaises(CanvasAPIError):
+            self.manager.download_file(self.remote_file, self.destination)
+
+    def test_downloaded_files_are_skipped_after_restart(self):
+        """
+        Test that files recorded as downloaded are skipped after a restart, checked with a single folder listing
+        """
+        self.mocks['get'].return_value = self.build_download_response(200, '0123456789')
+        result = self.manager.download_folder(42, self.directory)
+        self.assertEqual(result.transferred, [7])
+
+        self.reopen()
+        result = self.manager.download_folder(42, self.directory)
+        self.assertEqual(result.skipped, [7])
+        self.assertEqual(self.mocks['get'].call_count, 1)
+        self.assertEqual(self.mocks['list_files'].call_count, 2)
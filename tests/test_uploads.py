@@ -0,0 +1,275 @@
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+import mock
+import requests
+from mock import patch
+from canvas_sdk.client import RequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.methods import files
+from canvas_sdk.uploads import FolderUploader, MultipartEncoder, get_file_size, upload_file_stream
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    longMessage = True
+
+    def build_encoder(self, content='0123456789', **kwargs):
+        encoder = MultipartEncoder([('key', 'uploads/abc'), (u'na\xefve', u'caf\xe9')], 'file', 'a "b".txt',
+                                   StringIO(content), len(content), 'text/plain', **kwargs)
+        return encoder
+
+    def test_body_has_fields_before_file(self):
+        """
+        Test that the body is the form fields, then the file part, then the closing boundary, and that its
+        length is known up front
+        """
+        encoder = MultipartEncoder([('key', 'uploads/abc')], 'file', 'a "b".txt', StringIO('0123456789'), 10,
+                                   'text/plain')
+        boundary = encoder.content_type.split('boundary=')[1]
+        body = encoder.read()
+        self.assertEqual(body, (
+            '--%(b)s\r\nContent-Disposition: form-data; name="key"\r\n\r\nuploads/abc\r\n'
+            '--%(b)s\r\nContent-Disposition: form-data; name="file"; filename="a %%22b%%22.txt"\r\n'
+            'Content-Type: text/plain\r\n\r\n0123456789\r\n--%(b)s--\r\n') % {'b': boundary})
+        self.assertEqual(len(encoder), len(body))
+        self.assertEqual(encoder.read(), '')
+
+    def test_reads_in_chunks_of_requested_size(self):
+        """
+        Test that reading the body in small pieces gives the same bytes, never more than asked for
+        """
+        encoder = self.build_encoder(content='x' * 1000, chunk_size=7)
+        expected = len(encoder)
+        pieces = []
+        while True:
+            piece = encoder.read(13)
+            if not piece:
+                break
+            self.assertLessEqual(len(piece), 13)
+            pieces.append(piece)
+        self.assertEqual(len(''.join(pieces)), expected)
+        self.assertIn('x' * 1000, ''.join(pieces))
+
+    def test_reports_progress_per_chunk(self):
+        """
+        Test that progress is called with the bytes of the file read so far and its size
+        """
+        progress = mock.Mock(name='progress')
+        encoder = self.build_encoder(content='x' * 10, chunk_size=4, progress=progress)
+        list(encoder)
+        self.assertEqual(progress.call_args_list, [mock.call(4, 10), mock.call(8, 10), mock.call(10, 10)])
+
+    def test_short_file_raises_io_error(self):
+        """
+        Test that a file with fewer bytes than its stated size raises an IOError rather than sending a body
+        shorter than its Content-Length
+        """
+        encoder = MultipartEncoder([], 'file', 'a.txt', StringIO('abc'), 10)
+        with self.assertRaises(IOError):
+            encoder.read()
+
+    def test_requests_sends_it_with_content_length(self):
+        """
+        Test that requests streams the encoder as the body with a Content-Length header, not chunked
+        """
+        encoder = self.build_encoder()
+        prepared = requests.Request('POST', 'http://upload/url', data=encoder,
+                                    headers={'Content-Type': encoder.content_type}).prepare()
+        self.assertIs(prepared.body, encoder)
+        self.assertEqual(prepared.headers['Content-Length'], str(len(encoder)))
+        self.assertNotIn('Transfer-Encoding', prepared.headers)
+
+
+class TestUploadFileStream(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.timeout = 30
+        self.req_ctx.proxies = None
+        self.req_ctx.verify = True
+        self.req_ctx.cert = None
+        self.function = mock.Mock(name='upload-function')
+        self.function.return_value.json.return_value = {
+            'upload_url': 'https://upload/url', 'upload_params': {'key': 'uploads/abc', 'Policy': 'p'}}
+        self.bodies = []
+        self.upload_response = mock.Mock(name='upload-response', status_code=302,
+                                         headers={'Location': 'https://canvas/api/v1/files/1/create_success'})
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'lecture.mp4')
+        with open(self.path, 'wb') as upload_file:
+            upload_file.write('x' * 100)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def post(self, url, data=None, **kwargs):
+        self.bodies.append(data.read())
+        return self.upload_response
+
+    @patch('canvas_sdk.uploads.client.get')
+    @patch('canvas_sdk.uploads.requests.post')
+    def test_runs_three_steps_for_path(self, mock_post, mock_get):
+        """
+        Test that the upload is announced with the file's name, size and type, posted to the upload url
+        without auth, and confirmed by getting the redirect location
+        """
+        mock_post.side_effect = self.post
+        progress = mock.Mock(name='progress')
+        result = upload_file_stream(self.req_ctx, self.function, self.path, 'folder-id',
+                                    on_duplicate='rename', progress=progress, timeout=5)
+        self.function.assert_called_once_with(self.req_ctx, 'folder-id', timeout=5, data={
+            'name': 'lecture.mp4', 'size': 100, 'content_type': 'video/mp4', 'on_duplicate': 'rename'})
+        (url,), kwargs = mock_post.call_args
+        self.assertEqual(url, 'https://upload/url')
+        self.assertNotIn('auth', kwargs)
+        self.assertFalse(kwargs['allow_redirects'])
+        self.assertTrue(kwargs['headers']['Content-Type'].startswith('multipart/form-data; boundary='))
+        self.assertLess(self.bodies[0].index('name="Policy"'), self.bodies[0].index('name="file"'))
+        self.assertIn('x' * 100, self.bodies[0])
+        progress.assert_called_with(100, 100)
+        mock_get.assert_called_once_with(self.req_ctx, 'https://canvas/api/v1/files/1/create_success')
+        self.assertEqual(result, mock_get.return_value)
+
+    @patch('canvas_sdk.uploads.client.get')
+    @patch('canvas_sdk.uploads.requests.post')
+    def test_created_response_with_file_json_is_returned(self, mock_post, mock_get):
+        """
+        Test that a 201 Created response with content is the confirmation, and a file object is left open
+        """
+        mock_post.side_effect = self.post
+        self.upload_response.status_code = 201
+        self.upload_response.content = '{"id": 1}'
+        with open(self.path, 'rb') as fileobj:
+            result = upload_file_stream(self.req_ctx, self.function, fileobj, 'folder-id')
+            self.assertFalse(fileobj.closed)
+        self.assertEqual(result, self.upload_response)
+        self.assertFalse(mock_get.called)
+
+    @patch('canvas_sdk.uploads.requests.post')
+    def test_rejected_upload_raises_canvas_api_error(self, mock_post):
+        """
+        Test that an error status from the upload url raises a CanvasAPIError
+        """
+        mock_post.side_effect = self.post
+        self.upload_response.status_code = 403
+        self.upload_response.text = 'Policy expired'
+        with self.assertRaises(CanvasAPIError) as context:
+            upload_file_stream(self.req_ctx, self.function, self.path, 'folder-id')
+        self.assertEqual(context.exception.status_code, 403)
+
+    def test_file_object_without_name_or_size_raises_value_error(self):
+        """
+        Test that uploading a file object needs a name and size when they can't be found from it
+        """
+        fileobj = mock.Mock(spec=['read'])
+        with self.assertRaises(ValueError):
+            upload_file_stream(self.req_ctx, self.function, fileobj, 'folder-id', size=10)
+        with self.assertRaises(ValueError):
+            upload_file_stream(self.req_ctx, self.function, fileobj, 'folder-id', name='a.txt')
+        self.assertFalse(self.function.called)
+
+    def test_get_file_size_counts_from_current_position(self):
+        """
+        Test that the size of a file object is counted from its current position
+        """
+        fileobj = StringIO('0123456789')
+        fileobj.seek(4)
+        self.assertEqual(get_file_size(fileobj), 6)
+        self.assertEqual(fileobj.tell(), 4)
+        with open(self.path, 'rb') as real_file:
+            self.assertEqual(get_file_size(real_file), 100)
+
+
+class TestFolderUploader(unittest.TestCase):
+    longMessage = True
+
+    def setUp(self):
+        self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'week 1'))
+        for path, content in (('a.txt', 'aaaaa'), ('b.txt', 'bbb'), (os.path.join('week 1', 'c.txt'), 'c')):
+            with open(os.path.join(self.root, path), 'wb') as local_file:
+                local_file.write(content)
+        self.uploader = FolderUploader(self.req_ctx, 1234, workers=2)
+        patchers = {
+            'resolve_root': patch('canvas_sdk.uploads.files.resolve_path_courses'),
+            'resolve_path': patch('canvas_sdk.uploads.files.resolve_path_courses_full_path'),
+            'create_folder': patch('canvas_sdk.uploads.files.create_folder_courses'),
+            'list_files': patch('canvas_sdk.uploads.utils.get_all_list_data'),
+            'upload': patch('canvas_sdk.uploads.upload_file_stream'),
+        }
+        self.mocks = dict((name, patcher.start()) for name, patcher in patchers.items())
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+        self.mocks['resolve_root'].return_value.json.return_value = [{'id': 1}]
+        self.mocks['resolve_path'].side_effect = CanvasAPIError(status_code=404)
+        self.mocks['create_folder'].return_value.json.return_value = {'id': 2}
+        self.remote_files = {1: [{'display_name': 'a.txt', 'size': 5}, {'display_name': 'b.txt', 'size': 99}],
+                             2: []}
+        self.mocks['list_files'].side_effect = lambda ctx, function, folder_id: self.remote_files[folder_id]
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_sync_uploads_files_that_are_missing_or_differ_in_size(self):
+        """
+        Test that files whose name and size match a remote file are skipped, and the rest are uploaded to their
+        folders, which are created when missing
+        """
+        result = self.uploader.sync(self.root)
+        a, b, c = [os.path.join(self.root, path) for path in ('a.txt', 'b.txt', os.path.join('week 1', 'c.txt'))]
+        self.assertEqual(result.skipped, [a])
+        self.assertEqual(sorted(result.uploaded), sorted([b, c]))
+        self.assertEqual(result.failed, [])
+        self.mocks['resolve_path'].assert_called_once_with(self.req_ctx, 1234, 'week%201')
+        self.mocks['create_folder'].assert_called_once_with(
+            self.req_ctx, 1234, 'week 1', 1, None, None, None, None, None, None)
+        self.assertEqual(sorted(self.mocks['upload'].call_args_list), sorted([
+            mock.call(self.req_ctx, files.upload_file, b, 1, on_duplicate='overwrite', progress=None),
+            mock.call(self.req_ctx, files.upload_file, c, 2, on_duplicate='overwrite', progress=None),
+        ]))
+
+    def test_folders_are_resolved_once(self):
+        """
+        Test that folder ids are cached, so a second sync doesn't resolve or create folders again
+        """
+        self.uploader.sync(self.root)
+        self.uploader.sync(self.root)
+        self.assertEqual(self.mocks['resolve_root'].call_count, 1)
+        self.assertEqual(self.mocks['resolve_path'].call_count, 1)
+        self.assertEqual(self.mocks['create_folder'].call_count, 1)
+
+    def test_resolved_path_caches_ancestors(self):
+        """
+        Test that resolving a nested folder caches the ids of every folder on its path
+        """
+        self.mocks['resolve_path'].side_effect = None
+        self.mocks['resolve_path'].return_value.json.return_value = [{'id': 1}, {'id': 5}, {'id': 6}]
+        self.assertEqual(self.uploader.get_folder_id('/lectures/week 1/'), 6)
+        self.assertEqual(self.uploader.folder_ids, {'': 1, 'lectures': 5, 'lectures/week 1': 6})
+
+    def test_sync_returns_failed_uploads(self):
+        """
+        Test that a failed upload is returned with its error rather than stopping the other uploads
+        """
+        error = CanvasAPIError(status_code=500)
+        self.mocks['upload'].side_effect = lambda ctx, function, path, *args, **kwargs: (
+            self.raise_error(error) if path.endswith('b.txt') else mock.DEFAULT)
+        result = self.uploader.sync(self.root)
+        self.assertEqual(result.failed, [(os.path.join(self.root, 'b.txt'), error)])
+        self.assertEqual(result.uploaded, [os.path.join(self.root, 'week 1', 'c.txt')])
+
+    def raise_error(self, error):
+        raise error
+
+    def test_other_resolve_errors_are_raised(self):
+        """
+        Test that errors other than Not Found from resolving a folder are raised, not treated as missing folders
+        """
+        self.mocks['resolve_path'].side_effect = CanvasAPIError(status_code=401)
+        with self.assertRaises(CanvasAPIError):
+            self.uploader.get_folder_id('lectures')
+        self.assertFalse(self.mocks['create_folder'].called)
@@ -1,9 +1,13 @@
+import threading
 import unittest
+import urlparse
 import mock
 import requests
 from mock import patch
 from canvas_sdk import utils
 from canvas_sdk.client import RequestContext
+from canvas_sdk.exceptions import CanvasAPIError
+from canvas_sdk.records import record_type
 
 
 class TestUtils(unittest.TestCase):
@@ -11,6 +15,7 @@ class TestUtils(unittest.TestCase):
     def setUp(self):
         self.path = '/v1/accounts'
         self.req_ctx = mock.MagicMock(name='request-context', spec=RequestContext)
+        self.req_ctx.prefetch_depth = 0
 
     def build_response_mock(self, links=None, json_data=None):
         """
@@ -77,6 +82,16 @@ class TestUtils(unittest.TestCase):
         """
         self.assertRaises(AttributeError, utils.validate_attr_is_acceptable, 'a', ['b', 'c'])
 
+    def test_validate_attr_is_acceptable_with_frozenset(self):
+        """
+        Assert that validate_attr_is_acceptable accepts a frozenset of acceptable values and lists
+        them in a stable order when it raises
+        """
+        utils.validate_attr_is_acceptable(['b', 'c'], frozenset(['b', 'c']))
+        with self.assertRaises(AttributeError) as context:
+            utils.validate_attr_is_acceptable('a', frozenset(['c', 'b']))
+        self.assertEqual(str(context.exception), "a must be one of ('b', 'c')")
+
     def test_validate_attr_is_acceptable_raises_attributeerror_on_allow_none_false(self):
         """
         Assert that validate_attr_is_acceptable raises an AttributeError if the value is None
@@ -156,6 +171,60 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(utils.get_next(self.req_ctx, result))
 
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_next_with_prefetch_depth_yields_next_responses_in_order(self, mock_client_get):
+        """
+        Assert that get_next with a prefetch_depth on the context yields each "next" response in order.
+        """
+        self.req_ctx.prefetch_depth = 2
+        responses = [
+            self.build_response_mock({'next': {'url': 'http://next/url/2'}}),
+            self.build_response_mock({'next': {'url': 'http://next/url/3'}}),
+            self.build_response_mock(),
+        ]
+        mock_client_get.side_effect = responses
+        initial_response = self.build_response_mock({'next': {'url': 'http://next/url/1'}})
+
+        results = list(utils.get_next(self.req_ctx, initial_response))
+        self.assertEqual(results, responses)
+        self.assertEqual(
+            [c[0][1] for c in mock_client_get.call_args_list],
+            ['http://next/url/1', 'http://next/url/2', 'http://next/url/3'])
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_next_with_prefetch_depth_fetches_ahead_of_caller(self, mock_client_get):
+        """
+        Assert that get_next with a prefetch_depth requests the next page before the caller asks for it.
+        """
+        self.req_ctx.prefetch_depth = 1
+        fetched = threading.Event()
+
+        def get(request_context, url):
+            fetched.set()
+            return self.build_response_mock()
+
+        mock_client_get.side_effect = get
+        initial_response = self.build_response_mock({'next': {'url': 'http://next/url/1'}})
+
+        pages = utils.get_next(self.req_ctx, initial_response)
+        self.assertTrue(fetched.wait(5), "Next page should be fetched without advancing the iterator")
+        pages.close()
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_next_with_prefetch_depth_raises_fetch_errors_to_caller(self, mock_client_get):
+        """
+        Assert that an exception raised while prefetching a page is raised by the iterator.
+        """
+        self.req_ctx.prefetch_depth = 2
+        mock_client_get.side_effect = CanvasAPIError(status_code=500)
+        initial_response = self.build_response_mock({'next': {'url': 'http://next/url/1'}})
+
+        pages = utils.get_next(self.req_ctx, initial_response)
+        with self.assertRaises(CanvasAPIError):
+            next(pages)
+        with self.assertRaises(StopIteration):
+            next(pages)
+
     @patch('canvas_sdk.utils.get_next')
     def test_get_all_list_data_calls_function_parameter_with_context_args_and_kwargs(self, mock_next):
         """
@@ -182,6 +251,21 @@ class TestUtils(unittest.TestCase):
         utils.get_all_list_data(self.req_ctx, mock_function)
         mock_response.json.assert_called_once_with()
 
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_all_list_data_does_not_modify_first_page_json(self, mock_next):
+        """
+        Assert that the decoded json of the first page, which may be memoized on the response, is left as it was
+        """
+        first_page = [{'id': 1}]
+        mock_response = self.build_response_mock()
+        mock_response.json.return_value = first_page
+        next_response = self.build_response_mock()
+        next_response.json.return_value = [{'id': 2}]
+        mock_next.return_value = iter([next_response])
+        result = utils.get_all_list_data(self.req_ctx, mock.Mock(return_value=mock_response))
+        self.assertEqual(result, [{'id': 1}, {'id': 2}])
+        self.assertEqual(first_page, [{'id': 1}])
+
     @patch('canvas_sdk.utils.get_next')
     def test_get_all_list_data_calls_get_next_with_request_context_and_response(self, mock_next):
         """
@@ -266,6 +350,99 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(
             results, expected_json, "The json list of data returned by get_all function should be the fully concatenated list of json")
 
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_all_list_data_converts_pages_to_record_type(self, mock_next):
+        """
+        Assert that get_all_list_data with a record_type converts the json objects of every page to records,
+        dropping keys that aren't fields of the record type
+        """
+        Enrollment = record_type('Enrollment', ('id', 'user_id'))
+        mock_next.return_value = iter([self.build_response_mock(json_data=[{'id': 2, 'user_id': 20, 'grades': {}}])])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[{'id': 1, 'user_id': 10, 'grades': {}}])
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function, 'arg1', record_type=Enrollment)
+        self.assertEqual(results, [Enrollment(1, 10), Enrollment(2, 20)])
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1')
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_all_list_data_projects_to_fields(self, mock_next):
+        """
+        Assert that get_all_list_data with fields keeps only those keys of each json object
+        """
+        mock_next.return_value = iter([])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[{'id': 1, 'user_id': 10}])
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function, fields=('user_id',))
+        self.assertEqual([result.as_dict() for result in results], [{'user_id': 10}])
+
+    def test_get_link_page_returns_numeric_page_of_link(self):
+        """
+        Assert that get_link_page returns the page query parameter of the given link as an int
+        """
+        response = self.build_response_mock(
+            {'last': {'url': 'http://canvas/api/v1/courses?page=7&per_page=10'}})
+        self.assertEqual(utils.get_link_page(response, 'last'), 7)
+
+    def test_get_link_page_returns_none_for_missing_or_bookmark_links(self):
+        """
+        Assert that get_link_page returns None when the link is missing or its page isn't numeric
+        """
+        response = self.build_response_mock(
+            {'next': {'url': 'http://canvas/api/v1/courses?page=bookmark:WzFd&per_page=10'}})
+        self.assertIsNone(utils.get_link_page(response, 'last'))
+        self.assertIsNone(utils.get_link_page(response, 'next'))
+
+    def test_build_page_url_replaces_page_parameter(self):
+        """
+        Assert that build_page_url only replaces the page query parameter
+        """
+        url = utils.build_page_url('http://canvas/api/v1/courses?include%5B%5D=term&page=2&per_page=10', 5)
+        self.assertEqual(url, 'http://canvas/api/v1/courses?include%5B%5D=term&page=5&per_page=10')
+
+    @patch('canvas_sdk.utils.get_next')
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_all_list_data_parallel_fetches_numbered_pages_in_page_order(self, mock_client_get, mock_next):
+        """
+        Assert that get_all_list_data with parallel requests every page up to the last link directly and
+        concatenates the results in page order
+        """
+        page_data = {'2': ['two'], '3': ['three'], '4': ['four']}
+
+        def get(request_context, url):
+            page = urlparse.parse_qs(urlparse.urlsplit(url).query)['page'][0]
+            return self.build_response_mock(json_data=page_data[page])
+
+        mock_client_get.side_effect = get
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            links={'next': {'url': 'http://canvas/api/v1/users?page=2&per_page=1'},
+                   'last': {'url': 'http://canvas/api/v1/users?page=4&per_page=1'}},
+            json_data=['one'])
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function, 'arg1', parallel=3)
+        self.assertEqual(results, ['one', 'two', 'three', 'four'])
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1')
+        self.assertEqual(mock_client_get.call_count, 3)
+        self.assertFalse(mock_next.called, "Serial paging should not be used when a last link is present")
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_all_list_data_parallel_falls_back_to_get_next_without_last_link(self, mock_next):
+        """
+        Assert that get_all_list_data with parallel follows next links when there is no numbered last link
+        """
+        mock_next.return_value = iter([self.build_response_mock(json_data=['two'])])
+        mock_function = mock.Mock(name='mock-function')
+        mock_response = self.build_response_mock(
+            links={'next': {'url': 'http://canvas/api/v1/users?page=bookmark:WzFd'}},
+            json_data=['one'])
+        mock_function.return_value = mock_response
+
+        results = utils.get_all_list_data(self.req_ctx, mock_function, parallel=3)
+        self.assertEqual(results, ['one', 'two'])
+        mock_next.assert_called_once_with(self.req_ctx, mock_response)
+
     def test_masquerade_returns_function_response(self):
         """
         Assert that result of call to masquerade is the API function response.
@@ -304,36 +481,200 @@ class TestUtils(unittest.TestCase):
         mock_function.assert_called_once_with(
             mock.ANY, params={'as_user_id': as_user_id, 'foo': 'bar'})
 
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_calls_get_all_list_data_with_request_context_and_function(self, mock_get_all):
-        """
-        Assert that call to get_count makes a call to get_all_list_data with context and function
-        """
-        mock_function = mock.Mock(name='mock-function')
-        utils.get_count(self.req_ctx, mock_function)
-        mock_get_all.assert_called_once_with(self.req_ctx, mock_function)
-
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_calls_get_all_list_data_with_args_and_kwargs(self, mock_get_all):
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_count_calls_function_with_context_args_and_kwargs(self, mock_next):
         """
-        Assert that call to get_count makes a call to get_all_list_data with args and kwargs
+        Assert that call to get_count calls function parameter with context, args, and kwargs
         """
+        mock_next.return_value = iter([])
         mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[])
         arg1, arg2 = 'arg1', 'arg2'
         kwargs = {'kwarg1': 'val1', 'kwarg2': 'val2'}
 
         utils.get_count(self.req_ctx, mock_function, arg1, arg2, **kwargs)
-        mock_get_all.assert_called_once_with(mock.ANY, mock.ANY, arg1, arg2, **kwargs)
+        mock_function.assert_called_once_with(self.req_ctx, arg1, arg2, **kwargs)
 
-    @patch('canvas_sdk.utils.get_all_list_data')
-    def test_get_count_returns_length_of_get_all_list_data(self, mock_get_all):
+    @patch('canvas_sdk.utils.get_next')
+    def test_get_count_without_last_link_counts_every_page(self, mock_next):
         """
-        Assert that call to get_count makes a call to get_all_list_data with args and kwargs
+        Assert that get_count without a numbered last link counts the records of every "next" page
         """
-        mock_get_all.return_value = [1, 2, 3, 4, 5]
+        mock_next.return_value = iter([
+            self.build_response_mock(json_data=[3, 4]),
+            self.build_response_mock(json_data=[5]),
+        ])
         mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            links={'next': {'url': 'http://canvas/api/v1/users?page=bookmark:WzFd'}}, json_data=[1, 2])
 
         result = utils.get_count(self.req_ctx, mock_function)
         self.assertEqual(result, 5, "The result of get_count should match length of result set")
 
- 
+    @patch('canvas_sdk.utils.get_next')
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_count_with_last_link_requests_only_last_page(self, mock_client_get, mock_next):
+        """
+        Assert that get_count computes the count from the last link's page number and per_page, requesting
+        only the last page
+        """
+        last_url = 'http://canvas/api/v1/users?page=40&per_page=10'
+        mock_client_get.return_value = self.build_response_mock(json_data=[1, 2, 3])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            links={'next': {'url': 'http://canvas/api/v1/users?page=2&per_page=10'},
+                   'last': {'url': last_url}},
+            json_data=range(10))
+
+        result = utils.get_count(self.req_ctx, mock_function)
+        self.assertEqual(result, 393)
+        mock_client_get.assert_called_once_with(self.req_ctx, last_url)
+        self.assertFalse(mock_next.called, "Intermediate pages should not be requested")
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_count_with_last_link_without_per_page_uses_first_page_size(self, mock_client_get):
+        """
+        Assert that get_count uses the size of the first page as the page size when the last link has no
+        per_page parameter
+        """
+        mock_client_get.return_value = self.build_response_mock(json_data=[1])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            links={'next': {'url': 'http://canvas/api/v1/users?page=2'},
+                   'last': {'url': 'http://canvas/api/v1/users?page=3'}},
+            json_data=range(5))
+
+        result = utils.get_count(self.req_ctx, mock_function)
+        self.assertEqual(result, 11)
+
+    @patch('canvas_sdk.utils.client.get')
+    def test_get_count_with_single_page_makes_no_further_requests(self, mock_client_get):
+        """
+        Assert that get_count returns the size of the first page when it is also the last page
+        """
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(
+            links={'last': {'url': 'http://canvas/api/v1/users?page=1&per_page=10'}},
+            json_data=[1, 2, 3])
+
+        result = utils.get_count(self.req_ctx, mock_function)
+        self.assertEqual(result, 3)
+        self.assertFalse(mock_client_get.called)
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_calls_function_parameter_with_context_args_and_kwargs(self, mock_next):
+        """
+        Assert that iter_list_data calls function parameter with context, args, and kwargs, minus the
+        keyword arguments it consumes itself
+        """
+        mock_next.return_value = iter([])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[])
+        kwargs = {'kwarg1': 'val1'}
+
+        list(utils.iter_list_data(
+            self.req_ctx, mock_function, 'arg1', max_items=5, stop_when=bool, **kwargs))
+        mock_function.assert_called_once_with(self.req_ctx, 'arg1', **kwargs)
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_yields_records_from_every_page(self, mock_next):
+        """
+        Assert that iter_list_data yields each record of the initial and "next" responses in order
+        """
+        mock_next.return_value = iter([
+            self.build_response_mock(json_data=[3, 4]),
+            self.build_response_mock(json_data=[5]),
+        ])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[1, 2])
+
+        results = list(utils.iter_list_data(self.req_ctx, mock_function))
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_yields_non_list_json_as_single_record(self, mock_next):
+        """
+        Assert that iter_list_data yields json data that isn't a list as a single record
+        """
+        mock_next.return_value = iter([])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data={'dict': 'data'})
+
+        results = list(utils.iter_list_data(self.req_ctx, mock_function))
+        self.assertEqual(results, [{'dict': 'data'}])
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_yields_records_of_record_type(self, mock_next):
+        """
+        Assert that iter_list_data with a record_type yields records, and passes them to stop_when
+        """
+        Enrollment = record_type('Enrollment', ('id',))
+        mock_next.return_value = iter([self.build_response_mock(json_data=[{'id': 3}])])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[{'id': 1}, {'id': 2}])
+
+        results = list(utils.iter_list_data(
+            self.req_ctx, mock_function, record_type=Enrollment, stop_when=lambda record: record.id == 3))
+        self.assertEqual(results, [Enrollment(1), Enrollment(2)])
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_does_not_request_pages_before_they_are_needed(self, mock_next):
+        """
+        Assert that the next page is not requested until the records of the current page are consumed
+        """
+        fetched = []
+
+        def next_pages():
+            fetched.append('page-2')
+            yield self.build_response_mock(json_data=[3])
+
+        mock_next.return_value = next_pages()
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[1, 2])
+
+        records = utils.iter_list_data(self.req_ctx, mock_function)
+        next(records)
+        next(records)
+        self.assertEqual(fetched, [], "Next page should not be requested yet")
+        next(records)
+        self.assertEqual(fetched, ['page-2'])
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_stops_after_max_items(self, mock_next):
+        """
+        Assert that iter_list_data stops once max_items records have been yielded, without fetching
+        further pages
+        """
+        mock_next.return_value = iter([
+            self.build_response_mock(json_data=[3, 4]),
+            self.build_response_mock(json_data=[5]),
+        ])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[1, 2])
+
+        results = list(utils.iter_list_data(self.req_ctx, mock_function, max_items=3))
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(len(list(mock_next.return_value)), 1, "The last page should not have been fetched")
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_with_max_items_zero_makes_no_request(self, mock_next):
+        """
+        Assert that iter_list_data doesn't call the function when max_items is zero
+        """
+        mock_function = mock.Mock(name='mock-function')
+        self.assertEqual(list(utils.iter_list_data(self.req_ctx, mock_function, max_items=0)), [])
+        self.assertFalse(mock_function.called)
+
+    @patch('canvas_sdk.utils.get_next')
+    def test_iter_list_data_stops_when_predicate_is_true(self, mock_next):
+        """
+        Assert that iter_list_data stops at (and excludes) the first record that stop_when returns True for
+        """
+        mock_next.return_value = iter([
+            self.build_response_mock(json_data=[3, 4]),
+        ])
+        mock_function = mock.Mock(name='mock-function')
+        mock_function.return_value = self.build_response_mock(json_data=[1, 2])
+
+        results = list(utils.iter_list_data(self.req_ctx, mock_function, stop_when=lambda r: r == 3))
+        self.assertEqual(results, [1, 2])